@@ -0,0 +1,7 @@
+"""Offline framework-overhead benchmarks for fast-agent.
+
+Workloads drive real agents, workflows, sessions and batch runs with the
+internal ``passthrough``/``playback`` models and a local stdio MCP stub, so
+the measured time is fast-agent's own per-turn overhead rather than provider
+latency. Run ``python -m benchmarks --help`` for usage.
+"""
@@ -0,0 +1,135 @@
+"""Run the offline framework-overhead benchmarks.
+
+Each workload runs in a fresh interpreter by default so peak RSS is reported
+per workload. Results are written as JSON for comparison across commits.
+
+Examples:
+
+    uv run python -m benchmarks --list
+    uv run python -m benchmarks --output bench.json
+    uv run python -m benchmarks --workload tool_loop --workload chain --scale 0.1
+    uv run python -m benchmarks --compare main.json --output branch.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from benchmarks.harness import environment_metadata, run_isolated, run_workload
+from benchmarks.workloads import WORKLOADS
+
+COMPARED_METRICS = ("p50_ms", "p99_ms", "peak_rss_bytes")
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Offline fast-agent framework-overhead benchmarks.",
+    )
+    parser.add_argument(
+        "--workload",
+        action="append",
+        choices=sorted(WORKLOADS),
+        help="workload to run (repeatable; default: all)",
+    )
+    parser.add_argument("--list", action="store_true", help="list workloads and exit")
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="multiply operation counts (e.g. 0.1 for a quick smoke run)",
+    )
+    parser.add_argument(
+        "--trace-allocations",
+        action="store_true",
+        help="record tracemalloc peak bytes (slows the run; timings are not comparable)",
+    )
+    parser.add_argument("--output", type=Path, help="write JSON results to this file")
+    parser.add_argument("--compare", type=Path, help="baseline JSON to diff results against")
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="run workloads in this interpreter instead of one subprocess each",
+    )
+    return parser.parse_args(argv)
+
+
+def _compare(results: list[dict[str, Any]], baseline_path: Path) -> dict[str, Any]:
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    previous = {entry["workload"]: entry for entry in baseline.get("results", [])}
+    comparison: dict[str, Any] = {}
+    for entry in results:
+        before = previous.get(entry["workload"])
+        if before is None:
+            continue
+        deltas: dict[str, float] = {}
+        for metric in COMPARED_METRICS:
+            old, new = before.get(metric), entry.get(metric)
+            if isinstance(old, int | float) and isinstance(new, int | float) and old:
+                deltas[f"{metric}_change_pct"] = round((new - old) / old * 100, 2)
+        comparison[entry["workload"]] = deltas
+    return {"baseline": str(baseline_path), "workloads": comparison}
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    if args.list:
+        for name, workload in WORKLOADS.items():
+            summary = (workload.__doc__ or "").strip().splitlines()[0]
+            print(f"{name:22} {summary}")
+        return 0
+
+    names = args.workload or list(WORKLOADS)
+    results: list[dict[str, Any]] = []
+    for name in names:
+        if args.in_process:
+            result = run_workload(
+                name,
+                WORKLOADS[name],
+                scale=args.scale,
+                trace_allocations=args.trace_allocations,
+            )
+        else:
+            result = run_isolated(
+                name,
+                scale=args.scale,
+                trace_allocations=args.trace_allocations,
+            )
+        results.append(result)
+        print(_format_row(result), file=sys.stderr)
+
+    payload: dict[str, Any] = {
+        "schema": "fast-agent.benchmarks/v1",
+        "created_at": datetime.now(UTC).isoformat(),
+        "scale": args.scale,
+        "environment": environment_metadata(),
+        "results": results,
+    }
+    if args.compare is not None:
+        payload["comparison"] = _compare(results, args.compare)
+
+    text = json.dumps(payload, indent=2)
+    if args.output is not None:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    return 1 if any("error" in result for result in results) else 0
+
+
+def _format_row(result: dict[str, Any]) -> str:
+    if "error" in result:
+        return f"{result['workload']:22} ERROR {result['error'].splitlines()[-1:]}"
+    rss_mb = result["peak_rss_bytes"] / (1024 * 1024)
+    return (
+        f"{result['workload']:22} ops={result['operations']:<6} "
+        f"p50={result['p50_ms']:.3f}ms p99={result['p99_ms']:.3f}ms rss={rss_mb:.0f}MB"
+    )
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,247 @@
+"""Measurement primitives shared by the benchmark workloads."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterator
+
+STUB_SERVER_PATH = Path(__file__).with_name("stub_mcp_server.py")
+
+CONFIG_TEMPLATE = """\
+default_model: passthrough
+session_history: {session_history}
+
+logger:
+  level: error
+  type: none
+  progress_display: false
+  show_chat: false
+  show_tools: false
+
+mcp:
+  servers:
+    stub:
+      command: {python}
+      args: [{stub_server}]
+"""
+
+
+class Recorder:
+    """Collects per-operation durations for a workload."""
+
+    def __init__(self) -> None:
+        self.durations: list[float] = []
+        self.extra: dict[str, Any] = {}
+
+    @contextmanager
+    def measure(self) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.durations.append(time.perf_counter() - started)
+
+    def add(self, seconds: float) -> None:
+        self.durations.append(seconds)
+
+
+@dataclass(slots=True)
+class WorkloadContext:
+    """Per-workload scratch directory, generated config and scale factor."""
+
+    workdir: Path
+    config_path: Path
+    scale: float
+    recorder: Recorder = field(default_factory=Recorder)
+
+    def count(self, base: int) -> int:
+        return max(1, int(base * self.scale))
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of ``values`` (``fraction`` in ``[0, 1]``)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, round(fraction * len(ordered) + 0.5))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def peak_rss_bytes() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes elsewhere.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def write_config(workdir: Path, *, session_history: bool = False) -> Path:
+    config_path = workdir / "fastagent.config.yaml"
+    config_path.write_text(
+        CONFIG_TEMPLATE.format(
+            session_history=str(session_history).lower(),
+            python=_yaml_string(sys.executable),
+            stub_server=_yaml_string(str(STUB_SERVER_PATH)),
+        ),
+        encoding="utf-8",
+    )
+    return config_path
+
+
+def _yaml_string(value: str) -> str:
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def run_workload(
+    name: str,
+    workload: Callable[[WorkloadContext], Awaitable[None]],
+    *,
+    scale: float = 1.0,
+    trace_allocations: bool = False,
+    session_history: bool = False,
+) -> dict[str, Any]:
+    """Run one workload in a scratch directory and summarise its measurements.
+
+    ``tracemalloc`` roughly doubles Python-level overhead, so allocation
+    tracing is opt-in; the always-on ``allocated_blocks_delta`` is the change
+    in live object blocks across the run and is cheap to collect.
+    """
+    original_cwd = Path.cwd()
+    original_argv = sys.argv
+    with tempfile.TemporaryDirectory(prefix=f"fast-agent-bench-{name}-") as tmp:
+        workdir = Path(tmp)
+        context = WorkloadContext(
+            workdir=workdir,
+            config_path=write_config(workdir, session_history=session_history),
+            scale=scale,
+        )
+        os.chdir(workdir)
+        sys.argv = [sys.argv[0]]
+        if trace_allocations:
+            tracemalloc.start()
+        blocks_before = sys.getallocatedblocks()
+        started = time.perf_counter()
+        try:
+            asyncio.run(workload(context))
+        finally:
+            wall_seconds = time.perf_counter() - started
+            blocks_after = sys.getallocatedblocks()
+            traced_peak = None
+            if trace_allocations:
+                _, traced_peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+            os.chdir(original_cwd)
+            sys.argv = original_argv
+
+    return summarize(
+        name,
+        context.recorder,
+        wall_seconds=wall_seconds,
+        allocated_blocks_delta=blocks_after - blocks_before,
+        tracemalloc_peak_bytes=traced_peak,
+    )
+
+
+def summarize(
+    name: str,
+    recorder: Recorder,
+    *,
+    wall_seconds: float,
+    allocated_blocks_delta: int,
+    tracemalloc_peak_bytes: int | None,
+) -> dict[str, Any]:
+    durations = recorder.durations
+    operations = len(durations)
+    total = sum(durations)
+    result: dict[str, Any] = {
+        "workload": name,
+        "operations": operations,
+        "wall_seconds": round(wall_seconds, 4),
+        "ops_per_second": round(operations / total, 2) if total else None,
+        "mean_ms": round(total / operations * 1000, 4) if operations else None,
+        "p50_ms": round(percentile(durations, 0.50) * 1000, 4),
+        "p99_ms": round(percentile(durations, 0.99) * 1000, 4),
+        "max_ms": round(max(durations, default=0.0) * 1000, 4),
+        "peak_rss_bytes": peak_rss_bytes(),
+        "allocated_blocks_delta": allocated_blocks_delta,
+        "tracemalloc_peak_bytes": tracemalloc_peak_bytes,
+    }
+    result.update(recorder.extra)
+    return result
+
+
+def run_isolated(
+    name: str,
+    *,
+    scale: float,
+    trace_allocations: bool,
+) -> dict[str, Any]:
+    """Run one workload in a fresh interpreter so peak RSS is per workload."""
+    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as handle:
+        output = Path(handle.name)
+    command = [
+        sys.executable,
+        "-m",
+        "benchmarks",
+        "--in-process",
+        "--workload",
+        name,
+        "--scale",
+        str(scale),
+        "--output",
+        str(output),
+    ]
+    if trace_allocations:
+        command.append("--trace-allocations")
+    try:
+        completed = subprocess.run(
+            command,
+            cwd=Path(__file__).resolve().parent.parent,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if completed.returncode != 0:
+            detail = completed.stderr.strip().splitlines()[-20:]
+            return {"workload": name, "error": "\n".join(detail)}
+        payload = json.loads(output.read_text(encoding="utf-8"))
+        return payload["results"][0]
+    finally:
+        output.unlink(missing_ok=True)
+
+
+def environment_metadata() -> dict[str, Any]:
+    metadata: dict[str, Any] = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+    try:
+        from importlib.metadata import version
+
+        metadata["fast_agent_version"] = version("fast-agent-mcp")
+    except Exception:
+        metadata["fast_agent_version"] = None
+    commit = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"],
+        cwd=Path(__file__).resolve().parent,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    metadata["git_commit"] = commit.stdout.strip() or None
+    return metadata
@@ -0,0 +1,465 @@
+"""Generate the synthetic provider stream captures used by the replay benchmark.
+
+The committed corpus under ``benchmarks/captures`` stresses the stream hot
+path beyond what the sanitized live traces cover: very large tool-call
+arguments streamed as hundreds of small deltas, and reasoning-heavy turns
+where thinking text dominates the output. Captures use the same JSONL format
+as ``stream_capture.save_stream_chunk`` (``model_dump(mode="json")`` per
+chunk) and are fully deterministic, so regenerating produces no diff.
+
+Examples:
+
+    uv run python -m benchmarks.stream_captures
+    uv run python -m benchmarks.stream_captures --check
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from anthropic.lib.streaming._beta_messages import ParsedBetaMessageStreamEvent
+from openai.types.chat import ChatCompletionChunk
+from openai.types.responses import ResponseStreamEvent
+from pydantic import TypeAdapter
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+CAPTURE_ROOT = Path(__file__).with_name("captures")
+
+TOOL_ARGUMENT_DELTA_CHARS = 48
+TOOL_ARGUMENT_LINES = 400
+REASONING_SENTENCES = 500
+ANSWER_SENTENCES = 120
+
+_ANTHROPIC_EVENTS = TypeAdapter(ParsedBetaMessageStreamEvent)
+_RESPONSES_EVENTS = TypeAdapter(ResponseStreamEvent)
+
+_WORDS = (
+    "agent",
+    "stream",
+    "buffer",
+    "tool",
+    "server",
+    "history",
+    "token",
+    "result",
+    "schema",
+    "prompt",
+    "context",
+    "channel",
+)
+
+
+def _sentence(index: int) -> str:
+    words = [_WORDS[(index * 7 + offset * 5) % len(_WORDS)] for offset in range(9)]
+    return f"Step {index}: check the {' '.join(words)} before continuing."
+
+
+def _large_file_content() -> str:
+    lines = []
+    for index in range(TOOL_ARGUMENT_LINES):
+        name = _WORDS[index % len(_WORDS)]
+        lines.append(f"def handle_{name}_{index}(value: int) -> int:\n    return value * {index}\n")
+    return "\n".join(lines)
+
+
+def _large_tool_arguments() -> str:
+    return json.dumps(
+        {"path": "src/generated/handlers.py", "content": _large_file_content()},
+        ensure_ascii=False,
+    )
+
+
+def _split(text: str, size: int) -> Iterator[str]:
+    for start in range(0, len(text), size):
+        yield text[start : start + size]
+
+
+def _reasoning_deltas() -> list[str]:
+    return [(" " if index else "") + _sentence(index) for index in range(REASONING_SENTENCES)]
+
+
+def _answer_deltas() -> list[str]:
+    return [(" " if index else "") + _sentence(index + 10_000) for index in range(ANSWER_SENTENCES)]
+
+
+# -- Anthropic ----------------------------------------------------------------
+
+
+def _anthropic_usage(output_tokens: int) -> dict[str, Any]:
+    return {
+        "input_tokens": 1200,
+        "output_tokens": output_tokens,
+        "cache_creation_input_tokens": 0,
+        "cache_read_input_tokens": 0,
+    }
+
+
+def _anthropic_stream(
+    blocks: list[tuple[dict[str, Any], list[dict[str, Any]], dict[str, Any]]],
+    *,
+    stop_reason: str,
+    output_tokens: int,
+) -> list[dict[str, Any]]:
+    """Build raw events for content ``blocks`` of ``(start, deltas, final)``."""
+    message = {
+        "id": "msg_bench",
+        "type": "message",
+        "role": "assistant",
+        "model": "claude-sonnet-4-6",
+        "content": [],
+        "stop_reason": None,
+        "stop_sequence": None,
+        "usage": _anthropic_usage(1),
+    }
+    events: list[dict[str, Any]] = [{"type": "message_start", "message": dict(message)}]
+    for index, (start, deltas, final) in enumerate(blocks):
+        events.append({"type": "content_block_start", "index": index, "content_block": start})
+        events.extend(
+            {"type": "content_block_delta", "index": index, "delta": delta} for delta in deltas
+        )
+        events.append({"type": "content_block_stop", "index": index, "content_block": final})
+    events.append(
+        {
+            "type": "message_delta",
+            "delta": {"stop_reason": stop_reason, "stop_sequence": None},
+            "usage": _anthropic_usage(output_tokens),
+        }
+    )
+    final_message = dict(
+        message,
+        content=[final for _, _, final in blocks],
+        stop_reason=stop_reason,
+        usage=_anthropic_usage(output_tokens),
+    )
+    events.append({"type": "message_stop", "message": final_message})
+    return [_ANTHROPIC_EVENTS.validate_python(event).model_dump(mode="json") for event in events]
+
+
+def _anthropic_thinking_block(deltas: list[str]) -> tuple[dict, list[dict], dict]:
+    signature = "c2lnbmF0dXJl" * 8
+    return (
+        {"type": "thinking", "thinking": "", "signature": ""},
+        [{"type": "thinking_delta", "thinking": text} for text in deltas]
+        + [{"type": "signature_delta", "signature": signature}],
+        {"type": "thinking", "thinking": "".join(deltas), "signature": signature},
+    )
+
+
+def _anthropic_text_block(deltas: list[str]) -> tuple[dict, list[dict], dict]:
+    return (
+        {"type": "text", "text": ""},
+        [{"type": "text_delta", "text": text} for text in deltas],
+        {"type": "text", "text": "".join(deltas)},
+    )
+
+
+def anthropic_large_tool_arguments() -> list[dict[str, Any]]:
+    arguments = _large_tool_arguments()
+    tool_block = (
+        {"type": "tool_use", "id": "toolu_bench", "name": "write_file", "input": {}},
+        [
+            {"type": "input_json_delta", "partial_json": part}
+            for part in _split(arguments, TOOL_ARGUMENT_DELTA_CHARS)
+        ],
+        {
+            "type": "tool_use",
+            "id": "toolu_bench",
+            "name": "write_file",
+            "input": json.loads(arguments),
+        },
+    )
+    blocks = [_anthropic_text_block(["Writing the generated handlers now."]), tool_block]
+    return _anthropic_stream(blocks, stop_reason="tool_use", output_tokens=len(arguments) // 4)
+
+
+def anthropic_reasoning_heavy() -> list[dict[str, Any]]:
+    reasoning = _reasoning_deltas()
+    answer = _answer_deltas()
+    blocks = [_anthropic_thinking_block(reasoning), _anthropic_text_block(answer)]
+    output_tokens = sum(len(text) for text in reasoning + answer) // 4
+    return _anthropic_stream(blocks, stop_reason="end_turn", output_tokens=output_tokens)
+
+
+# -- OpenAI Responses ---------------------------------------------------------
+
+
+def _responses_payload(output: list[dict[str, Any]], *, output_tokens: int) -> dict[str, Any]:
+    return {
+        "id": "resp_bench",
+        "object": "response",
+        "created_at": 0,
+        "model": "gpt-5-mini",
+        "status": "completed",
+        "output": output,
+        "parallel_tool_calls": True,
+        "tool_choice": "auto",
+        "tools": [],
+        "usage": {
+            "input_tokens": 1200,
+            "input_tokens_details": {"cached_tokens": 0, "cache_write_tokens": 0},
+            "output_tokens": output_tokens,
+            "output_tokens_details": {"reasoning_tokens": 0},
+            "total_tokens": 1200 + output_tokens,
+        },
+    }
+
+
+def _responses_stream(
+    items: list[tuple[dict[str, Any], list[dict[str, Any]], dict[str, Any]]],
+    *,
+    output_tokens: int,
+) -> list[dict[str, Any]]:
+    """Build events for output ``items`` of ``(added_item, body_events, done_item)``."""
+    in_progress = dict(_responses_payload([], output_tokens=0), status="in_progress", usage=None)
+    events: list[dict[str, Any]] = [
+        {"type": "response.created", "response": in_progress},
+        {"type": "response.in_progress", "response": in_progress},
+    ]
+    for output_index, (added, body, done) in enumerate(items):
+        events.append(
+            {"type": "response.output_item.added", "output_index": output_index, "item": added}
+        )
+        events.extend(dict(event, output_index=output_index) for event in body)
+        events.append(
+            {"type": "response.output_item.done", "output_index": output_index, "item": done}
+        )
+    final = _responses_payload([done for _, _, done in items], output_tokens=output_tokens)
+    events.append({"type": "response.completed", "response": final})
+    for sequence_number, event in enumerate(events):
+        event["sequence_number"] = sequence_number
+    return [_RESPONSES_EVENTS.validate_python(event).model_dump(mode="json") for event in events]
+
+
+def responses_large_tool_arguments() -> list[dict[str, Any]]:
+    arguments = _large_tool_arguments()
+    item = {
+        "type": "function_call",
+        "id": "fc_bench",
+        "call_id": "call_bench",
+        "name": "write_file",
+        "arguments": "",
+        "status": "in_progress",
+    }
+    body = [
+        {"type": "response.function_call_arguments.delta", "item_id": "fc_bench", "delta": part}
+        for part in _split(arguments, TOOL_ARGUMENT_DELTA_CHARS)
+    ]
+    body.append(
+        {
+            "type": "response.function_call_arguments.done",
+            "item_id": "fc_bench",
+            "name": "write_file",
+            "arguments": arguments,
+        }
+    )
+    done = dict(item, arguments=arguments, status="completed")
+    return _responses_stream([(item, body, done)], output_tokens=len(arguments) // 4)
+
+
+def responses_reasoning_heavy() -> list[dict[str, Any]]:
+    reasoning = _reasoning_deltas()
+    answer = _answer_deltas()
+    summary = "".join(reasoning)
+    text = "".join(answer)
+    reasoning_item = {"type": "reasoning", "id": "rs_bench", "summary": []}
+    reasoning_body: list[dict[str, Any]] = [
+        {
+            "type": "response.reasoning_summary_part.added",
+            "item_id": "rs_bench",
+            "summary_index": 0,
+            "part": {"type": "summary_text", "text": ""},
+        }
+    ]
+    reasoning_body.extend(
+        {
+            "type": "response.reasoning_summary_text.delta",
+            "item_id": "rs_bench",
+            "summary_index": 0,
+            "delta": delta,
+        }
+        for delta in reasoning
+    )
+    reasoning_body += [
+        {
+            "type": "response.reasoning_summary_text.done",
+            "item_id": "rs_bench",
+            "summary_index": 0,
+            "text": summary,
+        },
+        {
+            "type": "response.reasoning_summary_part.done",
+            "item_id": "rs_bench",
+            "summary_index": 0,
+            "part": {"type": "summary_text", "text": summary},
+        },
+    ]
+    reasoning_done = dict(reasoning_item, summary=[{"type": "summary_text", "text": summary}])
+
+    message_item = {
+        "type": "message",
+        "id": "msg_bench",
+        "role": "assistant",
+        "status": "in_progress",
+        "content": [],
+    }
+    empty_part = {"type": "output_text", "text": "", "annotations": [], "logprobs": []}
+    message_body: list[dict[str, Any]] = [
+        {
+            "type": "response.content_part.added",
+            "item_id": "msg_bench",
+            "content_index": 0,
+            "part": empty_part,
+        }
+    ]
+    message_body.extend(
+        {
+            "type": "response.output_text.delta",
+            "item_id": "msg_bench",
+            "content_index": 0,
+            "delta": delta,
+            "logprobs": [],
+        }
+        for delta in answer
+    )
+    final_part = dict(empty_part, text=text)
+    message_body += [
+        {
+            "type": "response.output_text.done",
+            "item_id": "msg_bench",
+            "content_index": 0,
+            "text": text,
+            "logprobs": [],
+        },
+        {
+            "type": "response.content_part.done",
+            "item_id": "msg_bench",
+            "content_index": 0,
+            "part": final_part,
+        },
+    ]
+    message_done = dict(message_item, status="completed", content=[final_part])
+    output_tokens = (len(summary) + len(text)) // 4
+    return _responses_stream(
+        [
+            (reasoning_item, reasoning_body, reasoning_done),
+            (message_item, message_body, message_done),
+        ],
+        output_tokens=output_tokens,
+    )
+
+
+# -- OpenAI Chat Completions --------------------------------------------------
+
+
+def _chat_chunk(delta: dict[str, Any], *, finish_reason: str | None = None) -> dict[str, Any]:
+    chunk = {
+        "id": "chatcmpl-bench",
+        "object": "chat.completion.chunk",
+        "created": 0,
+        "model": "gpt-4.1",
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
+    return ChatCompletionChunk.model_validate(chunk).model_dump(mode="json")
+
+
+def openai_chat_large_tool_arguments() -> list[dict[str, Any]]:
+    arguments = _large_tool_arguments()
+    chunks = [_chat_chunk({"role": "assistant", "content": None})]
+    chunks.append(
+        _chat_chunk(
+            {
+                "tool_calls": [
+                    {
+                        "index": 0,
+                        "id": "call_bench",
+                        "type": "function",
+                        "function": {"name": "write_file", "arguments": ""},
+                    }
+                ]
+            }
+        )
+    )
+    chunks.extend(
+        _chat_chunk({"tool_calls": [{"index": 0, "function": {"arguments": part}}]})
+        for part in _split(arguments, TOOL_ARGUMENT_DELTA_CHARS)
+    )
+    chunks.append(_chat_chunk({}, finish_reason="tool_calls"))
+    return chunks
+
+
+CAPTURES: dict[tuple[str, str], Callable[[], list[dict[str, Any]]]] = {
+    ("anthropic", "large_tool_arguments"): anthropic_large_tool_arguments,
+    ("anthropic", "reasoning_heavy"): anthropic_reasoning_heavy,
+    ("responses", "large_tool_arguments"): responses_large_tool_arguments,
+    ("responses", "reasoning_heavy"): responses_reasoning_heavy,
+    ("openai-chat", "large_tool_arguments"): openai_chat_large_tool_arguments,
+}
+
+CAPTURE_MODELS = {
+    "anthropic": "claude-sonnet-4-6",
+    "responses": "gpt-5-mini",
+    "openai-chat": "gpt-4.1",
+}
+
+
+def render_capture(payloads: list[dict[str, Any]]) -> str:
+    return "".join(json.dumps(payload, sort_keys=True) + "\n" for payload in payloads)
+
+
+def render_meta(family: str, scenario: str, payloads: list[dict[str, Any]]) -> str:
+    meta = {
+        "family": family,
+        "model": CAPTURE_MODELS[family],
+        "scenario": scenario,
+        "chunk_count": len(payloads),
+        "synthetic": True,
+    }
+    return json.dumps(meta, indent=2, sort_keys=True) + "\n"
+
+
+def write_captures(root: Path = CAPTURE_ROOT, *, check: bool = False) -> list[Path]:
+    """Write (or with ``check`` compare) every capture; returns stale paths."""
+    stale: list[Path] = []
+    for (family, scenario), build in CAPTURES.items():
+        payloads = build()
+        directory = root / family / scenario
+        expected = {
+            directory / "stream.jsonl": render_capture(payloads),
+            directory / "meta.json": render_meta(family, scenario, payloads),
+        }
+        for path, text in expected.items():
+            current = path.read_text(encoding="utf-8") if path.exists() else None
+            if current == text:
+                continue
+            stale.append(path)
+            if not check:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(text, encoding="utf-8")
+    return stale
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.stream_captures",
+        description="Regenerate the synthetic stream replay corpus.",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="exit non-zero if the committed corpus differs from the generator",
+    )
+    args = parser.parse_args(argv)
+    stale = write_captures(check=args.check)
+    for path in stale:
+        print(f"{'stale' if args.check else 'wrote'} {path}", file=sys.stderr)
+    return 1 if args.check and stale else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
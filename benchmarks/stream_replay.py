@@ -0,0 +1,448 @@
+"""Replay captured provider streams through the real stream handlers.
+
+Each capture (a ``stream.jsonl`` of ``model_dump(mode="json")`` chunks) is
+decoded into SDK objects once, then fed repeatedly through the provider's own
+``_process_stream``/``_consume_google_stream`` on a real LLM instance with
+stream and tool listeners attached. No network or API key is needed.
+
+The corpus is the sanitized live traces listed in
+``tests/fixtures/llm_traces/manifests/replay_cases.json`` plus the synthetic
+large-tool-argument and reasoning-heavy captures in ``benchmarks/captures``
+(regenerate with ``python -m benchmarks.stream_captures``).
+
+For every capture and listener count the report gives chunks per second,
+median CPU microseconds per chunk and, relative to the zero-listener run, the
+extra CPU per chunk spent fanning events out to the listeners. ``--compare`` with ``--max-regression``
+turns the report into a CI gate on CPU per chunk.
+
+Examples:
+
+    uv run python -m benchmarks.stream_replay --list
+    uv run python -m benchmarks.stream_replay --output replay.json
+    uv run python -m benchmarks.stream_replay --capture anthropic/reasoning_heavy --iterations 50
+    uv run python -m benchmarks.stream_replay --compare main.json --max-regression 25
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import sys
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from benchmarks.harness import environment_metadata, percentile
+from benchmarks.stream_captures import CAPTURE_ROOT
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+TRACE_ROOT = REPO_ROOT / "tests" / "fixtures" / "llm_traces"
+REPLAY_CASES_PATH = TRACE_ROOT / "manifests" / "replay_cases.json"
+
+DEFAULT_ITERATIONS = 20
+DEFAULT_LISTENER_COUNTS = (0, 1, 8)
+WARMUP_ITERATIONS = 2
+COMPARED_METRIC = "cpu_us_per_chunk"
+
+_LLM_CLASSES = {
+    "anthropic": ("fast_agent.llm.provider.anthropic.llm_anthropic", "AnthropicLLM"),
+    "google": ("fast_agent.llm.provider.google.llm_google_native", "GoogleNativeLLM"),
+    "openai-chat": ("fast_agent.llm.provider.openai.llm_openai", "OpenAILLM"),
+    "openresponses": ("fast_agent.llm.provider.openai.openresponses", "OpenResponsesLLM"),
+    "responses": ("fast_agent.llm.provider.openai.responses", "ResponsesLLM"),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class StreamCapture:
+    """One captured provider stream and the model it was recorded against."""
+
+    name: str
+    family: str
+    model: str
+    path: Path
+
+    def payloads(self) -> list[dict[str, Any]]:
+        with self.path.open(encoding="utf-8") as handle:
+            return [json.loads(line) for line in handle if line.strip()]
+
+
+class ReplayStream:
+    """Async iterator over pre-decoded chunks, reusable across iterations.
+
+    Provides the finalisers the provider handlers call once the events are
+    exhausted (``get_final_message``/``get_final_response``/``aclose``).
+    """
+
+    def __init__(self, events: list[Any], final: Any = None) -> None:
+        self._events = events
+        self._final = final
+        self._index = 0
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __aiter__(self) -> ReplayStream:
+        self._index = 0
+        return self
+
+    async def __anext__(self) -> Any:
+        if self._index >= len(self._events):
+            raise StopAsyncIteration
+        event = self._events[self._index]
+        self._index += 1
+        return event
+
+    async def get_final_message(self) -> Any:
+        return self._final
+
+    async def get_final_response(self) -> Any:
+        return self._final
+
+    async def aclose(self) -> None:
+        return None
+
+
+def load_captures(*, include_traces: bool = True) -> list[StreamCapture]:
+    """Synthetic corpus captures first, then the sanitized live traces."""
+    captures: list[StreamCapture] = []
+    for meta_path in sorted(CAPTURE_ROOT.glob("*/*/meta.json")):
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        captures.append(
+            StreamCapture(
+                name=f"{meta['family']}/{meta['scenario']}",
+                family=meta["family"],
+                model=meta["model"],
+                path=meta_path.with_name("stream.jsonl"),
+            )
+        )
+    if include_traces and REPLAY_CASES_PATH.exists():
+        manifest = json.loads(REPLAY_CASES_PATH.read_text(encoding="utf-8"))
+        for case in manifest.get("cases", []):
+            if case.get("skip_reason"):
+                continue
+            fixture = TRACE_ROOT / "sanitized" / case["fixture_dir"]
+            meta = json.loads((fixture / "meta.json").read_text(encoding="utf-8"))
+            captures.append(
+                StreamCapture(
+                    name=f"trace/{case['id']}",
+                    family=case["family"],
+                    model=meta.get("resolved_model") or case["model_label"],
+                    path=fixture / "stream.jsonl",
+                )
+            )
+    return captures
+
+
+def decode_capture(capture: StreamCapture) -> ReplayStream:
+    """Rebuild the SDK chunk objects the provider client would have yielded.
+
+    The Anthropic and OpenAI clients build stream events with their lenient
+    ``construct_type`` rather than validating, so replay does the same; older
+    captures therefore decode even when the SDK has since added fields.
+    """
+    payloads = capture.payloads()
+    if capture.family == "anthropic":
+        from anthropic._models import construct_type
+        from anthropic.lib.streaming._beta_messages import ParsedBetaMessageStreamEvent
+
+        events = [construct_type(type_=ParsedBetaMessageStreamEvent, value=p) for p in payloads]
+        final = next(
+            (event.message for event in reversed(events) if event.type == "message_stop"), None
+        )
+        if final is None:
+            final = construct_type(
+                type_=ParsedBetaMessageStreamEvent,
+                value={"type": "message_stop", "message": _anthropic_message(capture, payloads)},
+            ).message
+        return ReplayStream(events, final)
+
+    if capture.family in ("responses", "openresponses"):
+        from openai._models import construct_type
+        from openai.types.responses import ResponseStreamEvent
+
+        events = [construct_type(type_=ResponseStreamEvent, value=p) for p in payloads]
+        final = next(
+            (
+                event.response
+                for event in reversed(events)
+                if event.type in ("response.completed", "response.incomplete")
+            ),
+            None,
+        )
+        return ReplayStream(events, final)
+
+    if capture.family == "google":
+        from google.genai import types as google_types
+
+        return ReplayStream(
+            [google_types.GenerateContentResponse.model_validate(p) for p in payloads]
+        )
+
+    if capture.family == "openai-chat":
+        from openai._models import construct_type
+        from openai.types.chat import ChatCompletionChunk
+
+        return ReplayStream(
+            [construct_type(type_=ChatCompletionChunk, value=_drop_nulls(p)) for p in payloads]
+        )
+
+    raise ValueError(f"{capture.name}: unsupported stream family {capture.family!r}")
+
+
+def _anthropic_message(capture: StreamCapture, payloads: list[dict[str, Any]]) -> dict[str, Any]:
+    """Assemble the final message for captures that end before ``message_stop``."""
+    message: dict[str, Any] | None = None
+    content: dict[int, Any] = {}
+    for payload in payloads:
+        event_type = payload.get("type")
+        if event_type == "message_start":
+            message = dict(payload["message"])
+        elif event_type == "content_block_stop" and "content_block" in payload:
+            content[payload["index"]] = payload["content_block"]
+        elif event_type == "message_delta" and message is not None:
+            message.update(payload.get("delta") or {})
+            message["usage"] = payload.get("usage") or message.get("usage")
+    if message is None:
+        raise ValueError(f"{capture.name}: Anthropic capture has no message_start event")
+    message["content"] = [content[index] for index in sorted(content)]
+    return message
+
+
+def _drop_nulls(value: Any) -> Any:
+    # Captures serialise unset delta fields as null; the SDK's chunk accumulator
+    # treats an explicit null as a value, so restore the wire's omitted keys.
+    if isinstance(value, dict):
+        return {key: _drop_nulls(item) for key, item in value.items() if item is not None}
+    if isinstance(value, list):
+        return [_drop_nulls(item) for item in value]
+    return value
+
+
+def build_llm(family: str, model: str) -> Any:
+    """Create the provider LLM a live run would use; construction is offline."""
+    import importlib
+
+    from fast_agent.context import Context
+
+    module_name, class_name = _LLM_CLASSES[family]
+    llm_class = getattr(importlib.import_module(module_name), class_name)
+    return llm_class(context=Context(), model=model, name="replay")
+
+
+async def process_stream(llm: Any, family: str, stream: ReplayStream, model: str) -> None:
+    if family == "google":
+        await llm._consume_google_stream(stream, model=model)
+    else:
+        await llm._process_stream(stream, model, None)
+
+
+@dataclass(slots=True)
+class _ListenerCounter:
+    calls: int = 0
+
+    def on_chunk(self, chunk: Any) -> None:
+        self.calls += 1
+
+    def on_tool_event(self, event_type: str, payload: dict[str, Any] | None) -> None:
+        self.calls += 1
+
+
+async def replay_capture(
+    capture: StreamCapture,
+    *,
+    iterations: int = DEFAULT_ITERATIONS,
+    listener_counts: Sequence[int] = DEFAULT_LISTENER_COUNTS,
+) -> dict[str, Any]:
+    """Replay one capture ``iterations`` times per listener count."""
+    stream = decode_capture(capture)
+    chunks = len(stream)
+    runs: dict[str, dict[str, Any]] = {}
+    for listener_count in listener_counts:
+        llm = build_llm(capture.family, capture.model)
+        counters = [_ListenerCounter() for _ in range(listener_count)]
+        for counter in counters:
+            llm.add_stream_listener(counter.on_chunk)
+            llm.add_tool_stream_listener(counter.on_tool_event)
+
+        for _ in range(WARMUP_ITERATIONS):
+            await process_stream(llm, capture.family, stream, capture.model)
+        for counter in counters:
+            counter.calls = 0
+
+        durations: list[float] = []
+        cpu_times: list[float] = []
+        gc.collect()
+        for _ in range(iterations):
+            started = time.perf_counter()
+            cpu_started = time.process_time()
+            await process_stream(llm, capture.family, stream, capture.model)
+            cpu_times.append(time.process_time() - cpu_started)
+            durations.append(time.perf_counter() - started)
+        wall_seconds = sum(durations)
+        replayed_chunks = chunks * iterations
+
+        runs[str(listener_count)] = {
+            "listeners": listener_count,
+            "chunks_per_second": round(replayed_chunks / wall_seconds, 1) if wall_seconds else None,
+            # Median per-stream CPU keeps one GC pause or scheduler hiccup out of the gate.
+            COMPARED_METRIC: round(percentile(cpu_times, 0.50) / chunks * 1e6, 3),
+            "stream_p50_ms": round(percentile(durations, 0.50) * 1000, 4),
+            "stream_p99_ms": round(percentile(durations, 0.99) * 1000, 4),
+            "listener_calls_per_stream": (counters[0].calls // iterations) if counters else 0,
+        }
+
+    result: dict[str, Any] = {
+        "capture": capture.name,
+        "family": capture.family,
+        "model": capture.model,
+        "chunks": chunks,
+        "iterations": iterations,
+        "runs": runs,
+    }
+    baseline = runs.get("0")
+    if baseline is not None:
+        for run in runs.values():
+            if run["listeners"]:
+                # Extra CPU per chunk over the zero-listener run; small values are within noise.
+                run["fan_out_us_per_chunk"] = round(
+                    run[COMPARED_METRIC] - baseline[COMPARED_METRIC], 3
+                )
+    return result
+
+
+async def replay_all(
+    captures: Sequence[StreamCapture],
+    *,
+    iterations: int = DEFAULT_ITERATIONS,
+    listener_counts: Sequence[int] = DEFAULT_LISTENER_COUNTS,
+) -> list[dict[str, Any]]:
+    return [
+        await replay_capture(capture, iterations=iterations, listener_counts=listener_counts)
+        for capture in captures
+    ]
+
+
+def compare_results(
+    results: list[dict[str, Any]], baseline: dict[str, Any], *, max_regression: float | None
+) -> tuple[dict[str, Any], list[str]]:
+    """Diff CPU per chunk against ``baseline``; returns the diff and regressions."""
+    previous = {entry["capture"]: entry for entry in baseline.get("results", [])}
+    comparison: dict[str, Any] = {}
+    regressions: list[str] = []
+    for entry in results:
+        before = previous.get(entry["capture"])
+        if before is None:
+            continue
+        deltas: dict[str, float] = {}
+        for key, run in entry["runs"].items():
+            old = before.get("runs", {}).get(key, {}).get(COMPARED_METRIC)
+            new = run[COMPARED_METRIC]
+            if not old:
+                continue
+            change = round((new - old) / old * 100, 2)
+            deltas[f"listeners_{key}_{COMPARED_METRIC}_change_pct"] = change
+            if max_regression is not None and change > max_regression:
+                regressions.append(
+                    f"{entry['capture']} (listeners={key}): "
+                    f"{COMPARED_METRIC} {old} -> {new} (+{change}%)"
+                )
+        comparison[entry["capture"]] = deltas
+    return comparison, regressions
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.stream_replay",
+        description="Replay captured provider streams through fast-agent's stream handlers.",
+    )
+    parser.add_argument(
+        "--capture",
+        action="append",
+        help="capture name to replay (repeatable; default: all)",
+    )
+    parser.add_argument("--list", action="store_true", help="list captures and exit")
+    parser.add_argument(
+        "--no-traces",
+        action="store_true",
+        help="replay only the synthetic corpus, not the sanitized live traces",
+    )
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument(
+        "--listeners",
+        default=",".join(str(count) for count in DEFAULT_LISTENER_COUNTS),
+        help="comma-separated listener counts to replay with (default: %(default)s)",
+    )
+    parser.add_argument("--output", type=Path, help="write JSON results to this file")
+    parser.add_argument("--compare", type=Path, help="baseline JSON to diff results against")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        help="with --compare, exit non-zero when CPU per chunk grows by more than this percent",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    captures = load_captures(include_traces=not args.no_traces)
+    if args.list:
+        for capture in captures:
+            print(f"{capture.name:52} {capture.family:14} {capture.model}")
+        return 0
+    if args.capture:
+        known = {capture.name: capture for capture in captures}
+        unknown = sorted(set(args.capture) - set(known))
+        if unknown:
+            print(f"Unknown capture(s): {', '.join(unknown)}", file=sys.stderr)
+            return 2
+        captures = [known[name] for name in args.capture]
+
+    listener_counts = [int(value) for value in args.listeners.split(",") if value.strip()]
+    results = asyncio.run(
+        replay_all(captures, iterations=args.iterations, listener_counts=listener_counts)
+    )
+    for result in results:
+        print(_format_row(result), file=sys.stderr)
+
+    payload: dict[str, Any] = {
+        "schema": "fast-agent.benchmarks.stream-replay/v1",
+        "created_at": datetime.now(UTC).isoformat(),
+        "iterations": args.iterations,
+        "environment": environment_metadata(),
+        "results": results,
+    }
+    regressions: list[str] = []
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        comparison, regressions = compare_results(
+            results, baseline, max_regression=args.max_regression
+        )
+        payload["comparison"] = {"baseline": str(args.compare), "captures": comparison}
+
+    text = json.dumps(payload, indent=2)
+    if args.output is not None:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+def _format_row(result: dict[str, Any]) -> str:
+    parts = [f"{result['capture']:52} chunks={result['chunks']:<5}"]
+    for key, run in result["runs"].items():
+        parts.append(f"L{key}: {run['chunks_per_second']:>9.0f}/s {run[COMPARED_METRIC]:>7.2f}us")
+    return " ".join(parts)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
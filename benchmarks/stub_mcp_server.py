@@ -0,0 +1,23 @@
+"""Minimal stdio MCP server used by the benchmark workloads.
+
+Tools return immediately so round trips measure transport and framework
+overhead only.
+"""
+
+from fastmcp import FastMCP
+
+app = FastMCP(name="bench-stub", instructions="Benchmark stub server.")
+
+
+@app.tool(name="echo", description="Return the supplied text unchanged.")
+def echo(text: str) -> str:
+    return text
+
+
+@app.tool(name="lookup", description="Return a small fixed record for a key.")
+def lookup(key: str) -> dict[str, str]:
+    return {"key": key, "value": key[::-1], "status": "ok"}
+
+
+if __name__ == "__main__":
+    app.run(transport="stdio", show_banner=False)
@@ -0,0 +1,276 @@
+"""Benchmark workloads.
+
+Each workload is an async function taking a :class:`WorkloadContext`. It builds
+agents against the generated config (``passthrough`` default model plus the
+``stub`` stdio MCP server), performs warm-up work outside the recorder and then
+records one duration per measured operation.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import TYPE_CHECKING, Any
+
+from fast_agent import FastAgent
+from fast_agent.llm.internal.passthrough import CALL_TOOL_INDICATOR, FIXED_RESPONSE_INDICATOR
+from fast_agent.mcp.prompt import Prompt
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from benchmarks.harness import WorkloadContext
+
+WARMUP_OPERATIONS = 3
+
+
+def _fast_agent(context: WorkloadContext) -> FastAgent:
+    return FastAgent(
+        "benchmark",
+        config_path=str(context.config_path),
+        parse_cli_args=False,
+        quiet=True,
+    )
+
+
+def _register_agents(fast: FastAgent, names: list[str], **kwargs: Any) -> None:
+    for name in names:
+        fast.agent(name=name, instruction=f"You are {name}.", **kwargs)(_noop)
+
+
+async def _noop() -> None:
+    return None
+
+
+async def tool_loop(context: WorkloadContext) -> None:
+    """300 turns, each calling a tool on the stdio MCP stub, with growing history."""
+    fast = _fast_agent(context)
+    fast.agent(name="looper", instruction="Call tools.", servers=["stub"])(_noop)
+    turns = context.count(300)
+
+    async with fast.run() as app:
+        agent = app.looper
+        for index in range(WARMUP_OPERATIONS):
+            await agent.send(_tool_call("stub__echo", {"text": f"warmup {index}"}))
+        for index in range(turns):
+            message = _tool_call("stub__echo", {"text": f"turn {index}"})
+            with context.recorder.measure():
+                await agent.send(message)
+        context.recorder.extra["history_messages"] = len(agent.message_history)
+
+
+async def parallel_fan_out(context: WorkloadContext) -> None:
+    """Parallel workflow fanning out to 32 agents and aggregating the results."""
+    fast = _fast_agent(context)
+    fan_out = [f"fan_out_{index}" for index in range(32)]
+    _register_agents(fast, fan_out)
+    fast.parallel(name="parallel", fan_out=fan_out)(_noop)
+    iterations = context.count(100)
+
+    async with fast.run() as app:
+        await _measure_sends(context, app.parallel.send, iterations, "fan out request")
+    context.recorder.extra["fan_out"] = len(fan_out)
+
+
+async def chain(context: WorkloadContext) -> None:
+    """Chain workflow passing each response through 8 agents."""
+    fast = _fast_agent(context)
+    sequence = [f"step_{index}" for index in range(8)]
+    _register_agents(fast, sequence)
+    fast.chain(name="chain", sequence=sequence)(_noop)
+    iterations = context.count(300)
+
+    async with fast.run() as app:
+        await _measure_sends(context, app.chain.send, iterations, "chain request")
+    context.recorder.extra["chain_length"] = len(sequence)
+
+
+async def router(context: WorkloadContext) -> None:
+    """Router selecting between 8 targets from a structured routing response."""
+    fast = _fast_agent(context)
+    targets = [f"target_{index}" for index in range(8)]
+    _register_agents(fast, targets)
+    fast.router(name="router", agents=targets)(_noop)
+    iterations = context.count(300)
+
+    async with fast.run() as app:
+        route = app.router
+        for index in range(WARMUP_OPERATIONS + iterations):
+            # The passthrough router model returns the fixed routing decision verbatim.
+            routing = json.dumps(
+                {
+                    "agent": targets[index % len(targets)],
+                    "confidence": "high",
+                    "reasoning": "benchmark",
+                }
+            )
+            message = f"{FIXED_RESPONSE_INDICATOR} {routing}"
+            if index < WARMUP_OPERATIONS:
+                await route.send(message)
+                continue
+            with context.recorder.measure():
+                await route.send(message)
+    context.recorder.extra["targets"] = len(targets)
+
+
+async def agents_as_tools(context: WorkloadContext) -> None:
+    """Parent agent calling each of 20 child agents exposed as tools."""
+    fast = _fast_agent(context)
+    children = [f"child_{index}" for index in range(20)]
+    _register_agents(fast, children)
+    fast.agent(name="parent", instruction="Delegate to children.", agents=children)(_noop)
+    iterations = context.count(200)
+
+    async with fast.run() as app:
+        parent = app.parent
+        for index in range(WARMUP_OPERATIONS + iterations):
+            child = children[index % len(children)]
+            message = _tool_call(f"agent__{child}", {"message": f"task {index}"})
+            if index < WARMUP_OPERATIONS:
+                await parent.send(message)
+                continue
+            with context.recorder.measure():
+                await parent.send(message)
+    context.recorder.extra["children"] = len(children)
+
+
+async def session_save_resume(context: WorkloadContext) -> None:
+    """Save and resume a session whose history holds thousands of messages."""
+    from fast_agent.session import SessionManager
+
+    fast = _fast_agent(context)
+    fast.agent(name="historian", instruction="Remember everything.")(_noop)
+    history_turns = context.count(2_000)
+    iterations = context.count(20)
+    payload = "lorem ipsum dolor sit amet " * 40
+
+    async with fast.run() as app:
+        agent = app.historian
+        history = []
+        for index in range(history_turns):
+            history.append(Prompt.user(f"question {index}: {payload}"))
+            history.append(Prompt.assistant(f"answer {index}: {payload}"))
+        agent.load_message_history(history)
+
+        manager = SessionManager(cwd=context.workdir)
+        session = manager.create_session()
+        save_times: list[float] = []
+        resume_times: list[float] = []
+        for _ in range(iterations):
+            started = time.perf_counter()
+            await session.save_history(agent)
+            saved = time.perf_counter()
+            agent.clear()
+            await manager.resume_session_agents_async(
+                {agent.name: agent},
+                session.info.name,
+                fallback_agent_name=agent.name,
+            )
+            finished = time.perf_counter()
+            save_times.append(saved - started)
+            resume_times.append(finished - saved)
+            context.recorder.add(finished - started)
+
+        history_files = list(session.directory.glob("history_*.json"))
+        context.recorder.extra.update(
+            {
+                "history_messages": len(agent.message_history),
+                "history_bytes": max((path.stat().st_size for path in history_files), default=0),
+                "save_mean_ms": round(sum(save_times) / len(save_times) * 1000, 4),
+                "resume_mean_ms": round(sum(resume_times) / len(resume_times) * 1000, 4),
+            }
+        )
+
+
+async def batch(context: WorkloadContext) -> None:
+    """Structured batch run over 10k templated rows with the passthrough model."""
+    from fast_agent.batch import BatchRunner
+
+    rows = context.count(10_000)
+    input_path = context.workdir / "rows.jsonl"
+    with input_path.open("w", encoding="utf-8") as handle:
+        for index in range(rows):
+            handle.write(json.dumps({"id": str(index), "topic": f"topic {index}"}) + "\n")
+    home = context.workdir / "batch-home"
+    home.mkdir()
+
+    started = time.perf_counter()
+    result = await BatchRunner(home=home).run(
+        input=input_path,
+        output_path=context.workdir / "out.jsonl",
+        template="Topic: {{topic}}",
+        model="passthrough",
+        overwrite=True,
+    )
+    elapsed = time.perf_counter() - started
+    # Batch rows run inside the engine, so only the amortised per-row cost is observable.
+    per_row = elapsed / rows
+    for _ in range(rows):
+        context.recorder.add(per_row)
+    context.recorder.extra.update(
+        {
+            "rows": rows,
+            "processed_rows": result.summary.get("processed_rows"),
+            "rows_per_second": round(rows / elapsed, 2),
+            "latency_basis": "amortised",
+        }
+    )
+
+
+async def stream_replay(context: WorkloadContext) -> None:
+    """Replay captured provider streams through the real stream handlers."""
+    from benchmarks.stream_replay import build_llm, decode_capture, load_captures, process_stream
+
+    iterations = context.count(20)
+    chunks = 0
+    for capture in load_captures():
+        stream = decode_capture(capture)
+        llm = build_llm(capture.family, capture.model)
+        llm.add_stream_listener(_noop_listener)
+        llm.add_tool_stream_listener(_noop_listener)
+        for _ in range(WARMUP_OPERATIONS):
+            await process_stream(llm, capture.family, stream, capture.model)
+        for _ in range(iterations):
+            with context.recorder.measure():
+                await process_stream(llm, capture.family, stream, capture.model)
+        chunks += len(stream) * iterations
+    total = sum(context.recorder.durations)
+    context.recorder.extra.update(
+        {
+            "chunks": chunks,
+            "chunks_per_second": round(chunks / total, 1) if total else None,
+        }
+    )
+
+
+def _noop_listener(*args: Any) -> None:
+    return None
+
+
+async def _measure_sends(
+    context: WorkloadContext,
+    send: Callable[[str], Awaitable[str]],
+    iterations: int,
+    message: str,
+) -> None:
+    for index in range(WARMUP_OPERATIONS):
+        await send(f"{message} warmup {index}")
+    for index in range(iterations):
+        with context.recorder.measure():
+            await send(f"{message} {index}")
+
+
+def _tool_call(tool_name: str, arguments: dict[str, Any]) -> str:
+    return f"{CALL_TOOL_INDICATOR} {tool_name} {json.dumps(arguments)}"
+
+
+WORKLOADS: dict[str, Callable[[WorkloadContext], Awaitable[None]]] = {
+    "tool_loop": tool_loop,
+    "parallel_fan_out": parallel_fan_out,
+    "chain": chain,
+    "router": router,
+    "agents_as_tools": agents_as_tools,
+    "session_save_resume": session_save_resume,
+    "batch": batch,
+    "stream_replay": stream_replay,
+}
@@ -678,6 +678,7 @@ def _yaml_default_text(default: object) -> str:
 _COMPACTION_SNIPPET_COMMENTS = {
     "auto": "automatically compact when the threshold is crossed",
     "threshold": "fraction of the context window that triggers compaction",
+    "precompact_threshold": "start summarizing in the background from this fraction",
     "keep_turns": "recent turns kept verbatim after compaction",
     "prompt": "built-in prompt; set inline text or a relative file path",
 }
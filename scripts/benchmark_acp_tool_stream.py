@@ -0,0 +1,109 @@
+"""Benchmark bytes on the wire for streamed ACP tool-call arguments.
+
+Streams a large synthetic ``write_text_file`` argument payload through
+``ACPToolProgressManager`` and counts the serialized ``session/update`` bytes
+for snapshot mode and delta mode. The per-chunk full-snapshot behaviour that
+preceded rate limiting is estimated analytically for comparison.
+
+Examples:
+
+    uv run scripts/benchmark_acp_tool_stream.py
+    uv run scripts/benchmark_acp_tool_stream.py --size 1000000 --chunks-per-second 8000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any
+
+from acp.contrib import ToolCallTracker
+
+from fast_agent.acp.tool_progress import STREAM_NOTIFY_THRESHOLD_CHUNKS, ACPToolProgressManager
+
+
+class ByteCountingConnection:
+    def __init__(self) -> None:
+        self.notifications = 0
+        self.bytes_sent = 0
+
+    async def session_update(self, session_id: str = "", update: Any = None, **_: Any) -> None:
+        payload = update.model_dump_json(by_alias=True, exclude_none=True)
+        self.notifications += 1
+        self.bytes_sent += len(payload.encode("utf-8"))
+
+
+def _argument_chunks(size: int, chunk_chars: int) -> list[str]:
+    line = "The quick brown fox jumps over the lazy dog.\n"
+    body = (line * (size // len(line) + 1))[:size]
+    payload = json.dumps({"path": "/tmp/generated.txt", "content": body})
+    return [payload[index : index + chunk_chars] for index in range(0, len(payload), chunk_chars)]
+
+
+async def _stream(chunks: list[str], *, argument_deltas: bool, chunks_per_second: float) -> dict:
+    connection = ByteCountingConnection()
+    manager = ACPToolProgressManager(connection, "bench", argument_deltas=argument_deltas)  # type: ignore[arg-type]
+    manager.handle_tool_stream_event(
+        "start", {"tool_name": "acp_filesystem__write_text_file", "tool_use_id": "use-1"}
+    )
+    batch = max(1, int(chunks_per_second / 100))
+    started = time.perf_counter()
+    for index in range(0, len(chunks), batch):
+        for chunk in chunks[index : index + batch]:
+            manager.handle_tool_stream_event("delta", {"tool_use_id": "use-1", "chunk": chunk})
+        await asyncio.sleep(batch / chunks_per_second)
+    # Let the final rate-limited update drain before execution starts.
+    await asyncio.sleep(0.3)
+    elapsed = time.perf_counter() - started
+    await manager.cleanup_session_tools("bench")
+    return {
+        "notifications": connection.notifications,
+        "bytes": connection.bytes_sent,
+        "elapsed_seconds": round(elapsed, 3),
+    }
+
+
+def _legacy_estimate(chunks: list[str]) -> dict:
+    """Every chunk past the threshold resent the accumulated text."""
+    tracker = ToolCallTracker()
+    tracker.start("bench", title="acp_filesystem/write_text_file", status="pending")
+    envelope = tracker.append_stream_text("bench", "", title="write_text_file (streaming: 100)")
+    overhead = len(envelope.model_dump_json(by_alias=True, exclude_none=True))
+    escaped = 0
+    total = 0
+    notifications = 0
+    for index, chunk in enumerate(chunks, start=1):
+        escaped += len(json.dumps(chunk)) - 2
+        if index >= STREAM_NOTIFY_THRESHOLD_CHUNKS:
+            total += overhead + escaped
+            notifications += 1
+    return {"notifications": notifications, "bytes": total}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=200_000, help="argument content characters")
+    parser.add_argument("--chunk-chars", type=int, default=16)
+    parser.add_argument("--chunks-per-second", type=float, default=4000.0)
+    args = parser.parse_args()
+
+    chunks = _argument_chunks(args.size, args.chunk_chars)
+    payload_bytes = sum(len(chunk.encode("utf-8")) for chunk in chunks)
+    results = {
+        "chunks": len(chunks),
+        "payload_bytes": payload_bytes,
+        "per_chunk_snapshots_estimate": _legacy_estimate(chunks),
+        "snapshot": asyncio.run(
+            _stream(chunks, argument_deltas=False, chunks_per_second=args.chunks_per_second)
+        ),
+        "delta": asyncio.run(
+            _stream(chunks, argument_deltas=True, chunks_per_second=args.chunks_per_second)
+        ),
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
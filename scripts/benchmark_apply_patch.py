@@ -0,0 +1,132 @@
+"""Benchmark apply_patch hunk matching on large generated files.
+
+Compares the indexed ``seek_sequence`` against the original linear scan for a
+patch with many hunks, including hunks that only match via the trim and
+unicode-normalised fallbacks.
+
+Examples:
+
+    uv run scripts/benchmark_apply_patch.py
+    uv run scripts/benchmark_apply_patch.py --lines 50000 --hunks 400 --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+from fast_agent.patch.engine import apply_replacements, compute_replacements
+from fast_agent.patch.parser import UpdateFileChunk
+from fast_agent.patch.seek_sequence import _normalise
+
+
+def _generate_lines(count: int) -> list[str]:
+    lines: list[str] = []
+    for index in range(count):
+        if index % 7 == 0:
+            lines.append(f"    value_{index} = compute({index})  ")
+        elif index % 11 == 0:
+            lines.append(f"    # section {index} — generated")
+        else:
+            lines.append(f"    value_{index} = {index}")
+    return lines
+
+
+def _generate_chunks(lines: list[str], hunks: int) -> list[UpdateFileChunk]:
+    step = max(len(lines) // (hunks + 1), 4)
+    chunks: list[UpdateFileChunk] = []
+    for hunk in range(hunks):
+        start = (hunk + 1) * step
+        if start + 3 >= len(lines):
+            break
+        old_lines = lines[start : start + 3]
+        if hunk % 3 == 1:
+            old_lines = [line.strip() for line in old_lines]
+        elif hunk % 3 == 2:
+            old_lines = [line.replace("—", "-") for line in old_lines]
+        chunks.append(
+            UpdateFileChunk(
+                change_context=None,
+                old_lines=old_lines,
+                new_lines=[*old_lines, f"    patched_{hunk} = True"],
+                is_end_of_file=False,
+            )
+        )
+    return chunks
+
+
+def _linear_seek(lines: list[str], pattern: list[str], start: int, eof: bool) -> int | None:
+    """Reference implementation: the pre-index linear scan."""
+    if not pattern:
+        return start
+    if len(pattern) > len(lines):
+        return None
+    last_start = len(lines) - len(pattern)
+    search_range = range(last_start if eof else start, last_start + 1)
+    for normaliser in (lambda value: value, str.rstrip, str.strip, _normalise):
+        for index in search_range:
+            if all(
+                normaliser(lines[index + offset]) == normaliser(pat)
+                for offset, pat in enumerate(pattern)
+            ):
+                return index
+    return None
+
+
+def _linear_replacements(
+    lines: list[str], chunks: list[UpdateFileChunk]
+) -> list[tuple[int, int, list[str]]]:
+    replacements: list[tuple[int, int, list[str]]] = []
+    line_index = 0
+    for chunk in chunks:
+        found = _linear_seek(lines, list(chunk.old_lines), line_index, chunk.is_end_of_file)
+        if found is None:
+            raise SystemExit("linear reference failed to match a hunk")
+        replacements.append((found, len(chunk.old_lines), list(chunk.new_lines)))
+        line_index = found + len(chunk.old_lines)
+    return replacements
+
+
+def _best(label: str, repeat: int, run) -> tuple[float, object]:
+    best: float | None = None
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = run()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"{label:<10} best={best or 0:8.3f}s")
+    return best or 0.0, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--lines", type=int, default=50_000)
+    parser.add_argument("--hunks", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--skip-linear", action="store_true")
+    args = parser.parse_args()
+
+    lines = _generate_lines(args.lines)
+    chunks = _generate_chunks(lines, args.hunks)
+    print(f"lines={len(lines):,} hunks={len(chunks)}")
+
+    indexed_time, indexed = _best(
+        "indexed",
+        args.repeat,
+        lambda: compute_replacements(lines, Path("generated.py"), chunks),
+    )
+    apply_replacements(lines, indexed)  # type: ignore[arg-type]
+    if args.skip_linear:
+        return
+
+    linear_time, linear = _best("linear", args.repeat, lambda: _linear_replacements(lines, chunks))
+    if linear != indexed:
+        raise SystemExit("indexed and linear matching disagree")
+    if indexed_time:
+        print(f"speedup    {linear_time / indexed_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
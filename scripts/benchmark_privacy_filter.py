@@ -11,6 +11,11 @@ Examples:
       --model-dir ~/.cache/fast-agent/privacy-filter-q4f16 \
       --session-dir ~/temp/skills-test/llama.cpp/.fast-agent/sessions/2604242111-39GThH \
       --candidate 3
+
+    uv run --extra privacy scripts/benchmark_privacy_filter.py \
+      --model-dir ~/.cache/fast-agent/privacy-filter-q4f16 \
+      --session-dir ~/temp/skills-test/llama.cpp/.fast-agent/sessions/2604242111-39GThH \
+      --batch
 """
 
 from __future__ import annotations
@@ -138,6 +143,29 @@ def _run_case(
             print(f"  {span.label} {span.start}:{span.end} {snippet!r}")
 
 
+def _run_batch(*, model_dir: Path, candidates: list[Candidate], repeat: int) -> None:
+    texts = [candidate.text for candidate in candidates]
+    characters = sum(len(text) for text in texts)
+    for label, batched in (("sequential", False), ("batched", True)):
+        best: float | None = None
+        for _ in range(repeat):
+            sanitizer = OpenAIPrivacyFilterOnnxSanitizer(model_dir)
+            started = time.perf_counter()
+            if batched:
+                sanitizer.sanitize_texts(texts)
+            else:
+                for text in texts:
+                    sanitizer.sanitize_text(text)
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        seconds = best or 0.0
+        rate = characters / seconds if seconds else 0.0
+        print(
+            f"{label:<10} texts={len(texts):<5} chars={characters:,} "
+            f"best={seconds:6.2f}s rate={rate:,.0f} chars/s rss={_rss_mb():8.1f}MB"
+        )
+
+
 def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("--session-dir", type=Path, default=DEFAULT_SESSION_DIR)
@@ -147,9 +175,21 @@ def main() -> None:
     parser.add_argument("--list", action="store_true")
     parser.add_argument("--repeat", type=int, default=1)
     parser.add_argument("--show-spans", action="store_true")
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Compare sequential and batched sanitization over all candidates.",
+    )
     args = parser.parse_args()
 
     candidates = _load_candidates(args.session_dir.expanduser(), args.agent)
+    if args.batch:
+        _run_batch(
+            model_dir=args.model_dir.expanduser(),
+            candidates=candidates,
+            repeat=args.repeat,
+        )
+        return
     if args.list:
         for index, candidate in enumerate(candidates[:30]):
             preview = " ".join(candidate.text.split())[:100]
@@ -0,0 +1,156 @@
+"""Benchmark MCP tool-name resolution on large synthetic catalogs.
+
+Compares the indexed ``MCPToolCatalog`` lookups against the original linear
+scans for a catalog of many servers and tools, resolving a mix of namespaced,
+unknown-suffix, bare and missing names.
+
+Examples:
+
+    uv run scripts/benchmark_tool_catalog.py
+    uv run scripts/benchmark_tool_catalog.py --servers 40 --tools 10000 --lookups 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from mcp_types import Tool
+
+from fast_agent.mcp.common import SEP, is_namespaced_name
+from fast_agent.mcp.mcp_aggregator import MCPToolCatalog, NamespacedTool, ToolNameResolution
+
+
+def _generate_maps(
+    servers: int, tools: int
+) -> tuple[dict[str, NamespacedTool], dict[str, list[NamespacedTool]], list[str]]:
+    server_names = [f"server_{index}" for index in range(servers)]
+    by_server: dict[str, list[NamespacedTool]] = {name: [] for name in server_names}
+    by_name: dict[str, NamespacedTool] = {}
+    for index in range(tools):
+        server_name = server_names[index % servers]
+        # Every 50th local name is shared by several servers to exercise ambiguity.
+        local_name = f"shared_{index % 7}" if index % 50 == 0 else f"tool_{index}"
+        namespaced = NamespacedTool(
+            tool=Tool(name=local_name, input_schema={"type": "object"}),
+            server_name=server_name,
+            namespaced_tool_name=f"{server_name}{SEP}{local_name}",
+        )
+        by_server[server_name].append(namespaced)
+        by_name[namespaced.namespaced_tool_name] = namespaced
+    return by_name, by_server, server_names
+
+
+def _generate_names(catalog: MCPToolCatalog, lookups: int) -> list[str]:
+    rng = random.Random(0)
+    namespaced = list(catalog._by_namespaced_name)
+    bare = [tool.tool.name for tool in catalog._by_namespaced_name.values()]
+    names: list[str] = []
+    for index in range(lookups):
+        kind = index % 4
+        if kind == 0:
+            names.append(rng.choice(namespaced))
+        elif kind == 1:
+            names.append(f"{rng.choice(catalog._server_names)}{SEP}not_listed_{index}")
+        elif kind == 2:
+            names.append(rng.choice(bare))
+        else:
+            names.append(f"missing_{index}")
+    return names
+
+
+def _linear_resolve(catalog: MCPToolCatalog, name: str) -> ToolNameResolution:
+    """Reference implementation: the pre-index scans, with longest-prefix matching."""
+    if namespaced_tool := catalog._by_namespaced_name.get(name):
+        return ToolNameResolution(namespaced_tool.server_name, namespaced_tool.tool.name)
+    if is_namespaced_name(name):
+        matches = [
+            server_name
+            for server_name in catalog._server_names
+            if name.startswith(f"{server_name}{SEP}")
+        ]
+        if matches:
+            server_name = max(matches, key=len)
+            return ToolNameResolution(server_name, name[len(server_name) + len(SEP) :])
+    owners = tuple(
+        server_name
+        for server_name, tools in catalog._by_server.items()
+        if any(namespaced_tool.tool.name == name for namespaced_tool in tools)
+    )
+    if owners:
+        return ToolNameResolution(owners[0], name, owners if len(owners) > 1 else ())
+    return ToolNameResolution(catalog._server_names[0] if catalog._server_names else None, name)
+
+
+def _linear_routable(catalog: MCPToolCatalog) -> frozenset[str]:
+    return frozenset(catalog._by_namespaced_name) | frozenset(
+        tool.tool.name for tool in catalog._by_namespaced_name.values()
+    )
+
+
+def _best(label: str, repeat: int, run) -> tuple[float, object]:
+    best: float | None = None
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = run()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"{label:<18} best={best or 0:8.4f}s")
+    return best or 0.0, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--servers", type=int, default=40)
+    parser.add_argument("--tools", type=int, default=10_000)
+    parser.add_argument("--lookups", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--skip-linear", action="store_true")
+    args = parser.parse_args()
+
+    by_name, by_server, server_names = _generate_maps(args.servers, args.tools)
+    snapshot_time, catalog = _best(
+        "snapshot",
+        args.repeat,
+        lambda: MCPToolCatalog.snapshot(
+            by_namespaced_name=by_name,
+            by_server=by_server,
+            server_names=server_names,
+        ),
+    )
+    assert isinstance(catalog, MCPToolCatalog)
+    names = _generate_names(catalog, args.lookups)
+    print(
+        f"servers={args.servers} tools={len(catalog._by_namespaced_name):,} lookups={len(names):,}"
+    )
+
+    indexed_time, indexed = _best(
+        "indexed resolve",
+        args.repeat,
+        lambda: [catalog.resolve_tool_name(name) for name in names],
+    )
+    _best(
+        "indexed routable", args.repeat, lambda: [catalog.routable_tool_names() for _ in range(100)]
+    )
+    if args.skip_linear:
+        return
+
+    linear_time, linear = _best(
+        "linear resolve",
+        args.repeat,
+        lambda: [_linear_resolve(catalog, name) for name in names],
+    )
+    _best("linear routable", args.repeat, lambda: [_linear_routable(catalog) for _ in range(100)])
+    if linear != indexed:
+        raise SystemExit("indexed and linear resolution disagree")
+    if _linear_routable(catalog) != catalog.routable_tool_names():
+        raise SystemExit("indexed and linear routable names disagree")
+    if indexed_time:
+        print(f"speedup            {linear_time / indexed_time:8.1f}x")
+        print(f"snapshot/lookup    {snapshot_time / (indexed_time / len(names)):8.0f} lookups")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""Benchmark Codex trace export memory and throughput on a synthetic session.
+
+Builds an in-memory session of roughly ``--size-mb`` of message content (text,
+tool calls and base64 images), then measures the traced memory peak of the
+export itself. The history is built before the measurement starts, so the peak
+reports what the writer adds on top of the loaded session.
+
+Examples:
+
+    uv run scripts/benchmark_trace_export.py --size-mb 1024
+    uv run scripts/benchmark_trace_export.py --size-mb 1024 --hash-attachments --shard-records 50000
+    uv run scripts/benchmark_trace_export.py --size-mb 256 --materialize
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+import os
+import resource
+import tempfile
+import time
+import tracemalloc
+from datetime import UTC, datetime
+from pathlib import Path
+
+from mcp_types import (
+    CallToolRequest,
+    CallToolRequestParams,
+    CallToolResult,
+    ImageContent,
+    TextContent,
+)
+
+from fast_agent.session.snapshot import (
+    SessionAgentSnapshot,
+    SessionContinuationSnapshot,
+    SessionSnapshot,
+)
+from fast_agent.session.trace_export_codex import CodexTraceWriter
+from fast_agent.session.trace_export_models import ResolvedSessionExport
+from fast_agent.types import LlmStopReason, PromptMessageExtended
+
+MB = 1024 * 1024
+
+
+def _turn(index: int, *, text_bytes: int, image_bytes: int) -> list[PromptMessageExtended]:
+    image = base64.b64encode(os.urandom(image_bytes)).decode("ascii") if image_bytes else None
+    user_content: list[TextContent | ImageContent] = [
+        TextContent(type="text", text=f"turn {index}: " + "u" * text_bytes)
+    ]
+    if image is not None:
+        user_content.append(ImageContent(type="image", data=image, mime_type="image/png"))
+    call_id = f"call-{index}"
+    return [
+        PromptMessageExtended(role="user", content=user_content),
+        PromptMessageExtended(
+            role="assistant",
+            content=[],
+            tool_calls={
+                call_id: CallToolRequest(
+                    method="tools/call",
+                    params=CallToolRequestParams(name="search", arguments={"q": f"q{index}"}),
+                )
+            },
+            stop_reason=LlmStopReason.TOOL_USE,
+        ),
+        PromptMessageExtended(
+            role="user",
+            content=[],
+            tool_results={
+                call_id: CallToolResult(
+                    content=[TextContent(type="text", text="r" * text_bytes)],
+                )
+            },
+        ),
+        PromptMessageExtended(
+            role="assistant",
+            content=[TextContent(type="text", text="a" * text_bytes)],
+            stop_reason=LlmStopReason.END_TURN,
+        ),
+    ]
+
+
+def _synthetic_session(
+    *, size_mb: int, turn_kb: int, image_fraction: float, session_dir: Path
+) -> ResolvedSessionExport:
+    turn_bytes = turn_kb * 1024
+    image_bytes = int(turn_bytes * image_fraction * 3 / 4)  # base64 expands by 4/3
+    text_bytes = max(1, int(turn_bytes * (1 - image_fraction)) // 3)
+    history: list[PromptMessageExtended] = []
+    for index in range(max(1, size_mb * MB // turn_bytes)):
+        history.extend(_turn(index, text_bytes=text_bytes, image_bytes=image_bytes))
+    now = datetime.now(UTC)
+    snapshot = SessionSnapshot(
+        session_id="benchmark",
+        created_at=now,
+        last_activity=now,
+        continuation=SessionContinuationSnapshot(
+            active_agent="dev",
+            agents={"dev": SessionAgentSnapshot(history_file="history.json")},
+        ),
+    )
+    return ResolvedSessionExport(
+        session_id="benchmark",
+        session_dir=session_dir,
+        snapshot=snapshot,
+        agent_name="dev",
+        history_path=session_dir / "history.json",
+        history=history,
+        message_timestamps=tuple(None for _ in history),
+    )
+
+
+def _directory_bytes(path: Path) -> int:
+    return sum(item.stat().st_size for item in path.rglob("*") if item.is_file())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=1024, help="Approximate session size")
+    parser.add_argument("--turn-kb", type=int, default=256, help="Approximate size of one turn")
+    parser.add_argument(
+        "--image-fraction", type=float, default=0.75, help="Share of each turn that is image data"
+    )
+    parser.add_argument("--zstd", action="store_true", help="Write zstd-compressed output")
+    parser.add_argument("--shard-records", type=int, default=None)
+    parser.add_argument("--hash-attachments", action="store_true")
+    parser.add_argument(
+        "--materialize",
+        action="store_true",
+        help="Also measure building every record in memory, as a whole-trace writer would",
+    )
+    parser.add_argument("--output-dir", type=Path, default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temporary:
+        output_dir = args.output_dir or Path(temporary)
+        started = time.perf_counter()
+        resolved = _synthetic_session(
+            size_mb=args.size_mb,
+            turn_kb=args.turn_kb,
+            image_fraction=args.image_fraction,
+            session_dir=output_dir,
+        )
+        build_seconds = time.perf_counter() - started
+        writer = CodexTraceWriter(
+            compression="zstd" if args.zstd else None,
+            shard_records=args.shard_records,
+            hash_attachments=args.hash_attachments,
+        )
+
+        report: dict[str, object] = {
+            "messages": len(resolved.history),
+            "build_seconds": round(build_seconds, 2),
+        }
+        tracemalloc.start()
+        if args.materialize:
+            tracemalloc.reset_peak()
+            records = list(writer._records(resolved))
+            report["materialized_records"] = len(records)
+            report["materialized_peak_mb"] = round(tracemalloc.get_traced_memory()[1] / MB, 1)
+            del records
+
+        tracemalloc.reset_peak()
+        started = time.perf_counter()
+        result = writer.write(resolved, output_dir / "trace.jsonl")
+        seconds = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        output_bytes = sum(path.stat().st_size for path in result.output_paths)
+        if result.attachments_dir is not None:
+            report["attachment_bytes_mb"] = round(_directory_bytes(result.attachments_dir) / MB, 1)
+        report.update(
+            {
+                "records": result.record_count,
+                "files": len(result.output_paths),
+                "output_mb": round(output_bytes / MB, 1),
+                "export_seconds": round(seconds, 2),
+                "export_mb_per_second": round(output_bytes / MB / seconds, 1) if seconds else None,
+                "export_peak_mb": round(peak / MB, 1),
+                "max_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+            }
+        )
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -193,12 +193,15 @@ _validate_domains
 _validate_domain_filters
 _validate_excluded_domains
 _validate_image_size
+_validate_max_concurrent
 _validate_max_concurrent_activities
+_validate_max_concurrent_calls
 _validate_max_uses
 _validate_model_alias_tokens
 _validate_model_references
 _validate_name
 _validate_plugin_commands
+_validate_pool_size
 _validate_positive_limits
 _validate_timeout_seconds
 _validate_uri
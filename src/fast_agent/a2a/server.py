@@ -6,6 +6,7 @@ import asyncio
 import base64
 import contextlib
 import copy
+import io
 import json
 import os
 from importlib.metadata import version as get_version
@@ -552,51 +553,166 @@ async def _start_a2a_task() -> None:
     await _ensure_current_task_started()
 
 
+def _env_int(name: str, default: int) -> int:
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        return default
+
+
+DEFAULT_A2A_STREAM_FLUSH_CHARS = 256
+DEFAULT_A2A_STREAM_FLUSH_MS = 50
+DEFAULT_A2A_STREAM_MAX_PENDING_CHARS = 65_536
+
+
 class _A2AStreamingContext:
-    def __init__(self, *, updater: TaskUpdater, artifact_id: str) -> None:
+    """Publish streamed text as coalesced, ordered artifact updates.
+
+    Chunks are buffered and flushed as one ``append`` artifact update once
+    ``flush_chars`` characters are pending or the oldest pending chunk is
+    ``flush_interval`` seconds old. While an update is being published (slow
+    subscribers), new chunks keep coalescing into the next batch. If more than
+    ``max_pending_chars`` characters back up behind a publish, incremental
+    updates stop and the executor sends the complete artifact at the end
+    (``max_pending_chars <= 0`` disables the limit).
+    """
+
+    def __init__(
+        self,
+        *,
+        updater: TaskUpdater,
+        artifact_id: str,
+        flush_chars: int | None = None,
+        flush_interval: float | None = None,
+        max_pending_chars: int | None = None,
+    ) -> None:
         self.updater = updater
         self.artifact_id = artifact_id
         self.remove_listener: Callable[[], None] | None = None
         self.tasks: list[asyncio.Task[None]] = []
-        self._queue: asyncio.Queue[tuple[str, bool] | None] = asyncio.Queue()
-        self._chunks: list[str] = []
+        self._flush_chars = max(
+            1,
+            flush_chars
+            if flush_chars is not None
+            else _env_int("FAST_AGENT_A2A_STREAM_FLUSH_CHARS", DEFAULT_A2A_STREAM_FLUSH_CHARS),
+        )
+        self._flush_interval = max(
+            0.0,
+            flush_interval
+            if flush_interval is not None
+            else _env_int("FAST_AGENT_A2A_STREAM_FLUSH_MS", DEFAULT_A2A_STREAM_FLUSH_MS) / 1000,
+        )
+        self._max_pending_chars = (
+            max_pending_chars
+            if max_pending_chars is not None
+            else _env_int(
+                "FAST_AGENT_A2A_STREAM_MAX_PENDING_CHARS", DEFAULT_A2A_STREAM_MAX_PENDING_CHARS
+            )
+        )
+        self._text = io.StringIO()
+        self._pending: list[str] = []
+        self._pending_chars = 0
+        self._pending_since: float | None = None
+        self._published_chars = 0
+        self._publishing = False
+        self._shed = False
+        self._closing = False
+        self._has_pending = asyncio.Event()
+        self._flush_now = asyncio.Event()
+        self.chunks_recorded = 0
+        self.events_published = 0
 
     def start(self) -> None:
         self.tasks.append(asyncio.create_task(self._publish_chunks()))
 
     def record_chunk(self, text: str) -> None:
-        append = bool(self._chunks)
-        self._chunks.append(text)
-        self._queue.put_nowait((text, append))
+        if not text:
+            return
+        self.chunks_recorded += 1
+        self._text.write(text)
+        if self._shed:
+            return
+        self._pending.append(text)
+        self._pending_chars += len(text)
+        if (
+            self._publishing
+            and self._max_pending_chars > 0
+            and self._pending_chars > self._max_pending_chars
+        ):
+            logger.warning(
+                "A2A artifact subscribers are falling behind; "
+                "sending the complete response when the turn finishes",
+                pending_chars=self._pending_chars,
+            )
+            self._shed = True
+            self._pending.clear()
+            self._pending_chars = 0
+            self._pending_since = None
+            return
+        if self._pending_since is None:
+            self._pending_since = asyncio.get_running_loop().time()
+        if self._pending_chars >= self._flush_chars:
+            self._flush_now.set()
+        self._has_pending.set()
 
     def streamed_text(self) -> str:
-        return "".join(self._chunks)
+        """Text delivered through incremental artifact updates."""
+        if self._shed:
+            return self._text.getvalue()[: self._published_chars]
+        return self._text.getvalue()
 
     async def _publish_chunks(self) -> None:
+        loop = asyncio.get_running_loop()
         while True:
-            item = await self._queue.get()
-            if item is None:
-                self._queue.task_done()
-                return
-            text, append = item
-            try:
-                await _ensure_current_task_started()
-                await self.updater.add_artifact(
-                    parts=[Part(text=text)],
-                    artifact_id=self.artifact_id,
-                    name="response",
-                    append=append,
-                    last_chunk=False,
-                )
-            except Exception:
-                logger.warning("Failed to publish A2A streaming artifact update", exc_info=True)
-            finally:
-                self._queue.task_done()
+            if not self._pending:
+                if self._closing:
+                    return
+                self._has_pending.clear()
+                await self._has_pending.wait()
+                continue
+            if not self._flush_now.is_set() and not self._closing:
+                assert self._pending_since is not None
+                delay = self._pending_since + self._flush_interval - loop.time()
+                if delay > 0:
+                    with contextlib.suppress(TimeoutError):
+                        await asyncio.wait_for(self._flush_now.wait(), delay)
+            self._flush_now.clear()
+            if not self._pending:
+                continue
+            text = "".join(self._pending)
+            self._pending.clear()
+            self._pending_chars = 0
+            self._pending_since = None
+            await self._publish(text)
+
+    async def _publish(self, text: str) -> None:
+        append = self._published_chars > 0
+        self._publishing = True
+        try:
+            await _ensure_current_task_started()
+            await self.updater.add_artifact(
+                parts=[Part(text=text)],
+                artifact_id=self.artifact_id,
+                name="response",
+                append=append,
+                last_chunk=False,
+            )
+            self._published_chars += len(text)
+            self.events_published += 1
+        except Exception:
+            logger.warning("Failed to publish A2A streaming artifact update", exc_info=True)
+        finally:
+            self._publishing = False
 
     async def drain(self) -> None:
-        await self._queue.join()
+        self._closing = True
+        self._flush_now.set()
+        self._has_pending.set()
         if self.tasks:
-            self._queue.put_nowait(None)
+            await asyncio.gather(*self.tasks, return_exceptions=True)
 
 
 class AgentA2AServer:
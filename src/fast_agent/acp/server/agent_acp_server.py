@@ -321,6 +321,7 @@ class AgentACPServer(ACPAgent):
                 field_meta={
                     "co.huggingface": {
                         "structuredOutput": True,
+                        "toolCallArgumentDeltas": True,
                     }
                 },
                 prompt_capabilities=PromptCapabilities(
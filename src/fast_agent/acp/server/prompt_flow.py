@@ -20,6 +20,7 @@ from fast_agent.acp.server.common import (
     clear_current_task_cancellation_requests,
     map_llm_stop_reason_to_acp,
 )
+from fast_agent.acp.server.stream_pipeline import ACPStreamPipeline
 from fast_agent.agents.tool_runner import ToolRunnerHooks
 from fast_agent.core.exceptions import ProviderKeyError
 from fast_agent.core.logging.logger import get_logger
@@ -401,6 +402,10 @@ class ACPPromptFlow:
             agent=agent,
             session_id=session_id,
         )
+        progress_manager = session_state.progress_manager if session_state else None
+        stream_pipeline = stream_context["stream_pipeline"]
+        if progress_manager is not None and stream_pipeline is not None:
+            progress_manager.set_text_flush(stream_pipeline.flush)
         try:
             session_request_params = await self._host._build_session_request_params(
                 agent, session_state
@@ -440,7 +445,7 @@ class ACPPromptFlow:
             await self._finalize_prompt_delivery(
                 session_id=session_id,
                 response_text=response_text,
-                streaming_tasks=stream_context["streaming_tasks"],
+                stream_pipeline=stream_context["stream_pipeline"],
                 assistant_text_streamed=stream_context["stream_state"].assistant_text_seen,
                 status_line_meta=status_line_meta,
             )
@@ -454,10 +459,13 @@ class ACPPromptFlow:
             )
             raise
         finally:
+            if progress_manager is not None and stream_pipeline is not None:
+                progress_manager.set_text_flush(None)
             await self._cleanup_stream_listener(
                 session_id=session_id,
                 stream_listener=stream_context["stream_listener"],
                 remove_listener=stream_context["remove_listener"],
+                stream_pipeline=stream_pipeline,
             )
 
     @staticmethod
@@ -611,42 +619,31 @@ class ACPPromptFlow:
     ) -> dict[str, Any]:
         stream_listener = None
         remove_listener: Callable[[], None] | None = None
-        streaming_tasks: list[asyncio.Task] = []
+        stream_pipeline: ACPStreamPipeline | None = None
         stream_state = StreamState()
         if self._host._connection and isinstance(agent, StreamingAgentProtocol):
             connection = self._host._connection
-            update_lock = asyncio.Lock()
 
-            async def send_stream_update(chunk: StreamChunk) -> None:
-                if not chunk.text:
-                    return
-                try:
-                    if chunk.is_reasoning:
-                        message_chunk = update_agent_thought_text(chunk.text)
-                    else:
-                        message_chunk = update_agent_message_text(chunk.text)
-                    await connection.session_update(
-                        session_id=session_id,
-                        update=message_chunk,
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"Error sending stream update: {e}",
-                        name="acp_stream_error",
-                        exc_info=True,
-                    )
+            async def send_stream_update(text: str, is_reasoning: bool) -> None:
+                if is_reasoning:
+                    message_chunk = update_agent_thought_text(text)
+                else:
+                    message_chunk = update_agent_message_text(text)
+                await connection.session_update(
+                    session_id=session_id,
+                    update=message_chunk,
+                )
 
-            async def send_stream_updates(chunk: StreamChunk) -> None:
-                async with update_lock:
-                    await send_stream_update(chunk)
+            pipeline = ACPStreamPipeline(send_stream_update)
 
             def on_stream_chunk(chunk: StreamChunk) -> None:
                 if not chunk or not chunk.text:
                     return
                 if not chunk.is_reasoning:
                     stream_state.assistant_text_seen = True
-                streaming_tasks.append(asyncio.create_task(send_stream_updates(chunk)))
+                pipeline.submit(chunk.text, is_reasoning=chunk.is_reasoning)
 
+            stream_pipeline = pipeline
             stream_listener = on_stream_chunk
             remove_listener = agent.add_stream_listener(stream_listener)
 
@@ -659,7 +656,7 @@ class ACPPromptFlow:
         return {
             "stream_listener": stream_listener,
             "remove_listener": remove_listener,
-            "streaming_tasks": streaming_tasks,
+            "stream_pipeline": stream_pipeline,
             "stream_state": stream_state,
         }
 
@@ -724,26 +721,21 @@ class ACPPromptFlow:
         *,
         session_id: str,
         response_text: str,
-        streaming_tasks: list[asyncio.Task],
+        stream_pipeline: ACPStreamPipeline | None,
         assistant_text_streamed: bool,
         status_line_meta: dict[str, Any] | None,
         emit_empty_status_update: bool = True,
     ) -> None:
-        if streaming_tasks:
-            try:
-                await asyncio.gather(*streaming_tasks)
-                logger.debug(
-                    f"All {len(streaming_tasks)} streaming tasks completed",
-                    name="acp_streaming_complete",
-                    session_id=session_id,
-                    task_count=len(streaming_tasks),
-                )
-            except Exception as e:
-                logger.error(
-                    f"Error waiting for streaming tasks: {e}",
-                    name="acp_streaming_wait_error",
-                    exc_info=True,
-                )
+        chunks_streamed = False
+        if stream_pipeline is not None:
+            await stream_pipeline.flush()
+            chunks_streamed = stream_pipeline.chunks_submitted > 0
+            logger.debug(
+                "Streaming pipeline flushed",
+                name="acp_streaming_complete",
+                session_id=session_id,
+                chunk_count=stream_pipeline.chunks_submitted,
+            )
 
         if not assistant_text_streamed and self._host._connection and response_text:
             try:
@@ -771,7 +763,7 @@ class ACPPromptFlow:
                     exc_info=True,
                 )
         elif (
-            (assistant_text_streamed or bool(streaming_tasks))
+            (assistant_text_streamed or chunks_streamed)
             and self._host._connection
             and status_line_meta
             and emit_empty_status_update
@@ -819,6 +811,7 @@ class ACPPromptFlow:
         session_id: str,
         stream_listener: Any,
         remove_listener: Callable[[], None] | None,
+        stream_pipeline: ACPStreamPipeline | None = None,
     ) -> None:
         if stream_listener and remove_listener:
             try:
@@ -831,3 +824,12 @@ class ACPPromptFlow:
                     name="acp_streaming_cleanup",
                     session_id=session_id,
                 )
+        if stream_pipeline is not None:
+            await stream_pipeline.close()
+            if stream_pipeline.chunks_submitted:
+                logger.info(
+                    "ACP stream pipeline stats",
+                    name="acp_stream_pipeline",
+                    session_id=session_id,
+                    data=stream_pipeline.stats().as_log_data(),
+                )
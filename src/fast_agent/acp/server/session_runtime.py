@@ -31,7 +31,10 @@ from fast_agent.acp.server.mcp_server_conversion import (
 from fast_agent.acp.server.models import ACPSessionState, SessionMCPServerState
 from fast_agent.acp.terminal_runtime import ACPTerminalRuntime
 from fast_agent.acp.tool_permission_adapter import ACPToolPermissionAdapter
-from fast_agent.acp.tool_progress import ACPToolProgressManager
+from fast_agent.acp.tool_progress import (
+    ACPToolProgressManager,
+    client_supports_tool_call_argument_deltas,
+)
 from fast_agent.agents.tool_runner import ToolRunnerHooks
 from fast_agent.context import Context
 from fast_agent.core.instruction_refresh import (
@@ -975,7 +978,14 @@ class ACPServerSessionRuntime:
     ) -> ACPToolProgressManager | None:
         tool_handler = initialization.session_state.progress_manager
         if self._host._connection and tool_handler is None:
-            tool_handler = ACPToolProgressManager(self._host._connection, session_id)
+            client_capabilities = self._host._parsed_client_capabilities
+            tool_handler = ACPToolProgressManager(
+                self._host._connection,
+                session_id,
+                argument_deltas=client_supports_tool_call_argument_deltas(
+                    client_capabilities.meta if client_capabilities else None
+                ),
+            )
             initialization.session_state.progress_manager = tool_handler
             initialization.tool_handler_created = True
             logger.info(
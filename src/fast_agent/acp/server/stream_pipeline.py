@@ -0,0 +1,203 @@
+"""Coalescing outbound pipeline for streamed ACP agent text and thought chunks."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from fast_agent.core.logging.logger import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+logger = get_logger(__name__)
+
+DEFAULT_STREAM_LATENCY_BUDGET_MS = 16.0
+DEFAULT_MAX_PENDING_FRAMES = 256
+DEFAULT_MAX_FRAME_CHARS = 32_768
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        return default
+
+
+def stream_latency_budget_seconds() -> float:
+    """Latency budget for merging chunks, from ``FAST_AGENT_ACP_STREAM_LATENCY_MS``."""
+    budget_ms = _env_float("FAST_AGENT_ACP_STREAM_LATENCY_MS", DEFAULT_STREAM_LATENCY_BUDGET_MS)
+    return max(0.0, budget_ms) / 1000.0
+
+
+@dataclass(slots=True)
+class _Frame:
+    is_reasoning: bool
+    enqueued_at: float
+    parts: list[str] = field(default_factory=list)
+    chars: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class StreamPipelineStats:
+    chunks: int
+    notifications: int
+    elapsed_seconds: float
+    max_queue_depth: int
+    max_queue_lag_ms: float
+    mean_queue_lag_ms: float
+
+    @property
+    def notifications_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.notifications / self.elapsed_seconds
+
+    def as_log_data(self) -> dict[str, int | float]:
+        return {
+            "chunks": self.chunks,
+            "notifications": self.notifications,
+            "notifications_per_second": round(self.notifications_per_second, 1),
+            "max_queue_depth": self.max_queue_depth,
+            "max_queue_lag_ms": round(self.max_queue_lag_ms, 2),
+            "mean_queue_lag_ms": round(self.mean_queue_lag_ms, 2),
+        }
+
+
+class ACPStreamPipeline:
+    """Single writer that turns streamed chunks into ordered ``session_update`` frames.
+
+    Chunks are appended to the newest unsent frame when it has the same kind
+    (message text or thought), so a burst of tokens becomes one notification.
+    The writer sends the first frame after an idle period immediately and then
+    at most one frame per latency budget. When ``max_pending_frames`` frames are
+    queued the newest frame keeps growing instead, which bounds queue length
+    while the client is slow to read.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[str, bool], Awaitable[None]],
+        *,
+        latency_budget_seconds: float | None = None,
+        max_pending_frames: int = DEFAULT_MAX_PENDING_FRAMES,
+        max_frame_chars: int = DEFAULT_MAX_FRAME_CHARS,
+    ) -> None:
+        self._send = send
+        self._latency_budget = (
+            stream_latency_budget_seconds()
+            if latency_budget_seconds is None
+            else max(0.0, latency_budget_seconds)
+        )
+        self._max_pending_frames = max(1, max_pending_frames)
+        self._max_frame_chars = max(1, max_frame_chars)
+        self._frames: deque[_Frame] = deque()
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._writer: asyncio.Task[None] | None = None
+        self._closing = False
+        self._last_sent_at: float | None = None
+        self._started_at: float | None = None
+        self._chunks = 0
+        self._notifications = 0
+        self._max_queue_depth = 0
+        self._max_queue_lag = 0.0
+        self._total_queue_lag = 0.0
+
+    def submit(self, text: str, *, is_reasoning: bool) -> None:
+        """Queue a chunk; must be called from the event loop thread."""
+        if not text or self._closing:
+            return
+        now = time.perf_counter()
+        if self._started_at is None:
+            self._started_at = now
+        self._chunks += 1
+
+        tail = self._frames[-1] if self._frames else None
+        if tail is None or tail.is_reasoning != is_reasoning or not self._can_extend(tail):
+            tail = _Frame(is_reasoning=is_reasoning, enqueued_at=now)
+            self._frames.append(tail)
+            self._max_queue_depth = max(self._max_queue_depth, len(self._frames))
+        tail.parts.append(text)
+        tail.chars += len(text)
+
+        self._idle.clear()
+        self._wakeup.set()
+        if self._writer is None:
+            self._writer = asyncio.create_task(self._run())
+
+    def _can_extend(self, frame: _Frame) -> bool:
+        return frame.chars < self._max_frame_chars or len(self._frames) >= self._max_pending_frames
+
+    @property
+    def chunks_submitted(self) -> int:
+        return self._chunks
+
+    async def flush(self) -> None:
+        """Wait until every chunk submitted so far has been sent."""
+        if self._writer is None:
+            return
+        await self._idle.wait()
+
+    async def close(self) -> None:
+        """Send any queued frames and stop the writer."""
+        self._closing = True
+        self._wakeup.set()
+        writer = self._writer
+        if writer is not None:
+            await writer
+
+    def stats(self) -> StreamPipelineStats:
+        elapsed = 0.0
+        if self._started_at is not None and self._last_sent_at is not None:
+            elapsed = self._last_sent_at - self._started_at
+        mean_lag = self._total_queue_lag / self._notifications if self._notifications else 0.0
+        return StreamPipelineStats(
+            chunks=self._chunks,
+            notifications=self._notifications,
+            elapsed_seconds=elapsed,
+            max_queue_depth=self._max_queue_depth,
+            max_queue_lag_ms=self._max_queue_lag * 1000.0,
+            mean_queue_lag_ms=mean_lag * 1000.0,
+        )
+
+    async def _run(self) -> None:
+        while True:
+            while not self._frames:
+                self._idle.set()
+                if self._closing:
+                    return
+                self._wakeup.clear()
+                await self._wakeup.wait()
+
+            if self._last_sent_at is not None and not self._closing:
+                delay = self._last_sent_at + self._latency_budget - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            frame = self._frames.popleft()
+            await self._send_frame(frame)
+
+    async def _send_frame(self, frame: _Frame) -> None:
+        started = time.perf_counter()
+        lag = started - frame.enqueued_at
+        self._max_queue_lag = max(self._max_queue_lag, lag)
+        self._total_queue_lag += lag
+        try:
+            await self._send("".join(frame.parts), frame.is_reasoning)
+        except Exception as e:
+            logger.error(
+                f"Error sending stream update: {e}",
+                name="acp_stream_error",
+                exc_info=True,
+            )
+        self._notifications += 1
+        self._last_sent_at = time.perf_counter()
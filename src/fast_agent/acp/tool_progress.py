@@ -11,8 +11,10 @@ When MCP tools execute and report progress, this module:
 from __future__ import annotations
 
 import asyncio
+import time
 import uuid
-from typing import TYPE_CHECKING, Any
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Final
 
 from acp.contrib import ToolCallTracker
 from acp.helpers import (
@@ -31,10 +33,42 @@ from fast_agent.mcp.common import get_resource_name, get_server_name, is_namespa
 from fast_agent.ui.tool_call_ids import format_tool_call_id
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from acp import AgentSideConnection
 
 logger = get_logger(__name__)
 
+HUGGINGFACE_META_KEY: Final[str] = "co.huggingface"
+TOOL_CALL_ARGUMENT_DELTAS_KEY: Final[str] = "toolCallArgumentDeltas"
+TOOL_CALL_ARGUMENT_DELTA_KEY: Final[str] = "toolCallArgumentDelta"
+
+# Argument streams shorter than this many chunks never produce updates.
+STREAM_NOTIFY_THRESHOLD_CHUNKS: Final[int] = 25
+# Minimum spacing between argument updates for one tool call. Snapshots resend
+# everything streamed so far, so they are spaced further apart than deltas.
+STREAM_SNAPSHOT_INTERVAL_SECONDS: Final[float] = 0.25
+STREAM_DELTA_INTERVAL_SECONDS: Final[float] = 0.05
+
+
+def client_supports_tool_call_argument_deltas(meta: dict[str, Any] | None) -> bool:
+    """Whether client capability `_meta` opts in to appended argument deltas."""
+    if not meta:
+        return False
+    extension = meta.get(HUGGINGFACE_META_KEY)
+    return isinstance(extension, dict) and extension.get(TOOL_CALL_ARGUMENT_DELTAS_KEY) is True
+
+
+@dataclass(slots=True)
+class _ArgumentStream:
+    """Streamed tool arguments that have not been sent to the client yet."""
+
+    external_id: str
+    pending: list[str] = field(default_factory=list)
+    sent_chars: int = 0
+    last_sent_at: float | None = None
+    flush_task: asyncio.Task[None] | None = None
+
 
 def _display_tool_id(tool_id: str | None) -> str:
     return format_tool_call_id(tool_id) or "unknown"
@@ -98,16 +132,36 @@ class ACPToolProgressManager:
     Uses the SDK's ToolCallTracker for state management and notification generation.
     """
 
-    def __init__(self, connection: AgentSideConnection, session_id: str) -> None:
+    def __init__(
+        self,
+        connection: AgentSideConnection,
+        session_id: str,
+        *,
+        argument_deltas: bool = False,
+        stream_interval_seconds: float | None = None,
+    ) -> None:
         """
         Initialize the progress manager.
 
         Args:
             connection: The ACP connection to send notifications on
             session_id: The ACP session ID for this manager
+            argument_deltas: Send streamed tool arguments as appended deltas
+                (client opted in via `co.huggingface.toolCallArgumentDeltas`)
+                instead of full snapshots
+            stream_interval_seconds: Minimum spacing between argument updates
+                for one tool call; defaults depend on the streaming mode
         """
         self._connection = connection
         self._session_id = session_id
+        self._argument_deltas = argument_deltas
+        if stream_interval_seconds is None:
+            stream_interval_seconds = (
+                STREAM_DELTA_INTERVAL_SECONDS
+                if argument_deltas
+                else STREAM_SNAPSHOT_INTERVAL_SECONDS
+            )
+        self._stream_interval = max(0.0, stream_interval_seconds)
         # Use SDK's ToolCallTracker for state management
         self._tracker = ToolCallTracker()
         # Persist tool_use_id → external_id for the full lifetime of a tool call.
@@ -142,8 +196,21 @@ class ACPToolProgressManager:
         self._stream_chunk_counts: dict[str, int] = {}  # tool_use_id → chunk count
         # Track base titles for streaming tools (before chunk count suffix)
         self._stream_base_titles: dict[str, str] = {}  # tool_use_id → base title
+        # Unsent argument text and rate-limit state per streaming tool
+        self._argument_streams: dict[str, _ArgumentStream] = {}  # tool_use_id → stream
+        # Sends queued assistant text first, so tool notifications never overtake it.
+        self._flush_text: Callable[[], Awaitable[None]] | None = None
         self._lock = asyncio.Lock()
 
+    def set_text_flush(self, flush: Callable[[], Awaitable[None]] | None) -> None:
+        """Set the coroutine that drains streamed assistant text before tool notifications."""
+        self._flush_text = flush
+
+    async def _send_update(self, update: Any) -> None:
+        if self._flush_text is not None:
+            await self._flush_text()
+        await self._connection.session_update(session_id=self._session_id, update=update)
+
     def _track_stream_task(self, tool_use_id: str, task: asyncio.Task[None]) -> None:
         self._stream_tasks[tool_use_id] = task
         task.add_done_callback(lambda completed: self._discard_stream_task(tool_use_id, completed))
@@ -152,6 +219,12 @@ class ACPToolProgressManager:
         if self._stream_tasks.get(tool_use_id) is task:
             self._stream_tasks.pop(tool_use_id, None)
 
+    def _forget_stream_state(self, tool_use_id: str) -> None:
+        self._stream_tool_use_ids.pop(tool_use_id, None)
+        self._stream_chunk_counts.pop(tool_use_id, None)
+        self._stream_base_titles.pop(tool_use_id, None)
+        self._argument_streams.pop(tool_use_id, None)
+
     def _forget_tool_call_state(self, tool_call_id: str) -> None:
         self._tool_call_id_to_external_id.pop(tool_call_id, None)
         self._simple_titles.pop(tool_call_id, None)
@@ -263,9 +336,7 @@ class ACPToolProgressManager:
         # Send the notification
         try:
             _attach_acp_meta(tool_call_start)
-            await self._connection.session_update(
-                session_id=self._session_id, update=tool_call_start
-            )
+            await self._send_update(tool_call_start)
             logger.debug(
                 "Created tool call notification (non-streaming): "
                 f"{_display_tool_id(tool_call_start.tool_call_id)}",
@@ -319,6 +390,8 @@ class ACPToolProgressManager:
                 self._external_id_to_tool_use_id[external_id] = tool_use_id
                 # Mark this tool_use_id as actively streaming arguments/content.
                 self._stream_tool_use_ids[tool_use_id] = external_id
+                self._stream_chunk_counts[tool_use_id] = 0
+                self._argument_streams[tool_use_id] = _ArgumentStream(external_id=external_id)
 
                 # Schedule async notification sending and store the task
                 task = asyncio.create_task(
@@ -337,10 +410,23 @@ class ACPToolProgressManager:
                 # execution has started (or after we deduped a late start event).
                 if tool_use_id not in self._stream_tool_use_ids:
                     return
-                # Delta notifications must not replace the tracked stream-start task.
+                stream = self._argument_streams.get(tool_use_id)
+                if stream is None:
+                    return
+                chunk_count = self._stream_chunk_counts.get(tool_use_id, 0) + 1
+                self._stream_chunk_counts[tool_use_id] = chunk_count
+                stream.pending.append(chunk)
+                # Only send updates after a threshold to avoid UI noise for small calls
+                if chunk_count < STREAM_NOTIFY_THRESHOLD_CHUNKS:
+                    return
+                # One flush task per stream drains pending chunks at a bounded rate.
+                # It must not replace the tracked stream-start task:
                 # get_tool_call_id_for_tool_use() relies on that task to wait until
                 # the initial ToolCallStart has created the ACP tool_call_id.
-                asyncio.create_task(self._send_stream_delta_notification(tool_use_id, chunk))
+                if stream.flush_task is None or stream.flush_task.done():
+                    stream.flush_task = asyncio.create_task(
+                        self._send_stream_delta_notification(tool_use_id, stream)
+                    )
 
         elif event_type == "stop" and info:
             tool_use_id = info.get("tool_use_id")
@@ -393,13 +479,10 @@ class ACPToolProgressManager:
                 self._tool_call_id_to_external_id[tool_call_start.tool_call_id] = external_id
                 # Initialize streaming state for this tool
                 self._stream_base_titles[tool_use_id] = title
-                self._stream_chunk_counts[tool_use_id] = 0
 
             # Send initial notification
             _attach_acp_meta(tool_call_start)
-            await self._connection.session_update(
-                session_id=self._session_id, update=tool_call_start
-            )
+            await self._send_update(tool_call_start)
 
             logger.debug(
                 "Sent early stream tool call notification: "
@@ -418,47 +501,68 @@ class ACPToolProgressManager:
                 exc_info=True,
             )
 
-    async def _send_stream_delta_notification(self, tool_use_id: str, chunk: str) -> None:
+    async def _send_stream_delta_notification(
+        self, tool_use_id: str, stream: _ArgumentStream
+    ) -> None:
         """
-        Send ACP notification with tool argument chunk as it streams.
+        Send ACP notifications for streamed tool argument chunks.
 
-        Accumulates chunks into content and updates title with chunk count.
+        Drains the stream's pending chunks, sending at most one update per
+        stream interval. Clients that opted in to argument deltas receive only
+        the newly streamed text plus its offset in `_meta`; other clients receive
+        a snapshot of everything streamed so far. The title shows the chunk count.
 
         Args:
             tool_use_id: LLM's tool use ID
-            chunk: JSON fragment chunk
+            stream: Pending argument text for the tool call
         """
         try:
             await self._await_stream_start_task(tool_use_id)
-            async with self._lock:
-                # Only apply deltas for tools that are actively streaming.
-                external_id = self._stream_tool_use_ids.get(tool_use_id)
-                if not external_id:
-                    # No start notification sent yet, skip this chunk
-                    return
-
-                # Increment chunk count and build title with count
-                self._stream_chunk_counts[tool_use_id] = (
-                    self._stream_chunk_counts.get(tool_use_id, 0) + 1
-                )
-                chunk_count = self._stream_chunk_counts[tool_use_id]
-                base_title = self._stream_base_titles.get(tool_use_id, "Tool")
-                title_with_count = f"{base_title} (streaming: {chunk_count})"
-
-                # Use SDK's append_stream_text to accumulate chunks into content
-                update = self._tracker.append_stream_text(
-                    external_id=external_id,
-                    text=chunk,
-                    title=title_with_count,
-                )
-
-            # Only send notifications after 25 chunks to avoid UI noise for small calls
-            if chunk_count < 25:
-                return
-
-            # Send notification outside the lock
-            _attach_acp_meta(update)
-            await self._connection.session_update(session_id=self._session_id, update=update)
+            while stream.pending:
+                if stream.last_sent_at is not None:
+                    delay = stream.last_sent_at + self._stream_interval - time.monotonic()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+
+                async with self._lock:
+                    # Only apply deltas for tools that are actively streaming.
+                    if self._stream_tool_use_ids.get(tool_use_id) != stream.external_id:
+                        return
+                    if self._argument_streams.get(tool_use_id) is not stream:
+                        return
+                    text = "".join(stream.pending)
+                    stream.pending.clear()
+                    chunk_count = self._stream_chunk_counts.get(tool_use_id, 0)
+                    base_title = self._stream_base_titles.get(tool_use_id, "Tool")
+                    title_with_count = f"{base_title} (streaming: {chunk_count})"
+
+                    if self._argument_deltas:
+                        update = self._tracker.progress(
+                            external_id=stream.external_id,
+                            title=title_with_count,
+                            content=[tool_content(text_block(text))],
+                        )
+                        update.field_meta = _merge_meta(
+                            update.field_meta,
+                            {
+                                HUGGINGFACE_META_KEY: {
+                                    TOOL_CALL_ARGUMENT_DELTA_KEY: {"offset": stream.sent_chars}
+                                }
+                            },
+                        )
+                    else:
+                        # SDK's append_stream_text accumulates chunks into content
+                        update = self._tracker.append_stream_text(
+                            external_id=stream.external_id,
+                            text=text,
+                            title=title_with_count,
+                        )
+                    stream.sent_chars += len(text)
+                    stream.last_sent_at = time.monotonic()
+
+                # Send notification outside the lock
+                _attach_acp_meta(update)
+                await self._send_update(update)
 
         except Exception as e:
             logger.debug(
@@ -598,9 +702,7 @@ class ACPToolProgressManager:
 
                 # Clean up streaming state since we're now in execution
                 if tool_use_id:
-                    self._stream_chunk_counts.pop(tool_use_id, None)
-                    self._stream_base_titles.pop(tool_use_id, None)
-                    self._stream_tool_use_ids.pop(tool_use_id, None)
+                    self._forget_stream_state(tool_use_id)
 
                 logger.debug(
                     "Updated stream tool call with execution details: "
@@ -648,9 +750,7 @@ class ACPToolProgressManager:
         # Send notification (either new start or update)
         try:
             _attach_acp_meta(tool_call_update)
-            await self._connection.session_update(
-                session_id=self._session_id, update=tool_call_update
-            )
+            await self._send_update(tool_call_update)
         except Exception as e:
             logger.error(
                 f"Error sending tool_call notification: {e}",
@@ -714,7 +814,7 @@ class ACPToolProgressManager:
         # Send the failure notification
         try:
             _attach_acp_meta(update_data)
-            await self._connection.session_update(session_id=self._session_id, update=update_data)
+            await self._send_update(update_data)
         except Exception as e:
             logger.error(
                 f"Error sending permission-denied notification: {e}",
@@ -732,9 +832,7 @@ class ACPToolProgressManager:
                     if ext_id == external_id:
                         self._forget_tool_call_state(tool_call_id)
 
-                self._stream_tool_use_ids.pop(tool_use_id, None)
-                self._stream_chunk_counts.pop(tool_use_id, None)
-                self._stream_base_titles.pop(tool_use_id, None)
+                self._forget_stream_state(tool_use_id)
 
     async def on_tool_progress(
         self,
@@ -812,7 +910,7 @@ class ACPToolProgressManager:
         # Send progress update
         try:
             _attach_acp_meta(update_data)
-            await self._connection.session_update(session_id=self._session_id, update=update_data)
+            await self._send_update(update_data)
 
             logger.debug(
                 f"Updated tool call progress: {_display_tool_id(tool_call_id)}",
@@ -910,7 +1008,7 @@ class ACPToolProgressManager:
         # Send completion notification
         try:
             _attach_acp_meta(update_data)
-            await self._connection.session_update(session_id=self._session_id, update=update_data)
+            await self._send_update(update_data)
 
             logger.info(
                 f"Completed tool call: {_display_tool_id(tool_call_id)}",
@@ -933,9 +1031,7 @@ class ACPToolProgressManager:
                 if tool_use_id:
                     self._tool_use_id_to_external_id.pop(tool_use_id, None)
                     # Defensive cleanup in case streaming state lingered.
-                    self._stream_tool_use_ids.pop(tool_use_id, None)
-                    self._stream_chunk_counts.pop(tool_use_id, None)
-                    self._stream_base_titles.pop(tool_use_id, None)
+                    self._forget_stream_state(tool_use_id)
 
     async def cleanup_session_tools(self, session_id: str) -> None:
         """
@@ -950,6 +1046,11 @@ class ACPToolProgressManager:
         async with self._lock:
             count = len(self._tool_call_id_to_external_id)
             stream_tasks = list(self._stream_tasks.values())
+            stream_tasks.extend(
+                stream.flush_task
+                for stream in self._argument_streams.values()
+                if stream.flush_task is not None
+            )
             for task in stream_tasks:
                 if not task.done():
                     task.cancel()
@@ -967,6 +1068,7 @@ class ACPToolProgressManager:
             self._stream_tool_use_ids.clear()
             self._stream_chunk_counts.clear()
             self._stream_base_titles.clear()
+            self._argument_streams.clear()
 
         if stream_tasks:
             await asyncio.gather(*stream_tasks, return_exceptions=True)
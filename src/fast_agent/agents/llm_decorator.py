@@ -454,6 +454,24 @@ class LlmDecorator(StreamingAgentMixin, AgentProtocol):
 
         return self._llm
 
+    def spawn_side_llm(self) -> FastAgentLLMProtocol | None:
+        """Create an unattached LLM with the same model and settings as the attached one.
+
+        Background side-channel calls use it so their usage and progress state
+        never interleave with the agent's own turns.
+        """
+        if self._llm_factory_ref is None or self._llm_attach_kwargs is None:
+            return None
+        attach_kwargs = dict(self._llm_attach_kwargs)
+        request_params = attach_kwargs.pop("request_params", None)
+        model = self._llm.default_request_params.model if self._llm is not None else None
+        effective_params = self._merge_request_params(
+            self._default_request_params, request_params, model
+        )
+        return self._llm_factory_ref(
+            agent=self, request_params=effective_params, context=self._context, **attach_kwargs
+        )
+
     def _validate_llm_attachment(self, llm: FastAgentLLMProtocol) -> None:
         """Hook for subclasses to reject an LLM before it becomes active."""
 
@@ -1,9 +1,14 @@
 """Batch processing helpers for fast-agent."""
 
-from fast_agent.batch.output import extract_structured_output, extract_text_output
+from fast_agent.batch.output import (
+    BatchOutputRows,
+    extract_structured_output,
+    extract_text_output,
+)
 from fast_agent.batch.runner import BatchRunner, BatchRunResult
 
 __all__ = [
+    "BatchOutputRows",
     "BatchRunResult",
     "BatchRunner",
     "extract_structured_output",
@@ -0,0 +1,163 @@
+"""Content-addressed response cache for batch rows.
+
+Entries live in a local SQLite file keyed by a SHA-256 digest of everything
+that shapes a row's response: the rendered prompt, the worker instruction, the
+model spec, request settings and the result schema. Re-running a batch after an
+unrelated change, or over overlapping inputs, then reuses earlier results
+instead of sending those rows to the provider again.
+
+Only successful results are stored. Entries expire after an optional TTL, and
+an optional size budget evicts the least recently used entries first.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import time
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+    from pathlib import Path
+
+RESPONSE_CACHE_VERSION = 1
+"""Bumped when the key or stored result format changes, invalidating old entries."""
+
+_EVICT_EVERY_WRITES = 256
+_SCHEMA = (
+    (
+        "CREATE TABLE IF NOT EXISTS responses ("
+        "key TEXT PRIMARY KEY, "
+        "result TEXT NOT NULL, "
+        "size INTEGER NOT NULL, "
+        "created_at REAL NOT NULL, "
+        "accessed_at REAL NOT NULL)"
+    ),
+    "CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)",
+)
+
+
+def response_cache_key(identity: Mapping[str, Any], rendered: str) -> str:
+    """Return the cache key for one rendered row prompt under a worker identity."""
+    payload = {"version": RESPONSE_CACHE_VERSION, "identity": identity, "prompt": rendered}
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    result: Any
+    created_at: float
+
+
+@dataclass(slots=True)
+class ResponseCacheStats:
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    expired: int = 0
+    evicted: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+class BatchResponseCache:
+    """SQLite-backed store of successful batch results."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        ttl_seconds: float | None = None,
+        max_bytes: int | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = path
+        self._ttl_seconds = ttl_seconds
+        self._max_bytes = max_bytes
+        self._clock = clock
+        self.stats = ResponseCacheStats()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit with a generous busy timeout, so parallel workers can share a file.
+        self._connection = sqlite3.connect(path, timeout=30.0, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        for statement in _SCHEMA:
+            self._connection.execute(statement)
+        self.evict()
+
+    def __enter__(self) -> BatchResponseCache:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def get(self, key: str) -> CachedResponse | None:
+        row = self._connection.execute(
+            "SELECT result, created_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        now = self._clock()
+        if row is not None and self._expired(row[1], now):
+            self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self.stats.expired += 1
+            row = None
+        if row is None:
+            self.stats.misses += 1
+            return None
+        self._connection.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        self.stats.hits += 1
+        return CachedResponse(result=json.loads(row[0]), created_at=row[1])
+
+    def put(self, key: str, result: Any) -> None:
+        encoded = json.dumps(result, ensure_ascii=False)
+        now = self._clock()
+        self._connection.execute(
+            "INSERT OR REPLACE INTO responses (key, result, size, created_at, accessed_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (key, encoded, len(encoded.encode("utf-8")), now, now),
+        )
+        self.stats.writes += 1
+        if self.stats.writes % _EVICT_EVERY_WRITES == 0:
+            self.evict()
+
+    def evict(self) -> None:
+        """Drop expired entries, then least recently used ones beyond the size budget."""
+        if self._ttl_seconds is not None:
+            cursor = self._connection.execute(
+                "DELETE FROM responses WHERE created_at < ?",
+                (self._clock() - self._ttl_seconds,),
+            )
+            self.stats.expired += max(cursor.rowcount, 0)
+        if self._max_bytes is not None:
+            cursor = self._connection.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM (SELECT key, SUM(size) OVER "
+                "(ORDER BY accessed_at DESC, key ROWS UNBOUNDED PRECEDING) AS kept "
+                "FROM responses) WHERE kept > ?)",
+                (self._max_bytes,),
+            )
+            self.stats.evicted += max(cursor.rowcount, 0)
+
+    def summary(self) -> dict[str, Any]:
+        """Return run statistics plus the current size of the cache file's contents."""
+        entries, size = self._connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        return {
+            "path": str(self.path),
+            **self.stats.to_dict(),
+            "entries": entries,
+            "bytes": size,
+        }
+
+    def close(self) -> None:
+        try:
+            self.evict()
+        finally:
+            self._connection.close()
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self._ttl_seconds is not None and created_at < now - self._ttl_seconds
@@ -1,16 +1,30 @@
-"""JSONL output envelope helpers for batch runs."""
+"""Output envelope helpers and record writers for batch runs."""
 
 from __future__ import annotations
 
 import json
-from typing import TYPE_CHECKING, Any, TextIO
+from collections.abc import Sequence
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Protocol, TextIO, overload
+
+from fast_agent.batch.parquet import (
+    ParquetRecordWriter,
+    count_parquet_output_rows,
+    is_parquet_output_path,
+    iter_parquet_output_rows,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
     from pathlib import Path
 
     from fast_agent.batch.input import RowError
 
 
+class RecordWriter(Protocol):
+    def write(self, record: dict[str, Any]) -> None: ...
+
+
 def success_envelope(
     *,
     identity: str | int,
@@ -18,6 +32,7 @@ def success_envelope(
     result: Any,
     row: dict[str, Any] | None,
     include_input: bool,
+    cached: bool | None = None,
 ) -> dict[str, Any]:
     envelope: dict[str, Any] = {
         "id": identity,
@@ -26,6 +41,8 @@ def success_envelope(
         "result": result,
         "error": None,
     }
+    if cached is not None:
+        envelope["cached"] = cached
     if include_input:
         envelope["input"] = row
     return envelope
@@ -38,6 +55,7 @@ def error_envelope(
     error: RowError,
     row: dict[str, Any] | None,
     include_input: bool,
+    cached: bool | None = None,
 ) -> dict[str, Any]:
     envelope: dict[str, Any] = {
         "id": identity,
@@ -49,6 +67,8 @@ def error_envelope(
             "message": error.message,
         },
     }
+    if cached is not None:
+        envelope["cached"] = cached
     if include_input:
         envelope["input"] = row
     return envelope
@@ -65,6 +85,96 @@ def write_jsonl_record(handle: TextIO, record: dict[str, Any]) -> None:
     handle.flush()
 
 
+class JsonlRecordWriter:
+    """Write each record as one flushed JSON line."""
+
+    def __init__(self, handle: TextIO) -> None:
+        self._handle = handle
+
+    def write(self, record: dict[str, Any]) -> None:
+        write_jsonl_record(self._handle, record)
+
+
+@contextmanager
+def open_record_writer(
+    path: Path,
+    *,
+    append: bool,
+    columns: Mapping[str, str],
+) -> Iterator[RecordWriter]:
+    """Open a JSONL or parquet writer for ``path``, chosen by its suffix.
+
+    ``columns`` gives the parquet column types besides ``id``; JSONL ignores it.
+    """
+    if is_parquet_output_path(path):
+        with ParquetRecordWriter(path, columns, append=append) as writer:
+            yield writer
+        return
+    with path.open("a" if append else "w", encoding="utf-8") as handle:
+        yield JsonlRecordWriter(handle)
+
+
+def iter_output_rows(path: Path) -> Iterator[dict[str, Any]]:
+    """Stream records from JSONL or parquet batch output without loading it all."""
+    if is_parquet_output_path(path):
+        yield from iter_parquet_output_rows(path)
+        return
+    if not path.exists():
+        return
+    with path.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            payload = json.loads(line)
+            if isinstance(payload, dict):
+                yield payload
+
+
+class BatchOutputRows(Sequence[dict[str, Any]]):
+    """Lazy view of the records in a batch output file or parquet dataset.
+
+    Iterating streams records from disk each time. Indexing loads every record
+    once and keeps them, so prefer iteration for large outputs.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._loaded: list[dict[str, Any]] | None = None
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        if self._loaded is not None:
+            return iter(self._loaded)
+        return iter_output_rows(self.path)
+
+    def __len__(self) -> int:
+        if self._loaded is not None:
+            return len(self._loaded)
+        if is_parquet_output_path(self.path):
+            return count_parquet_output_rows(self.path)
+        return sum(1 for _ in iter_output_rows(self.path))
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict[str, Any]]: ...
+
+    def __getitem__(self, index: int | slice) -> dict[str, Any] | list[dict[str, Any]]:
+        if self._loaded is None:
+            self._loaded = list(iter_output_rows(self.path))
+        return self._loaded[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"BatchOutputRows({str(self.path)!r})"
+
+
 def extract_structured_output(row: dict[str, Any]) -> Any | None:
     """Return the normalized structured result from a batch output envelope."""
     result = row.get("result")
@@ -0,0 +1,401 @@
+"""Parquet output for batch runs.
+
+A ``.parquet`` output path is written as a directory dataset: each flush of
+buffered records becomes one ``part-NNNNN.parquet`` file holding a single row
+group, so results reach disk as they complete and a resumed run appends new
+parts instead of rewriting the file. DuckDB, pandas, polars and pyarrow all read
+the directory (or a ``part-*.parquet`` glob) as one table.
+
+Column types come from the batch JSON schema when one is given, so structured
+results land in typed ``STRUCT``/``LIST`` columns rather than JSON strings.
+Values the schema cannot describe are stored in DuckDB ``JSON`` columns.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from fast_agent.batch.resume import canonical_batch_id
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+    from types import ModuleType
+
+    from fast_agent.batch.resume import CanonicalBatchId
+
+PARQUET_PART_GLOB = "part-*.parquet"
+DEFAULT_ROW_GROUP_ROWS = 1000
+"""Records buffered before a part file (one row group) is written."""
+DEFAULT_FLUSH_SECONDS = 60.0
+"""Longest time completed records wait in memory before being written."""
+
+_READ_BATCH_ROWS = 1000
+_MAX_SCHEMA_DEPTH = 16
+
+ERROR_COLUMN_TYPE = 'STRUCT("type" VARCHAR, "message" VARCHAR)'
+TELEMETRY_COLUMNS: dict[str, str] = {
+    "row_number": "BIGINT",
+    "ok": "BOOLEAN",
+    "timing": "JSON",
+    "usage": "JSON",
+}
+
+
+def is_parquet_output_path(path: Path) -> bool:
+    return path.suffix.lower() == ".parquet"
+
+
+def duckdb_module() -> ModuleType:
+    try:
+        return importlib.import_module("duckdb")
+    except ImportError as exc:
+        raise ValueError(
+            "Parquet output requires DuckDB. Install the `duckdb` Python package "
+            "or fast-agent-mcp[batch-parquet]."
+        ) from exc
+
+
+def envelope_columns(
+    result_schema: Mapping[str, Any] | None,
+    *,
+    include_input: bool,
+    include_cached: bool = False,
+) -> dict[str, str]:
+    """Return column types (besides ``id``) for batch output envelopes.
+
+    Without a schema the result is the model's text, stored as ``VARCHAR``.
+    """
+    columns = {
+        "row_number": "BIGINT",
+        "ok": "BOOLEAN",
+        "result": "VARCHAR" if result_schema is None else duckdb_type_for_schema(result_schema),
+        "error": ERROR_COLUMN_TYPE,
+    }
+    if include_cached:
+        columns["cached"] = "BOOLEAN"
+    if include_input:
+        columns["input"] = "JSON"
+    return columns
+
+
+def duckdb_type_for_schema(schema: Mapping[str, Any]) -> str:
+    """Map a JSON schema to the DuckDB column type used for its values."""
+    definitions = {**schema.get("definitions", {}), **schema.get("$defs", {})}
+    return _schema_type(schema, definitions, depth=0)
+
+
+def _schema_type(schema: Any, definitions: Mapping[str, Any], *, depth: int) -> str:
+    if not isinstance(schema, dict) or depth > _MAX_SCHEMA_DEPTH:
+        return "JSON"
+    reference = schema.get("$ref")
+    if isinstance(reference, str):
+        target = definitions.get(reference.rsplit("/", 1)[-1])
+        return _schema_type(target, definitions, depth=depth + 1)
+
+    for key in ("anyOf", "oneOf", "allOf"):
+        variants = schema.get(key)
+        if isinstance(variants, list):
+            non_null = [item for item in variants if item != {"type": "null"}]
+            if len(non_null) == 1:
+                return _schema_type(non_null[0], definitions, depth=depth + 1)
+            return "JSON"
+
+    literals = schema.get("enum", [schema["const"]] if "const" in schema else None)
+    if isinstance(literals, list):
+        return _literal_type([value for value in literals if value is not None])
+
+    declared = schema.get("type")
+    if isinstance(declared, list):
+        non_null_types = [item for item in declared if item != "null"]
+        declared = non_null_types[0] if len(non_null_types) == 1 else None
+
+    if declared == "string":
+        return "VARCHAR"
+    if declared == "integer":
+        return "BIGINT"
+    if declared == "number":
+        return "DOUBLE"
+    if declared == "boolean":
+        return "BOOLEAN"
+    if declared == "array":
+        items = schema.get("items")
+        if isinstance(items, dict):
+            return f"{_schema_type(items, definitions, depth=depth + 1)}[]"
+        return "JSON"
+    if declared == "object":
+        return _object_type(schema, definitions, depth=depth)
+    return "JSON"
+
+
+def _object_type(schema: Mapping[str, Any], definitions: Mapping[str, Any], *, depth: int) -> str:
+    properties = schema.get("properties")
+    # A STRUCT silently drops keys it does not list, so only closed objects qualify.
+    if not isinstance(properties, dict) or not properties:
+        return "JSON"
+    if schema.get("additionalProperties") is not False:
+        return "JSON"
+    # DuckDB struct field names are case-insensitive.
+    if len({name.lower() for name in properties}) != len(properties):
+        return "JSON"
+    fields = ", ".join(
+        f"{_quote_identifier(name)} {_schema_type(value, definitions, depth=depth + 1)}"
+        for name, value in properties.items()
+    )
+    return f"STRUCT({fields})"
+
+
+def _literal_type(values: list[Any]) -> str:
+    if values and all(isinstance(value, str) for value in values):
+        return "VARCHAR"
+    if values and all(isinstance(value, bool) for value in values):
+        return "BOOLEAN"
+    if values and all(isinstance(value, int) and not isinstance(value, bool) for value in values):
+        return "BIGINT"
+    return "JSON"
+
+
+class ParquetRecordWriter:
+    """Append batch records to a parquet directory dataset, one row group per part."""
+
+    def __init__(
+        self,
+        path: Path,
+        columns: Mapping[str, str],
+        *,
+        append: bool,
+        row_group_rows: int = DEFAULT_ROW_GROUP_ROWS,
+        flush_seconds: float = DEFAULT_FLUSH_SECONDS,
+    ) -> None:
+        self.path = path
+        self._columns = dict(columns)
+        self._row_group_rows = row_group_rows
+        self._flush_seconds = flush_seconds
+        self._connection = duckdb_module().connect()
+        self._buffer: list[Mapping[str, Any]] = []
+        self._last_flush = time.monotonic()
+        self._id_type: str | None = None
+        self.record_count = 0
+
+        existing = _prepare_dataset(path, append=append)
+        self._next_part = _next_part_index(existing)
+        if existing:
+            self._id_type = _existing_id_type(self._connection, existing)
+
+    def __enter__(self) -> ParquetRecordWriter:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def write(self, record: Mapping[str, Any]) -> None:
+        self._check_id(record.get("id"))
+        self._buffer.append(record)
+        self.record_count += 1
+        if (
+            len(self._buffer) >= self._row_group_rows
+            or time.monotonic() - self._last_flush >= self._flush_seconds
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        part_path = self.path / f"part-{self._next_part:05d}.parquet"
+        try:
+            self._copy_records(self._buffer, part_path)
+        except ValueError:
+            # Keep the rest of the row group when a few values do not fit their columns.
+            self._copy_records(
+                [self._readable_record(record) for record in self._buffer], part_path
+            )
+        self._next_part += 1
+        self._buffer.clear()
+
+    def _copy_records(self, records: list[Mapping[str, Any]], part_path: Path) -> None:
+        pending_path = part_path.with_name(f".{part_path.name}.pending")
+        with self._staged(records) as staging_path:
+            try:
+                self._connection.execute(
+                    f"COPY (SELECT * FROM {self._read_json_sql(staging_path)}) "
+                    f"TO {_sql_string(str(pending_path))} "
+                    f"(FORMAT parquet, COMPRESSION zstd, ROW_GROUP_SIZE {len(records)})"
+                )
+                pending_path.replace(part_path)
+            except Exception as exc:
+                pending_path.unlink(missing_ok=True)
+                raise ValueError(f"Could not write parquet output part {part_path}: {exc}") from exc
+
+    def _readable_record(self, record: Mapping[str, Any]) -> Mapping[str, Any]:
+        """Return the record, or an error envelope when its values cannot be cast."""
+        with self._staged([record]) as staging_path:
+            try:
+                self._connection.execute(
+                    f"SELECT * FROM {self._read_json_sql(staging_path)}"
+                ).fetchall()
+                return record
+            except Exception as exc:
+                if "result" not in self._columns or "error" not in self._columns:
+                    raise ValueError(f"Could not write parquet output record: {exc}") from exc
+                return {
+                    **record,
+                    "ok": False,
+                    "result": None,
+                    "error": {
+                        "type": "ParquetTypeError",
+                        "message": f"Result does not match the parquet column types: {exc}",
+                    },
+                }
+
+    @contextmanager
+    def _staged(self, records: list[Mapping[str, Any]]) -> Iterator[Path]:
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=self.path,
+            prefix=".part-",
+            suffix=".jsonl",
+            delete=False,
+        ) as staging:
+            staging_path = Path(staging.name)
+            for record in records:
+                staging.write(json.dumps(record, ensure_ascii=False))
+                staging.write("\n")
+        try:
+            yield staging_path
+        finally:
+            staging_path.unlink(missing_ok=True)
+
+    def _read_json_sql(self, staging_path: Path) -> str:
+        columns = {"id": self._id_type or "VARCHAR", **self._columns}
+        return (
+            f"read_json({_sql_string(str(staging_path))}, "
+            f"format='newline_delimited', columns={_columns_literal(columns)})"
+        )
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self._connection.close()
+
+    def _check_id(self, value: Any) -> None:
+        identity = canonical_batch_id(value, source="Parquet output id")
+        id_type = "BIGINT" if isinstance(identity, int) else "VARCHAR"
+        if self._id_type is None:
+            self._id_type = id_type
+        elif id_type != self._id_type:
+            raise ValueError(
+                "Parquet output stores ids in one typed column, but this run mixes integer "
+                "and string ids; use JSONL output or an --id-field with one id type."
+            )
+
+
+def parquet_part_paths(path: Path) -> list[Path]:
+    if path.is_file():
+        return [path]
+    if not path.is_dir():
+        return []
+    return sorted(path.glob(PARQUET_PART_GLOB))
+
+
+def iter_parquet_output_rows(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield records from parquet batch output in write order, a batch at a time."""
+    parts = parquet_part_paths(path)
+    if not parts:
+        return
+    connection = duckdb_module().connect()
+    try:
+        cursor = connection.execute(f"SELECT to_json(t) FROM {_read_parts_sql(parts)} AS t")
+        while batch := cursor.fetchmany(_READ_BATCH_ROWS):
+            for (payload,) in batch:
+                yield json.loads(payload)
+    finally:
+        connection.close()
+
+
+def count_parquet_output_rows(path: Path) -> int:
+    parts = parquet_part_paths(path)
+    if not parts:
+        return 0
+    connection = duckdb_module().connect()
+    try:
+        row = connection.execute(f"SELECT count(*) FROM {_read_parts_sql(parts)}").fetchone()
+    finally:
+        connection.close()
+    return int(row[0]) if row is not None else 0
+
+
+def load_parquet_completed_ids(path: Path) -> set[CanonicalBatchId]:
+    """Load successful record ids from the ``id`` column of parquet output."""
+    parts = parquet_part_paths(path)
+    if not parts:
+        return set()
+    connection = duckdb_module().connect()
+    try:
+        rows = connection.execute(
+            f"SELECT id FROM {_read_parts_sql(parts)} WHERE ok IS TRUE"
+        ).fetchall()
+    finally:
+        connection.close()
+    return {canonical_batch_id(value, source="Existing parquet output id") for (value,) in rows}
+
+
+def _prepare_dataset(path: Path, *, append: bool) -> list[Path]:
+    if path.is_file():
+        if append:
+            raise ValueError(
+                f"Parquet output {path} is a single file; resuming needs the part "
+                "directory written by fast-agent batch."
+            )
+        path.unlink()
+    path.mkdir(parents=True, exist_ok=True)
+    existing = sorted(path.glob(PARQUET_PART_GLOB))
+    if not append:
+        for part in existing:
+            part.unlink()
+        existing = []
+    for stale in path.glob(".part-*"):
+        stale.unlink(missing_ok=True)
+    return existing
+
+
+def _next_part_index(parts: list[Path]) -> int:
+    indexes = [int(suffix) for part in parts if (suffix := part.stem[5:]).isdigit()]
+    return max(indexes, default=-1) + 1
+
+
+def _existing_id_type(connection: Any, parts: list[Path]) -> str | None:
+    row = connection.execute(
+        f"SELECT typeof(id) FROM {_read_parts_sql(parts)} WHERE id IS NOT NULL LIMIT 1"
+    ).fetchone()
+    if row is None:
+        return None
+    return "BIGINT" if row[0] in {"BIGINT", "INTEGER", "HUGEINT"} else "VARCHAR"
+
+
+def _read_parts_sql(parts: list[Path]) -> str:
+    sources = ", ".join(_sql_string(os.fspath(part)) for part in parts)
+    return f"read_parquet([{sources}], union_by_name=true)"
+
+
+def _columns_literal(columns: Mapping[str, str]) -> str:
+    entries = ", ".join(
+        f"{_sql_string(name)}: {_sql_string(kind)}" for name, kind in columns.items()
+    )
+    return "{" + entries + "}"
+
+
+def _quote_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _sql_string(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
@@ -26,6 +26,11 @@ def canonical_batch_id(value: Any, *, source: str) -> CanonicalBatchId:
 
 def load_completed_ids(path: Path) -> set[CanonicalBatchId]:
     """Load IDs for existing successful output records."""
+    from fast_agent.batch.parquet import is_parquet_output_path, load_parquet_completed_ids
+
+    if is_parquet_output_path(path):
+        return load_parquet_completed_ids(path)
+
     completed: set[CanonicalBatchId] = set()
     if not path.exists():
         return completed
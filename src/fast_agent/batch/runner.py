@@ -7,20 +7,28 @@ import subprocess
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 from fast_agent.batch.monitoring import BatchTrackioOptions
+from fast_agent.batch.output import BatchOutputRows
 from fast_agent.batch.structured import StructuredBatchOptions, run_parallel_structured_batch
 from fast_agent.utils.text import strip_to_none
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 BatchBackend = Literal["harness", "process"]
 
 
 @dataclass(frozen=True)
 class BatchRunResult:
-    """Inspectable result from a batch run."""
+    """Inspectable result from a batch run.
+
+    ``rows`` reads the output lazily: iterating it streams records from the
+    JSONL file or parquet dataset rather than holding the whole run in memory.
+    """
 
-    rows: list[dict[str, Any]]
+    rows: Sequence[dict[str, Any]]
     output_path: Path
     summary: dict[str, Any]
     telemetry_path: Path | None
@@ -72,6 +80,10 @@ class BatchRunner:
         sample: int | None = None,
         seed: int | None = None,
         max_errors: int | None = None,
+        cache_path: str | Path | None = None,
+        cache_ttl: int | None = None,
+        cache_max_mb: int | None = None,
+        cache_only: bool = False,
         progress: bool = False,
         trackio_project: str | None = None,
         trackio_name: str | None = None,
@@ -85,6 +97,7 @@ class BatchRunner:
         summary_output = Path(summary_path) if summary_path is not None else None
         telemetry_output = Path(telemetry_path) if telemetry_path is not None else None
         error_output = Path(error_output_path) if error_output_path is not None else None
+        cache_output = Path(cache_path) if cache_path is not None else None
         if self.backend == "process":
             return self._run_process(
                 input=input,
@@ -110,6 +123,10 @@ class BatchRunner:
                 sample=sample,
                 seed=seed,
                 max_errors=max_errors,
+                cache_path=cache_output,
+                cache_ttl=cache_ttl,
+                cache_max_mb=cache_max_mb,
+                cache_only=cache_only,
                 progress=progress,
                 trackio_project=trackio_project,
                 trackio_name=trackio_name,
@@ -148,6 +165,10 @@ class BatchRunner:
             overwrite=overwrite,
             id_field=id_field,
             max_errors=max_errors,
+            response_cache_path=cache_output,
+            response_cache_ttl_seconds=cache_ttl,
+            response_cache_max_mb=cache_max_mb,
+            cache_only=cache_only,
             error_output_path=error_output,
             telemetry_output_path=telemetry_output,
             summary_output_path=summary_output,
@@ -161,7 +182,7 @@ class BatchRunner:
         )
         summary = await run_parallel_structured_batch(options)
         return BatchRunResult(
-            rows=_read_jsonl(output),
+            rows=BatchOutputRows(output),
             output_path=output,
             summary=summary,
             telemetry_path=telemetry_output,
@@ -195,6 +216,10 @@ class BatchRunner:
         sample: int | None,
         seed: int | None,
         max_errors: int | None,
+        cache_path: Path | None,
+        cache_ttl: int | None,
+        cache_max_mb: int | None,
+        cache_only: bool,
         progress: bool,
         trackio_project: str | None,
         trackio_name: str | None,
@@ -223,6 +248,9 @@ class BatchRunner:
         _extend_optional(command, "--sample", sample)
         _extend_optional(command, "--seed", seed)
         _extend_optional(command, "--max-errors", max_errors)
+        _extend_optional(command, "--cache", cache_path)
+        _extend_optional(command, "--cache-ttl", cache_ttl)
+        _extend_optional(command, "--cache-max-mb", cache_max_mb)
         _extend_optional(command, "--summary-output", summary_path)
         _extend_optional(command, "--telemetry-output", telemetry_output)
         _extend_optional(command, "--error-output", error_output)
@@ -238,6 +266,8 @@ class BatchRunner:
             command.append("--overwrite")
         if resume:
             command.append("--resume")
+        if cache_only:
+            command.append("--cache-only")
         if not progress:
             command.append("--no-progress")
         command.append("--no-final-summary")
@@ -267,7 +297,7 @@ class BatchRunner:
             )
         summary = json.loads(summary_path.read_text(encoding="utf-8"))
         return BatchRunResult(
-            rows=_read_jsonl(output),
+            rows=BatchOutputRows(output),
             output_path=output,
             summary=summary,
             telemetry_path=telemetry_output,
@@ -276,19 +306,6 @@ class BatchRunner:
         )
 
 
-def _read_jsonl(path: Path) -> list[dict[str, Any]]:
-    rows: list[dict[str, Any]] = []
-    if not path.exists():
-        return rows
-    for line in path.read_text(encoding="utf-8").splitlines():
-        if not line.strip():
-            continue
-        payload = json.loads(line)
-        if isinstance(payload, dict):
-            rows.append(payload)
-    return rows
-
-
 def _extend_optional(command: list[str], option: str, value: str | int | Path | None) -> None:
     if value is not None:
         command.extend([option, str(value)])
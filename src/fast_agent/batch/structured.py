@@ -9,14 +9,16 @@ import sys
 import time
 import uuid
 from collections.abc import Mapping
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass, replace
 from dataclasses import field as dataclass_field
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, TextIO, TypeAlias, cast
+from typing import TYPE_CHECKING, Any, TypeAlias, cast
 
 from pydantic import BaseModel
 
+from fast_agent.batch.cache import BatchResponseCache, ResponseCacheStats, response_cache_key
 from fast_agent.batch.input import (
     RowCandidate,
     RowError,
@@ -35,8 +37,16 @@ from fast_agent.batch.monitoring import (
 from fast_agent.batch.output import (
     ensure_parent,
     error_envelope,
+    iter_output_rows,
+    open_record_writer,
     success_envelope,
-    write_jsonl_record,
+)
+from fast_agent.batch.parquet import (
+    TELEMETRY_COLUMNS,
+    ParquetRecordWriter,
+    duckdb_module,
+    envelope_columns,
+    is_parquet_output_path,
 )
 from fast_agent.batch.resume import canonical_batch_id, load_completed_ids
 from fast_agent.batch.summary import BatchSummary
@@ -54,15 +64,21 @@ from fast_agent.llm.structured_schema import (
 )
 from fast_agent.llm.usage_tracking import UsageReport
 from fast_agent.mcp.helpers.content_helpers import get_text
-from fast_agent.session.trace_export_errors import SessionExportUploadError
+from fast_agent.session.trace_export_errors import (
+    SessionExportOptionsError,
+    SessionExportUploadError,
+)
+from fast_agent.session.trace_export_stream import zstd_module
 from fast_agent.utils.numeric import nonnegative_int_or_none, positive_int_or_none
 from fast_agent.utils.text import strip_to_none
 
 DEFAULT_CHUNKS_PER_WORKER = 8
 
 if TYPE_CHECKING:
+    from fast_agent.batch.output import RecordWriter
     from fast_agent.core.fastagent import FastAgent
     from fast_agent.interfaces import AgentProtocol
+    from fast_agent.session.trace_export_models import TraceCompression
 
 
 @dataclass(frozen=True)
@@ -94,6 +110,12 @@ class StructuredBatchOptions:
     agent_card_source: str | None = None
     agent_name: str | None = None
     export_traces_path: Path | None = None
+    trace_compression: TraceCompression | None = None
+    hash_trace_attachments: bool = False
+    response_cache_path: Path | None = None
+    response_cache_ttl_seconds: int | None = None
+    response_cache_max_mb: int | None = None
+    cache_only: bool = False
     hf_dataset: str | None = None
     hf_dataset_path: str | None = None
     parallel: int | None = None
@@ -315,8 +337,28 @@ class PreparedBatchRow:
     error: RowError | None
 
 
+@dataclass(frozen=True, slots=True)
+class _RowResponseCache:
+    cache: BatchResponseCache
+    identity: dict[str, Any]
+
+
 LoadedSchemaSource: TypeAlias = StructuredSchemaSource
 
+# Request settings that do not change what the model is asked to produce.
+_UNCACHED_REQUEST_FIELDS = {
+    "messages",
+    "use_history",
+    "tool_execution_handler",
+    "batch_context",
+    "emit_loop_progress",
+    "streaming_timeout",
+    "mcp_metadata",
+    # The resolved system prompt embeds the date, cwd and client name; the
+    # instruction template is keyed instead.
+    "system_prompt",
+}
+
 
 def utc_now_iso() -> str:
     return datetime.now(UTC).replace(microsecond=0).isoformat().replace("+00:00", "Z")
@@ -355,8 +397,39 @@ def _validate_structured_batch_options(options: StructuredBatchOptions) -> None:
         raise ValueError("--hf-dataset-path requires --hf-dataset")
     if options.hf_dataset is not None and options.export_traces_path is None:
         raise ValueError("--hf-dataset requires --export-traces")
+    if options.export_traces_path is None:
+        if options.trace_compression is not None:
+            raise ValueError("--trace-zstd requires --export-traces")
+        if options.hash_trace_attachments:
+            raise ValueError("--trace-hash-attachments requires --export-traces")
+    if options.trace_compression == "zstd":
+        try:
+            zstd_module()
+        except SessionExportOptionsError as exc:
+            raise ValueError(str(exc)) from exc
     if options.sql is not None:
         _validate_sql_options(options)
+    _validate_response_cache_options(options)
+    if any(
+        path is not None and is_parquet_output_path(path)
+        for path in (options.output_path, options.error_output_path, options.telemetry_output_path)
+    ):
+        duckdb_module()
+
+
+def _validate_response_cache_options(options: StructuredBatchOptions) -> None:
+    if options.response_cache_path is None:
+        if options.response_cache_ttl_seconds is not None:
+            raise ValueError("--cache-ttl requires --cache")
+        if options.response_cache_max_mb is not None:
+            raise ValueError("--cache-max-mb requires --cache")
+        if options.cache_only:
+            raise ValueError("--cache-only requires --cache")
+        return
+    if options.response_cache_ttl_seconds is not None and options.response_cache_ttl_seconds < 1:
+        raise ValueError("--cache-ttl must be greater than zero")
+    if options.response_cache_max_mb is not None and options.response_cache_max_mb < 1:
+        raise ValueError("--cache-max-mb must be greater than zero")
 
 
 def _validate_sql_options(options: StructuredBatchOptions) -> None:
@@ -433,15 +506,15 @@ def _extract_usage(response: Any) -> dict[str, Any] | None:
 
 
 def _write_optional_failure(
-    error_handle: TextIO | None,
+    error_writer: RecordWriter | None,
     record: dict[str, Any],
 ) -> None:
-    if error_handle is not None:
-        write_jsonl_record(error_handle, record)
+    if error_writer is not None:
+        error_writer.write(record)
 
 
 def _write_optional_telemetry(
-    telemetry_handle: TextIO | None,
+    telemetry_writer: RecordWriter | None,
     *,
     identity: str | int,
     row_number: int,
@@ -449,10 +522,9 @@ def _write_optional_telemetry(
     timing: dict[str, Any] | None,
     usage: dict[str, Any] | None = None,
 ) -> None:
-    if telemetry_handle is None:
+    if telemetry_writer is None:
         return
-    write_jsonl_record(
-        telemetry_handle,
+    telemetry_writer.write(
         {
             "id": identity,
             "row_number": row_number,
@@ -585,6 +657,7 @@ def _reject_duplicate_output_paths(options: StructuredBatchOptions) -> None:
         "--error-output": options.error_output_path,
         "--telemetry-output": options.telemetry_output_path,
         "--summary-output": options.summary_output_path,
+        "--cache": options.response_cache_path,
     }
     resolved_paths: dict[Path, str] = {}
     for label, path in configured_paths.items():
@@ -633,15 +706,36 @@ def _batch_summary_metadata(
         "shell_runtime": options.shell_runtime,
         "output_mode": "structured" if schema_source is not None else "text",
         "export_traces": str(options.export_traces_path) if options.export_traces_path else None,
+        "trace_compression": options.trace_compression,
+        "hash_trace_attachments": options.hash_trace_attachments,
         "hf_dataset": options.hf_dataset,
         "hf_dataset_path": options.hf_dataset_path,
     }
 
 
-def _output_mode(options: StructuredBatchOptions) -> str:
-    if options.overwrite:
-        return "w"
-    return "a" if options.resume else "w"
+def _append_output(options: StructuredBatchOptions) -> bool:
+    return options.resume and not options.overwrite
+
+
+def _result_json_schema(schema_source: LoadedSchemaSource | None) -> dict[str, Any] | None:
+    if isinstance(schema_source, type) and issubclass(schema_source, BaseModel):
+        return schema_source.model_json_schema()
+    return schema_source
+
+
+def _output_columns(
+    options: StructuredBatchOptions,
+    schema_source: LoadedSchemaSource | None,
+) -> dict[str, str]:
+    return envelope_columns(
+        _result_json_schema(schema_source),
+        include_input=options.include_input,
+        include_cached=options.response_cache_path is not None,
+    )
+
+
+def _cached_marker(options: StructuredBatchOptions, cached: bool) -> bool | None:
+    return cached if options.response_cache_path is not None else None
 
 
 def _prepare_batch_row(
@@ -674,9 +768,9 @@ def _prepare_batch_row(
 def _record_batch_failure(
     *,
     options: StructuredBatchOptions,
-    output_handle: TextIO,
-    error_handle: TextIO | None,
-    telemetry_handle: TextIO | None,
+    output_writer: RecordWriter,
+    error_writer: RecordWriter | None,
+    telemetry_writer: RecordWriter | None,
     summary: BatchSummary,
     monitor: BatchMonitor,
     trace_recorder: BatchTraceRecorder | None,
@@ -693,11 +787,12 @@ def _record_batch_failure(
         error=error,
         row=prepared.row,
         include_input=options.include_input,
+        cached=_cached_marker(options, False),
     )
-    write_jsonl_record(output_handle, record)
-    _write_optional_failure(error_handle, record)
+    output_writer.write(record)
+    _write_optional_failure(error_writer, record)
     _write_optional_telemetry(
-        telemetry_handle,
+        telemetry_writer,
         identity=prepared.identity,
         row_number=prepared.row_number,
         ok=False,
@@ -748,8 +843,8 @@ def _record_trace_failure(
 def _record_batch_success(
     *,
     options: StructuredBatchOptions,
-    output_handle: TextIO,
-    telemetry_handle: TextIO | None,
+    output_writer: RecordWriter,
+    telemetry_writer: RecordWriter | None,
     summary: BatchSummary,
     monitor: BatchMonitor,
     trace_recorder: BatchTraceRecorder | None,
@@ -758,6 +853,7 @@ def _record_batch_success(
     response: Any,
     timing: dict[str, Any] | None,
     usage: dict[str, Any] | None,
+    cached: bool = False,
 ) -> None:
     record = success_envelope(
         identity=prepared.identity,
@@ -765,10 +861,11 @@ def _record_batch_success(
         result=_json_result(parsed),
         row=prepared.row,
         include_input=options.include_input,
+        cached=_cached_marker(options, cached),
     )
-    write_jsonl_record(output_handle, record)
+    output_writer.write(record)
     _write_optional_telemetry(
-        telemetry_handle,
+        telemetry_writer,
         identity=prepared.identity,
         row_number=prepared.row_number,
         ok=True,
@@ -779,7 +876,15 @@ def _record_batch_success(
     summary.add_usage(usage)
     _emit_row_progress(options, summary)
     monitor.row(summary)
-    if trace_recorder is not None:
+    if trace_recorder is None:
+        return
+    if cached:
+        trace_recorder.record_row_without_trace(
+            row_number=prepared.row_number,
+            identity=prepared.identity,
+            ok=True,
+        )
+    else:
         trace_recorder.finish_row(ok=True, response=response)
 
 
@@ -813,19 +918,20 @@ async def _process_prepared_batch_row(
     prepared: PreparedBatchRow,
     schema_source: LoadedSchemaSource | None,
     options: StructuredBatchOptions,
-    output_handle: TextIO,
-    error_handle: TextIO | None,
-    telemetry_handle: TextIO | None,
+    output_writer: RecordWriter,
+    error_writer: RecordWriter | None,
+    telemetry_writer: RecordWriter | None,
     summary: BatchSummary,
     monitor: BatchMonitor,
     trace_recorder: BatchTraceRecorder | None,
+    response_cache: _RowResponseCache | None = None,
 ) -> None:
     if prepared.error is not None:
         _record_batch_failure(
             options=options,
-            output_handle=output_handle,
-            error_handle=error_handle,
-            telemetry_handle=telemetry_handle,
+            output_writer=output_writer,
+            error_writer=error_writer,
+            telemetry_writer=telemetry_writer,
             summary=summary,
             monitor=monitor,
             trace_recorder=trace_recorder,
@@ -835,6 +941,43 @@ async def _process_prepared_batch_row(
         return
 
     assert prepared.rendered is not None
+    cache_key = None
+    if response_cache is not None:
+        cache_key = response_cache_key(response_cache.identity, prepared.rendered)
+        cached = response_cache.cache.get(cache_key)
+        if cached is not None:
+            _record_batch_success(
+                options=options,
+                output_writer=output_writer,
+                telemetry_writer=telemetry_writer,
+                summary=summary,
+                monitor=monitor,
+                trace_recorder=trace_recorder,
+                prepared=prepared,
+                parsed=cached.result,
+                response=None,
+                timing=None,
+                usage=None,
+                cached=True,
+            )
+            return
+        if options.cache_only:
+            _record_batch_failure(
+                options=options,
+                output_writer=output_writer,
+                error_writer=error_writer,
+                telemetry_writer=telemetry_writer,
+                summary=summary,
+                monitor=monitor,
+                trace_recorder=trace_recorder,
+                prepared=prepared,
+                error=RowError(
+                    "CacheMiss",
+                    "No cached response for this row; --cache-only does not call the model.",
+                ),
+            )
+            return
+
     if trace_recorder is not None:
         trace_recorder.start_row(
             row_number=prepared.row_number,
@@ -854,9 +997,9 @@ async def _process_prepared_batch_row(
     except Exception as exc:
         _record_batch_failure(
             options=options,
-            output_handle=output_handle,
-            error_handle=error_handle,
-            telemetry_handle=telemetry_handle,
+            output_writer=output_writer,
+            error_writer=error_writer,
+            telemetry_writer=telemetry_writer,
             summary=summary,
             monitor=monitor,
             trace_recorder=trace_recorder,
@@ -872,9 +1015,9 @@ async def _process_prepared_batch_row(
     if parsed is None:
         _record_batch_failure(
             options=options,
-            output_handle=output_handle,
-            error_handle=error_handle,
-            telemetry_handle=telemetry_handle,
+            output_writer=output_writer,
+            error_writer=error_writer,
+            telemetry_writer=telemetry_writer,
             summary=summary,
             monitor=monitor,
             trace_recorder=trace_recorder,
@@ -890,10 +1033,12 @@ async def _process_prepared_batch_row(
         )
         return
 
+    if response_cache is not None and cache_key is not None:
+        response_cache.cache.put(cache_key, _json_result(parsed))
     _record_batch_success(
         options=options,
-        output_handle=output_handle,
-        telemetry_handle=telemetry_handle,
+        output_writer=output_writer,
+        telemetry_writer=telemetry_writer,
         summary=summary,
         monitor=monitor,
         trace_recorder=trace_recorder,
@@ -1031,17 +1176,28 @@ async def _process_batch_selection(
     summary: BatchSummary,
     monitor: BatchMonitor,
 ) -> None:
-    output_mode = _output_mode(options)
+    columns = _output_columns(options, schema_source)
     trace_recorder = _configure_trace_recorder(worker, options, summary.metadata)
     with (
-        options.output_path.open(output_mode, encoding="utf-8") as output_handle,
-        _optional_jsonl_handle(
-            options.error_output_path, "a" if options.resume else "w"
-        ) as error_handle,
-        _optional_jsonl_handle(
-            options.telemetry_output_path, "a" if options.resume else "w"
-        ) as telemetry_handle,
+        _optional_response_cache(options) as cache,
+        open_record_writer(
+            options.output_path, append=_append_output(options), columns=columns
+        ) as output_writer,
+        _optional_record_writer(
+            options.error_output_path, append=options.resume, columns=columns
+        ) as error_writer,
+        _optional_record_writer(
+            options.telemetry_output_path, append=options.resume, columns=TELEMETRY_COLUMNS
+        ) as telemetry_writer,
     ):
+        response_cache = (
+            _RowResponseCache(
+                cache=cache,
+                identity=_response_cache_identity(worker, options, schema_source),
+            )
+            if cache is not None
+            else None
+        )
         for candidate in selected:
             if _max_errors_reached(summary.failed_rows, options.max_errors):
                 break
@@ -1059,16 +1215,21 @@ async def _process_batch_selection(
                 prepared=prepared,
                 schema_source=schema_source,
                 options=options,
-                output_handle=cast("TextIO", output_handle),
-                error_handle=error_handle,
-                telemetry_handle=telemetry_handle,
+                output_writer=output_writer,
+                error_writer=error_writer,
+                telemetry_writer=telemetry_writer,
                 summary=summary,
                 monitor=monitor,
                 trace_recorder=trace_recorder,
+                response_cache=response_cache,
             )
             if _max_errors_reached(summary.failed_rows, options.max_errors):
                 break
 
+        if cache is not None:
+            cache.evict()
+            summary.response_cache = cache.summary()
+
     _finalize_trace_export(
         options=options,
         summary=summary,
@@ -1185,15 +1346,22 @@ async def _run_parallel_structured_batch_started(
         raise
 
     _emit_progress(options, f"merging {len(chunks)} chunks into {options.output_path}")
-    _merge_jsonl_chunks([chunk.output_path for chunk in chunks], options.output_path, work_dir)
+    columns = _output_columns(options, load_schema_source(options))
+    _merge_chunk_outputs(
+        [chunk.output_path for chunk in chunks],
+        options.output_path,
+        work_dir,
+        columns=columns,
+    )
     if options.error_output_path is not None:
-        _merge_jsonl_chunks(
+        _merge_chunk_outputs(
             [chunk.error_output_path for chunk in chunks if chunk.error_output_path is not None],
             options.error_output_path,
             work_dir,
+            columns=columns,
         )
     if options.telemetry_output_path is not None:
-        _merge_jsonl_chunks(
+        _merge_chunk_outputs(
             [
                 chunk.telemetry_output_path
                 for chunk in chunks
@@ -1201,6 +1369,7 @@ async def _run_parallel_structured_batch_started(
             ],
             options.telemetry_output_path,
             work_dir,
+            columns=TELEMETRY_COLUMNS,
         )
 
     payload = _merge_parallel_summaries(
@@ -1638,18 +1807,41 @@ def _input_source_identity(source: str | Path) -> str:
     return str(Path(source_text).expanduser().resolve())
 
 
-def _merge_jsonl_chunks(source_paths: list[Path], output_path: Path, work_dir: Path) -> None:
+def _merge_chunk_outputs(
+    source_paths: list[Path],
+    output_path: Path,
+    work_dir: Path,
+    *,
+    columns: Mapping[str, str],
+) -> None:
     ensure_parent(output_path)
+    for source_path in source_paths:
+        if not source_path.exists():
+            raise ValueError(f"Chunk output missing: {source_path}")
     tmp_path = work_dir / f"{output_path.name}.tmp"
+    if is_parquet_output_path(output_path):
+        # Chunks are always JSONL; re-encode them into one typed parquet dataset.
+        with ParquetRecordWriter(tmp_path, columns, append=False) as writer:
+            for source_path in source_paths:
+                for record in iter_output_rows(source_path):
+                    writer.write(record)
+        _remove_output(output_path)
+        shutil.move(tmp_path, output_path)
+        return
     with tmp_path.open("w", encoding="utf-8") as output_handle:
         for source_path in source_paths:
-            if not source_path.exists():
-                raise ValueError(f"Chunk output missing: {source_path}")
             with source_path.open("r", encoding="utf-8") as input_handle:
                 shutil.copyfileobj(input_handle, output_handle)
     tmp_path.replace(output_path)
 
 
+def _remove_output(path: Path) -> None:
+    if path.is_dir():
+        shutil.rmtree(path)
+    else:
+        path.unlink(missing_ok=True)
+
+
 def _merge_parallel_summaries(
     *,
     options: StructuredBatchOptions,
@@ -1706,6 +1898,8 @@ def _merge_parallel_summaries(
             for chunk in chunks
         ],
     }
+    if options.response_cache_path is not None:
+        payload["response_cache"] = _merge_response_cache_summaries(options, chunk_summaries)
     return payload
 
 
@@ -1763,7 +1957,8 @@ def _write_empty_parallel_outputs(options: StructuredBatchOptions) -> None:
     for path in (options.output_path, options.error_output_path, options.telemetry_output_path):
         if path is not None:
             ensure_parent(path)
-            path.write_text("", encoding="utf-8")
+            with open_record_writer(path, append=False, columns={}):
+                pass
 
 
 def _write_parallel_summary(options: StructuredBatchOptions, payload: dict[str, Any]) -> None:
@@ -1834,6 +2029,8 @@ def _configure_trace_recorder(
         export_traces_path=options.export_traces_path,
         hf_dataset=options.hf_dataset,
         hf_dataset_path=options.hf_dataset_path,
+        compression=options.trace_compression,
+        hash_attachments=options.hash_trace_attachments,
     )
     if trace_options.export_traces_path is None:
         return None
@@ -1841,6 +2038,8 @@ def _configure_trace_recorder(
         trace_dir=trace_options.export_traces_path,
         agent=worker,
         run_metadata=metadata,
+        compression=trace_options.compression,
+        hash_attachments=trace_options.hash_attachments,
     )
     recorder.initialize(resume=options.resume)
     recorder.install_hook()
@@ -1901,22 +2100,80 @@ def _json_result(parsed: Any) -> Any:
     return parsed
 
 
-def _max_errors_reached(failed_rows: int, max_errors: int | None) -> bool:
-    return max_errors is not None and failed_rows >= max_errors
+def _optional_response_cache(
+    options: StructuredBatchOptions,
+) -> AbstractContextManager[BatchResponseCache | None]:
+    if options.response_cache_path is None:
+        return nullcontext()
+    return _open_response_cache(options)
+
+
+def _open_response_cache(options: StructuredBatchOptions) -> BatchResponseCache:
+    assert options.response_cache_path is not None
+    max_mb = options.response_cache_max_mb
+    return BatchResponseCache(
+        options.response_cache_path,
+        ttl_seconds=options.response_cache_ttl_seconds,
+        max_bytes=max_mb * 1024 * 1024 if max_mb is not None else None,
+    )
+
+
+def _response_cache_identity(
+    worker: AgentProtocol,
+    options: StructuredBatchOptions,
+    schema_source: LoadedSchemaSource | None,
+) -> dict[str, Any]:
+    """Describe everything besides the row prompt that shapes a row's response."""
+    identity: dict[str, Any] = {
+        "instruction": getattr(worker.config, "instruction", None),
+        "agent_card": options.agent_card_source,
+        "agent": options.agent_name,
+        "shell_runtime": options.shell_runtime,
+        "schema": _result_json_schema(schema_source),
+        "model": options.model,
+    }
+    llm = worker.llm
+    if llm is not None:
+        identity.update(
+            {
+                "provider": str(llm.provider),
+                "model": llm.model_name,
+                "reasoning_effort": llm.reasoning_effort,
+                "text_verbosity": llm.text_verbosity,
+                "request_params": llm.default_request_params.model_dump(
+                    exclude=_UNCACHED_REQUEST_FIELDS,
+                    exclude_none=True,
+                ),
+            }
+        )
+    return identity
 
 
-class _optional_jsonl_handle:
-    def __init__(self, path: Path | None, mode: str) -> None:
-        self._path = path
-        self._mode = mode
-        self._handle: TextIO | None = None
+def _merge_response_cache_summaries(
+    options: StructuredBatchOptions,
+    summaries: list[dict[str, Any]],
+) -> dict[str, Any]:
+    counters = ResponseCacheStats().to_dict()
+    for summary in summaries:
+        chunk_cache = summary.get("response_cache")
+        if isinstance(chunk_cache, dict):
+            for key in counters:
+                counters[key] += _summary_int(chunk_cache, key)
+    with _open_response_cache(options) as cache:
+        current = cache.summary()
+    return {**current, **counters}
 
-    def __enter__(self) -> TextIO | None:
-        if self._path is None:
-            return None
-        self._handle = cast("TextIO", self._path.open(self._mode, encoding="utf-8"))
-        return self._handle
 
-    def __exit__(self, exc_type: object, exc: object, traceback: object) -> None:
-        if self._handle is not None:
-            self._handle.close()
+def _max_errors_reached(failed_rows: int, max_errors: int | None) -> bool:
+    return max_errors is not None and failed_rows >= max_errors
+
+
+def _optional_record_writer(
+    path: Path | None,
+    *,
+    append: bool,
+    columns: Mapping[str, str],
+) -> AbstractContextManager[RecordWriter | None]:
+    if path is None:
+        return nullcontext()
+    return open_record_writer(path, append=append, columns=columns)
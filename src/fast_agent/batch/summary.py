@@ -36,6 +36,7 @@ class BatchSummary:
     timing_ttft_ms: list[float] = field(default_factory=list)
     timing_time_to_response_ms: list[float] = field(default_factory=list)
     usage_totals: BatchUsageTotals = field(default_factory=BatchUsageTotals)
+    response_cache: dict[str, Any] | None = None
     started_monotonic: float = field(default_factory=time.monotonic)
 
     def add_timing(self, timing: dict[str, Any] | None) -> None:
@@ -55,7 +56,7 @@ class BatchSummary:
         self.usage_totals.add_row_usage(usage)
 
     def to_dict(self, completed_at: str) -> dict[str, Any]:
-        return {
+        payload = {
             **self.metadata,
             "started_at": self.started_at,
             "completed_at": completed_at,
@@ -73,3 +74,6 @@ class BatchSummary:
             "usage": self.usage_totals.usage_block(processed_rows=self.processed_rows),
             "cache": self.usage_totals.cache_block(),
         }
+        if self.response_cache is not None:
+            payload["response_cache"] = self.response_cache
+        return payload
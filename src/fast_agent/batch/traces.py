@@ -31,6 +31,7 @@ if TYPE_CHECKING:
     from fast_agent.agents.tool_runner import ToolRunner
     from fast_agent.interfaces import AgentProtocol
     from fast_agent.mcp.prompt_message_extended import PromptMessageExtended
+    from fast_agent.session.trace_export_models import TraceCompression
 
 
 @dataclass(frozen=True)
@@ -38,6 +39,8 @@ class BatchTraceOptions:
     export_traces_path: Path | None = None
     hf_dataset: str | None = None
     hf_dataset_path: str | None = None
+    compression: TraceCompression | None = None
+    hash_attachments: bool = False
 
 
 @dataclass(frozen=True)
@@ -65,12 +68,16 @@ class BatchTraceRecorder:
         agent: AgentProtocol,
         run_metadata: dict[str, object],
         progress_callback: Callable[[str], None] | None = None,
+        compression: TraceCompression | None = None,
+        hash_attachments: bool = False,
     ) -> None:
         self.trace_dir = trace_dir
         self.run_id = _new_run_id()
         self._agent = agent
         self._run_metadata = run_metadata
         self._progress_callback = progress_callback
+        self._compression = compression
+        self._hash_attachments = hash_attachments
         self._active: _RowTraceContext | None = None
         self._captured: list[PromptMessageExtended] | None = None
         self._manifest_path = self.trace_dir / "manifest.jsonl"
@@ -155,11 +162,17 @@ class BatchTraceRecorder:
             record_count = 0
             if messages:
                 trace_path = self._trace_path(active)
-                result = CodexTraceWriter(progress_callback=self._progress_callback).write(
+                # Rows share one attachments/ directory, so repeated images are stored once.
+                writer = CodexTraceWriter(
+                    progress_callback=self._progress_callback,
+                    compression=self._compression,
+                    hash_attachments=self._hash_attachments,
+                )
+                result = writer.write(
                     self._resolved_export(active, messages, trace_path.name),
                     trace_path,
                 )
-                trace_relpath = trace_path.name
+                trace_relpath = result.output_path.name
                 record_count = result.record_count
 
             self._write_manifest(
@@ -671,25 +671,20 @@ def check_card_pack_updates(
         return []
 
     owners = _collect_installed_file_owners(destination_root)
-    updates: list[CardPackUpdateInfo] = []
     head_cache: CardPackHeadCache = {}
     path_cache: CardPackPathCache = {}
 
-    index = 0
-    for pack_dir in sorted(destination_root.iterdir()):
-        if not pack_dir.is_dir():
-            continue
-        index += 1
-        update = _evaluate_card_pack_update(
-            pack_dir=pack_dir,
-            index=index,
+    pack_dirs = [entry for entry in sorted(destination_root.iterdir()) if entry.is_dir()]
+    return marketplace_update_status.evaluate_updates_concurrently(
+        list(enumerate(pack_dirs, start=1)),
+        lambda entry: _evaluate_card_pack_update(
+            pack_dir=entry[1],
+            index=entry[0],
             owners=owners,
             head_cache=head_cache,
             path_cache=path_cache,
-        )
-        updates.append(update)
-
-    return updates
+        ),
+    )
 
 
 def select_card_pack_updates(
@@ -715,16 +710,18 @@ def apply_card_pack_updates(
     path_cache: CardPackPathCache = {}
 
     results: list[CardPackUpdateInfo] = []
-
-    for update in updates:
-        refreshed = _evaluate_card_pack_update(
+    refreshed_updates = marketplace_update_status.evaluate_updates_concurrently(
+        updates,
+        lambda update: _evaluate_card_pack_update(
             pack_dir=update.pack_dir,
             index=update.index,
             owners=owners,
             head_cache=head_cache,
             path_cache=path_cache,
-        )
+        ),
+    )
 
+    for refreshed in refreshed_updates:
         if not is_update_applicable(refreshed.status):
             results.append(refreshed)
             continue
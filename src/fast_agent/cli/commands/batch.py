@@ -333,6 +333,12 @@ def _build_structured_batch_options(
     telemetry_output_path: Path | None,
     summary_output_path: Path | None,
     export_traces_path: Path | None,
+    trace_zstd: bool,
+    trace_hash_attachments: bool,
+    response_cache_path: Path | None,
+    cache_ttl: int | None,
+    cache_max_mb: int | None,
+    cache_only: bool,
     hf_dataset: str | None,
     hf_dataset_path: str | None,
     parallel: int | None,
@@ -388,6 +394,12 @@ def _build_structured_batch_options(
         telemetry_output_path=telemetry_output_path,
         summary_output_path=summary_output_path,
         export_traces_path=export_traces_path,
+        trace_compression="zstd" if trace_zstd else None,
+        hash_trace_attachments=trace_hash_attachments,
+        response_cache_path=response_cache_path,
+        response_cache_ttl_seconds=cache_ttl,
+        response_cache_max_mb=cache_max_mb,
+        cache_only=cache_only,
         hf_dataset=hf_dataset,
         hf_dataset_path=hf_dataset_path,
         parallel=parallel,
@@ -472,7 +484,9 @@ def run(
         "-p",
         help="Inline row prompt template; mutually exclusive with --template",
     ),
-    output_path: Path = typer.Option(..., "--output", "-o", help="Output JSONL file"),
+    output_path: Path = typer.Option(
+        ..., "--output", "-o", help="Output .jsonl file or .parquet dataset"
+    ),
     schema_source: str | None = typer.Option(
         None,
         "--json-schema",
@@ -544,12 +558,12 @@ def run(
     error_output_path: Path | None = typer.Option(
         None,
         "--error-output",
-        help="Additional JSONL file containing failed envelopes",
+        help="Additional .jsonl or .parquet output containing failed envelopes",
     ),
     telemetry_output_path: Path | None = typer.Option(
         None,
         "--telemetry-output",
-        help="JSONL file containing per-attempt normalized telemetry",
+        help=".jsonl or .parquet output containing per-attempt normalized telemetry",
     ),
     summary_output_path: Path | None = typer.Option(
         None,
@@ -561,6 +575,36 @@ def run(
         "--export-traces",
         help="Directory for per-row Codex trace JSONL files and manifest.jsonl",
     ),
+    trace_zstd: bool = typer.Option(
+        False,
+        "--trace-zstd",
+        help="Compress exported per-row traces with zstd",
+    ),
+    trace_hash_attachments: bool = typer.Option(
+        False,
+        "--trace-hash-attachments",
+        help="Store trace images and files once under attachments/ and reference them by hash",
+    ),
+    response_cache_path: Path | None = typer.Option(
+        None,
+        "--cache",
+        help="SQLite response cache; rows with a cached result skip the model",
+    ),
+    cache_ttl: int | None = typer.Option(
+        None,
+        "--cache-ttl",
+        help="Expire cached responses after this many seconds",
+    ),
+    cache_max_mb: int | None = typer.Option(
+        None,
+        "--cache-max-mb",
+        help="Evict least recently used cached responses beyond this size",
+    ),
+    cache_only: bool = typer.Option(
+        False,
+        "--cache-only",
+        help="Dry run from --cache; uncached rows fail without calling the model",
+    ),
     hf_dataset: str | None = typer.Option(
         None,
         "--hf-dataset",
@@ -720,6 +764,12 @@ def run(
         telemetry_output_path=telemetry_output_path,
         summary_output_path=summary_output_path,
         export_traces_path=export_traces_path,
+        trace_zstd=trace_zstd,
+        trace_hash_attachments=trace_hash_attachments,
+        response_cache_path=response_cache_path,
+        cache_ttl=cache_ttl,
+        cache_max_mb=cache_max_mb,
+        cache_only=cache_only,
         hf_dataset=hf_dataset,
         hf_dataset_path=hf_dataset_path,
         parallel=parallel,
@@ -6,6 +6,7 @@ import platform
 import sys
 from collections.abc import Iterable, Sequence
 from dataclasses import asdict, dataclass
+from datetime import datetime
 from importlib.metadata import version
 from itertools import zip_longest
 from pathlib import Path
@@ -28,6 +29,7 @@ from fast_agent.core.agent_card_validation import AgentCardScanResult, scan_agen
 from fast_agent.core.exceptions import ModelConfigError
 from fast_agent.core.keyring_utils import KeyringStatus, get_keyring_status
 from fast_agent.core.logging.logger import get_logger
+from fast_agent.core.startup_timings import load_startup_timings, startup_timings_path
 from fast_agent.home import discover_config_files, resolve_fast_agent_home
 from fast_agent.llm.model_factory import ModelFactory
 from fast_agent.llm.model_overlays import ModelOverlayRegistry, load_model_overlay_registry
@@ -40,7 +42,7 @@ from fast_agent.skills import SkillManifest, SkillRegistry
 from fast_agent.ui.a3_headers import build_a3_section_header
 from fast_agent.ui.console import console
 from fast_agent.utils.async_utils import run_coroutine
-from fast_agent.utils.count_display import plural_label
+from fast_agent.utils.count_display import format_count, plural_label
 from fast_agent.utils.huggingface_hub import is_huggingface_hub_logged_in
 from fast_agent.utils.name_normalization import normalize_provider_key
 from fast_agent.utils.text import strip_str_to_none, strip_to_none
@@ -2184,6 +2186,42 @@ def _render_agent_card_panel(context: _CheckSummaryContext) -> None:
         console.print("[dim]No local AgentCard directories found in the fast-agent home.[/dim]")
 
 
+def _render_startup_timings_panel(context: _CheckSummaryContext) -> None:
+    timings = load_startup_timings(startup_timings_path(context.home_paths.root))
+    if timings is None or not timings.agents:
+        return
+
+    _print_section_header("Last Startup", color="blue")
+    recorded = datetime.fromtimestamp(timings.recorded_at).strftime("%Y-%m-%d %H:%M:%S")
+    console.print(
+        f"Built {format_count(len(timings.agents), 'agent')} in "
+        f"[green]{timings.total_seconds:.2f}s[/green] "
+        f"[dim](up to {timings.concurrency} at once, recorded {recorded})[/dim]"
+    )
+
+    level_seconds = timings.level_seconds()
+    timings_table = Table(show_header=True, box=None)
+    timings_table.add_column("Level", style="dim", header_style="bold bright_white")
+    timings_table.add_column("Agent", style="cyan", header_style="bold bright_white")
+    timings_table.add_column("Type", style="white", header_style="bold bright_white")
+    timings_table.add_column(
+        "Start", style="dim", justify="right", header_style="bold bright_white"
+    )
+    timings_table.add_column(
+        "Time", style="green", justify="right", header_style="bold bright_white"
+    )
+    for timing in timings.agents:
+        slowest = timing.seconds >= level_seconds.get(timing.level, 0.0) - 1e-9
+        timings_table.add_row(
+            str(timing.level),
+            timing.name,
+            timing.agent_type,
+            f"+{timing.started_seconds:.2f}s",
+            f"[bold]{timing.seconds:.2f}s[/bold]" if slowest else f"{timing.seconds:.2f}s",
+        )
+    console.print(timings_table)
+
+
 def _render_check_summary_guidance(context: _CheckSummaryContext) -> None:
     config_status = context.config_summary.get("status", "not_found")
     secrets_status = context.secrets_summary.get("status", "not_found")
@@ -2232,6 +2270,7 @@ def show_check_summary(home: Path | None = None) -> None:
     _render_mcp_servers_panel(context)
     _render_skills_panel(context)
     _render_agent_card_panel(context)
+    _render_startup_timings_panel(context)
     _render_check_summary_guidance(context)
 
 
@@ -18,6 +18,7 @@ from fast_agent.commands.handlers import session_export as session_export_handle
 from fast_agent.commands.handlers import sessions as session_handlers
 from fast_agent.commands.session_export_help import (
     SESSION_EXPORT_AGENT_HELP,
+    SESSION_EXPORT_HASH_ATTACHMENTS_HELP,
     SESSION_EXPORT_HF_DATASET_HELP,
     SESSION_EXPORT_HF_DATASET_PATH_HELP,
     SESSION_EXPORT_HF_URL_HELP,
@@ -27,8 +28,10 @@ from fast_agent.commands.session_export_help import (
     SESSION_EXPORT_PRIVACY_FILTER_HELP,
     SESSION_EXPORT_PRIVACY_PATH_HELP,
     SESSION_EXPORT_PRIVACY_VARIANT_HELP,
+    SESSION_EXPORT_SHARD_RECORDS_HELP,
     SESSION_EXPORT_SHOW_REDACTIONS_HELP,
     SESSION_EXPORT_TARGET_HELP,
+    SESSION_EXPORT_ZSTD_HELP,
 )
 from fast_agent.session.session_manager import SessionManager
 from fast_agent.utils.async_utils import run_coroutine
@@ -123,6 +126,17 @@ def export(
         "--show-redactions",
         help=SESSION_EXPORT_SHOW_REDACTIONS_HELP,
     ),
+    zstd: bool = typer.Option(False, "--zstd", help=SESSION_EXPORT_ZSTD_HELP),
+    shard_records: int | None = typer.Option(
+        None,
+        "--shard-records",
+        help=SESSION_EXPORT_SHARD_RECORDS_HELP,
+    ),
+    hash_attachments: bool = typer.Option(
+        False,
+        "--hash-attachments",
+        help=SESSION_EXPORT_HASH_ATTACHMENTS_HELP,
+    ),
 ) -> None:
     """Export a persisted session trace."""
     context_payload = ensure_context_object(ctx)
@@ -152,6 +166,9 @@ def export(
             or privacy_filter_device is not None
             or privacy_filter_variant is not None
             or show_redactions
+            or zstd
+            or shard_records is not None
+            or hash_attachments
         ):
             raise typer.BadParameter("Cannot combine --list with export options.")
         outcome = run_coroutine(
@@ -181,6 +198,9 @@ def export(
             privacy_filter_device=privacy_filter_device,
             privacy_filter_variant=privacy_filter_variant,
             show_redactions=show_redactions,
+            compression="zstd" if zstd else None,
+            shard_records=shard_records,
+            hash_attachments=hash_attachments,
             progress_callback=lambda message: typer.echo(message, err=True),
         )
     )
@@ -102,7 +102,11 @@ async def handle_compact_preview(
     tokens_now = usage.current_context_tokens if usage else None
     window = usage.context_window_size if usage else None
     estimated_after = (
-        estimate_tokens(plan.templates + plan.retained_tail) + _PREVIEW_SUMMARY_TOKEN_ALLOWANCE
+        estimate_tokens(
+            plan.templates + plan.retained_tail,
+            model=usage.model if usage else None,
+        )
+        + _PREVIEW_SUMMARY_TOKEN_ALLOWANCE
     )
 
     lines: list[Text] = []
@@ -18,7 +18,11 @@ from fast_agent.privacy.model_resolver import (
 )
 from fast_agent.privacy.privacy_filter_onnx import OpenAIPrivacyFilterOnnxSanitizer
 from fast_agent.session.trace_export_errors import TraceExportError
-from fast_agent.session.trace_export_models import ExportRequest, ExportResult
+from fast_agent.session.trace_export_models import (
+    ExportRequest,
+    ExportResult,
+    TraceCompression,
+)
 from fast_agent.session.trace_exporter import SessionTraceExporter
 from fast_agent.utils.action_normalization import normalize_action_token
 from fast_agent.utils.count_display import format_count
@@ -44,6 +48,9 @@ def _redaction_summary_text(summary: "RedactionSummary") -> str:
     elapsed = _format_elapsed(summary.elapsed.total_seconds()) if summary.elapsed else None
     count_text = format_count(summary.total, "text span")
     suffix = f" in {elapsed}" if elapsed else ""
+    throughput = summary.characters_per_second
+    if throughput is not None:
+        suffix = f"{suffix} ({throughput:,.0f} chars/s)"
     if summary.total == 0:
         return f"Privacy filter redacted {count_text}{suffix}."
     lines = [f"Privacy filter redacted {count_text}{suffix}:"]
@@ -145,12 +152,22 @@ def _add_export_result_messages(outcome: CommandOutcome, result: ExportResult) -
         right_info="session",
         agent_name=result.agent_name,
     )
+    written = f"Wrote {format_count(result.record_count, 'trace record')}"
+    if len(result.output_paths) > 1:
+        written += f" across {format_count(len(result.output_paths), 'file')}"
     outcome.add_message(
-        f"Wrote {format_count(result.record_count, 'trace record')}.",
+        f"{written}.",
         channel="info",
         right_info="session",
         agent_name=result.agent_name,
     )
+    if result.attachments_dir is not None:
+        outcome.add_message(
+            f"Attachments are stored by hash in {result.attachments_dir}",
+            channel="info",
+            right_info="session",
+            agent_name=result.agent_name,
+        )
 
     if result.redaction is not None:
         _add_redaction_result_messages(outcome, result)
@@ -349,6 +366,9 @@ async def handle_session_export(
     privacy_filter_device: str | None = None,
     privacy_filter_variant: str | None = None,
     show_redactions: bool = False,
+    compression: TraceCompression | None = None,
+    shard_records: int | None = None,
+    hash_attachments: bool = False,
     progress_callback: Callable[[str], None] | None = None,
     current_session_id: str | None = None,
     error: str | None = None,
@@ -406,6 +426,9 @@ async def handle_session_export(
         privacy_filter_path=_path_option(privacy_filter_path),
         download_privacy_filter=download_privacy_filter,
         privacy_filter_variant=privacy_filter_variant,
+        compression=compression,
+        shard_records=shard_records,
+        hash_attachments=hash_attachments,
     )
     if ctx.session_runtime is None:
         outcome.add_message(
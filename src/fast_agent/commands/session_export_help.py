@@ -71,6 +71,14 @@ SESSION_EXPORT_PRIVACY_VARIANT_HELP = (
 SESSION_EXPORT_SHOW_REDACTIONS_HELP = (
     "Print detected redaction labels and original text to stderr. Use only for local review."
 )
+SESSION_EXPORT_ZSTD_HELP = "Compress codex JSONL output with zstd (adds a .zst suffix)."
+SESSION_EXPORT_SHARD_RECORDS_HELP = (
+    "Split codex JSONL output into numbered files of at most this many records."
+)
+SESSION_EXPORT_HASH_ATTACHMENTS_HELP = (
+    "Write inline images and files once to an attachments/ directory next to the trace "
+    "and reference them by SHA-256 instead of embedding base64."
+)
 
 SESSION_EXPORT_EXAMPLES: tuple[str, ...] = (
     "/session export latest --output trace.jsonl",
@@ -18,6 +18,8 @@ from pydantic_settings import BaseSettings, PydanticBaseSettingsSource, Settings
 
 from fast_agent.command_actions import PluginCommandActionSpec, parse_plugin_command_action_specs
 from fast_agent.constants import (
+    DEFAULT_AGENT_STARTUP_CONCURRENCY,
+    DEFAULT_INSTRUCTION_SOURCE_TTL_SECONDS,
     MAX_FOREGROUND_AUTO_AWAIT_SECONDS,
     MAX_PROCESS_POLL_WAIT_SECONDS,
 )
@@ -175,8 +177,25 @@ class MCPSamplingSettings(BaseModel):
     model: str | None = None
     """Model used for sampling requests. Falls back to the agent or configured global model."""
 
+    max_concurrent: int | None = None
+    """Maximum sampling requests from this server handled at once (default: unlimited)."""
+
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
 
+    @field_validator("max_concurrent", mode="before")
+    @classmethod
+    def _validate_max_concurrent(cls, value: Any) -> int | None:
+        if value is None:
+            return None
+        if isinstance(value, bool):
+            raise TypeError("max_concurrent must be an integer.")
+        if isinstance(value, str):
+            value = int(value.strip())
+        value = int(value)
+        if value <= 0:
+            raise ValueError("max_concurrent must be greater than zero.")
+        return value
+
 
 class MCPElicitationSettings(BaseModel):
     mode: Literal["forms", "auto-cancel", "none"] = "none"
@@ -531,6 +550,16 @@ class CompactionSettings(BaseModel):
         le=1.0,
         description="Fraction of the model context window that triggers auto-compaction",
     )
+    precompact_threshold: float | None = Field(
+        default=None,
+        gt=0.0,
+        le=1.0,
+        description=(
+            "Fraction of the context window at which a checkpoint summary is prepared in the "
+            "background and applied at the next turn boundary. None disables background "
+            "pre-compaction"
+        ),
+    )
     keep_turns: int = Field(
         default=2,
         ge=0,
@@ -605,6 +634,15 @@ class MCPServerSettings(BaseModel):
     max_missed_pings: int = 3
     """Number of consecutive missed ping responses before treating the connection as failed."""
 
+    max_concurrent_calls: int | None = None
+    """Maximum concurrent tools/call requests to this server across all agents sharing it.
+    Further calls wait in a queue that is served round-robin per agent. Unlimited when unset."""
+
+    pool_size: int | None = None
+    """Number of identical client connections to keep for tools/call (persistent connections only).
+    Extra connections are launched on first tool call and calls go to the least busy one;
+    discovery, prompts and resources stay on the primary connection. Defaults to one connection."""
+
     http_timeout_seconds: int | None = None
     """Overall HTTP timeout (seconds) for StreamableHTTP transport. Defaults to MCP SDK."""
 
@@ -647,6 +685,11 @@ class MCPServerSettings(BaseModel):
     load_on_start: bool = True
     """Whether to connect to this server automatically when the agent starts."""
 
+    discovery_cache: Literal["off", "stale-while-revalidate", "strict"] = "off"
+    """Reuse tool/prompt discovery from disk across restarts (persistent connections only).
+    "stale-while-revalidate" serves the cached lists immediately and refreshes them in the
+    background; "strict" always re-discovers before attaching and only updates the cache."""
+
     include_instructions: bool = True
     """Whether to include this server's instructions in the system prompt (default: True)."""
 
@@ -687,6 +730,34 @@ class MCPServerSettings(BaseModel):
             raise ValueError("max_missed_pings must be greater than zero.")
         return value
 
+    @field_validator("max_concurrent_calls", mode="before")
+    @classmethod
+    def _validate_max_concurrent_calls(cls, value: Any) -> int | None:
+        if value is None:
+            return None
+        if isinstance(value, bool):
+            raise TypeError("max_concurrent_calls must be an integer.")
+        if isinstance(value, str):
+            value = int(value.strip())
+        value = int(value)
+        if value <= 0:
+            raise ValueError("max_concurrent_calls must be greater than zero.")
+        return value
+
+    @field_validator("pool_size", mode="before")
+    @classmethod
+    def _validate_pool_size(cls, value: Any) -> int | None:
+        if value is None:
+            return None
+        if isinstance(value, bool):
+            raise TypeError("pool_size must be an integer.")
+        if isinstance(value, str):
+            value = int(value.strip())
+        value = int(value)
+        if value <= 0:
+            raise ValueError("pool_size must be greater than zero.")
+        return value
+
     @field_validator("access_token", mode="before")
     @classmethod
     def _normalize_access_token(cls, value: Any) -> str | None:
@@ -1296,6 +1367,13 @@ class ResponsesProviderSettingsBase(BaseModel):
             "with automatic SSE fallback."
         ),
     )
+    http_continuation: bool = Field(
+        default=False,
+        description=(
+            "Continue SSE turns with previous_response_id instead of resending the full "
+            "conversation. Requires server-side response storage (store=true)."
+        ),
+    )
     service_tier: Literal["fast", "flex"] | None = Field(
         default=None,
         description="Responses service tier: fast (priority) or flex.",
@@ -2312,9 +2390,34 @@ class Settings(BaseSettings):
     session_history_window: int = 20
     """Maximum number of sessions to keep in the rolling window (default: 20)."""
 
+    agent_startup_concurrency: int = Field(default=DEFAULT_AGENT_STARTUP_CONCURRENCY, ge=1)
+    """Agents in the same dependency level constructed at once during startup (default: 8)."""
+
+    instruction_source_ttl_seconds: float = Field(
+        default=DEFAULT_INSTRUCTION_SOURCE_TTL_SECONDS, ge=0
+    )
+    """Seconds to reuse {{url:...}} instruction content before revalidating it (default: 300)."""
+
+    token_estimator: Literal["heuristic", "tiktoken"] = "tiktoken"
+    """Backend for local token estimates (compaction planning, streaming progress).
+    'tiktoken' uses the model's encoding once loaded, and the heuristic until then."""
+
     git_aware: bool = False
     """Persist git repository provenance in session snapshots and trace exports."""
 
+    git_dirty_check: Literal["full", "tracked", "index"] = "full"
+    """How session saves detect uncommitted changes when git_aware is enabled.
+
+    ``full`` runs ``git status --porcelain`` (includes untracked files), ``tracked``
+    skips the untracked-file scan, and ``index`` compares the work tree against the
+    index using cached stat data (``git diff-index``), the cheapest option for
+    large repositories.
+    """
+
+    git_state_max_age_seconds: float = 30.0
+    """Reuse cached HEAD/branch/dirty state while .git/HEAD, refs and the index are
+    unchanged, for at most this many seconds (0 always re-queries)."""
+
     compaction: CompactionSettings = Field(default_factory=CompactionSettings)
     """History compaction settings (auto trigger threshold, retained turns, prompt)."""
 
@@ -64,6 +64,12 @@ DEFAULT_MAX_ITERATIONS = 9999
 DEFAULT_STREAMING_TIMEOUT = 120.0
 """Default idle timeout in seconds between provider streaming events."""
 
+DEFAULT_AGENT_STARTUP_CONCURRENCY = 8
+"""Default number of agents in one dependency level constructed at once."""
+
+DEFAULT_INSTRUCTION_SOURCE_TTL_SECONDS = 300.0
+"""Default reuse window for ``{{url:...}}`` instruction template content."""
+
 MIN_PROCESS_POLL_WAIT_SECONDS = 10
 """Minimum positive managed-process wait exposed to models."""
 
@@ -9,13 +9,6 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from opentelemetry import trace
-from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
-from opentelemetry.propagate import set_global_textmap
-from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
-from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
-from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
 from pydantic import BaseModel, ConfigDict, Field
 
 from fast_agent.config import Settings, get_settings
@@ -29,20 +22,35 @@ from fast_agent.skills import SkillRegistry
 from fast_agent.utils.async_utils import run_sync
 
 if TYPE_CHECKING:
+    from opentelemetry.sdk.trace import TracerProvider
+
     from fast_agent.acp.acp_context import ACPContext
     from fast_agent.core.executor.workflow_signal import SignalWaitCallback
     from fast_agent.mcp.mcp_connection_manager import MCPConnectionManager
+    from fast_agent.mcp.sampling_pool import SamplingLLMPool
     from fast_agent.session.session_manager import SessionManager
 else:
     # Runtime placeholders for the types
     ACPContext = Any
     SignalWaitCallback = Any
     MCPConnectionManager = Any
+    SamplingLLMPool = Any
     SessionManager = Any
 
 logger = get_logger(__name__)
 
 _otel_tracer_provider: TracerProvider | None = None
+_llm_sdks_in_use: set[str] = set()
+
+# Instrumentor per LLM SDK, attached when the first LLM using that SDK is created.
+_LLM_SDK_INSTRUMENTORS: dict[str, tuple[str, str]] = {
+    "openai": ("opentelemetry.instrumentation.openai", "OpenAIInstrumentor"),
+    "google_genai": (
+        "opentelemetry.instrumentation.google_genai",
+        "GoogleGenAiSdkInstrumentor",
+    ),
+    "anthropic": ("opentelemetry.instrumentation.anthropic", "AnthropicInstrumentor"),
+}
 
 """
 A central context object to store global state that is shared across the application.
@@ -72,6 +80,7 @@ class Context(BaseModel):
     # Provides agents access to ACP capabilities (mode switching, commands, etc.)
     acp: "ACPContext | None" = None
     session_manager: "SessionManager | None" = None
+    sampling_pool: "SamplingLLMPool | None" = None
 
     model_config = ConfigDict(
         extra="allow",
@@ -90,6 +99,15 @@ async def configure_otel(config: "Settings") -> None:
     if _otel_tracer_provider is not None:
         return
 
+    # The SDK and exporters are only imported when telemetry is enabled.
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+    from opentelemetry.propagate import set_global_textmap
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+    from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
+
     # Set up global textmap propagator first
     set_global_textmap(TraceContextTextMapPropagator())
 
@@ -133,6 +151,26 @@ async def configure_otel(config: "Settings") -> None:
     trace.set_tracer_provider(tracer_provider)
     _otel_tracer_provider = tracer_provider
 
+    for sdk in sorted(_llm_sdks_in_use):
+        _attach_llm_sdk_instrumentor(sdk, tracer_provider)
+
+
+def instrument_llm_sdk(sdk: str) -> None:
+    """Instrument an LLM SDK for tracing the first time one of its LLMs is created.
+
+    SDKs seen before telemetry is configured are instrumented by ``configure_otel``.
+    """
+    if sdk in _llm_sdks_in_use:
+        return
+    _llm_sdks_in_use.add(sdk)
+    if _otel_tracer_provider is not None:
+        _attach_llm_sdk_instrumentor(sdk, _otel_tracer_provider)
+
+
+def _attach_llm_sdk_instrumentor(sdk: str, tracer_provider: TracerProvider) -> None:
+    import importlib
+
+    module_name, class_name = _LLM_SDK_INSTRUMENTORS[sdk]
     # OpenLLMetry through 0.62.1 still uses asyncio.iscoroutinefunction while
     # importing its instrumentations. Keep that Python 3.14 deprecation local to
     # the third-party import; importing fast-agent with telemetry disabled stays clean.
@@ -149,13 +187,8 @@ async def configure_otel(config: "Settings") -> None:
             category=DeprecationWarning,
             module=r"opentelemetry\.instrumentation\.openai\..*",
         )
-        from opentelemetry.instrumentation.anthropic import AnthropicInstrumentor
-        from opentelemetry.instrumentation.google_genai import GoogleGenAiSdkInstrumentor
-        from opentelemetry.instrumentation.openai import OpenAIInstrumentor
-
-        OpenAIInstrumentor().instrument(tracer_provider=tracer_provider)
-        GoogleGenAiSdkInstrumentor().instrument(tracer_provider=tracer_provider)
-        AnthropicInstrumentor().instrument(tracer_provider=tracer_provider)
+        instrumentor = getattr(importlib.import_module(module_name), class_name)
+        instrumentor().instrument(tracer_provider=tracer_provider)
 
 
 async def configure_logger(config: "Settings") -> None:
@@ -237,6 +270,12 @@ async def initialize_context(
         directories=override_directories,
     )
 
+    from fast_agent.core.template_sources import template_source_cache
+    from fast_agent.llm.token_estimation import configure_token_estimator
+
+    template_source_cache().ttl_seconds = config.instruction_source_ttl_seconds
+    configure_token_estimator(config.token_estimator)
+
     # Configure logging and telemetry
     await configure_otel(config)
     await configure_logger(config)
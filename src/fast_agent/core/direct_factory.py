@@ -3,6 +3,8 @@ Direct factory functions for creating agent and workflow instances without proxi
 Implements type-safe factories with improved error handling.
 """
 
+import asyncio
+import time
 from collections.abc import Awaitable, Callable, Mapping, Sequence
 from dataclasses import dataclass, replace
 from functools import partial
@@ -30,12 +32,14 @@ from fast_agent.agents.workflow.evaluator_optimizer import (
 from fast_agent.agents.workflow.iterative_planner import IterativePlanner
 from fast_agent.agents.workflow.parallel_agent import ParallelAgent
 from fast_agent.agents.workflow.router_agent import RouterAgent
+from fast_agent.constants import DEFAULT_AGENT_STARTUP_CONCURRENCY
 from fast_agent.context import Context
 from fast_agent.core.agent_card_types import AgentCardData
 from fast_agent.core.exceptions import AgentConfigError, ModelConfigError
 from fast_agent.core.function_tool_support import custom_class_supports_function_tools
 from fast_agent.core.logging.logger import get_logger
 from fast_agent.core.model_resolution import get_context_cli_model_override, resolve_model_spec
+from fast_agent.core.startup_timings import StartupTimings
 from fast_agent.core.validation import (
     get_dependencies_groups,
     is_basic_like_agent_type,
@@ -52,6 +56,7 @@ from fast_agent.llm.model_factory import ModelFactory
 from fast_agent.tools.function_tool_loader import load_function_tools
 from fast_agent.tools.hook_loader import load_tool_runner_hooks
 from fast_agent.types import RequestParams
+from fast_agent.utils.async_utils import gather_with_cancel
 
 if TYPE_CHECKING:
     from fast_agent.agents.workflow.agents_as_tools_agent import AgentsAsToolsOptions
@@ -989,6 +994,118 @@ _AGENT_TYPE_BUILDERS: dict[AgentType, AgentTypeBuilder] = {
 }
 
 
+@dataclass(frozen=True)
+class _PendingAgentBuild:
+    name: str
+    agent_data: Mapping[str, Any]
+    agent_type: AgentType
+    builder: AgentTypeBuilder
+
+
+def _agent_build_context(
+    app_instance: CoreContextProtocol,
+    agents_dict: AgentConfigDict,
+    active_agents: AgentDict,
+    model_factory_func: ModelFactoryFunctionProtocol,
+    global_function_tools: Sequence[FunctionTool],
+    shell_environment: "ShellEnvironment | None",
+) -> AgentBuildContext:
+    session_history_enabled = True
+    if app_instance.context and app_instance.context.config:
+        session_history_enabled = app_instance.context.config.session_history
+    return AgentBuildContext(
+        app_instance=app_instance,
+        agents_dict=agents_dict,
+        active_agents=active_agents,
+        model_factory_func=model_factory_func,
+        session_history_enabled=session_history_enabled,
+        global_function_tools=global_function_tools,
+        shell_environment=shell_environment,
+    )
+
+
+def _agent_startup_concurrency(app_instance: CoreContextProtocol) -> int:
+    if app_instance.context and app_instance.context.config:
+        return app_instance.context.config.agent_startup_concurrency
+    return DEFAULT_AGENT_STARTUP_CONCURRENCY
+
+
+def _pending_builds(
+    agents_dict: AgentConfigDict,
+    agent_type: AgentType,
+) -> list[_PendingAgentBuild]:
+    builder = _AGENT_TYPE_BUILDERS.get(agent_type)
+    if builder is None:
+        raise ValueError(f"Unknown agent type: {agent_type}")
+    return [
+        _PendingAgentBuild(name=name, agent_data=agent_data, agent_type=agent_type, builder=builder)
+        for name, agent_data in _iter_agents_of_type(agents_dict, agent_type)
+    ]
+
+
+async def _shutdown_agents(agents: AgentDict) -> None:
+    for name, agent in agents.items():
+        try:
+            await agent.shutdown()
+        except Exception as exc:
+            logger.warning(f"Error shutting down agent {name} after failed startup: {exc}")
+
+
+async def _build_agents_concurrently(
+    builds: Sequence[_PendingAgentBuild],
+    build_ctx: AgentBuildContext,
+    *,
+    level: int = 0,
+    startup_timings: StartupTimings | None = None,
+) -> AgentDict:
+    """Build independent agents with bounded parallelism.
+
+    Agents are returned in ``builds`` order whatever order they finish in. If any
+    build fails, every agent built by this call is shut down and the first
+    failure in ``builds`` order is raised; the same cleanup runs on cancellation.
+    """
+    semaphore = asyncio.Semaphore(_agent_startup_concurrency(build_ctx.app_instance))
+    built: list[AgentDict] = [{} for _ in builds]
+    spans: list[tuple[float, float] | None] = [None] * len(builds)
+
+    async def run(index: int, build: _PendingAgentBuild) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await build.builder(build.name, build.agent_data, build_ctx, built[index])
+            spans[index] = (started, time.perf_counter())
+
+    def collect_built() -> AgentDict:
+        result_agents: AgentDict = {}
+        for agents in built:
+            result_agents.update(agents)
+        return result_agents
+
+    try:
+        outcomes = await gather_with_cancel(run(index, build) for index, build in enumerate(builds))
+    except BaseException:
+        # Cancellation skips the per-build outcomes, so release what already finished.
+        await _shutdown_agents(collect_built())
+        raise
+
+    result_agents = collect_built()
+    failure = next((outcome for outcome in outcomes if isinstance(outcome, BaseException)), None)
+    if failure is not None:
+        await _shutdown_agents(result_agents)
+        raise failure
+
+    if startup_timings is not None:
+        for build, span in zip(builds, spans, strict=True):
+            if span is not None:
+                startup_timings.record(
+                    build.name,
+                    build.agent_type.value,
+                    level=level,
+                    started=span[0],
+                    finished=span[1],
+                )
+    return result_agents
+
+
 async def create_agents_by_type(
     app_instance: CoreContextProtocol,
     agents_dict: AgentConfigDict,
@@ -1001,6 +1118,9 @@ async def create_agents_by_type(
     """
     Generic method to create agents of a specific type without using proxies.
 
+    Agents are built concurrently (up to ``agent_startup_concurrency`` at once)
+    and returned in declaration order.
+
     Args:
         app_instance: The main application instance
         agents_dict: Dictionary of agent configurations
@@ -1013,28 +1133,16 @@ async def create_agents_by_type(
     if active_agents is None:
         active_agents = {}
 
-    result_agents: AgentDict = {}
-    session_history_enabled = True
-    if app_instance.context and app_instance.context.config:
-        session_history_enabled = app_instance.context.config.session_history
-    builder = _AGENT_TYPE_BUILDERS.get(agent_type)
-    if builder is None:
-        raise ValueError(f"Unknown agent type: {agent_type}")
-
-    build_ctx = AgentBuildContext(
-        app_instance=app_instance,
-        agents_dict=agents_dict,
-        active_agents=active_agents,
-        model_factory_func=model_factory_func,
-        session_history_enabled=session_history_enabled,
-        global_function_tools=global_function_tools,
-        shell_environment=shell_environment,
+    builds = _pending_builds(agents_dict, agent_type)
+    build_ctx = _agent_build_context(
+        app_instance,
+        agents_dict,
+        active_agents,
+        model_factory_func,
+        global_function_tools,
+        shell_environment,
     )
-
-    for name, agent_data in _iter_agents_of_type(agents_dict, agent_type):
-        await builder(name, agent_data, build_ctx, result_agents)
-
-    return result_agents
+    return await _build_agents_concurrently(builds, build_ctx)
 
 
 async def active_agents_in_dependency_group(
@@ -1045,29 +1153,39 @@ async def active_agents_in_dependency_group(
     group: list[str],
     active_agents: AgentDict,
     shell_environment: "ShellEnvironment | None" = None,
+    *,
+    level: int = 0,
+    startup_timings: StartupTimings | None = None,
 ):
     """
-    For each of the possible agent types, create agents and update the active agents dictionary.
+    Create every agent in one dependency group and update the active agents dictionary.
+
+    Agents in a group do not depend on each other, so they are built concurrently.
+    They are registered grouped by agent type, in declaration order within each type.
 
     Notice: This function modifies the active_agents dictionary in-place which is a feature (no copies).
     """
-    type_of_agents = [(agent_type, agent_type.value) for agent_type in AgentType]
-    for agent_type, agent_type_value in type_of_agents:
-        agents_dict_local = {
-            name: agents_dict[name]
-            for name in group
-            if normalize_agent_type_value(agents_dict[name].get("type")) == agent_type_value
-        }
-        agents = await create_agents_by_type(
-            app_instance,
-            agents_dict_local,
-            agent_type,
-            model_factory_func,
-            active_agents,
-            global_function_tools,
-            shell_environment=shell_environment,
-        )
-        active_agents.update(agents)
+    agents_dict_local = {name: agents_dict[name] for name in group}
+    builds = [
+        build
+        for agent_type in AgentType
+        for build in _pending_builds(agents_dict_local, agent_type)
+    ]
+    build_ctx = _agent_build_context(
+        app_instance,
+        agents_dict_local,
+        active_agents,
+        model_factory_func,
+        global_function_tools,
+        shell_environment,
+    )
+    agents = await _build_agents_concurrently(
+        builds,
+        build_ctx,
+        level=level,
+        startup_timings=startup_timings,
+    )
+    active_agents.update(agents)
 
 
 async def create_agents_in_dependency_order(
@@ -1077,6 +1195,7 @@ async def create_agents_in_dependency_order(
     global_function_tools: Sequence[FunctionTool] = (),
     allow_cycles: bool = False,
     shell_environment: "ShellEnvironment | None" = None,
+    startup_timings: StartupTimings | None = None,
 ) -> AgentDict:
     """
     Create agent instances in dependency order without proxies.
@@ -1086,6 +1205,7 @@ async def create_agents_in_dependency_order(
         agents_dict: Dictionary of agent configurations
         model_factory_func: Function for creating model factories
         allow_cycles: Whether to allow cyclic dependencies
+        startup_timings: Optional collector for per-agent construction times
 
     Returns:
         Dictionary of initialized agent instances
@@ -1103,12 +1223,22 @@ async def create_agents_in_dependency_order(
         model_factory_func,
         global_function_tools,
         shell_environment=shell_environment,
+        startup_timings=startup_timings,
     )
+    if startup_timings is not None:
+        startup_timings.concurrency = _agent_startup_concurrency(app_instance)
 
-    # Create agent proxies for each group in dependency order
-    for group in dependencies:
-        await active_agents_in_dependency_group_partial(group, active_agents)
-
+    # Create agents for each group in dependency order
+    try:
+        for level, group in enumerate(dependencies):
+            await active_agents_in_dependency_group_partial(group, active_agents, level=level)
+    except BaseException:
+        # Agents from earlier levels are not returned to the caller, so release them here.
+        await _shutdown_agents(active_agents)
+        raise
+
+    if startup_timings is not None:
+        startup_timings.finish()
     return active_agents
 
 
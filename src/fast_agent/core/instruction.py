@@ -48,7 +48,8 @@ from typing import ClassVar
 from fast_agent.core.exceptions import AgentConfigError
 from fast_agent.core.logging.logger import get_logger
 from fast_agent.core.template_escape import protect_escaped_braces, restore_escaped_braces
-from fast_agent.io.source_resolver import read_text_source
+from fast_agent.core.template_sources import TemplateSourceCache, template_source_cache
+from fast_agent.utils.async_utils import gather_with_cancel
 from fast_agent.utils.text import strip_to_none
 
 logger = get_logger(__name__)
@@ -128,6 +129,9 @@ class InstructionBuilder:
     - {{url:https://...}} - Fetches content from URL (resolved at build time)
     - {{file:path}} - Reads file content relative to workspace (requires workspaceRoot)
     - {{file_silent:path}} - Like file: but returns empty string if missing
+
+    URL and file contents are read concurrently through a TemplateSourceCache
+    shared across builders, so repeated builds reuse unchanged sources.
     """
 
     # Built-in values that are automatically available
@@ -137,16 +141,24 @@ class InstructionBuilder:
         "pythonVer": _get_python_version,
     }
 
-    def __init__(self, template: str, *, source: str | None = None):
+    def __init__(
+        self,
+        template: str,
+        *,
+        source: str | None = None,
+        sources: TemplateSourceCache | None = None,
+    ):
         """
         Initialize the builder with a template string.
 
         Args:
             template: The instruction template with {{placeholder}} patterns
             source: Optional label for diagnostics (agent name, card, etc.)
+            sources: Cache for url/file content (default: the process-wide cache)
         """
         self._template = template
         self._source = source
+        self._sources = sources if sources is not None else template_source_cache()
         self._static: dict[str, str] = {}
         self._resolvers: dict[str, Resolver] = {}
 
@@ -234,13 +246,13 @@ class InstructionBuilder:
         result = self._resolve_internal_patterns(result)
 
         # 2. Resolve {{url:...}} patterns
-        result = self._resolve_url_patterns(result)
+        result = await self._resolve_url_patterns(result)
 
         # 3. Resolve {{file:...}} patterns (strict - errors if missing)
-        result = self._resolve_file_patterns(result, silent=False)
+        result = await self._resolve_file_patterns(result, silent=False)
 
         # 4. Resolve {{file_silent:...}} patterns (returns empty if missing)
-        result = self._resolve_file_patterns(result, silent=True)
+        result = await self._resolve_file_patterns(result, silent=True)
 
         # 5. Apply built-in values (can be overridden by static values)
         for placeholder, value_fn in self._BUILTINS.items():
@@ -299,25 +311,29 @@ class InstructionBuilder:
             "Detected recursive or excessively deep {{internal:...}} include chain",
         )
 
-    def _resolve_url_patterns(self, text: str) -> str:
+    async def _resolve_url_patterns(self, text: str) -> str:
         """Resolve {{url:https://...}} and {{url:hf://...}} patterns by fetching content."""
         url_pattern = re.compile(r"\{\{url:((?:https?|hf)://[^}]+)\}\}")
-
-        def replace_url(match: re.Match) -> str:
-            url = match.group(1)
-            try:
-                return read_text_source(url, label="URL template")
-            except Exception as e:
+        urls = list(dict.fromkeys(match.group(1) for match in url_pattern.finditer(text)))
+        if not urls:
+            return text
+
+        results = await gather_with_cancel(self._sources.read_url(url) for url in urls)
+        contents: dict[str, str] = {}
+        for url, result in zip(urls, results, strict=True):
+            if isinstance(result, BaseException):
                 logger.warning(
-                    f"Failed to fetch URL {url}: {e}",
+                    f"Failed to fetch URL {url}: {result}",
                     url=url,
                     source=self._source,
                 )
-                return ""
+                contents[url] = ""
+            else:
+                contents[url] = result
 
-        return url_pattern.sub(replace_url, text)
+        return url_pattern.sub(lambda match: contents[match.group(1)], text)
 
-    def _resolve_file_patterns(self, text: str, *, silent: bool) -> str:
+    async def _resolve_file_patterns(self, text: str, *, silent: bool) -> str:
         """
         Resolve {{file:path}} or {{file_silent:path}} patterns.
 
@@ -331,13 +347,27 @@ class InstructionBuilder:
         pattern_name = "file_silent" if silent else "file"
         file_pattern = re.compile(rf"\{{\{{{pattern_name}:([^}}]+)\}}\}}")
 
-        def replace_file(match: re.Match) -> str:
-            file_path_str = strip_to_none(match.group(1)) or ""
-            return self._read_file_placeholder(file_path_str, silent=silent)
+        def placeholder_path(match: re.Match) -> str:
+            return strip_to_none(match.group(1)) or ""
+
+        paths = list(
+            dict.fromkeys(placeholder_path(match) for match in file_pattern.finditer(text))
+        )
+        if not paths:
+            return text
+
+        results = await gather_with_cancel(
+            self._read_file_placeholder(path, silent=silent) for path in paths
+        )
+        contents: dict[str, str] = {}
+        for path, result in zip(paths, results, strict=True):
+            if isinstance(result, BaseException):
+                raise result
+            contents[path] = result
 
-        return file_pattern.sub(replace_file, text)
+        return file_pattern.sub(lambda match: contents[placeholder_path(match)], text)
 
-    def _read_file_placeholder(self, file_path_str: str, *, silent: bool) -> str:
+    async def _read_file_placeholder(self, file_path_str: str, *, silent: bool) -> str:
         file_path = Path(file_path_str).expanduser()
 
         if file_path.is_absolute():
@@ -349,7 +379,7 @@ class InstructionBuilder:
 
         resolved_path = self._resolve_file_placeholder_path(file_path)
         try:
-            return resolved_path.read_text(encoding="utf-8")
+            return await self._sources.read_file(resolved_path)
         except FileNotFoundError as exc:
             if silent:
                 return ""
@@ -385,7 +415,7 @@ class InstructionBuilder:
         Returns:
             A new InstructionBuilder with copied state
         """
-        new_builder = InstructionBuilder(self._template, source=self._source)
+        new_builder = InstructionBuilder(self._template, source=self._source, sources=self._sources)
         new_builder._static = self._static.copy()
         new_builder._resolvers = self._resolvers.copy()
         return new_builder
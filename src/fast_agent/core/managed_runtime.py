@@ -29,6 +29,7 @@ from fast_agent.core.runtime_finalization import (
     session_restore_warnings,
     validate_final_provider_state,
 )
+from fast_agent.core.startup_timings import StartupTimings, save_startup_timings
 from fast_agent.core.subagent_policy import apply_subagent_runtime_policy
 from fast_agent.core.validation import get_agent_dependencies, get_dependencies_groups
 from fast_agent.mcp.prompts.prompt_load import load_prompt
@@ -176,13 +177,17 @@ class ManagedRuntimeMixin:
         from fast_agent.core.fastagent import AgentInstance
 
         async with runtime.instance_lock:
+            startup_timings = StartupTimings()
             agents_map = await create_agents_in_dependency_order(
                 self.app,
                 self.agents,
                 runtime.model_factory_func,
                 global_function_tools=self._registered_tools,
                 shell_environment=runtime.shell_environment,
+                startup_timings=startup_timings,
             )
+            if not runtime.no_home_mode:
+                save_startup_timings(startup_timings, self.context.config)
 
             tool_only_agents = {
                 name for name, data in self.agents.items() if data.get("tool_only", False)
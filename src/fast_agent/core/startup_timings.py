@@ -0,0 +1,124 @@
+"""Per-agent construction timings recorded while an app starts.
+
+Agents in the same dependency level are built concurrently, so the slowest
+agent in each level bounds startup. The runtime saves the most recent breakdown
+under ``<home>/cache/startup-timings.json``, where ``fast-agent check`` shows it.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from fast_agent.core.logging.logger import get_logger
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from fast_agent.config import Settings
+
+logger = get_logger(__name__)
+
+STARTUP_TIMINGS_FILENAME = "startup-timings.json"
+
+
+@dataclass(frozen=True, slots=True)
+class AgentStartupTiming:
+    """Construction time for one agent (initialize, LLM attach, hooks)."""
+
+    name: str
+    agent_type: str
+    level: int
+    """Dependency level; agents in one level are built concurrently."""
+    started_seconds: float
+    """Offset from the start of agent construction."""
+    seconds: float
+
+
+@dataclass(slots=True)
+class StartupTimings:
+    """Collects agent timings in registration order."""
+
+    concurrency: int = 1
+    agents: list[AgentStartupTiming] = field(default_factory=list)
+    total_seconds: float = 0.0
+    recorded_at: float = 0.0
+    _origin: float = field(default_factory=time.perf_counter, repr=False)
+
+    def record(
+        self,
+        name: str,
+        agent_type: str,
+        *,
+        level: int,
+        started: float,
+        finished: float,
+    ) -> None:
+        """Add one agent, given ``time.perf_counter()`` start and finish readings."""
+        self.agents.append(
+            AgentStartupTiming(
+                name=name,
+                agent_type=agent_type,
+                level=level,
+                started_seconds=started - self._origin,
+                seconds=finished - started,
+            )
+        )
+
+    def finish(self) -> None:
+        self.total_seconds = time.perf_counter() - self._origin
+        self.recorded_at = time.time()
+
+    def level_seconds(self) -> dict[int, float]:
+        """Wall-clock time of each dependency level."""
+        spans: dict[int, tuple[float, float]] = {}
+        for timing in self.agents:
+            end = timing.started_seconds + timing.seconds
+            start, stop = spans.get(timing.level, (timing.started_seconds, end))
+            spans[timing.level] = (min(start, timing.started_seconds), max(stop, end))
+        return {level: stop - start for level, (start, stop) in spans.items()}
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            "recorded_at": self.recorded_at,
+            "total_seconds": self.total_seconds,
+            "concurrency": self.concurrency,
+            "agents": [asdict(timing) for timing in self.agents],
+        }
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> StartupTimings:
+        return cls(
+            concurrency=int(payload["concurrency"]),
+            agents=[AgentStartupTiming(**entry) for entry in payload["agents"]],
+            total_seconds=float(payload["total_seconds"]),
+            recorded_at=float(payload["recorded_at"]),
+        )
+
+
+def startup_timings_path(home: Path) -> Path:
+    return home / "cache" / STARTUP_TIMINGS_FILENAME
+
+
+def save_startup_timings(timings: StartupTimings, settings: Settings | None) -> None:
+    """Best-effort write of the latest startup breakdown to the fast-agent home."""
+    from fast_agent.paths import resolve_home_dir
+
+    try:
+        path = startup_timings_path(resolve_home_dir(settings))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(timings.to_payload(), indent=2), encoding="utf-8")
+    except (OSError, ValueError) as exc:
+        logger.debug(f"Skipping startup timing record: {exc}")
+
+
+def load_startup_timings(path: Path) -> StartupTimings | None:
+    try:
+        return StartupTimings.from_payload(json.loads(path.read_text(encoding="utf-8")))
+    except FileNotFoundError:
+        return None
+    except (OSError, KeyError, TypeError, ValueError) as exc:
+        logger.debug(f"Ignoring unreadable startup timings: {exc}")
+        return None
@@ -0,0 +1,151 @@
+"""Shared cache for ``{{url:...}}`` and ``{{file:...}}`` instruction sources.
+
+Instructions are rebuilt when an agent's tool list changes and whenever an agent
+instance is created (request-scoped servers, batch workers, clones). Reading
+every template source again each time repeats network and disk I/O for content
+that rarely changes, so sources are cached per process:
+
+- URL content is reused for ``ttl_seconds``. After that the next build
+  revalidates it with ``If-None-Match``/``If-Modified-Since`` and keeps the
+  cached text on a 304. If revalidation fails, the cached text is served until
+  the next revalidation.
+- File content is keyed by resolved path and reread only when the file's mtime
+  or size changes.
+
+Reads run in worker threads, and concurrent builds needing the same source
+share one read.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from fast_agent.constants import DEFAULT_INSTRUCTION_SOURCE_TTL_SECONDS
+from fast_agent.core.logging.logger import get_logger
+from fast_agent.io.source_resolver import fetch_text_source
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from pathlib import Path
+
+logger = get_logger(__name__)
+
+
+@dataclass(slots=True)
+class _UrlEntry:
+    text: str
+    etag: str | None
+    last_modified: str | None
+    checked_at: float
+    """``time.monotonic()`` of the last fetch or revalidation."""
+
+
+@dataclass(frozen=True, slots=True)
+class _FileEntry:
+    text: str
+    mtime_ns: int
+    size: int
+
+
+class TemplateSourceCache:
+    """Process-wide cache of instruction template sources."""
+
+    def __init__(self, ttl_seconds: float = DEFAULT_INSTRUCTION_SOURCE_TTL_SECONDS) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._urls: dict[str, _UrlEntry] = {}
+        self._files: dict[Path, _FileEntry] = {}
+        self._inflight: dict[str | Path, asyncio.Task[str]] = {}
+
+    async def read_url(self, url: str) -> str:
+        """Return the content of ``url``; raises only if it has never been read."""
+        entry = self._urls.get(url)
+        if entry is not None and time.monotonic() - entry.checked_at < self.ttl_seconds:
+            return entry.text
+        return await self._shared(url, lambda: self._revalidate_url(url))
+
+    async def read_file(self, path: Path) -> str:
+        """Return the content of ``path``, rereading it only if it changed."""
+        return await self._shared(path, lambda: self._read_file(path))
+
+    def clear(self) -> None:
+        self._urls.clear()
+        self._files.clear()
+
+    async def _shared(self, key: str | Path, read: Callable[[], Awaitable[str]]) -> str:
+        task = self._inflight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(read())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        # One waiter being cancelled must not cancel the read for the others.
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str | Path, task: asyncio.Task[str]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    async def _revalidate_url(self, url: str) -> str:
+        entry = self._urls.get(url)
+        try:
+            fetched = await asyncio.to_thread(
+                fetch_text_source,
+                url,
+                etag=entry.etag if entry else None,
+                last_modified=entry.last_modified if entry else None,
+                label="URL template",
+            )
+        except Exception as exc:
+            if entry is None:
+                raise
+            logger.warning(f"Serving cached content for {url} after refresh failed: {exc}", url=url)
+            entry.checked_at = time.monotonic()
+            return entry.text
+
+        if fetched.text is None and entry is not None:
+            entry.checked_at = time.monotonic()
+            return entry.text
+        text = fetched.text or ""
+        self._urls[url] = _UrlEntry(
+            text=text,
+            etag=fetched.etag,
+            last_modified=fetched.last_modified,
+            checked_at=time.monotonic(),
+        )
+        return text
+
+    async def _read_file(self, path: Path) -> str:
+        entry = self._files.get(path)
+        try:
+            current = await asyncio.to_thread(_read_file_if_changed, path, entry)
+        except FileNotFoundError:
+            self._files.pop(path, None)
+            raise
+        except OSError as exc:
+            if entry is None:
+                raise
+            logger.warning(f"Serving cached content for {path} after read failed: {exc}")
+            return entry.text
+        self._files[path] = current
+        return current.text
+
+
+def _read_file_if_changed(path: Path, entry: _FileEntry | None) -> _FileEntry:
+    stat = path.stat()
+    if entry is not None and (entry.mtime_ns, entry.size) == (stat.st_mtime_ns, stat.st_size):
+        return entry
+    return _FileEntry(
+        text=path.read_text(encoding="utf-8"),
+        mtime_ns=stat.st_mtime_ns,
+        size=stat.st_size,
+    )
+
+
+_shared_cache = TemplateSourceCache()
+
+
+def template_source_cache() -> TemplateSourceCache:
+    """Return the cache shared by every InstructionBuilder in this process."""
+    return _shared_cache
@@ -514,8 +514,8 @@ def get_dependencies_groups(
                 # This should not happen if we checked for cycles
                 raise CircularDependencyError("Unresolvable dependency cycle detected")
 
-        # Add the current level to the result
-        result.append(list(current_level))
+        # Add the current level to the result, keeping declaration order
+        result.append([name for name in agent_names if name in current_level])
 
         # Remove current level from remaining
         remaining -= current_level
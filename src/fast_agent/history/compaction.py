@@ -8,11 +8,21 @@ counts used, so the operation stays inspectable after the fact.
 
 Used by the ``/compact`` command and the automatic post-turn trigger
 (``fast_agent.hooks.compaction``).
+
+With ``compaction.precompact_threshold`` set, a :class:`Precompactor` starts
+the summary in the background once usage passes that lower watermark, so the
+turn that later crosses ``compaction.threshold`` does not wait for a
+summarization call. The background summary is applied at the next turn
+boundary only if the messages it covers still lead the history unchanged;
+otherwise it is discarded and its spend is reported as wasted.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
+import time
+import weakref
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -23,7 +33,7 @@ from mcp_types import TextContent
 from fast_agent.constants import FAST_AGENT_COMPACTION_CHANNEL
 from fast_agent.core.logging.logger import get_logger
 from fast_agent.event_progress import ProgressAction
-from fast_agent.mcp.helpers.content_helpers import get_text
+from fast_agent.llm.token_estimation import CHARS_PER_TOKEN, token_estimator
 from fast_agent.mcp.prompt import Prompt
 from fast_agent.types.llm_stop_reason import LlmStopReason
 
@@ -65,7 +75,7 @@ SUMMARY_NOTICE = (
     "claims in the summary."
 )
 
-_CHARS_PER_TOKEN = 4
+_CHARS_PER_TOKEN = CHARS_PER_TOKEN
 _MIN_COMPACTABLE_MESSAGES = 2
 _SUMMARY_TOKEN_ALLOWANCE = 2048
 MID_TURN_RECENT_TOOL_EXCHANGES = 3
@@ -165,15 +175,44 @@ def should_auto_compact(
     settings: "CompactionSettings",
 ) -> bool:
     """True when server-observed context usage has crossed the configured threshold."""
-    if not settings.auto or usage is None:
+    if not settings.auto:
+        return False
+    ratio = _context_ratio(usage)
+    return ratio is not None and ratio >= settings.threshold
+
+
+def should_precompact(
+    usage: "UsageAccumulator | None",
+    settings: "CompactionSettings",
+) -> bool:
+    """True when context usage has crossed the background pre-compaction watermark."""
+    if not settings.auto or settings.precompact_threshold is None:
         return False
+    ratio = _context_ratio(usage)
+    return ratio is not None and ratio >= settings.precompact_threshold
+
+
+def _context_ratio(usage: "UsageAccumulator | None") -> float | None:
+    if usage is None:
+        return None
     window = usage.context_window_size
     if not window or window <= 0:
-        return False
+        return None
     current = usage.current_context_tokens
     if current is None or current <= 0:
-        return False
-    return (current / window) >= settings.threshold
+        return None
+    return current / window
+
+
+def compaction_token_budget(
+    usage: "UsageAccumulator | None",
+    settings: "CompactionSettings",
+) -> int | None:
+    """Largest post-compaction context size the planner aims for, if the window is known."""
+    context_window = usage.context_window_size if usage else None
+    if context_window is None or context_window <= 0:
+        return None
+    return int(context_window * settings.threshold)
 
 
 def _turn_start_indices(messages: list[PromptMessageExtended]) -> list[int]:
@@ -193,46 +232,16 @@ def _turn_start_indices(messages: list[PromptMessageExtended]) -> list[int]:
     ]
 
 
-def estimate_tokens(messages: list[PromptMessageExtended]) -> int:
-    """Rough token estimate for a message list.
+def estimate_tokens(messages: list[PromptMessageExtended], *, model: str | None = None) -> int:
+    """Estimate the prompt tokens for a message list.
 
-    Count text plus serialized non-text payloads. Compaction relies on this
-    estimate after replacing history; ignoring image/data blocks or diagnostic
-    channels can make a compacted history look small while still replaying a
-    provider-sized payload.
+    Counts text plus non-text payloads (tool traffic, channels, images).
+    Compaction relies on this estimate after replacing history; ignoring
+    image/data blocks or diagnostic channels can make a compacted history look
+    small while still replaying a provider-sized payload. Per-message counts are
+    cached and corrected for ``model`` from its observed usage.
     """
-    chars = 0
-    for message in messages:
-        chars += len(message.all_text())
-        for content in message.content:
-            if get_text(content) is not None:
-                # Text is already counted via all_text() above; only serialize
-                # non-text payloads here (matches the "non-text" docstring).
-                continue
-            try:
-                chars += len(content.model_dump_json())
-            except Exception:
-                chars += 64
-        if message.tool_calls:
-            for call in message.tool_calls.values():
-                try:
-                    chars += len(call.model_dump_json())
-                except Exception:
-                    chars += 64
-        if message.tool_results:
-            for result in message.tool_results.values():
-                try:
-                    chars += len(result.model_dump_json())
-                except Exception:
-                    chars += 64
-        if message.channels:
-            for blocks in message.channels.values():
-                for block in blocks:
-                    try:
-                        chars += len(block.model_dump_json())
-                    except Exception:
-                        chars += 64
-    return max(1, chars // _CHARS_PER_TOKEN)
+    return max(1, token_estimator().estimate_messages(messages, model=model))
 
 
 def _plan_compaction_with_budget(
@@ -241,6 +250,7 @@ def _plan_compaction_with_budget(
     keep_turns: int,
     max_tokens_after: int | None,
     recent_tool_exchanges: int | None = None,
+    model: str | None = None,
 ) -> CompactionPlan:
     """Return a compaction plan, reducing kept turns when the tail is too large."""
     if recent_tool_exchanges is not None:
@@ -260,7 +270,7 @@ def _plan_compaction_with_budget(
             except CompactionSkipped:
                 continue
             projected = (
-                estimate_tokens(candidate.templates + candidate.retained_tail)
+                estimate_tokens(candidate.templates + candidate.retained_tail, model=model)
                 + _SUMMARY_TOKEN_ALLOWANCE
             )
             if projected <= max_tokens_after:
@@ -277,7 +287,7 @@ def _plan_compaction_with_budget(
     for candidate_keep in range(max(keep_turns, 0), -1, -1):
         candidate = plan_compaction(history, keep_turns=candidate_keep)
         projected = (
-            estimate_tokens(candidate.templates + candidate.retained_tail)
+            estimate_tokens(candidate.templates + candidate.retained_tail, model=model)
             + _SUMMARY_TOKEN_ALLOWANCE
         )
         if projected <= max_tokens_after:
@@ -532,31 +542,60 @@ async def compact_conversation(
         raise CompactionError(f"Agent '{agent.name}' has no attached LLM.")
 
     usage = agent.usage_accumulator
-    tokens_before = usage.current_context_tokens if usage else None
-    context_window = usage.context_window_size if usage else None
-    if tokens_before is not None and tokens_before <= 0:
-        tokens_before = None
-
+    model = usage.model if usage else None
+    # Read before the summary call, which records its own usage turn.
+    tokens_before = observed_context_tokens(usage)
     history = list(agent.message_history)
-    max_tokens_after = (
-        int(context_window * settings.threshold)
-        if context_window is not None and context_window > 0
-        else None
-    )
     plan = _plan_compaction_with_budget(
         history,
         keep_turns=settings.keep_turns,
-        max_tokens_after=max_tokens_after,
+        max_tokens_after=compaction_token_budget(usage, settings),
         recent_tool_exchanges=recent_tool_exchanges,
+        model=model,
+    )
+
+    prompt_text, request_text = _summary_request(settings, instructions)
+    summary_text = await summarize_compaction_region(llm, plan, request_text)
+
+    return apply_compaction_summary(
+        agent,
+        history=history,
+        plan=plan,
+        summary_text=summary_text,
+        prompt_text=prompt_text,
+        tokens_before=tokens_before,
+        instructions=instructions,
     )
 
+
+def observed_context_tokens(usage: "UsageAccumulator | None") -> int | None:
+    """Current context size, or None when unknown."""
+    tokens = usage.current_context_tokens if usage else None
+    if tokens is not None and tokens <= 0:
+        return None
+    return tokens
+
+
+def _summary_request(
+    settings: "CompactionSettings",
+    instructions: str | None,
+) -> tuple[str, str]:
+    """Return the summarization prompt and the request text sent to the model."""
     prompt_text = resolve_compaction_prompt(settings)
     request_text = prompt_text
     if instructions and instructions.strip():
         request_text = (
             f"{prompt_text}\n\nAdditional focus for this summary:\n{instructions.strip()}"
         )
+    return prompt_text, request_text
+
 
+async def summarize_compaction_region(
+    llm: "FastAgentLLMProtocol",
+    plan: CompactionPlan,
+    request_text: str,
+) -> str:
+    """Ask ``llm`` for a checkpoint summary of the plan's templates and compact region."""
     summary_source = plan.templates + plan.compact_region
     previous_verb = llm.verb
     llm.verb = ProgressAction.COMPACTING
@@ -569,6 +608,27 @@ async def compact_conversation(
     summary_text = (response.last_text() or "").strip()
     if not summary_text:
         raise CompactionError("Compaction model returned an empty summary; history unchanged.")
+    return summary_text
+
+
+def apply_compaction_summary(
+    agent: CompactableAgent,
+    *,
+    history: list[PromptMessageExtended],
+    plan: CompactionPlan,
+    summary_text: str,
+    prompt_text: str,
+    tokens_before: int | None,
+    instructions: str | None = None,
+) -> CompactionResult:
+    """Replace the agent's history with ``plan`` compacted into ``summary_text``.
+
+    ``history`` is the full pre-compaction history, archived into the active
+    session when session persistence is enabled.
+    """
+    usage = agent.usage_accumulator
+    context_window = usage.context_window_size if usage else None
+    model = usage.model if usage else None
 
     archive_file = _archive_history(agent, history)
 
@@ -579,13 +639,13 @@ async def compact_conversation(
         messages_compacted=len(plan.compact_region),
         tokens_before=tokens_before,
         context_window=context_window,
-        model=usage.model if usage else None,
+        model=model,
     )
 
     new_history = plan.templates + [summary_message] + plan.retained_tail
     agent.load_message_history(new_history)
 
-    tokens_after_estimate = estimate_tokens(new_history)
+    tokens_after_estimate = estimate_tokens(new_history, model=model)
     if usage is not None:
         usage.set_context_estimate(tokens_after_estimate)
 
@@ -613,6 +673,245 @@ async def compact_conversation(
     )
 
 
+@dataclass(slots=True)
+class PrecompactionStats:
+    """Running totals for one agent's background pre-compaction."""
+
+    started: int = 0
+    applied: int = 0
+    discarded: int = 0
+    seconds_saved: float = 0.0
+    """Summarization time that applied summaries kept out of the user's turns."""
+    wasted_tokens: int = 0
+    """Tokens spent on discarded summaries."""
+    wasted_cost_usd: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class AppliedPrecompaction:
+    """A background summary applied at a turn boundary."""
+
+    result: CompactionResult
+    seconds_saved: float
+    """Summarization time not spent waiting at the turn boundary."""
+
+
+@dataclass(slots=True)
+class _PendingPrecompaction:
+    plan: CompactionPlan
+    prompt_text: str
+    prefix_state: tuple[tuple[int, int, int], ...]
+    llm: FastAgentLLMProtocol
+    task: asyncio.Task[str]
+    started_at: float
+    finished_at: float | None = None
+
+
+class Precompactor:
+    """Background compaction summary for one agent.
+
+    The summary is generated on a side LLM (see ``SideLlmCapable``) so its usage
+    and progress never interleave with the agent's own turns. Its usage turns
+    are added to the agent's accumulator once the summary is applied or
+    discarded.
+    """
+
+    def __init__(self) -> None:
+        self.stats = PrecompactionStats()
+        self._pending: _PendingPrecompaction | None = None
+
+    @property
+    def pending(self) -> bool:
+        return self._pending is not None
+
+    def start(self, agent: CompactableAgent, settings: "CompactionSettings") -> bool:
+        """Start summarizing the compactable history; False when there is nothing to do."""
+        from fast_agent.interfaces import SideLlmCapable
+
+        if self._pending is not None or not isinstance(agent, SideLlmCapable):
+            return False
+        usage = agent.usage_accumulator
+        try:
+            plan = _plan_compaction_with_budget(
+                list(agent.message_history),
+                keep_turns=settings.keep_turns,
+                max_tokens_after=compaction_token_budget(usage, settings),
+                model=usage.model if usage else None,
+            )
+        except CompactionSkipped:
+            return False
+        llm = agent.spawn_side_llm()
+        if llm is None:
+            return False
+
+        prompt_text, request_text = _summary_request(settings, None)
+        pending = _PendingPrecompaction(
+            plan=plan,
+            prompt_text=prompt_text,
+            prefix_state=_prefix_state(plan.templates + plan.compact_region),
+            llm=llm,
+            task=asyncio.create_task(summarize_compaction_region(llm, plan, request_text)),
+            started_at=time.perf_counter(),
+        )
+        pending.task.add_done_callback(lambda task: _mark_finished(pending, task))
+        self._pending = pending
+        self.stats.started += 1
+        logger.info(
+            "Started background compaction summary",
+            data={"agent": agent.name, "messages": len(plan.compact_region)},
+        )
+        return True
+
+    async def apply(
+        self,
+        agent: CompactableAgent,
+        settings: "CompactionSettings",
+        *,
+        wait: bool,
+    ) -> AppliedPrecompaction | None:
+        """Apply the background summary if it still matches the history.
+
+        An unfinished summary is left running unless ``wait`` is set, in which
+        case it is awaited here instead of starting a new summarization call.
+        """
+        pending = self._pending
+        if pending is None:
+            return None
+        if not _prefix_unchanged(pending, agent.message_history):
+            self.discard(agent, reason="history changed")
+            return None
+
+        waited = 0.0
+        if not pending.task.done():
+            if not wait:
+                return None
+            wait_started = time.perf_counter()
+            await asyncio.wait([pending.task])
+            waited = time.perf_counter() - wait_started
+            if self._pending is not pending:
+                return None
+            if not _prefix_unchanged(pending, agent.message_history):
+                self.discard(agent, reason="history changed")
+                return None
+        if pending.task.cancelled() or pending.task.exception() is not None:
+            self.discard(agent, reason="summary failed")
+            return None
+
+        history = list(agent.message_history)
+        prefix_length = len(pending.prefix_state)
+        plan = CompactionPlan(
+            templates=pending.plan.templates,
+            compact_region=pending.plan.compact_region,
+            retained_tail=history[prefix_length:],
+        )
+        usage = agent.usage_accumulator
+        budget = compaction_token_budget(usage, settings)
+        projected = (
+            estimate_tokens(
+                plan.templates + plan.retained_tail, model=usage.model if usage else None
+            )
+            + _SUMMARY_TOKEN_ALLOWANCE
+        )
+        if budget is not None and projected > budget:
+            self.discard(agent, reason="recent turns no longer fit the compaction budget")
+            return None
+
+        self._pending = None
+        tokens_before = observed_context_tokens(usage)
+        _record_side_usage(usage, pending.llm)
+        result = apply_compaction_summary(
+            agent,
+            history=history,
+            plan=plan,
+            summary_text=pending.task.result(),
+            prompt_text=pending.prompt_text,
+            tokens_before=tokens_before,
+        )
+        finished_at = pending.finished_at or time.perf_counter()
+        seconds_saved = max(0.0, finished_at - pending.started_at - waited)
+        self.stats.applied += 1
+        self.stats.seconds_saved += seconds_saved
+        logger.info(
+            "Applied background compaction summary",
+            data={"agent": agent.name, "seconds_saved": round(seconds_saved, 3)},
+        )
+        return AppliedPrecompaction(result=result, seconds_saved=seconds_saved)
+
+    def discard(self, agent: CompactableAgent, *, reason: str) -> None:
+        """Cancel or drop the background summary, recording its spend as wasted."""
+        pending = self._pending
+        if pending is None:
+            return
+        self._pending = None
+        pending.task.cancel()
+        tokens, cost_usd = _record_side_usage(agent.usage_accumulator, pending.llm)
+        self.stats.discarded += 1
+        self.stats.wasted_tokens += tokens
+        self.stats.wasted_cost_usd += cost_usd
+        logger.info(
+            "Discarded background compaction summary",
+            data={
+                "agent": agent.name,
+                "reason": reason,
+                "wasted_tokens": tokens,
+                "wasted_cost_usd": cost_usd,
+            },
+        )
+
+
+_precompactors: weakref.WeakKeyDictionary[object, Precompactor] = weakref.WeakKeyDictionary()
+
+
+def precompactor_for(agent: CompactableAgent) -> Precompactor:
+    """Return the background compaction state for ``agent``, creating it if needed."""
+    precompactor = _precompactors.get(agent)
+    if precompactor is None:
+        precompactor = _precompactors[agent] = Precompactor()
+    return precompactor
+
+
+def _mark_finished(pending: _PendingPrecompaction, task: asyncio.Task[str]) -> None:
+    pending.finished_at = time.perf_counter()
+    if not task.cancelled():
+        # Retrieve failures here so an unapplied summary never logs them as unhandled.
+        task.exception()
+
+
+def _prefix_state(messages: list[PromptMessageExtended]) -> tuple[tuple[int, int, int], ...]:
+    return tuple(
+        (id(message), len(message.content), len(message.tool_results or {})) for message in messages
+    )
+
+
+def _prefix_unchanged(
+    pending: _PendingPrecompaction,
+    history: list[PromptMessageExtended],
+) -> bool:
+    # The pending plan holds the prefix messages, so their ids cannot be reused.
+    prefix_length = len(pending.prefix_state)
+    if len(history) < prefix_length:
+        return False
+    return _prefix_state(history[:prefix_length]) == pending.prefix_state
+
+
+def _record_side_usage(
+    usage: "UsageAccumulator | None",
+    llm: "FastAgentLLMProtocol",
+) -> tuple[int, float]:
+    """Add a side LLM's usage turns to ``usage``; returns its tokens and cost."""
+    side_usage = llm.usage_accumulator
+    if side_usage is None or not side_usage.turns:
+        return 0, 0.0
+    turns = list(side_usage.turns)
+    if usage is not None:
+        context_tokens = usage.current_context_tokens
+        for turn in turns:
+            usage.add_turn(turn)
+        # The summary call's prompt is not the conversation's context size.
+        usage.set_context_estimate(context_tokens)
+    return side_usage.summary.total or 0, sum(turn.cost_usd or 0.0 for turn in turns)
+
+
 async def persist_compacted_session(agent: CompactableAgent, *, no_home: bool = False) -> None:
     """Persist the agent's (now compacted) history into the active session."""
 
@@ -3,6 +3,10 @@
 After a turn completes, compacts the agent's history when server-observed
 context usage crosses the configured threshold (``compaction.threshold`` in
 settings). Failures never break the turn; history is left untouched.
+
+When ``compaction.precompact_threshold`` is set, crossing it starts a summary
+in the background; a later turn boundary applies it without waiting for a
+summarization call.
 """
 
 from __future__ import annotations
@@ -15,7 +19,9 @@ from fast_agent.history.compaction import (
     MID_TURN_RECENT_TOOL_EXCHANGES,
     CompactionSkipped,
     compact_conversation,
+    precompactor_for,
     should_auto_compact,
+    should_precompact,
 )
 from fast_agent.hooks.hook_messages import show_hook_failure, show_hook_message
 
@@ -69,8 +75,18 @@ async def _auto_compact_history(ctx: "HookContext", *, mid_turn: bool) -> None:
     if not _effective_use_history(ctx):
         return
 
-    if not should_auto_compact(ctx.usage, settings):
+    agent = cast("CompactableAgent", ctx.agent)
+    compact_now = should_auto_compact(ctx.usage, settings)
+    if settings.precompact_threshold is not None and not mid_turn:
+        if await _apply_precompaction(ctx, agent, settings, wait=compact_now):
+            return
+        if not compact_now and should_precompact(ctx.usage, settings):
+            precompactor_for(agent).start(agent, settings)
+
+    if not compact_now:
         return
+    # A synchronous compaction rewrites the history a background summary covers.
+    precompactor_for(agent).discard(agent, reason="compacting synchronously")
 
     usage = ctx.usage
     percent = usage.context_usage_percentage if usage else None
@@ -86,7 +102,7 @@ async def _auto_compact_history(ctx: "HookContext", *, mid_turn: bool) -> None:
 
     try:
         result = await compact_conversation(
-            cast("CompactableAgent", ctx.agent),
+            agent,
             settings=settings,
             recent_tool_exchanges=MID_TURN_RECENT_TOOL_EXCHANGES if mid_turn else None,
         )
@@ -104,3 +120,37 @@ async def _auto_compact_history(ctx: "HookContext", *, mid_turn: bool) -> None:
 
     combined = Text("\n").join(compaction_summary_lines(result))
     show_hook_message(ctx, combined, hook_name=_HOOK_NAME, style="cyan")
+
+
+async def _apply_precompaction(
+    ctx: "HookContext",
+    agent: "CompactableAgent",
+    settings: "CompactionSettings",
+    *,
+    wait: bool,
+) -> bool:
+    precompactor = precompactor_for(agent)
+    try:
+        applied = await precompactor.apply(agent, settings, wait=wait)
+    except Exception as exc:
+        precompactor.discard(agent, reason=f"apply failed: {exc}")
+        show_hook_failure(ctx, hook_name=_HOOK_NAME, error=exc)
+        logger.exception("Applying background compaction failed; history unchanged")
+        return False
+    if applied is None:
+        return False
+
+    from rich.text import Text
+
+    from fast_agent.ui.compaction_display import compaction_summary_lines
+
+    stats = precompactor.stats
+    note = Text(f"applied background summary, {applied.seconds_saved:.1f}s saved", style="dim")
+    if stats.discarded:
+        note.append(
+            f" • {stats.discarded} discarded"
+            f" ({stats.wasted_tokens:,} tokens, ${stats.wasted_cost_usd:.4f} wasted)"
+        )
+    lines = [*compaction_summary_lines(applied.result), note]
+    show_hook_message(ctx, Text("\n").join(lines), hook_name=_HOOK_NAME, style="cyan")
+    return True
@@ -426,6 +426,13 @@ class ToolRunnerHookCapable(Protocol):
     def tool_runner_hooks(self, value: "ToolRunnerHooks | None") -> None: ...
 
 
+@runtime_checkable
+class SideLlmCapable(Protocol):
+    """Optional capability for agents to create LLMs for background side-channel calls."""
+
+    def spawn_side_llm(self) -> FastAgentLLMProtocol | None: ...
+
+
 @runtime_checkable
 class TurnCancellationStateCapable(Protocol):
     """Optional capability for agents to expose last-turn cancellation state."""
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import tempfile
 from contextlib import contextmanager
+from dataclasses import dataclass
+from http import HTTPStatus
 from pathlib import Path
 from typing import TYPE_CHECKING, BinaryIO, Protocol
 from urllib.parse import ParseResult, urlparse
@@ -46,6 +48,52 @@ def read_text_source(source: str | Path, *, label: str = "source") -> str:
         raise ValueError(f"Could not read {label} {source_text}: {exc}") from exc
 
 
+@dataclass(frozen=True, slots=True)
+class TextSourceFetch:
+    """Result of a conditional read; ``text`` is None when the source is unchanged."""
+
+    text: str | None
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+def fetch_text_source(
+    source: str,
+    *,
+    etag: str | None = None,
+    last_modified: str | None = None,
+    label: str = "source",
+) -> TextSourceFetch:
+    """Read a text source, revalidating HTTP(S) URLs against a previous read.
+
+    The validators are sent as ``If-None-Match``/``If-Modified-Since``; a 304
+    response yields ``text=None``. Other sources have no validators and are
+    always read in full.
+    """
+    parsed = urlparse(source)
+    if parsed.scheme not in {"http", "https"}:
+        return TextSourceFetch(text=read_text_source(source, label=label))
+
+    headers: dict[str, str] = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    try:
+        response = requests.get(source, headers=headers, timeout=30)
+        if response.status_code == HTTPStatus.NOT_MODIFIED:
+            return TextSourceFetch(text=None, etag=etag, last_modified=last_modified)
+        response.raise_for_status()
+    except requests.RequestException as exc:
+        raise ValueError(f"Could not read {label} {source}: {exc}") from exc
+    response.encoding = response.encoding or "utf-8"
+    return TextSourceFetch(
+        text=response.text,
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"),
+    )
+
+
 def materialize_text_source(
     source: str | Path,
     *,
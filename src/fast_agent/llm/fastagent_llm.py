@@ -74,6 +74,8 @@ from fast_agent.llm.text_verbosity import (
     TextVerbositySpec,
     validate_text_verbosity,
 )
+from fast_agent.llm.token_estimation import token_estimator
+from fast_agent.llm.tool_payload_cache import ToolPayloadCache
 from fast_agent.llm.usage_tracking import TurnUsage, UsageAccumulator
 from fast_agent.mcp.helpers.content_helpers import get_text
 from fast_agent.mcp.prompt import Prompt
@@ -148,6 +150,9 @@ class FastAgentLLM(ContextDependent, FastAgentLLMProtocol, Generic[MessageParamT
         PARAM_MCP_TOOL_CHOICE,
     }
 
+    OTEL_INSTRUMENTATION: ClassVar[str | None] = None
+    """LLM SDK instrumented for OpenTelemetry when the first instance is created."""
+
     """
     Implementation of the Llm Protocol - intended be subclassed for Provider
     or behaviour specific reasons. Contains convenience and template methods.
@@ -186,6 +191,10 @@ class FastAgentLLM(ContextDependent, FastAgentLLMProtocol, Generic[MessageParamT
         # subclasses (e.g. AnthropicLLM) may pop it first for their own handling.
         long_context_requested = kwargs.pop("long_context", False)
         super().__init__(context=context, **kwargs)
+        if self.OTEL_INSTRUMENTATION is not None:
+            from fast_agent.context import instrument_llm_sdk
+
+            instrument_llm_sdk(self.OTEL_INSTRUMENTATION)
         self.logger = get_logger(__name__)
         self.executor = self.context.executor
         self.name: str = name or "fast-agent"
@@ -243,6 +252,8 @@ class FastAgentLLM(ContextDependent, FastAgentLLMProtocol, Generic[MessageParamT
         self.retry_count = self._resolve_retry_count()
         self.retry_backoff_seconds: float = 10.0
         self._provider_managed_mcp_state = ProviderManagedMCPState()
+        # Provider-ready tool payloads, reused while the tool objects are unchanged.
+        self._tool_payloads: ToolPayloadCache[Any] = ToolPayloadCache()
 
     @staticmethod
     def _normalize_default_headers(raw_default_headers: Any) -> dict[str, str] | None:
@@ -976,9 +987,37 @@ class FastAgentLLM(ContextDependent, FastAgentLLMProtocol, Generic[MessageParamT
 
         self.usage_accumulator.count_tools(len(assistant_response.tool_calls or {}))
         self._append_usage_channel(assistant_response, start_index=usage_start_index)
+        self._calibrate_token_estimator(
+            full_history,
+            prepared_tools,
+            start_index=usage_start_index,
+        )
 
         return assistant_response
 
+    def _calibrate_token_estimator(
+        self,
+        messages: list[PromptMessageExtended],
+        tools: list[Tool] | None,
+        *,
+        start_index: int,
+    ) -> None:
+        """Teach the local token estimator from the prompt total of this request."""
+        turns = self.usage_accumulator.turns
+        if len(turns) <= start_index:
+            return
+        final_attempt = turns[-1]
+        if final_attempt.prompt.total is None:
+            return
+        estimator = token_estimator()
+        counts = estimator.count_request(
+            messages,
+            instruction=self.instruction,
+            tools=tools,
+            model=final_attempt.model,
+        )
+        estimator.observe(final_attempt.model, counts, final_attempt.prompt.total)
+
     def _append_usage_channel(
         self,
         response: PromptMessageExtended,
@@ -1403,9 +1442,7 @@ class FastAgentLLM(ContextDependent, FastAgentLLMProtocol, Generic[MessageParamT
         Returns:
             Updated estimated token count
         """
-        # Rough estimate: 1 token per 4 characters (OpenAI's typical ratio)
-        text_length = len(content)
-        additional_tokens = max(1, text_length // 4)
+        additional_tokens = max(1, token_estimator().estimate_text(content, model=model))
         new_total = estimated_tokens + additional_tokens
 
         # Format token count for display
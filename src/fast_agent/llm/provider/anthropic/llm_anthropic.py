@@ -472,6 +472,7 @@ def _transform_anthropic_schema(schema: type[BaseModel] | dict[str, Any]) -> dic
 
 class AnthropicLLM(FastAgentLLM[BetaMessageParam, BetaMessage]):
     MAX_CONVERSATION_CACHE_BLOCKS = 2
+    OTEL_INSTRUMENTATION: ClassVar[str | None] = "anthropic"
     # Anthropic-specific parameter exclusions
     ANTHROPIC_EXCLUDE_FIELDS: ClassVar[set[str]] = {
         FastAgentLLM.PARAM_MESSAGES,
@@ -1130,14 +1131,15 @@ class AnthropicLLM(FastAgentLLM[BetaMessageParam, BetaMessage]):
         auto_tool_use_fallback: bool = False,
     ) -> list[BetaToolParam]:
         """Prepare tools based on whether we're in structured output mode."""
-        regular_tools = [
-            BetaToolParam(
+        regular_tools: list[BetaToolParam] = self._tool_payloads.payloads(
+            tools or [],
+            "anthropic",
+            lambda tool: BetaToolParam(
                 name=tool.name,
                 description=tool.description or "",
                 input_schema=tool.input_schema,
-            )
-            for tool in tools or []
-        ]
+            ),
+        )
         if (structured_model or structured_schema) and structured_mode == "tool_use":
             if auto_tool_use_fallback and regular_tools:
                 logger.warning(
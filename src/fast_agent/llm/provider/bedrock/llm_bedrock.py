@@ -668,77 +668,75 @@ class BedrockLLM(FastAgentLLM[BedrockMessageParam, BedrockMessage]):
         - Properties can only have type and description
         - Tools with no parameters should have empty properties object
         """
-        bedrock_tools = []
-
         self.logger.debug(f"Converting {len(tools.tools)} MCP tools to Nova format")
 
-        for tool in tools.tools:
-            self.logger.debug(f"Converting MCP tool: {tool.name}")
-
-            # Extract and validate the input schema
-            input_schema = tool.input_schema or {}
-
-            # Create Nova-compliant schema with ONLY the three allowed fields
-            # Always include type and properties (even if empty)
-            nova_schema: dict[str, Any] = {"type": "object", "properties": {}}
+        # Use the tool name mapping that was already built in _bedrock_completion
+        # This ensures consistent transformation logic across the codebase
+        clean_names: dict[str, str] = {}
+        for mapped_name, original_name in tool_name_mapping.items():
+            clean_names.setdefault(original_name, mapped_name)
 
-            # Properties - clean them strictly
-            properties: dict[str, Any] = {}
-            if "properties" in input_schema and isinstance(input_schema["properties"], dict):
-                for prop_name, prop_def in input_schema["properties"].items():
-                    # Only include type and description for each property
-                    clean_prop: dict[str, Any] = {}
+        bedrock_tools = self._tool_payloads.payloads(
+            tools.tools,
+            ("bedrock-nova", tuple(tool_name_mapping.items())),
+            lambda tool: self._nova_tool_spec(tool, clean_names.get(tool.name)),
+        )
 
-                    if isinstance(prop_def, dict):
-                        # Only include type (required) and description (optional)
-                        clean_prop["type"] = prop_def.get("type", "string")
-                        # Nova allows description in properties
-                        if "description" in prop_def:
-                            clean_prop["description"] = prop_def["description"]
-                    else:
-                        # Handle simple property definitions
-                        clean_prop["type"] = "string"
+        self.logger.debug(f"Converted {len(bedrock_tools)} tools for Nova format")
+        return bedrock_tools
 
-                    properties[prop_name] = clean_prop
+    def _nova_tool_spec(self, tool: Tool, clean_name: str | None) -> dict[str, Any]:
+        self.logger.debug(f"Converting MCP tool: {tool.name}")
+
+        # Extract and validate the input schema
+        input_schema = tool.input_schema or {}
+
+        # Create Nova-compliant schema with ONLY the three allowed fields
+        # Always include type and properties (even if empty)
+        nova_schema: dict[str, Any] = {"type": "object", "properties": {}}
+
+        # Properties - clean them strictly
+        properties: dict[str, Any] = {}
+        if "properties" in input_schema and isinstance(input_schema["properties"], dict):
+            for prop_name, prop_def in input_schema["properties"].items():
+                # Only include type and description for each property
+                clean_prop: dict[str, Any] = {}
+
+                if isinstance(prop_def, dict):
+                    # Only include type (required) and description (optional)
+                    clean_prop["type"] = prop_def.get("type", "string")
+                    # Nova allows description in properties
+                    if "description" in prop_def:
+                        clean_prop["description"] = prop_def["description"]
+                else:
+                    # Handle simple property definitions
+                    clean_prop["type"] = "string"
 
-            # Always set properties (even if empty for parameterless tools)
-            nova_schema["properties"] = properties
+                properties[prop_name] = clean_prop
 
-            # Required fields - only add if present and not empty
-            if (
-                "required" in input_schema
-                and isinstance(input_schema["required"], list)
-                and input_schema["required"]
-            ):
-                nova_schema["required"] = input_schema["required"]
+        # Always set properties (even if empty for parameterless tools)
+        nova_schema["properties"] = properties
 
-            # Use the tool name mapping that was already built in _bedrock_completion
-            # This ensures consistent transformation logic across the codebase
-            clean_name = None
-            for mapped_name, original_name in tool_name_mapping.items():
-                if original_name == tool.name:
-                    clean_name = mapped_name
-                    break
+        # Required fields - only add if present and not empty
+        if (
+            "required" in input_schema
+            and isinstance(input_schema["required"], list)
+            and input_schema["required"]
+        ):
+            nova_schema["required"] = input_schema["required"]
 
-            if clean_name is None:
-                # Fallback if mapping not found (shouldn't happen)
-                clean_name = tool.name
-                self.logger.warning(
-                    f"Tool name mapping not found for {tool.name}, using original name"
-                )
+        if clean_name is None:
+            # Fallback if mapping not found (shouldn't happen)
+            clean_name = tool.name
+            self.logger.warning(f"Tool name mapping not found for {tool.name}, using original name")
 
-            bedrock_tool = {
-                "toolSpec": {
-                    "name": clean_name,
-                    "description": tool.description or f"Tool: {tool.name}",
-                    "inputSchema": {"json": nova_schema},
-                }
+        return {
+            "toolSpec": {
+                "name": clean_name,
+                "description": tool.description or f"Tool: {tool.name}",
+                "inputSchema": {"json": nova_schema},
             }
-
-            bedrock_tools.append(bedrock_tool)
-
-        self.logger.debug(f"Converted {len(bedrock_tools)} tools for Nova format")
-        return bedrock_tools
+        }
 
     def _convert_tools_system_prompt_format(
         self, tools: "ListToolsResult", tool_name_mapping: dict[str, str]
@@ -801,30 +799,31 @@ class BedrockLLM(FastAgentLLM[BedrockMessageParam, BedrockMessage]):
             f"Converting {len(tools.tools)} MCP tools to Anthropic format with toolSpec wrapper"
         )
 
-        bedrock_tools = []
-        for tool in tools.tools:
-            self.logger.debug(f"Converting MCP tool: {tool.name}")
-
-            # Use raw MCP schema (like native Anthropic provider) - no cleaning
-            input_schema = tool.input_schema or {"type": "object", "properties": {}}
-
-            # Wrap in Bedrock toolSpec format but preserve raw Anthropic schema
-            bedrock_tool = {
-                "toolSpec": {
-                    "name": tool.name,  # Original name, no cleaning
-                    "description": tool.description or f"Tool: {tool.name}",
-                    "inputSchema": {
-                        "json": input_schema  # Raw MCP schema, not cleaned
-                    },
-                }
-            }
-            bedrock_tools.append(bedrock_tool)
+        bedrock_tools = self._tool_payloads.payloads(
+            tools.tools, "bedrock-anthropic", self._anthropic_tool_spec
+        )
 
         self.logger.debug(
             f"Converted {len(bedrock_tools)} tools to Anthropic format with toolSpec wrapper"
         )
         return bedrock_tools
 
+    @staticmethod
+    def _anthropic_tool_spec(tool: Tool) -> dict[str, Any]:
+        # Use raw MCP schema (like native Anthropic provider) - no cleaning
+        input_schema = tool.input_schema or {"type": "object", "properties": {}}
+
+        # Wrap in Bedrock toolSpec format but preserve raw Anthropic schema
+        return {
+            "toolSpec": {
+                "name": tool.name,  # Original name, no cleaning
+                "description": tool.description or f"Tool: {tool.name}",
+                "inputSchema": {
+                    "json": input_schema  # Raw MCP schema, not cleaned
+                },
+            }
+        }
+
     def _parse_tool_arguments(self, func_name: str, args_str: str) -> dict[str, Any]:
         """Parse tool call arguments from key=value or single-value format.
 
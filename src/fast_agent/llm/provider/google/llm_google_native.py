@@ -4,7 +4,7 @@ import secrets
 from collections.abc import Mapping
 from contextlib import suppress
 from dataclasses import dataclass, field
-from typing import Any, cast
+from typing import Any, ClassVar, cast
 
 from google import genai
 from google.genai import (
@@ -148,6 +148,8 @@ class GoogleNativeLLM(FastAgentLLM[types.Content, types.Content]):
     Google LLM provider using the native google.genai library.
     """
 
+    OTEL_INSTRUMENTATION: ClassVar[str | None] = "google_genai"
+
     def __init__(self, **kwargs) -> None:
         kwargs.pop("provider", None)
         web_search_override = kwargs.pop("web_search", None)
@@ -809,7 +811,13 @@ class GoogleNativeLLM(FastAgentLLM[types.Content, types.Content]):
     ) -> types.ToolListUnion:
         available_tools: types.ToolListUnion = []
         if tools and not suppress_tools:
-            available_tools.extend(self._converter.convert_to_google_tools(tools))
+            available_tools.extend(
+                self._tool_payloads.payloads(
+                    tools,
+                    "google",
+                    lambda tool: self._converter.convert_to_google_tools([tool])[0],
+                )
+            )
         if self.web_search_enabled and sampling_tool_choice is None:
             available_tools.append(types.Tool(google_search=types.GoogleSearch()))
         return available_tools
@@ -199,6 +199,7 @@ class OpenAILLM(
 ):
     # Config section name override (falls back to provider value)
     config_section: str | None = None
+    OTEL_INSTRUMENTATION: ClassVar[str | None] = "openai"
     # OpenAI-specific parameter exclusions
     OPENAI_EXCLUDE_FIELDS: ClassVar[set[str]] = {
         FastAgentLLM.PARAM_MESSAGES,
@@ -1214,17 +1215,18 @@ class OpenAILLM(
     ) -> list[ChatCompletionToolParam] | None:
         available_tools = cast(
             "list[ChatCompletionToolParam]",
-            [
-                {
+            self._tool_payloads.payloads(
+                tools or [],
+                ("chat", model_name),
+                lambda tool: {
                     "type": "function",
                     "function": {
                         "name": tool.name,
                         "description": tool.description if tool.description else "",
                         "parameters": self.adjust_schema(tool.input_schema, model_name=model_name),
                     },
-                }
-                for tool in tools or []
-            ],
+                },
+            ),
         )
         if available_tools:
             return available_tools
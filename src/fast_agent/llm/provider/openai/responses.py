@@ -37,7 +37,9 @@ from fast_agent.llm.provider.openai.responses_files import ResponsesFileMixin
 from fast_agent.llm.provider.openai.responses_output import ResponsesOutputMixin
 from fast_agent.llm.provider.openai.responses_streaming import ResponsesStreamingMixin
 from fast_agent.llm.provider.openai.responses_websocket import (
+    RESPONSES_CREATE_EVENT_TYPE,
     ManagedWebSocketConnection,
+    PlannedWsRequest,
     ResponsesWebSocketError,
     ResponsesWebSocketKeepaliveOptions,
     ResponsesWsRequestPlanner,
@@ -90,6 +92,7 @@ DEFAULT_RESPONSES_BASE_URL = "https://api.openai.com/v1"
 RESPONSES_DIAGNOSTICS_CHANNEL = "fast-agent-provider-diagnostics"
 RESPONSE_INCLUDE_REASONING = "reasoning.encrypted_content"
 RESPONSE_INCLUDE_WEB_SEARCH_SOURCES = "web_search_call.action.sources"
+PREVIOUS_RESPONSE_NOT_FOUND_CODE = "previous_response_not_found"
 OPENAI_TOOL_SEARCH_TOOL = {"type": "tool_search", "execution": "server"}
 
 ResponsesTransport = Literal["sse", "websocket", "auto"]
@@ -165,6 +168,7 @@ class ResponsesLLM(
     """LLM implementation for OpenAI's Responses models."""
 
     config_section: str | None = None
+    OTEL_INSTRUMENTATION: ClassVar[str | None] = "openai"
 
     RESPONSES_EXCLUDE_FIELDS: ClassVar[set[str]] = {
         FastAgentLLM.PARAM_MESSAGES,
@@ -237,6 +241,11 @@ class ResponsesLLM(
         self._last_ws_turn_outcome: ResponsesWsTurnOutcome | None = None
         self._last_ws_phase_timings_ms: dict[str, float] | None = None
         self._last_stream_timing: dict[str, int | float | bool | None] | None = None
+        self._http_continuation = False
+        self._sse_request_planner: ResponsesWsRequestPlanner | None = None
+        self._last_http_request_mode: Literal["create", "continuation"] | None = None
+        self._last_http_payload_saved_bytes: int | None = None
+        self._http_payload_saved_bytes_total = 0
         self._ws_turn_counters: dict[str, int] = {
             "total": 0,
             RESPONSES_WS_FRESH_OUTCOME: 0,
@@ -317,6 +326,10 @@ class ResponsesLLM(
     ) -> None:
         self._transport = self._resolve_transport_setting(kwargs.get("transport"), settings)
         self._validate_transport_support(chosen_model, self._transport)
+        http_continuation = kwargs.get("http_continuation")
+        if http_continuation is None and settings is not None:
+            http_continuation = getattr(settings, "http_continuation", False)
+        self._http_continuation = http_continuation is True
 
     @property
     def active_transport(self) -> ResponsesActiveTransport | None:
@@ -351,6 +364,13 @@ class ResponsesLLM(
         payload: dict[str, Any] = {"transport": self._last_transport_used or "unknown"}
         if self._last_stream_timing is not None:
             payload["stream_timing"] = self._last_stream_timing
+        if self._last_transport_used == RESPONSES_TRANSPORT_SSE:
+            if self._last_http_request_mode is not None:
+                payload["http_request_mode"] = self._last_http_request_mode
+            if self._last_http_payload_saved_bytes is not None:
+                payload["http_payload_saved_bytes"] = self._last_http_payload_saved_bytes
+                payload["http_payload_saved_bytes_total"] = self._http_payload_saved_bytes_total
+            return payload
         if self._last_transport_used != RESPONSES_TRANSPORT_WEBSOCKET:
             return payload
         if self._last_ws_request_type:
@@ -563,6 +583,16 @@ class ResponsesLLM(
     def _new_ws_request_planner(self) -> ResponsesWsRequestPlanner:
         return StatefulContinuationResponsesWsPlanner()
 
+    def _new_sse_request_planner(self) -> ResponsesWsRequestPlanner:
+        # Only used for opt-in HTTP continuations, which need the prior response
+        # stored server-side; the websocket planner's prefix and signature checks apply.
+        return StatefulContinuationResponsesWsPlanner()
+
+    def _sse_planner(self) -> ResponsesWsRequestPlanner:
+        if self._sse_request_planner is None:
+            self._sse_request_planner = self._new_sse_request_planner()
+        return self._sse_request_planner
+
     def _websocket_retry_diagnostics(
         self,
         connection: ManagedWebSocketConnection,
@@ -601,6 +631,53 @@ class ResponsesLLM(
             return None
         return len(compact.encode("utf-8"))
 
+    def _payload_savings(
+        self,
+        sent_arguments: dict[str, Any],
+        full_arguments: dict[str, Any],
+    ) -> tuple[int | None, int | None, int | None, float | None]:
+        sent_payload_bytes = self._payload_size_bytes(sent_arguments)
+        full_payload_bytes = self._payload_size_bytes(full_arguments)
+        payload_saved_bytes: int | None = None
+        payload_saved_ratio: float | None = None
+        if sent_payload_bytes is not None and full_payload_bytes and full_payload_bytes > 0:
+            payload_saved_bytes = max(0, full_payload_bytes - sent_payload_bytes)
+            payload_saved_ratio = payload_saved_bytes / full_payload_bytes
+        return sent_payload_bytes, full_payload_bytes, payload_saved_bytes, payload_saved_ratio
+
+    def _report_sse_request_plan(
+        self,
+        *,
+        model_name: str,
+        planned_request: PlannedWsRequest,
+        full_arguments: dict[str, Any],
+    ) -> None:
+        if not self._http_continuation:
+            return
+        continuation_id = planned_request.arguments.get("previous_response_id")
+        request_mode: Literal["create", "continuation"] = (
+            "continuation" if isinstance(continuation_id, str) and continuation_id else "create"
+        )
+        sent_payload_bytes, full_payload_bytes, payload_saved_bytes, payload_saved_ratio = (
+            self._payload_savings(planned_request.arguments, full_arguments)
+        )
+        self._last_http_request_mode = request_mode
+        self._last_http_payload_saved_bytes = payload_saved_bytes
+        self.logger.info(
+            "Responses HTTP request plan",
+            data={
+                "model": model_name,
+                "request_mode": request_mode,
+                "sent_input_items": self._ws_input_count(planned_request.arguments),
+                "total_input_items": self._ws_input_count(full_arguments),
+                "sent_payload_bytes": sent_payload_bytes,
+                "total_payload_bytes": full_payload_bytes,
+                "payload_saved_bytes": payload_saved_bytes,
+                "payload_saved_ratio": payload_saved_ratio,
+                "previous_response_id": continuation_id if request_mode == "continuation" else None,
+            },
+        )
+
     def _report_ws_request_plan(
         self,
         *,
@@ -617,13 +694,9 @@ class ResponsesLLM(
         self._last_ws_request_mode = request_mode
         sent_input_count = self._ws_input_count(planned_request.arguments)
         full_input_count = self._ws_input_count(full_arguments)
-        sent_payload_bytes = self._payload_size_bytes(planned_request.arguments)
-        full_payload_bytes = self._payload_size_bytes(full_arguments)
-        payload_saved_bytes: int | None = None
-        payload_saved_ratio: float | None = None
-        if sent_payload_bytes is not None and full_payload_bytes and full_payload_bytes > 0:
-            payload_saved_bytes = max(0, full_payload_bytes - sent_payload_bytes)
-            payload_saved_ratio = payload_saved_bytes / full_payload_bytes
+        sent_payload_bytes, full_payload_bytes, payload_saved_bytes, payload_saved_ratio = (
+            self._payload_savings(planned_request.arguments, full_arguments)
+        )
 
         self.logger.info(
             "Responses websocket request plan",
@@ -823,23 +896,23 @@ class ResponsesLLM(
         tools: list[Tool] | None,
         model: str,
     ) -> list[dict[str, Any]]:
-        tools_payload: list[dict[str, Any]] = []
-        for tool in tools or []:
-            custom_payload = get_openai_responses_custom_tool_payload(tool)
-            if custom_payload is not None:
-                tools_payload.append(custom_payload)
-                continue
+        return self._tool_payloads.payloads(
+            tools or [],
+            ("responses", model),
+            lambda tool: self._declared_tool_payload(tool, model),
+        )
 
-            tools_payload.append(
-                {
-                    "type": "function",
-                    "name": tool.name,
-                    "description": tool.description or "",
-                    "parameters": self._adjust_schema(tool.input_schema, model),
-                    "strict": False,
-                }
-            )
-        return tools_payload
+    def _declared_tool_payload(self, tool: Tool, model: str) -> dict[str, Any]:
+        custom_payload = get_openai_responses_custom_tool_payload(tool)
+        if custom_payload is not None:
+            return custom_payload
+        return {
+            "type": "function",
+            "name": tool.name,
+            "description": tool.description or "",
+            "parameters": self._adjust_schema(tool.input_schema, model),
+            "strict": False,
+        }
 
     def _tools_payload(self, base_args: dict[str, Any]) -> list[dict[str, Any]]:
         tools_payload = base_args.setdefault("tools", [])
@@ -1017,6 +1090,8 @@ class ResponsesLLM(
         self._last_ws_turn_outcome = None
         self._last_ws_phase_timings_ms = None
         self._last_stream_timing = None
+        self._last_http_request_mode = None
+        self._last_http_payload_saved_bytes = None
 
     async def _run_responses_transport(
         self,
@@ -1362,46 +1437,58 @@ class ResponsesLLM(
             async with self._responses_client() as client:
                 normalized_input = await self._normalize_input_files(client, input_items)
                 arguments = self._build_response_args(normalized_input, request_params, tools)
-                self.logger.debug("Responses request", data=arguments)
-                capture_filename = _stream_capture_filename(self.chat_turn())
-                _save_stream_request(capture_filename, arguments)
-                timeout = request_params.streaming_timeout
-                async with self._response_sse_stream(
-                    client=client,
-                    arguments=arguments,
-                    timeout_seconds=timeout,
-                ) as stream:
-                    timed_stream = with_stream_idle_timeout(
-                        stream,
-                        idle_timeout_seconds=timeout,
+                if not self._http_continuation:
+                    response, streamed_summary = await self._stream_planned_sse_request(
+                        client=client,
+                        planned_request=PlannedWsRequest(
+                            event_type=RESPONSES_CREATE_EVENT_TYPE,
+                            arguments=arguments,
+                        ),
+                        full_arguments=arguments,
+                        request_params=request_params,
+                        model_name=model_name,
                     )
-                    try:
-                        response, streamed_summary = await self._process_stream(
-                            timed_stream, model_name, capture_filename
-                        )
-                    except StreamIdleTimeoutError:
-                        self._record_stream_failure(timed_stream.timing)
-                        self.logger.error(
-                            "Streaming idle timeout while waiting for Responses",
-                            data={
-                                "model": model_name,
-                                "transport": RESPONSES_TRANSPORT_SSE,
-                                "timeout_seconds": timeout,
-                                "stream_timing": stream_timing_payload(
-                                    timed_stream.timing,
-                                    timed_out=True,
-                                ),
-                            },
-                        )
+                    return response, streamed_summary, normalized_input
+                arguments["store"] = True
+                planner = self._sse_planner()
+                planned_request = planner.plan(arguments)
+                try:
+                    response, streamed_summary = await self._stream_planned_sse_request(
+                        client=client,
+                        planned_request=planned_request,
+                        full_arguments=arguments,
+                        request_params=request_params,
+                        model_name=model_name,
+                    )
+                except APIError as error:
+                    planner.rollback(error, stream_started=False)
+                    if "previous_response_id" not in planned_request.arguments:
                         raise
-                    except Exception:
-                        self._record_stream_failure(timed_stream.timing)
+                    if not self._is_previous_response_not_found(error):
                         raise
-                    self._record_successful_stream_timing(
-                        timed_stream.timing,
-                        model=model_name,
-                        transport=RESPONSES_TRANSPORT_SSE,
+                    self.logger.warning(
+                        "Stored Responses continuation not found; resending full request",
+                        data={
+                            "model": model_name,
+                            "previous_response_id": planned_request.arguments.get(
+                                "previous_response_id"
+                            ),
+                        },
                     )
+                    planned_request = planner.plan(arguments)
+                    response, streamed_summary = await self._stream_planned_sse_request(
+                        client=client,
+                        planned_request=planned_request,
+                        full_arguments=arguments,
+                        request_params=request_params,
+                        model_name=model_name,
+                    )
+                except BaseException as error:
+                    planner.rollback(error, stream_started=False)
+                    raise
+                planner.commit(arguments, planned_request, response)
+                if self._last_http_payload_saved_bytes:
+                    self._http_payload_saved_bytes_total += self._last_http_payload_saved_bytes
                 return response, streamed_summary, normalized_input
         except AuthenticationError as e:
             raise ProviderKeyError(
@@ -1413,6 +1500,70 @@ class ResponsesLLM(
             self.logger.error("Streaming APIError during Responses completion", exc_info=error)
             raise
 
+    async def _stream_planned_sse_request(
+        self,
+        *,
+        client: AsyncOpenAI,
+        planned_request: PlannedWsRequest,
+        full_arguments: dict[str, Any],
+        request_params: RequestParams,
+        model_name: str,
+    ) -> tuple[Any, list[str]]:
+        arguments = planned_request.arguments
+        self._report_sse_request_plan(
+            model_name=model_name,
+            planned_request=planned_request,
+            full_arguments=full_arguments,
+        )
+        self.logger.debug("Responses request", data=arguments)
+        capture_filename = _stream_capture_filename(self.chat_turn())
+        _save_stream_request(capture_filename, arguments)
+        timeout = request_params.streaming_timeout
+        async with self._response_sse_stream(
+            client=client,
+            arguments=arguments,
+            timeout_seconds=timeout,
+        ) as stream:
+            timed_stream = with_stream_idle_timeout(
+                stream,
+                idle_timeout_seconds=timeout,
+            )
+            try:
+                response, streamed_summary = await self._process_stream(
+                    timed_stream, model_name, capture_filename
+                )
+            except StreamIdleTimeoutError:
+                self._record_stream_failure(timed_stream.timing)
+                self.logger.error(
+                    "Streaming idle timeout while waiting for Responses",
+                    data={
+                        "model": model_name,
+                        "transport": RESPONSES_TRANSPORT_SSE,
+                        "timeout_seconds": timeout,
+                        "stream_timing": stream_timing_payload(
+                            timed_stream.timing,
+                            timed_out=True,
+                        ),
+                    },
+                )
+                raise
+            except Exception:
+                self._record_stream_failure(timed_stream.timing)
+                raise
+            self._record_successful_stream_timing(
+                timed_stream.timing,
+                model=model_name,
+                transport=RESPONSES_TRANSPORT_SSE,
+            )
+        return response, streamed_summary
+
+    @staticmethod
+    def _is_previous_response_not_found(error: APIError) -> bool:
+        if getattr(error, "code", None) == PREVIOUS_RESPONSE_NOT_FOUND_CODE:
+            return True
+        message = str(getattr(error, "message", None) or error).lower()
+        return "previous response" in message and "not found" in message
+
     @asynccontextmanager
     async def _response_sse_stream(
         self,
@@ -1779,6 +1930,10 @@ class ResponsesLLM(
         self._last_ws_turn_outcome = None
         self._last_ws_phase_timings_ms = None
         self._last_stream_timing = None
+        self._last_http_request_mode = None
+        self._last_http_payload_saved_bytes = None
+        if self._sse_request_planner is not None:
+            self._sse_request_planner.reset()
         self._ws_turn_counters = {
             "total": 0,
             RESPONSES_WS_FRESH_OUTCOME: 0,
@@ -0,0 +1,419 @@
+"""Local token estimates for conversation histories, calibrated from provider usage.
+
+Compaction planning, the ``/compact`` preview, ``/status`` and streaming progress
+need token counts before (or without) a provider reporting them. A
+:class:`TokenEstimator` counts each message once, split by content kind:
+
+- ``text``: message text, counted by a :class:`TextTokenCounter` backend;
+- ``structured``: tool calls, tool results, channels and other non-text blocks,
+  counted from their JSON serialization;
+- ``image``: image blocks, counted from their serialized size. Providers bill
+  images by dimensions rather than payload size, so this is deliberately
+  pessimistic until calibration learns the model's actual image cost.
+
+Counts are cached per message (and per tool definition), model and active
+backend for the life of the object, so re-estimating a growing history only
+counts the new messages.
+
+After each provider call the LLM reports the real prompt total next to the
+estimate for what it sent. A per-model factor for each kind is nudged toward the
+observed ratio, in proportion to that kind's share of the estimate, so
+estimates for code, CJK or image-heavy histories converge on what the provider
+actually counts.
+
+The configured default is ``token_estimator: tiktoken``: the tiktoken encodings
+are used once they have loaded. They load in a worker thread (a first use may
+download them) and the character heuristic is used until then, or permanently
+when loading fails, for example when offline. ``token_estimator: heuristic``
+skips tiktoken entirely.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Literal, Protocol
+
+from fast_agent.core.logging.logger import get_logger
+from fast_agent.mcp.helpers.content_helpers import get_text
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+    from mcp import Tool
+
+    from fast_agent.types import PromptMessageExtended
+
+logger = get_logger(__name__)
+
+TokenEstimatorBackend = Literal["heuristic", "tiktoken"]
+ContentKind = Literal["text", "structured", "image"]
+
+CHARS_PER_TOKEN = 4
+
+_UNSERIALIZABLE_BLOCK_CHARS = 64
+_CALIBRATION_RATE = 0.5
+_MAX_STEP_RATIO = 2.0
+_MIN_FACTOR = 0.01
+_MAX_FACTOR = 5.0
+_DEFAULT_TIKTOKEN_ENCODING = "cl100k_base"
+
+
+class TextTokenCounter(Protocol):
+    """Backend counting the tokens in a piece of text."""
+
+    name: str
+
+    def count(self, text: str, *, model: str | None = None) -> int: ...
+
+    def active_backend(self, model: str | None = None) -> str:
+        """Name of what currently counts text for ``model``; part of cache keys."""
+        ...
+
+
+class HeuristicTokenCounter:
+    """Characters per token for ASCII text, one token per other character.
+
+    Non-ASCII characters are counted from the UTF-8 byte overhead, which is
+    exact for CJK text (three bytes per character) without a per-character loop.
+    """
+
+    name = "heuristic"
+
+    def active_backend(self, model: str | None = None) -> str:
+        del model
+        return self.name
+
+    def count(self, text: str, *, model: str | None = None) -> int:
+        del model
+        if not text:
+            return 0
+        if text.isascii():
+            return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+        non_ascii = (len(text.encode("utf-8")) - len(text)) // 2
+        ascii_chars = max(0, len(text) - non_ascii)
+        return (ascii_chars + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN + non_ascii
+
+
+class TiktokenCounter:
+    """Exact counts from tiktoken encodings once they are available locally."""
+
+    name = "tiktoken"
+
+    def __init__(self, fallback: TextTokenCounter | None = None) -> None:
+        self._fallback = fallback or HeuristicTokenCounter()
+        self._encodings: dict[str, Any] = {}
+        self._loading: set[str] = set()
+        self._unavailable: set[str] = set()
+        self._lock = threading.Lock()
+
+    def count(self, text: str, *, model: str | None = None) -> int:
+        if not text:
+            return 0
+        encoding = self._encoding(self.encoding_name(model))
+        if encoding is None:
+            return self._fallback.count(text, model=model)
+        return len(encoding.encode(text))
+
+    def active_backend(self, model: str | None = None) -> str:
+        encoding_name = self.encoding_name(model)
+        if encoding_name in self._encodings:
+            return f"{self.name}:{encoding_name}"
+        return self._fallback.active_backend(model)
+
+    @staticmethod
+    def encoding_name(model: str | None) -> str:
+        """The model's tiktoken encoding; other vendors' models use cl100k_base."""
+        if not model:
+            return _DEFAULT_TIKTOKEN_ENCODING
+        try:
+            import tiktoken
+
+            return tiktoken.encoding_name_for_model(model)
+        except (ImportError, KeyError):
+            return _DEFAULT_TIKTOKEN_ENCODING
+
+    def load(self, encoding_name: str) -> None:
+        """Load an encoding synchronously (may download it on first use)."""
+        try:
+            import tiktoken
+
+            encoding = tiktoken.get_encoding(encoding_name)
+        except Exception as exc:
+            logger.debug(f"tiktoken encoding {encoding_name} unavailable: {exc}")
+            with self._lock:
+                self._unavailable.add(encoding_name)
+                self._loading.discard(encoding_name)
+            return
+        with self._lock:
+            self._encodings[encoding_name] = encoding
+            self._loading.discard(encoding_name)
+
+    def _encoding(self, encoding_name: str) -> Any | None:
+        encoding = self._encodings.get(encoding_name)
+        if encoding is not None or encoding_name in self._unavailable:
+            return encoding
+        with self._lock:
+            if encoding_name in self._loading:
+                return None
+            self._loading.add(encoding_name)
+        threading.Thread(
+            target=self.load,
+            args=(encoding_name,),
+            name=f"tiktoken-{encoding_name}",
+            daemon=True,
+        ).start()
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class TokenCounts:
+    """Uncorrected token counts by content kind."""
+
+    text: int = 0
+    structured: int = 0
+    image: int = 0
+
+    def __add__(self, other: TokenCounts) -> TokenCounts:
+        return TokenCounts(
+            text=self.text + other.text,
+            structured=self.structured + other.structured,
+            image=self.image + other.image,
+        )
+
+    @property
+    def total(self) -> int:
+        return self.text + self.structured + self.image
+
+    def by_kind(self) -> dict[ContentKind, int]:
+        return {"text": self.text, "structured": self.structured, "image": self.image}
+
+
+@dataclass(slots=True)
+class ModelCalibration:
+    """Learned correction factors for one model."""
+
+    factors: dict[ContentKind, float] = field(
+        default_factory=lambda: {"text": 1.0, "structured": 1.0, "image": 1.0}
+    )
+    observations: int = 0
+
+    def apply(self, counts: TokenCounts) -> int:
+        return round(sum(self.factors[kind] * count for kind, count in counts.by_kind().items()))
+
+    def observe(self, counts: TokenCounts, actual: int) -> None:
+        predicted = self.apply(counts)
+        if predicted <= 0 or actual <= 0:
+            return
+        ratio = min(max(actual / predicted, 1 / _MAX_STEP_RATIO), _MAX_STEP_RATIO)
+        for kind, count in counts.by_kind().items():
+            if count <= 0:
+                continue
+            share = self.factors[kind] * count / predicted
+            factor = self.factors[kind] * ratio ** (_CALIBRATION_RATE * share)
+            self.factors[kind] = min(max(factor, _MIN_FACTOR), _MAX_FACTOR)
+        self.observations += 1
+
+
+_CacheKey = tuple[int, str | None, str]
+
+
+@dataclass(slots=True)
+class _CachedCounts:
+    ref: weakref.ReferenceType[Any]
+    fingerprint: tuple[int, ...]
+    counts: TokenCounts
+
+
+class TokenEstimator:
+    """Cached, calibrated token estimates for messages, tools and text."""
+
+    def __init__(self, backend: TextTokenCounter | None = None) -> None:
+        self._backend: TextTokenCounter = backend or HeuristicTokenCounter()
+        self._cache: dict[_CacheKey, _CachedCounts] = {}
+        self._calibrations: dict[str, ModelCalibration] = {}
+
+    @property
+    def backend(self) -> TextTokenCounter:
+        return self._backend
+
+    def set_backend(self, backend: TextTokenCounter) -> None:
+        """Switch backends; cached counts and calibrations no longer apply."""
+        self._backend = backend
+        self._cache.clear()
+        self._calibrations.clear()
+
+    def calibration(self, model: str | None) -> ModelCalibration | None:
+        return self._calibrations.get(model) if model else None
+
+    # Estimates
+
+    def estimate_text(self, text: str, *, model: str | None = None) -> int:
+        counts = TokenCounts(text=self._backend.count(text, model=model))
+        return self._corrected(counts, model)
+
+    def estimate_messages(
+        self,
+        messages: Iterable[PromptMessageExtended],
+        *,
+        model: str | None = None,
+    ) -> int:
+        return self._corrected(self.count_messages(messages, model=model), model)
+
+    def estimate_request(
+        self,
+        messages: Iterable[PromptMessageExtended],
+        *,
+        instruction: str | None = None,
+        tools: Sequence[Tool] | None = None,
+        model: str | None = None,
+    ) -> int:
+        return self._corrected(
+            self.count_request(messages, instruction=instruction, tools=tools, model=model),
+            model,
+        )
+
+    # Raw counts
+
+    def count_messages(
+        self,
+        messages: Iterable[PromptMessageExtended],
+        *,
+        model: str | None = None,
+    ) -> TokenCounts:
+        total = TokenCounts()
+        for message in messages:
+            total += self._cached(
+                message,
+                _message_fingerprint(message),
+                model,
+                lambda message=message: self._count_message(message, model),
+            )
+        return total
+
+    def count_request(
+        self,
+        messages: Iterable[PromptMessageExtended],
+        *,
+        instruction: str | None = None,
+        tools: Sequence[Tool] | None = None,
+        model: str | None = None,
+    ) -> TokenCounts:
+        total = self.count_messages(messages, model=model)
+        if instruction:
+            total += TokenCounts(text=self._backend.count(instruction, model=model))
+        for tool in tools or ():
+            total += self._cached(
+                tool,
+                (id(tool.input_schema),),
+                model,
+                lambda tool=tool: TokenCounts(structured=self._count_json(tool, model)),
+            )
+        return total
+
+    # Calibration
+
+    def observe(self, model: str | None, counts: TokenCounts, actual_prompt_tokens: int) -> None:
+        """Fold a provider-reported prompt total into the model's correction."""
+        if not model:
+            return
+        calibration = self._calibrations.setdefault(model, ModelCalibration())
+        calibration.observe(counts, actual_prompt_tokens)
+
+    # Internals
+
+    def _corrected(self, counts: TokenCounts, model: str | None) -> int:
+        calibration = self.calibration(model)
+        return calibration.apply(counts) if calibration is not None else counts.total
+
+    def _cached(
+        self,
+        obj: Any,
+        fingerprint: tuple[int, ...],
+        model: str | None,
+        compute: Callable[[], TokenCounts],
+    ) -> TokenCounts:
+        # Heuristic counts made while a tiktoken encoding loads are not reused after it loads.
+        key = (id(obj), model, self._backend.active_backend(model))
+        entry = self._cache.get(key)
+        if entry is not None and entry.ref() is obj and entry.fingerprint == fingerprint:
+            return entry.counts
+        counts = compute()
+        try:
+            ref = weakref.ref(obj, lambda _ref, key=key: self._forget(key, _ref))
+        except TypeError:
+            return counts
+        self._cache[key] = _CachedCounts(ref=ref, fingerprint=fingerprint, counts=counts)
+        return counts
+
+    def _forget(self, key: _CacheKey, ref: weakref.ReferenceType[Any]) -> None:
+        entry = self._cache.get(key)
+        if entry is not None and entry.ref is ref:
+            del self._cache[key]
+
+    def _count_message(self, message: PromptMessageExtended, model: str | None) -> TokenCounts:
+        text = self._backend.count(message.all_text(), model=model)
+        structured = 0
+        image = 0
+        for content in message.content:
+            if get_text(content) is not None:
+                # Already counted through all_text().
+                continue
+            if getattr(content, "type", None) == "image":
+                # Base64 is not text; tokenizing it would be slow and meaningless.
+                image += _serialized_chars(content) // CHARS_PER_TOKEN
+            else:
+                structured += self._count_json(content, model)
+        for call in (message.tool_calls or {}).values():
+            structured += self._count_json(call, model)
+        for result in (message.tool_results or {}).values():
+            structured += self._count_json(result, model)
+        for blocks in (message.channels or {}).values():
+            for block in blocks:
+                structured += self._count_json(block, model)
+        return TokenCounts(text=text, structured=structured, image=image)
+
+    def _count_json(self, payload: Any, model: str | None) -> int:
+        try:
+            serialized = payload.model_dump_json()
+        except Exception:
+            return _UNSERIALIZABLE_BLOCK_CHARS // CHARS_PER_TOKEN
+        return self._backend.count(serialized, model=model)
+
+
+def _serialized_chars(payload: Any) -> int:
+    try:
+        return len(payload.model_dump_json())
+    except Exception:
+        return _UNSERIALIZABLE_BLOCK_CHARS
+
+
+def _message_fingerprint(message: PromptMessageExtended) -> tuple[int, ...]:
+    channels = message.channels or {}
+    return (
+        id(message.content),
+        len(message.content),
+        len(message.tool_calls or {}),
+        len(message.tool_results or {}),
+        sum(len(blocks) for blocks in channels.values()),
+    )
+
+
+def create_text_token_counter(backend: TokenEstimatorBackend) -> TextTokenCounter:
+    if backend == "tiktoken":
+        return TiktokenCounter()
+    return HeuristicTokenCounter()
+
+
+_shared_estimator = TokenEstimator()
+
+
+def token_estimator() -> TokenEstimator:
+    """Return the estimator shared by compaction, status and streaming progress."""
+    return _shared_estimator
+
+
+def configure_token_estimator(backend: TokenEstimatorBackend) -> None:
+    if _shared_estimator.backend.name != backend:
+        _shared_estimator.set_backend(create_text_token_counter(backend))
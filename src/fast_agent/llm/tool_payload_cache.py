@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterable
+
+    from mcp import Tool
+
+PayloadT = TypeVar("PayloadT")
+
+
+class ToolPayloadCache(Generic[PayloadT]):
+    """Reuse provider-ready tool payloads while the tool objects are unchanged.
+
+    ``MCPAggregator.list_tools`` hands out the same ``Tool`` objects until the
+    catalog changes (``tools/list_changed``, attach/detach), and agent filters
+    only select from those objects, so payloads are keyed by tool identity plus
+    a provider variant (model, schema flavour). Each lookup keeps only the tools
+    seen in that call, so entries for removed or filtered-out tools are dropped
+    and the cache never outgrows the current tool list.
+
+    Cached payloads are shared between requests and must not be mutated.
+    """
+
+    __slots__ = ("_entries", "_variant", "hits", "misses")
+
+    def __init__(self) -> None:
+        self._entries: dict[int, tuple[Tool, PayloadT]] = {}
+        self._variant: Hashable | None = None
+        self.hits = 0
+        self.misses = 0
+
+    def payloads(
+        self,
+        tools: Iterable[Tool],
+        variant: Hashable,
+        build: Callable[[Tool], PayloadT],
+    ) -> list[PayloadT]:
+        previous = self._entries if variant == self._variant else {}
+        current: dict[int, tuple[Tool, PayloadT]] = {}
+        payloads: list[PayloadT] = []
+        for tool in tools:
+            entry = previous.get(id(tool))
+            if entry is None or entry[0] is not tool:
+                entry = (tool, build(tool))
+                self.misses += 1
+            else:
+                self.hits += 1
+            current[id(tool)] = entry
+            payloads.append(entry[1])
+        self._entries = current
+        self._variant = variant
+        return payloads
+
+    def clear(self) -> None:
+        self._entries = {}
+        self._variant = None
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import time
-from collections.abc import Mapping, Sequence
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass
 from enum import StrEnum
 from typing import TYPE_CHECKING, Annotated, Literal
@@ -572,14 +574,164 @@ def usage_from_bedrock(
     )
 
 
+_COUNT_COLUMNS = 7
+"""Prompt total/uncached/cache_read/cache_write/tool_use, completion total/reasoning."""
+
+
+def _turn_counts(turn: TurnUsage) -> tuple[int | None, ...]:
+    prompt = turn.prompt
+    completion = turn.completion
+    return (
+        prompt.total,
+        prompt.uncached,
+        prompt.cache_read,
+        prompt.cache_write,
+        prompt.tool_use,
+        completion.total,
+        completion.reasoning,
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class UsageRate:
+    """Consumption over a trailing time window, with complete-data semantics."""
+
+    window_seconds: float
+    provider_attempts: int
+    prompt_tokens: int | None
+    completion_tokens: int | None
+    cost_usd: float | None
+
+    @property
+    def tokens_per_second(self) -> float | None:
+        if self.prompt_tokens is None or self.completion_tokens is None:
+            return None
+        return (self.prompt_tokens + self.completion_tokens) / self.window_seconds
+
+    @property
+    def completion_tokens_per_second(self) -> float | None:
+        if self.completion_tokens is None:
+            return None
+        return self.completion_tokens / self.window_seconds
+
+    @property
+    def cost_usd_per_hour(self) -> float | None:
+        if self.cost_usd is None:
+            return None
+        return self.cost_usd * 3600 / self.window_seconds
+
+
+class UsageColumns:
+    """Compact columnar ledger of turns, stored as running totals.
+
+    Every metric keeps prefix sums plus a prefix count of missing values, so
+    the complete-data summary of any contiguous range of turns is O(1), and
+    the turns inside a trailing time window are found by bisecting the
+    timestamps. Storage is a few machine words per turn and never includes
+    raw provider payloads.
+    """
+
+    __slots__ = ("_cost", "_cost_missing", "_missing", "_sums", "_timestamps", "_tool_calls")
+
+    def __init__(self, turns: Iterable[TurnUsage] = ()) -> None:
+        self._sums = [array("q", [0]) for _ in range(_COUNT_COLUMNS)]
+        self._missing = [array("q", [0]) for _ in range(_COUNT_COLUMNS)]
+        self._tool_calls = array("q", [0])
+        self._cost = array("d", [0.0])
+        self._cost_missing = array("q", [0])
+        self._timestamps = array("d")
+        for turn in turns:
+            self.append(turn)
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def append(self, turn: TurnUsage) -> None:
+        for sums, missing, value in zip(self._sums, self._missing, _turn_counts(turn), strict=True):
+            sums.append(sums[-1] + (value or 0))
+            missing.append(missing[-1] + (value is None))
+        self._tool_calls.append(self._tool_calls[-1] + turn.tool_calls)
+        self._cost.append(self._cost[-1] + (turn.cost_usd or 0.0))
+        self._cost_missing.append(self._cost_missing[-1] + (turn.cost_usd is None))
+        self._timestamps.append(turn.timestamp)
+
+    def set_last_tool_calls(self, tool_calls: int) -> None:
+        if len(self):
+            self._tool_calls[-1] = self._tool_calls[-2] + tool_calls
+
+    def summarize(self, start: int = 0, stop: int | None = None) -> UsageSummary:
+        """Summarize ``turns[start:stop]``; equivalent to :func:`summarize_usage`."""
+
+        start, stop, _ = slice(start, stop).indices(len(self))
+        stop = max(start, stop)
+        (
+            prompt_total,
+            uncached,
+            cache_read,
+            cache_write,
+            tool_use,
+            completion_total,
+            reasoning,
+        ) = (self._complete_sum(index, start, stop) for index in range(_COUNT_COLUMNS))
+        return UsageSummary(
+            prompt=PromptTokenUsage(
+                total=prompt_total,
+                uncached=uncached,
+                cache_read=cache_read,
+                cache_write=cache_write,
+                tool_use=tool_use,
+            ),
+            completion=CompletionTokenUsage(total=completion_total, reasoning=reasoning),
+            provider_attempts=stop - start,
+            tool_calls=self._tool_calls[stop] - self._tool_calls[start],
+        )
+
+    def rate(self, window_seconds: float, *, now: float | None = None) -> UsageRate:
+        """Usage of turns with timestamps in ``(now - window_seconds, now]``."""
+
+        if window_seconds <= 0:
+            raise ValueError("window_seconds must be greater than zero")
+        end = time.time() if now is None else now
+        start = bisect_right(self._timestamps, end - window_seconds)
+        stop = max(start, bisect_right(self._timestamps, end))
+        if start == stop:
+            return UsageRate(window_seconds, 0, 0, 0, 0.0)
+        cost = (
+            max(0.0, self._cost[stop] - self._cost[start])
+            if self._cost_missing[stop] == self._cost_missing[start]
+            else None
+        )
+        return UsageRate(
+            window_seconds=window_seconds,
+            provider_attempts=stop - start,
+            prompt_tokens=self._complete_sum(0, start, stop),
+            completion_tokens=self._complete_sum(5, start, stop),
+            cost_usd=cost,
+        )
+
+    def _complete_sum(self, index: int, start: int, stop: int) -> int | None:
+        missing = self._missing[index]
+        if start == stop or missing[stop] != missing[start]:
+            return None
+        sums = self._sums[index]
+        return sums[stop] - sums[start]
+
+
 class UsageAccumulator(BaseModel):
-    """Accumulate canonical turns and operational context state."""
+    """Accumulate canonical turns and operational context state.
+
+    Aggregates come from a :class:`UsageColumns` ledger kept in step with
+    ``turns`` by :meth:`add_turn` and :meth:`count_tools`. Replacing or
+    appending to ``turns`` directly is also picked up on the next read.
+    """
 
     turns: list[TurnUsage] = Field(default_factory=list)
     model: str | None = None
     last_cache_activity_time: float | None = None
     _context_window_size: int | None = PrivateAttr(default=None)
     _context_estimate: int | None = PrivateAttr(default=None)
+    _columns: UsageColumns = PrivateAttr(default_factory=UsageColumns)
+    _columns_turns: list[TurnUsage] | None = PrivateAttr(default=None)
 
     def set_context_window_size(self, value: int | None) -> None:
         self._context_window_size = value
@@ -595,7 +747,9 @@ class UsageAccumulator(BaseModel):
 
     def add_turn(self, turn: TurnUsage) -> None:
         self._context_estimate = None
+        columns = self.columns
         self.turns.append(turn)
+        columns.append(turn)
         if self.model is None:
             self.model = turn.model
         if (turn.prompt.cache_read or 0) > 0 or (turn.prompt.cache_write or 0) > 0:
@@ -604,10 +758,30 @@ class UsageAccumulator(BaseModel):
     def count_tools(self, tool_calls: int) -> None:
         if self.turns:
             self.turns[-1].tool_calls = tool_calls
+            self.columns.set_last_tool_calls(tool_calls)
+
+    @property
+    def columns(self) -> UsageColumns:
+        """Columnar running totals over ``turns``."""
+
+        turns = self.turns
+        columns = self._columns
+        if self._columns_turns is not turns or len(columns) > len(turns):
+            columns = self._columns = UsageColumns(turns)
+            self._columns_turns = turns
+        else:
+            for turn in turns[len(columns) :]:
+                columns.append(turn)
+        return columns
 
     @property
     def summary(self) -> UsageSummary:
-        return summarize_usage(self.turns)
+        return self.columns.summarize()
+
+    def rate(self, window_seconds: float = 60.0, *, now: float | None = None) -> UsageRate:
+        """Token and cost rates over the trailing ``window_seconds``."""
+
+        return self.columns.rate(window_seconds, now=now)
 
     @computed_field
     @property
@@ -671,13 +845,15 @@ def last_turn_usage(
     turns = usage_accumulator.turns
     if start_index is not None and start_index >= len(turns):
         return None
-    selected = turns[start_index:] if start_index is not None else [turns[-1]]
-    prompt = _complete_sum([turn.prompt.total for turn in selected])
-    completion = _complete_sum([turn.completion.total for turn in selected])
+    summary = usage_accumulator.columns.summarize(
+        start_index if start_index is not None else len(turns) - 1
+    )
+    prompt = summary.prompt.total
+    completion = summary.completion.total
     if prompt is None or completion is None:
         return None
     return {
         "prompt_tokens": prompt,
         "completion_tokens": completion,
-        "tool_calls": sum(turn.tool_calls for turn in selected),
+        "tool_calls": summary.tool_calls,
     }
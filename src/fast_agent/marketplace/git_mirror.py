@@ -0,0 +1,183 @@
+"""Shared bare-mirror cache for git-backed marketplace sources.
+
+Skills, card packs and plugins installed from the same repository share one
+blobless ``git clone --mirror --filter=blob:none`` under
+``<home>/cache/git-mirrors``. Each mirror is fetched at most once per process;
+installs then extract a sparse checkout from the mirror with ``git clone
+--shared``, fetching only the blobs under the checked-out path from the
+remote, and update checks resolve path object ids directly in the mirror's
+commits and trees.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from fast_agent.marketplace import git_sources
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+GIT_MIRROR_CACHE_ENV = "FAST_AGENT_GIT_MIRROR_CACHE"
+GIT_MIRROR_CACHE_DIRNAME = "git-mirrors"
+
+_SLUG_PATTERN = re.compile(r"[^A-Za-z0-9._-]+")
+_caches: dict[Path, GitMirrorCache] = {}
+_caches_lock = threading.Lock()
+
+
+class GitMirrorError(RuntimeError):
+    """Raised when a mirror cannot be created, fetched or checked out."""
+
+
+class GitMirrorCache:
+    """Bare mirrors keyed by repository URL, fetched once per process."""
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        run_subprocess_fn: "Callable[..., subprocess.CompletedProcess[str]]" = subprocess.run,
+    ) -> None:
+        self.root = root
+        self._run_subprocess = run_subprocess_fn
+        self._locks: dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self._ready: set[str] = set()
+        self.fetch_count = 0
+
+    def mirror_path(self, repo_url: str) -> Path:
+        digest = hashlib.sha256(repo_url.encode("utf-8")).hexdigest()[:16]
+        name = repo_url.rstrip("/").rsplit("/", 1)[-1].removesuffix(".git")
+        slug = _SLUG_PATTERN.sub("-", name).strip("-")[:48] or "repo"
+        return self.root / f"{digest}-{slug}.git"
+
+    def ensure_mirror(self, repo_url: str) -> Path:
+        """Create or refresh the mirror for ``repo_url`` once per process."""
+        mirror = self.mirror_path(repo_url)
+        with self._lock_for(repo_url):
+            if repo_url in self._ready:
+                return mirror
+            if (mirror / "HEAD").is_file():
+                self._git(["git", "-C", str(mirror), "fetch", "--prune", "--quiet", "origin"])
+            else:
+                # A leftover directory without HEAD (an interrupted publish) is not a mirror.
+                shutil.rmtree(mirror, ignore_errors=True)
+                self._clone_mirror(repo_url, mirror)
+            self.fetch_count += 1
+            self._ready.add(repo_url)
+        return mirror
+
+    def checkout(
+        self,
+        *,
+        repo_url: str,
+        repo_ref: str | None,
+        repo_subdir: str,
+        destination_dir: Path,
+        checkout_ref: str | None = None,
+    ) -> None:
+        """Sparse-checkout ``repo_subdir`` from the mirror into ``destination_dir``.
+
+        The destination is a regular git checkout whose commits and trees are
+        borrowed from the mirror, so ``HEAD`` and path object ids resolve as
+        they did for a direct clone. It is a partial clone of ``repo_url``, so
+        checking out fetches just the blobs under ``repo_subdir``.
+        """
+        mirror = self.ensure_mirror(repo_url)
+        clone_args = ["git", "clone", "--quiet", "--shared", "--no-checkout"]
+        if repo_ref:
+            clone_args.extend(["--branch", repo_ref])
+        clone_args.extend([str(mirror), str(destination_dir)])
+        self._git(clone_args)
+        config = ["git", "-C", str(destination_dir), "config"]
+        self._git([*config, "remote.origin.url", repo_url])
+        self._git([*config, "remote.origin.promisor", "true"])
+        self._git([*config, "remote.origin.partialclonefilter", "blob:none"])
+        self._git(["git", "-C", str(destination_dir), "sparse-checkout", "set", repo_subdir])
+        checkout_args = ["git", "-C", str(destination_dir), "checkout", "--quiet"]
+        if checkout_ref:
+            checkout_args.append(checkout_ref)
+        self._git(checkout_args)
+
+    def resolve_commit(self, repo_url: str, revision: str | None) -> str | None:
+        return git_sources.resolve_git_commit(self.ensure_mirror(repo_url), revision)
+
+    def path_oid(self, repo_url: str, commit: str, repo_path: str) -> str | None:
+        return git_sources.resolve_git_path_oid(self.ensure_mirror(repo_url), commit, repo_path)
+
+    def _lock_for(self, repo_url: str) -> threading.Lock:
+        with self._locks_guard:
+            lock = self._locks.get(repo_url)
+            if lock is None:
+                lock = self._locks[repo_url] = threading.Lock()
+            return lock
+
+    def _clone_mirror(self, repo_url: str, mirror: Path) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f".{mirror.name}.", dir=self.root))
+        try:
+            self._git(
+                [
+                    "git",
+                    "clone",
+                    "--quiet",
+                    "--mirror",
+                    "--filter=blob:none",
+                    repo_url,
+                    str(staging),
+                ]
+            )
+            try:
+                staging.replace(mirror)
+            except OSError:
+                # Another process published the mirror first; use theirs.
+                if not (mirror / "HEAD").is_file():
+                    raise
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def _git(self, args: list[str]) -> None:
+        result = self._run_subprocess(args, capture_output=True, text=True, check=False)
+        if result.returncode != 0:
+            detail = result.stderr.strip() or result.stdout.strip()
+            raise GitMirrorError(f"Git command failed: {' '.join(args)}\n{detail}")
+
+
+def git_mirror_cache_enabled() -> bool:
+    value = os.getenv(GIT_MIRROR_CACHE_ENV, "").strip().lower()
+    return value not in {"0", "false", "no", "off"}
+
+
+def active_git_mirror_cache() -> GitMirrorCache | None:
+    """Return the process-wide mirror cache for the active fast-agent home.
+
+    Returns ``None`` when the cache is disabled via ``FAST_AGENT_GIT_MIRROR_CACHE=0``
+    or when the fast-agent home is disabled (``--no-home``).
+    """
+    if not git_mirror_cache_enabled():
+        return None
+    from fast_agent.paths import resolve_home_dir
+
+    try:
+        root = resolve_home_dir() / "cache" / GIT_MIRROR_CACHE_DIRNAME
+    except ValueError:
+        return None
+    return git_mirror_cache_for(root)
+
+
+def git_mirror_cache_for(root: Path) -> GitMirrorCache:
+    root = root.expanduser().resolve()
+    with _caches_lock:
+        cache = _caches.get(root)
+        if cache is None:
+            cache = _caches[root] = GitMirrorCache(root)
+        return cache
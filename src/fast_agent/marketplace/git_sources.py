@@ -6,8 +6,10 @@ import shutil
 import subprocess
 import tarfile
 import tempfile
+import threading
+from concurrent.futures import Future
 from pathlib import Path
-from typing import TYPE_CHECKING, BinaryIO, TypeVar
+from typing import TYPE_CHECKING, BinaryIO, TypeVar, cast
 from uuid import uuid4
 
 from fast_agent.marketplace.fetch import _source_location
@@ -16,17 +18,51 @@ from fast_agent.marketplace.source_models import SourcePathOid, SourceRevision
 if TYPE_CHECKING:
     from collections.abc import Callable, MutableMapping
 
+    from fast_agent.marketplace.git_mirror import GitMirrorCache
+
 StatusT = TypeVar("StatusT")
 CacheKeyT = TypeVar("CacheKeyT")
 CacheValueT = TypeVar("CacheValueT")
 
 
-def _remember(
+_PROBES_LOCK = threading.Lock()
+_PROBES_IN_FLIGHT: dict[tuple[int, object], Future[object]] = {}
+
+
+def _remember_once(
     cache: "MutableMapping[CacheKeyT, CacheValueT]",
     key: CacheKeyT,
-    value: CacheValueT,
+    probe: "Callable[[], CacheValueT]",
 ) -> CacheValueT:
-    cache[key] = value
+    """Return ``cache[key]``, running ``probe`` at most once per key across threads.
+
+    Update checks evaluate sources on a thread pool with shared caches, so a
+    second thread asking for a key that is still being probed waits for the
+    first result instead of repeating the ``git ls-remote`` or mirror fetch.
+    """
+    flight_key = (id(cache), key)
+    with _PROBES_LOCK:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+        pending = _PROBES_IN_FLIGHT.get(flight_key)
+        if pending is None:
+            future: Future[object] = Future()
+            _PROBES_IN_FLIGHT[flight_key] = future
+    if pending is not None:
+        return cast("CacheValueT", pending.result())
+
+    try:
+        value = probe()
+    except BaseException as exc:
+        with _PROBES_LOCK:
+            del _PROBES_IN_FLIGHT[flight_key]
+        future.set_exception(exc)
+        raise
+    with _PROBES_LOCK:
+        cache[key] = value
+        del _PROBES_IN_FLIGHT[flight_key]
+    future.set_result(value)
     return value
 
 
@@ -188,6 +224,22 @@ def clone_sparse_checkout(
     checkout_ref: str | None = None,
     run_git_fn: "Callable[[list[str]], None]" = run_git,
 ) -> None:
+    if run_git_fn is run_git:
+        mirror_cache = _active_git_mirror_cache()
+        if mirror_cache is not None:
+            try:
+                mirror_cache.checkout(
+                    repo_url=repo_url,
+                    repo_ref=repo_ref,
+                    repo_subdir=repo_subdir,
+                    destination_dir=destination_dir,
+                    checkout_ref=checkout_ref,
+                )
+                return
+            except RuntimeError:
+                # A broken or unusable mirror must not block installs; clone directly.
+                shutil.rmtree(destination_dir, ignore_errors=True)
+                destination_dir.mkdir(parents=True, exist_ok=True)
     run_git_fn(_sparse_clone_args(repo_url, repo_ref, destination_dir))
     run_git_fn(["git", "-C", str(destination_dir), "sparse-checkout", "set", repo_subdir])
     checkout_args = ["git", "-C", str(destination_dir), "checkout"]
@@ -196,6 +248,12 @@ def clone_sparse_checkout(
     run_git_fn(checkout_args)
 
 
+def _active_git_mirror_cache() -> "GitMirrorCache | None":
+    from fast_agent.marketplace.git_mirror import active_git_mirror_cache
+
+    return active_git_mirror_cache()
+
+
 def pinned_checkout_ref(pinned_revision: str | None, *, local_revision: str) -> str | None:
     if pinned_revision and pinned_revision != local_revision:
         return pinned_revision
@@ -328,36 +386,25 @@ def resolve_source_revision(
     resolve_git_commit_fn: "Callable[[Path, str | None], str | None]" = resolve_git_commit,
     run_subprocess_fn: "Callable[..., subprocess.CompletedProcess[str]]" = subprocess.run,
 ) -> SourceRevision[StatusT]:
-    cache_key = (repo_url, repo_ref)
-    cached = head_cache.get(cache_key)
-    if cached is not None:
-        return cached
-
-    local_repo = resolve_local_repo_fn(repo_url)
-    if local_repo is not None:
-        return _remember(
-            head_cache,
-            cache_key,
-            _local_source_revision(
+    def probe() -> SourceRevision[StatusT]:
+        local_repo = resolve_local_repo_fn(repo_url)
+        if local_repo is not None:
+            return _local_source_revision(
                 local_repo=local_repo,
                 repo_ref=repo_ref,
                 local_revision=local_revision,
                 source_ref_missing_status=source_ref_missing_status,
                 resolve_git_commit_fn=resolve_git_commit_fn,
-            ),
-        )
-
-    return _remember(
-        head_cache,
-        cache_key,
-        _remote_source_revision(
+            )
+        return _remote_source_revision(
             repo_url=repo_url,
             repo_ref=repo_ref,
             source_ref_missing_status=source_ref_missing_status,
             source_unreachable_status=source_unreachable_status,
             run_subprocess_fn=run_subprocess_fn,
-        ),
-    )
+        )
+
+    return _remember_once(head_cache, (repo_url, repo_ref), probe)
 
 
 def resolve_source_path_oid(
@@ -373,25 +420,61 @@ def resolve_source_path_oid(
     resolve_local_repo_fn: "Callable[[str], Path | None]" = resolve_local_repo,
     resolve_git_path_oid_fn: "Callable[[Path, str, str], str | None]" = resolve_git_path_oid,
 ) -> SourcePathOid[StatusT]:
-    cache_key = (repo_url, repo_ref, repo_path, commit)
-    cached = path_cache.get(cache_key)
-    if cached is not None:
-        return cached
+    def probe() -> SourcePathOid[StatusT]:
+        return _probe_source_path_oid(
+            repo_url=repo_url,
+            repo_ref=repo_ref,
+            repo_path=repo_path,
+            commit=commit,
+            source_ref_missing_status=source_ref_missing_status,
+            source_unreachable_status=source_unreachable_status,
+            source_path_missing_status=source_path_missing_status,
+            resolve_local_repo_fn=resolve_local_repo_fn,
+            resolve_git_path_oid_fn=resolve_git_path_oid_fn,
+        )
+
+    return _remember_once(path_cache, (repo_url, repo_ref, repo_path, commit), probe)
+
 
+def _missing_path_oid(repo_path: str, commit: str, status: StatusT) -> SourcePathOid[StatusT]:
+    return SourcePathOid(
+        path_oid=None,
+        status=status,
+        detail=f"path missing at revision {commit}: {repo_path}",
+    )
+
+
+def _probe_source_path_oid(
+    *,
+    repo_url: str,
+    repo_ref: str | None,
+    repo_path: str,
+    commit: str,
+    source_ref_missing_status: StatusT,
+    source_unreachable_status: StatusT,
+    source_path_missing_status: StatusT,
+    resolve_local_repo_fn: "Callable[[str], Path | None]",
+    resolve_git_path_oid_fn: "Callable[[Path, str, str], str | None]",
+) -> SourcePathOid[StatusT]:
     local_repo = resolve_local_repo_fn(repo_url)
     if local_repo is not None:
         path_oid = resolve_git_path_oid_fn(local_repo, commit, repo_path)
         if path_oid is None:
-            return _remember(
-                path_cache,
-                cache_key,
-                SourcePathOid(
-                    path_oid=None,
-                    status=source_path_missing_status,
-                    detail=f"path missing at revision {commit}: {repo_path}",
-                ),
-            )
-        return _remember(path_cache, cache_key, SourcePathOid(path_oid))
+            return _missing_path_oid(repo_path, commit, source_path_missing_status)
+        return SourcePathOid(path_oid)
+
+    mirror_cache = _active_git_mirror_cache()
+    if mirror_cache is not None:
+        return _mirror_source_path_oid(
+            mirror_cache,
+            repo_url=repo_url,
+            repo_ref=repo_ref,
+            repo_path=repo_path,
+            commit=commit,
+            source_ref_missing_status=source_ref_missing_status,
+            source_unreachable_status=source_unreachable_status,
+            source_path_missing_status=source_path_missing_status,
+        )
 
     with tempfile.TemporaryDirectory() as tmp_dir:
         tmp_path = Path(tmp_dir)
@@ -404,32 +487,52 @@ def resolve_source_path_oid(
         if result.returncode != 0:
             stderr = subprocess_failure_detail(result)
             if repo_ref and "Remote branch" in stderr and "not found" in stderr:
-                path_result = SourcePathOid(
+                return SourcePathOid(
                     path_oid=None,
                     status=source_ref_missing_status,
                     detail=f"ref not found: {repo_ref}",
                 )
-            else:
-                path_result = SourcePathOid(
-                    path_oid=None,
-                    status=source_unreachable_status,
-                    detail=stderr or "unable to reach source",
-                )
-            return _remember(path_cache, cache_key, path_result)
+            return SourcePathOid(
+                path_oid=None,
+                status=source_unreachable_status,
+                detail=stderr or "unable to reach source",
+            )
 
         path_oid = resolve_git_path_oid_fn(tmp_path, commit, repo_path)
         if path_oid is None:
-            return _remember(
-                path_cache,
-                cache_key,
-                SourcePathOid(
-                    path_oid=None,
-                    status=source_path_missing_status,
-                    detail=f"path missing at revision {commit}: {repo_path}",
-                ),
-            )
+            return _missing_path_oid(repo_path, commit, source_path_missing_status)
+
+    return SourcePathOid(path_oid)
 
-    return _remember(path_cache, cache_key, SourcePathOid(path_oid))
+
+def _mirror_source_path_oid(
+    mirror_cache: "GitMirrorCache",
+    *,
+    repo_url: str,
+    repo_ref: str | None,
+    repo_path: str,
+    commit: str,
+    source_ref_missing_status: StatusT,
+    source_unreachable_status: StatusT,
+    source_path_missing_status: StatusT,
+) -> SourcePathOid[StatusT]:
+    try:
+        if repo_ref and mirror_cache.resolve_commit(repo_url, repo_ref) is None:
+            return SourcePathOid(
+                path_oid=None,
+                status=source_ref_missing_status,
+                detail=f"ref not found: {repo_ref}",
+            )
+        path_oid = mirror_cache.path_oid(repo_url, commit, repo_path)
+    except RuntimeError as exc:
+        return SourcePathOid(
+            path_oid=None,
+            status=source_unreachable_status,
+            detail=str(exc) or "unable to reach source",
+        )
+    if path_oid is None:
+        return _missing_path_oid(repo_path, commit, source_path_missing_status)
+    return SourcePathOid(path_oid)
 
 
 def atomic_replace_directory(*, existing_dir: Path, staged_dir: Path) -> None:
@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal, TypeAlias
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Literal, TypeAlias, TypeVar
 
 from fast_agent.marketplace.source_models import SourceUpdateDecision
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Set
+    from collections.abc import Callable, Mapping, Sequence, Set
+
+ItemT = TypeVar("ItemT")
+ResultT = TypeVar("ResultT")
+
+UPDATE_CHECK_CONCURRENCY_ENV = "FAST_AGENT_UPDATE_CHECK_CONCURRENCY"
+DEFAULT_UPDATE_CHECK_CONCURRENCY = 8
 
 CommonMarketplaceUpdateStatus: TypeAlias = Literal[
     "up_to_date",
@@ -146,3 +154,32 @@ def decide_source_update_status(
         status="up_to_date",
         detail="already up to date",
     )
+
+
+def update_check_concurrency() -> int:
+    raw = os.getenv(UPDATE_CHECK_CONCURRENCY_ENV)
+    if raw is None:
+        return DEFAULT_UPDATE_CHECK_CONCURRENCY
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        return DEFAULT_UPDATE_CHECK_CONCURRENCY
+
+
+def evaluate_updates_concurrently(
+    items: "Sequence[ItemT]",
+    evaluate: "Callable[[ItemT], ResultT]",
+    *,
+    max_workers: int | None = None,
+) -> list[ResultT]:
+    """Run per-source update checks on a bounded thread pool, preserving order.
+
+    Remote probes (``git ls-remote`` and mirror fetches) dominate update checks,
+    so evaluating sources concurrently hides network latency. Results are
+    returned in the order of ``items``.
+    """
+    workers = min(max_workers or update_check_concurrency(), len(items))
+    if workers <= 1:
+        return [evaluate(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="update-check") as pool:
+        return list(pool.map(evaluate, items))
@@ -0,0 +1,131 @@
+"""Per-server concurrency limits for MCP ``tools/call`` requests.
+
+A :class:`ServerCallLimiter` is shared by every aggregator talking to the same
+server, so agents that share a server also share its ``max_concurrent_calls``
+budget. Waiting calls are queued per owner (normally the agent name) and slots
+are handed out round-robin across owners, so one agent issuing a burst of
+parallel tool calls cannot starve another agent's single call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+
+@dataclass(frozen=True, slots=True)
+class CallQueueStats:
+    """Point-in-time view of a server's call queue."""
+
+    max_concurrent: int | None
+    in_flight: int
+    queue_depth: int
+    queued_calls: int
+    """Calls that had to wait for a slot since the limiter was created."""
+    total_wait_seconds: float
+    max_wait_seconds: float
+
+    @property
+    def mean_wait_seconds(self) -> float:
+        return self.total_wait_seconds / self.queued_calls if self.queued_calls else 0.0
+
+
+class ServerCallLimiter:
+    """Bound concurrent calls to one server, queueing fairly across owners."""
+
+    def __init__(self, max_concurrent: int | None = None) -> None:
+        self._max_concurrent = max_concurrent
+        self._in_flight = 0
+        self._waiters: OrderedDict[str, deque[asyncio.Future[None]]] = OrderedDict()
+        self._queued_calls = 0
+        self._total_wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+
+    @property
+    def max_concurrent(self) -> int | None:
+        return self._max_concurrent
+
+    def set_max_concurrent(self, max_concurrent: int | None) -> None:
+        """Apply a new limit; raising it admits queued calls immediately."""
+        self._max_concurrent = max_concurrent
+        self._grant_waiters()
+
+    @asynccontextmanager
+    async def slot(self, owner: str) -> AsyncIterator[None]:
+        await self._acquire(owner)
+        try:
+            yield
+        finally:
+            self._release()
+
+    def stats(self) -> CallQueueStats:
+        return CallQueueStats(
+            max_concurrent=self._max_concurrent,
+            in_flight=self._in_flight,
+            queue_depth=sum(len(queue) for queue in self._waiters.values()),
+            queued_calls=self._queued_calls,
+            total_wait_seconds=self._total_wait_seconds,
+            max_wait_seconds=self._max_wait_seconds,
+        )
+
+    def _has_capacity(self) -> bool:
+        return self._max_concurrent is None or self._in_flight < self._max_concurrent
+
+    async def _acquire(self, owner: str) -> None:
+        if self._has_capacity() and not self._waiters:
+            self._in_flight += 1
+            return
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(owner, deque()).append(waiter)
+        started = time.perf_counter()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before cancellation; pass it on.
+                self._release()
+            else:
+                self._discard_waiter(owner, waiter)
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            self._queued_calls += 1
+            self._total_wait_seconds += waited
+            self._max_wait_seconds = max(self._max_wait_seconds, waited)
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        self._grant_waiters()
+
+    def _grant_waiters(self) -> None:
+        while self._waiters and self._has_capacity():
+            owner, queue = next(iter(self._waiters.items()))
+            waiter = queue.popleft()
+            if queue:
+                # Rotate so the next slot goes to the next owner with waiting calls.
+                self._waiters.move_to_end(owner)
+            else:
+                del self._waiters[owner]
+            if waiter.done():
+                continue
+            self._in_flight += 1
+            waiter.set_result(None)
+
+    def _discard_waiter(self, owner: str, waiter: asyncio.Future[None]) -> None:
+        queue = self._waiters.get(owner)
+        if queue is None:
+            return
+        try:
+            queue.remove(waiter)
+        except ValueError:
+            return
+        if not queue:
+            del self._waiters[owner]
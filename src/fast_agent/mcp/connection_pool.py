@@ -0,0 +1,120 @@
+"""Pools of identical MCP client runtimes for parallel ``tools/call`` execution.
+
+A server configured with ``pool_size > 1`` keeps its normal (primary)
+connection for discovery, subscriptions and every non-tool request, plus
+``pool_size - 1`` extra connections that only serve ``tools/call``. Each call
+is routed to the healthy member with the fewest outstanding requests, so a
+stdio server that handles one request at a time can run calls in parallel.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from fast_agent.config import MCPServerSettings
+    from fast_agent.mcp.mcp_connection_manager import ServerConnection
+
+
+@dataclass(slots=True)
+class PoolMember:
+    """One connection in a pool with its request accounting."""
+
+    connection: ServerConnection
+    outstanding: int = 0
+    calls: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class ConnectionPoolStats:
+    """Point-in-time view of a server's connection pool."""
+
+    size: int
+    """Configured pool size, including the primary connection."""
+    healthy: int
+    in_flight: int
+    member_calls: tuple[int, ...]
+    """Completed or in-progress tools/call requests per member; primary first."""
+    recycled: int
+    """Extra members shut down and replaced after becoming unhealthy."""
+
+
+class ServerConnectionPool:
+    """Least-outstanding-requests balancing over a primary plus extra members."""
+
+    def __init__(self, primary: ServerConnection, size: int) -> None:
+        self.server_name = primary.server_name
+        self.server_config: MCPServerSettings = primary.server_config
+        self.size = size
+        self._primary = PoolMember(connection=primary)
+        self._extras: list[PoolMember | None] = [None] * (size - 1)
+        self.recycled = 0
+        self.retry_after = 0.0
+        """Monotonic time before which failed members are not relaunched."""
+
+    def set_primary(self, connection: ServerConnection) -> None:
+        """Track the manager's current primary connection, which may be replaced."""
+        self._primary.connection = connection
+
+    def vacant_slots(self) -> list[int]:
+        """Indexes of extra members that are missing or need recycling."""
+        return [
+            index
+            for index, member in enumerate(self._extras)
+            if member is None or not member.connection.is_healthy()
+        ]
+
+    def take_unhealthy(self) -> list[ServerConnection]:
+        """Detach unhealthy extras so the caller can shut them down."""
+        detached: list[ServerConnection] = []
+        for index, member in enumerate(self._extras):
+            if member is not None and not member.connection.is_healthy():
+                detached.append(member.connection)
+                self._extras[index] = None
+                self.recycled += 1
+        return detached
+
+    def fill(self, index: int, connection: ServerConnection) -> None:
+        self._extras[index] = PoolMember(connection=connection)
+
+    def connections(self) -> list[ServerConnection]:
+        """Extra member connections currently held by the pool."""
+        return [member.connection for member in self._extras if member is not None]
+
+    def select(self) -> PoolMember:
+        """Pick the healthy member with the fewest outstanding requests.
+
+        Ties go to the member that has served the fewest calls, then to the
+        primary, so idle members are warmed evenly.
+        """
+        candidates = [self._primary] + [
+            member
+            for member in self._extras
+            if member is not None and member.connection.is_healthy()
+        ]
+        return min(candidates, key=lambda member: (member.outstanding, member.calls))
+
+    @contextmanager
+    def lease(self) -> Iterator[ServerConnection]:
+        member = self.select()
+        member.outstanding += 1
+        member.calls += 1
+        try:
+            yield member.connection
+        finally:
+            member.outstanding -= 1
+
+    def stats(self) -> ConnectionPoolStats:
+        members = [self._primary, *self._extras]
+        live = [member for member in members if member is not None]
+        return ConnectionPoolStats(
+            size=self.size,
+            healthy=sum(1 for member in live if member.connection.is_healthy()),
+            in_flight=sum(member.outstanding for member in live),
+            member_calls=tuple(member.calls if member is not None else 0 for member in members),
+            recycled=self.recycled,
+        )
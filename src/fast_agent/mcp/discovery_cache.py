@@ -0,0 +1,161 @@
+"""On-disk cache of MCP server discovery results.
+
+Attaching a server lists its tools, prompts and app resources. For large,
+rarely-changing servers that costs seconds on every start, so aggregators can
+keep the last discovery per server under ``<home>/cache/mcp-discovery``.
+
+An entry is only reused when its key matches: the server name, a hash of the
+server settings, and the implementation name/version, protocol version and
+instructions reported by the connected server. Anything else (a new release,
+edited config, changed instructions) is a miss. Unreadable or malformed entries
+are treated as misses and rewritten on the next successful discovery.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from mcp_types import Prompt, Tool
+from pydantic import ValidationError
+
+from fast_agent.core.logging.logger import get_logger
+from fast_agent.mcp.app_integrations import AppServerConfig
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from fast_agent.config import MCPServerSettings, Settings
+
+logger = get_logger(__name__)
+
+DISCOVERY_CACHE_DIRNAME = "mcp-discovery"
+CACHE_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True, slots=True)
+class CachedDiscovery:
+    """Discovery results restored from disk."""
+
+    tools: list[Tool]
+    prompts: list[Prompt]
+    app_integration_config: AppServerConfig
+    stored_at: float
+
+    @property
+    def age_seconds(self) -> float:
+        return max(0.0, time.time() - self.stored_at)
+
+
+def discovery_cache_key(
+    server_name: str,
+    config: MCPServerSettings,
+    *,
+    implementation_name: str | None,
+    implementation_version: str | None,
+    protocol_version: str | None,
+    instructions: str | None,
+) -> str:
+    """Return the digest identifying one server's discovery results."""
+    config_hash = hashlib.sha256(
+        config.model_dump_json(exclude={"discovery_cache"}).encode("utf-8")
+    ).hexdigest()
+    payload = {
+        "format": CACHE_FORMAT_VERSION,
+        "server": server_name,
+        "config": config_hash,
+        "implementation": [implementation_name, implementation_version],
+        "protocol_version": protocol_version,
+        "instructions": instructions,
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class DiscoveryCache:
+    """One JSON file per server; a new key overwrites the previous entry."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def _entry_path(self, server_name: str) -> Path:
+        digest = hashlib.sha256(server_name.encode("utf-8")).hexdigest()[:16]
+        return self.root / f"{digest}.json"
+
+    def load(self, server_name: str, key: str) -> CachedDiscovery | None:
+        path = self._entry_path(server_name)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.debug(f"{server_name}: Ignoring unreadable discovery cache entry: {exc}")
+            return None
+
+        if not isinstance(payload, dict) or payload.get("key") != key:
+            return None
+        try:
+            return CachedDiscovery(
+                tools=[Tool.model_validate(item) for item in payload["tools"]],
+                prompts=[Prompt.model_validate(item) for item in payload["prompts"]],
+                app_integration_config=AppServerConfig.model_validate(
+                    payload["app_integration_config"]
+                ),
+                stored_at=float(payload["stored_at"]),
+            )
+        except (KeyError, TypeError, ValueError, ValidationError) as exc:
+            logger.debug(f"{server_name}: Ignoring malformed discovery cache entry: {exc}")
+            return None
+
+    def store(
+        self,
+        server_name: str,
+        key: str,
+        *,
+        tools: Sequence[Tool],
+        prompts: Sequence[Prompt],
+        app_integration_config: AppServerConfig,
+    ) -> None:
+        payload: dict[str, Any] = {
+            "key": key,
+            "server_name": server_name,
+            "stored_at": time.time(),
+            "tools": [_dump(tool) for tool in tools],
+            "prompts": [_dump(prompt) for prompt in prompts],
+            "app_integration_config": app_integration_config.model_dump(mode="json"),
+        }
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self._entry_path(server_name)
+        # Write then rename so concurrent readers never see a partial entry.
+        fd, tmp_name = tempfile.mkstemp(dir=self.root, prefix=f".{path.stem}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle, separators=(",", ":"))
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def invalidate(self, server_name: str) -> None:
+        self._entry_path(server_name).unlink(missing_ok=True)
+
+
+def _dump(model: Tool | Prompt) -> dict[str, Any]:
+    return model.model_dump(mode="json", by_alias=True, exclude_none=True)
+
+
+def discovery_cache_for_settings(settings: Settings | None) -> DiscoveryCache | None:
+    """Return the discovery cache for the active fast-agent home, if one is enabled."""
+    from fast_agent.paths import resolve_home_dir
+
+    try:
+        root = resolve_home_dir(settings) / "cache" / DISCOVERY_CACHE_DIRNAME
+    except ValueError:
+        return None
+    return DiscoveryCache(root)
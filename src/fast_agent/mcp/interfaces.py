@@ -27,6 +27,7 @@ if TYPE_CHECKING:
     )
 
     from fast_agent.config import MCPServerSettings
+    from fast_agent.mcp.call_limiter import ServerCallLimiter
 __all__ = [
     "AgentProtocol",
     "FastAgentLLMProtocol",
@@ -63,6 +64,12 @@ class ServerRegistryProtocol(Protocol):
 
     def clear_server_capabilities(self, server_name: str) -> None: ...
 
+    def call_limiter(self, server_name: str) -> "ServerCallLimiter":
+        """Return the tools/call limiter shared by every agent using the server."""
+        ...
+
+    def get_call_limiter(self, server_name: str) -> "ServerCallLimiter | None": ...
+
     def register_runtime(
         self,
         server_name: str,
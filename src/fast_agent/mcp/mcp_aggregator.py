@@ -1,8 +1,9 @@
+import asyncio
 import sys
 from asyncio import Lock
 from collections import Counter
 from collections.abc import Awaitable, Callable, Iterable, Mapping
-from contextlib import suppress
+from contextlib import AbstractAsyncContextManager, nullcontext, suppress
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from types import MappingProxyType
@@ -64,6 +65,11 @@ from fast_agent.mcp.client_gateway import (
     resolve_oauth_mode,
 )
 from fast_agent.mcp.common import SEP, create_namespaced_name, is_namespaced_name
+from fast_agent.mcp.discovery_cache import (
+    DiscoveryCache,
+    discovery_cache_for_settings,
+    discovery_cache_key,
+)
 from fast_agent.mcp.gen_client import gen_client
 from fast_agent.mcp.helpers.content_helpers import get_text
 from fast_agent.mcp.interfaces import ServerRegistryProtocol
@@ -208,15 +214,25 @@ class NamespacedTool(BaseModel):
 class ToolNameResolution:
     server_name: str | None
     local_name: str
+    ambiguous_servers: tuple[str, ...] = ()
+    """Every server exposing a bare ``local_name`` when more than one does, in server order."""
 
 
 @dataclass(frozen=True, slots=True)
 class MCPToolCatalog:
-    """Read-only snapshot of the aggregator's discovered MCP tools."""
+    """Read-only snapshot of the aggregator's discovered MCP tools.
+
+    Lookup indexes are built once in :meth:`snapshot`, so resolving a tool name
+    costs a few dict probes regardless of how many servers and tools are attached.
+    """
 
     _by_namespaced_name: Mapping[str, NamespacedTool]
     _by_server: Mapping[str, tuple[NamespacedTool, ...]]
     _server_names: tuple[str, ...]
+    _first_by_local_name: Mapping[str, NamespacedTool] = field(default_factory=dict)
+    _servers_by_local_name: Mapping[str, tuple[str, ...]] = field(default_factory=dict)
+    _routable_names: frozenset[str] = frozenset()
+    _server_name_set: frozenset[str] = frozenset()
 
     @classmethod
     def snapshot(
@@ -226,31 +242,39 @@ class MCPToolCatalog:
         by_server: Mapping[str, Iterable[NamespacedTool]],
         server_names: Iterable[str],
     ) -> "MCPToolCatalog":
+        namespaced = dict(by_namespaced_name)
+        servers = {server_name: tuple(tools) for server_name, tools in by_server.items()}
+
+        first_by_local_name: dict[str, NamespacedTool] = {}
+        for namespaced_tool in namespaced.values():
+            first_by_local_name.setdefault(namespaced_tool.tool.name, namespaced_tool)
+
+        servers_by_local_name: dict[str, list[str]] = {}
+        for server_name, tools in servers.items():
+            for local_name in dict.fromkeys(tool.tool.name for tool in tools):
+                servers_by_local_name.setdefault(local_name, []).append(server_name)
+
+        ordered_server_names = tuple(server_names)
         return cls(
-            _by_namespaced_name=MappingProxyType(dict(by_namespaced_name)),
-            _by_server=MappingProxyType(
-                {server_name: tuple(tools) for server_name, tools in by_server.items()}
+            _by_namespaced_name=MappingProxyType(namespaced),
+            _by_server=MappingProxyType(servers),
+            _server_names=ordered_server_names,
+            _first_by_local_name=MappingProxyType(first_by_local_name),
+            _servers_by_local_name=MappingProxyType(
+                {name: tuple(owners) for name, owners in servers_by_local_name.items()}
             ),
-            _server_names=tuple(server_names),
+            _routable_names=frozenset(namespaced) | frozenset(first_by_local_name),
+            _server_name_set=frozenset(ordered_server_names),
         )
 
     def namespaced_tool(self, name: str) -> NamespacedTool | None:
         return self._by_namespaced_name.get(name)
 
     def first_tool_named(self, local_name: str) -> NamespacedTool | None:
-        return next(
-            (
-                namespaced_tool
-                for namespaced_tool in self._by_namespaced_name.values()
-                if namespaced_tool.tool.name == local_name
-            ),
-            None,
-        )
+        return self._first_by_local_name.get(local_name)
 
     def routable_tool_names(self) -> frozenset[str]:
-        return frozenset(self._by_namespaced_name) | frozenset(
-            tool.tool.name for tool in self._by_namespaced_name.values()
-        )
+        return self._routable_names
 
     def server_tool_names(self, server_name: str) -> tuple[str, ...]:
         return tuple(
@@ -264,23 +288,33 @@ class MCPToolCatalog:
                 local_name=namespaced_tool.tool.name,
             )
 
-        if is_namespaced_name(name):
-            for server_name in self._server_names:
-                if name.startswith(f"{server_name}{SEP}"):
-                    return ToolNameResolution(
-                        server_name=server_name,
-                        local_name=name[len(server_name) + len(SEP) :],
-                    )
+        if is_namespaced_name(name) and (server_name := self._longest_server_prefix(name)):
+            return ToolNameResolution(
+                server_name=server_name,
+                local_name=name[len(server_name) + len(SEP) :],
+            )
 
-        for server_name, tools in self._by_server.items():
-            if any(namespaced_tool.tool.name == name for namespaced_tool in tools):
-                return ToolNameResolution(server_name=server_name, local_name=name)
+        if owners := self._servers_by_local_name.get(name):
+            return ToolNameResolution(
+                server_name=owners[0],
+                local_name=name,
+                ambiguous_servers=owners if len(owners) > 1 else (),
+            )
 
         return ToolNameResolution(
             server_name=self._server_names[0] if self._server_names else None,
             local_name=name,
         )
 
+    def _longest_server_prefix(self, name: str) -> str | None:
+        # Server names may themselves contain SEP, so try each separator from the right.
+        end = name.rfind(SEP)
+        while end > 0:
+            if name[:end] in self._server_name_set:
+                return name[:end]
+            end = name.rfind(SEP, 0, end)
+        return None
+
 
 @dataclass
 class ServerStats:
@@ -335,6 +369,24 @@ class ServerStatus(BaseModel):
     app_integration_config: AppServerConfig | None = None
     mcp_skills_enabled: bool | None = None
     reconnect_count: int = 0
+    call_concurrency_limit: int | None = None
+    calls_in_flight: int | None = None
+    call_queue_depth: int | None = None
+    calls_queued: int | None = None
+    call_queue_wait_mean_ms: float | None = None
+    call_queue_wait_max_ms: float | None = None
+    pool_size: int | None = None
+    pool_healthy: int | None = None
+    pool_in_flight: int | None = None
+    pool_member_calls: list[int] | None = None
+    pool_recycled: int | None = None
+    sampling_concurrency_limit: int | None = None
+    sampling_in_flight: int | None = None
+    sampling_queue_depth: int | None = None
+    sampling_requests: int | None = None
+    sampling_pool_hit_rate: float | None = None
+    sampling_latency_mean_ms: float | None = None
+    sampling_latency_max_ms: float | None = None
     ping_interval_seconds: int | None = None
     ping_max_missed: int | None = None
     ping_ok_count: int | None = None
@@ -512,6 +564,14 @@ class MCPAggregator(ContextDependent):
         # Maps server_name -> list of tools
         self._server_to_tool_map: dict[str, list[NamespacedTool]] = {}
         self._tool_map_lock = Lock()
+        # Bumped whenever the tool maps or app integration metadata change, so
+        # list_tools can hand out the same Tool objects until the catalog changes.
+        self._tool_list_version = 0
+        self._tool_list_cache: tuple[int, tuple[Tool, ...]] | None = None
+        # The catalog snapshot also depends on server order, which attach/detach edit.
+        self._tool_catalog_cache: tuple[tuple[int, tuple[str, ...]], MCPToolCatalog] | None = None
+        # Background refreshes for attachments served from the on-disk discovery cache.
+        self._discovery_revalidations: dict[str, asyncio.Task[None]] = {}
 
         # Cache for prompt objects, maps server_name -> list of prompt objects
         self._prompt_cache: dict[str, list[Prompt]] = {}
@@ -632,6 +692,7 @@ class MCPAggregator(ContextDependent):
         """
         Close all attached MCP client runtimes when the aggregator is deleted.
         """
+        self._cancel_discovery_revalidations()
         async with self._lifecycle_lock:
             if self._closed:
                 return
@@ -811,6 +872,7 @@ class MCPAggregator(ContextDependent):
             self._capabilities_cache.clear()
 
         self._app_integration_configs.clear()
+        self._invalidate_tool_list()
         self._mcp_skill_registries.clear()
         self._attached_server_names = []
 
@@ -951,7 +1013,9 @@ class MCPAggregator(ContextDependent):
                     resolved_config,
                     attach_options,
                 )
-            discovery = await self._discover_server_attachment(server_name)
+            discovery, from_cache = await self._discover_server_attachment_with_cache(
+                server_name, resolved_config
+            )
             await self._commit_server_attachment(
                 server_name,
                 discovery,
@@ -959,6 +1023,8 @@ class MCPAggregator(ContextDependent):
             )
             if callback_runtime is not None:
                 callback_runtime.mark_subscription_ready()
+            if from_cache:
+                self._schedule_discovery_revalidation(server_name)
         except BaseException:
             self._attachment_configs.pop(server_name, None)
             await self._rollback_server_attachment(
@@ -1128,6 +1194,135 @@ class MCPAggregator(ContextDependent):
             capabilities=await self.get_capabilities(server_name),
         )
 
+    async def _discover_server_attachment_with_cache(
+        self,
+        server_name: str,
+        server_config: MCPServerSettings,
+    ) -> tuple[_AttachmentDiscovery, bool]:
+        """Discover a server, serving from the on-disk cache when configured.
+
+        Returns the discovery and whether it came from the cache (and so still
+        needs a background revalidation).
+        """
+        cache_target = self._discovery_cache_target(server_name, server_config)
+        if cache_target is None:
+            return await self._discover_server_attachment(server_name), False
+
+        cache, key = cache_target
+        if server_config.discovery_cache == "stale-while-revalidate":
+            cached = await asyncio.to_thread(cache.load, server_name, key)
+            if cached is not None:
+                logger.debug(
+                    f"{server_name}: Serving discovery from cache",
+                    data={"age_seconds": round(cached.age_seconds, 1)},
+                )
+                namespace = self.server_display_name(server_name)
+                discovery = _AttachmentDiscovery(
+                    tools=[
+                        NamespacedTool(
+                            tool=tool,
+                            server_name=server_name,
+                            namespaced_tool_name=create_namespaced_name(namespace, tool.name),
+                        )
+                        for tool in cached.tools
+                    ],
+                    prompts=cached.prompts,
+                    skill_registry=self._mcp_skill_registries.get(server_name),
+                    app_integration_config=cached.app_integration_config,
+                    capabilities=await self.get_capabilities(server_name),
+                )
+                return discovery, True
+
+        discovery = await self._discover_server_attachment(server_name)
+        await self._store_discovery_cache(server_name, discovery, cache_target)
+        return discovery, False
+
+    def _discovery_cache_target(
+        self,
+        server_name: str,
+        server_config: MCPServerSettings | None = None,
+    ) -> tuple[DiscoveryCache, str] | None:
+        """Return the cache and key for a connected server with caching enabled."""
+        config = server_config or self._server_config(server_name)
+        if config is None or config.discovery_cache == "off":
+            return None
+        manager = self._persistent_connection_manager
+        if not self.connection_persistence or manager is None:
+            return None
+        server_conn = manager.running_servers.get(server_name)
+        if server_conn is None or server_conn.client is None:
+            return None
+        cache = discovery_cache_for_settings(self.context.config if self.context else None)
+        if cache is None:
+            return None
+
+        implementation = server_conn.server_implementation
+        key = discovery_cache_key(
+            server_name,
+            server_conn.server_config,
+            implementation_name=implementation.name if implementation else None,
+            implementation_version=implementation.version if implementation else None,
+            protocol_version=server_conn.protocol_version,
+            instructions=server_conn.client.instructions,
+        )
+        return cache, key
+
+    async def _store_discovery_cache(
+        self,
+        server_name: str,
+        discovery: _AttachmentDiscovery,
+        cache_target: tuple[DiscoveryCache, str] | None = None,
+    ) -> None:
+        target = cache_target or self._discovery_cache_target(server_name)
+        if target is None:
+            return
+        cache, key = target
+        try:
+            await asyncio.to_thread(
+                cache.store,
+                server_name,
+                key,
+                tools=[namespaced.tool for namespaced in discovery.tools],
+                prompts=discovery.prompts,
+                app_integration_config=discovery.app_integration_config,
+            )
+        except OSError as exc:
+            logger.warning(f"{server_name}: Failed to write discovery cache: {exc}")
+
+    def _schedule_discovery_revalidation(self, server_name: str) -> None:
+        existing = self._discovery_revalidations.get(server_name)
+        if existing is not None and not existing.done():
+            return
+        task = asyncio.create_task(
+            self._revalidate_cached_discovery(server_name),
+            name=f"mcp-discovery-revalidate-{server_name}",
+        )
+        self._discovery_revalidations[server_name] = task
+        task.add_done_callback(
+            lambda done: (
+                self._discovery_revalidations.pop(server_name, None)
+                if self._discovery_revalidations.get(server_name) is done
+                else None
+            )
+        )
+
+    async def _revalidate_cached_discovery(self, server_name: str) -> None:
+        try:
+            await self.refresh_subscription_state(server_name)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            # Keep serving the cached lists; list_changed or the next start retries.
+            logger.warning(
+                f"{server_name}: Background discovery refresh failed; keeping cached tools",
+                data={"error": str(exc)},
+            )
+
+    def _cancel_discovery_revalidations(self) -> None:
+        for task in self._discovery_revalidations.values():
+            task.cancel()
+        self._discovery_revalidations.clear()
+
     async def _commit_server_attachment(
         self,
         server_name: str,
@@ -1169,6 +1364,7 @@ class MCPAggregator(ContextDependent):
                     self._mcp_skill_registries[server_name] = discovery.skill_registry
 
                 self._app_integration_configs[server_name] = discovery.app_integration_config
+                self._invalidate_tool_list()
                 if discovery.capabilities is not None:
                     registry.set_server_capabilities(
                         server_name,
@@ -1187,6 +1383,7 @@ class MCPAggregator(ContextDependent):
     ) -> AppServerConfig:
         discovery = await self._discover_server_attachment(server_name, cache_mode=cache_mode)
         await self._commit_server_attachment(server_name, discovery)
+        await self._store_discovery_cache(server_name, discovery)
         return discovery.app_integration_config
 
     def selected_materialized_resource_uris(self, server_name: str) -> tuple[str, ...]:
@@ -1248,6 +1445,7 @@ class MCPAggregator(ContextDependent):
                 self._prompt_cache.pop(server_name, None)
             self._mcp_skill_registries.pop(server_name, None)
             self._app_integration_configs.pop(server_name, None)
+            self._invalidate_tool_list()
             self._attached_server_names = [
                 name for name in self._attached_server_names if name != server_name
             ]
@@ -1338,6 +1536,7 @@ class MCPAggregator(ContextDependent):
             self._capabilities_cache.pop(server_name, None)
 
         self._app_integration_configs.pop(server_name, None)
+        self._invalidate_tool_list()
         self._mcp_skill_registries.pop(server_name, None)
         self._attachment_configs.pop(server_name, None)
         registry.clear_server_capabilities(server_name)
@@ -1924,26 +2123,41 @@ class MCPAggregator(ContextDependent):
         if not self.initialized:
             await self.load_servers()
 
+        cached = self._tool_list_cache
+        if cached is None or cached[0] != self._tool_list_version:
+            cached = (self._tool_list_version, self._build_tool_list())
+            self._tool_list_cache = cached
+        return ListToolsResult(tools=list(cached[1]))
+
+    @property
+    def tool_list_version(self) -> int:
+        """Counter bumped whenever the aggregated tool list may have changed."""
+        return self._tool_list_version
+
+    def _invalidate_tool_list(self) -> None:
+        self._tool_list_version += 1
+        self._tool_list_cache = None
+
+    def _build_tool_list(self) -> tuple[Tool, ...]:
+        discovered_by_name: dict[str, dict[str, AppToolConfig]] = {}
         tools: list[Tool] = []
 
         for namespaced_tool_name, namespaced_tool in self._namespaced_tool_map.items():
-            app_integration_config = self._app_integration_configs.get(namespaced_tool.server_name)
-            discovered_tool = None
-            matching_tool = None
-            if app_integration_config:
-                discovered_tool = next(
-                    (
-                        tool
-                        for tool in app_integration_config.tools
-                        if tool.namespaced_tool_name == namespaced_tool_name
-                    ),
-                    None,
-                )
-                if discovered_tool and discovered_tool.is_valid:
-                    matching_tool = discovered_tool
-
+            server_name = namespaced_tool.server_name
+            discovered_tools = discovered_by_name.get(server_name)
+            if discovered_tools is None:
+                discovered_tools = {}
+                app_integration_config = self._app_integration_configs.get(server_name)
+                for tool in app_integration_config.tools if app_integration_config else []:
+                    discovered_tools.setdefault(tool.namespaced_tool_name, tool)
+                discovered_by_name[server_name] = discovered_tools
+
+            discovered_tool = discovered_tools.get(namespaced_tool_name)
             if discovered_tool and discovered_tool.is_app_only:
                 continue
+            matching_tool = (
+                discovered_tool if discovered_tool and discovered_tool.is_valid else None
+            )
 
             tool_copy = namespaced_tool.tool.model_copy(
                 deep=True, update={"name": namespaced_tool_name}
@@ -1954,7 +2168,7 @@ class MCPAggregator(ContextDependent):
                 tool_copy.meta = meta
             tools.append(tool_copy)
 
-        return ListToolsResult(tools=tools)
+        return tuple(tools)
 
     async def _record_server_call(
         self, server_name: str, operation_type: str, success: bool
@@ -2088,10 +2302,65 @@ class MCPAggregator(ContextDependent):
             if status.server_capabilities is None:
                 status.server_capabilities = await self._capabilities_for_status(server_name)
             status.mcp_skills_enabled = server_supports_mcp_skills(status.server_capabilities)
+            self._apply_call_queue_status(status, server_cfg)
+            self._apply_pool_status(status, server_cfg)
+            self._apply_sampling_status(status)
             status_map[server_name] = status
 
         return status_map
 
+    def _apply_call_queue_status(
+        self,
+        status: ServerStatus,
+        server_cfg: MCPServerSettings | None,
+    ) -> None:
+        server_registry = self.context.server_registry if self.context else None
+        limiter = server_registry.get_call_limiter(status.server_name) if server_registry else None
+        if limiter is None:
+            status.call_concurrency_limit = server_cfg.max_concurrent_calls if server_cfg else None
+            return
+
+        stats = limiter.stats()
+        status.call_concurrency_limit = stats.max_concurrent
+        status.calls_in_flight = stats.in_flight
+        status.call_queue_depth = stats.queue_depth
+        status.calls_queued = stats.queued_calls
+        status.call_queue_wait_mean_ms = round(stats.mean_wait_seconds * 1000, 1)
+        status.call_queue_wait_max_ms = round(stats.max_wait_seconds * 1000, 1)
+
+    def _apply_pool_status(
+        self,
+        status: ServerStatus,
+        server_cfg: MCPServerSettings | None,
+    ) -> None:
+        manager = self._persistent_connection_manager
+        pool = manager.get_pool(status.server_name) if manager is not None else None
+        if pool is None:
+            pool_size = server_cfg.pool_size if server_cfg else None
+            status.pool_size = pool_size if pool_size and pool_size > 1 else None
+            return
+
+        stats = pool.stats()
+        status.pool_size = stats.size
+        status.pool_healthy = stats.healthy
+        status.pool_in_flight = stats.in_flight
+        status.pool_member_calls = list(stats.member_calls)
+        status.pool_recycled = stats.recycled
+
+    def _apply_sampling_status(self, status: ServerStatus) -> None:
+        pool = self.context.sampling_pool if self.context else None
+        stats = pool.stats(status.server_name) if pool is not None else None
+        if stats is None:
+            return
+
+        status.sampling_concurrency_limit = stats.max_concurrent
+        status.sampling_in_flight = stats.in_flight
+        status.sampling_queue_depth = stats.queue_depth
+        status.sampling_requests = stats.requests
+        status.sampling_pool_hit_rate = round(stats.hit_rate, 3)
+        status.sampling_latency_mean_ms = round(stats.mean_latency_seconds * 1000, 1)
+        status.sampling_latency_max_ms = round(stats.max_latency_seconds * 1000, 1)
+
     async def _capabilities_for_status(self, server_name: str) -> ServerCapabilities | None:
         async with self._capabilities_cache_lock:
             cached = self._capabilities_cache.get(server_name)
@@ -2352,7 +2621,11 @@ class MCPAggregator(ContextDependent):
         result: R | None = None
 
         try:
-            result = await self._execute_initial_server_operation(server_name, try_execute)
+            result = await self._execute_initial_server_operation(
+                server_name,
+                try_execute,
+                pooled=method_name == "call_tool",
+            )
             success_flag = True
         except ConnectionError as exc:
             if method_name not in _CONNECTION_ERROR_REPLAY_SAFE_METHODS:
@@ -2470,13 +2743,33 @@ class MCPAggregator(ContextDependent):
         self,
         server_name: str,
         try_execute: Callable[[MCPOperationClient], Awaitable[R]],
+        *,
+        pooled: bool = False,
     ) -> R:
         if self.connection_persistence and not self._should_use_request_scoped_connection(
             server_name
         ):
+            if pooled:
+                return await self._execute_pooled_server_operation(server_name, try_execute)
             return await self._execute_persistent_server_operation(server_name, try_execute)
         return await self._execute_temporary_server_operation(server_name, try_execute)
 
+    async def _execute_pooled_server_operation(
+        self,
+        server_name: str,
+        try_execute: Callable[[MCPOperationClient], Awaitable[R]],
+    ) -> R:
+        manager = self._require_connection_manager()
+        async with manager.lease_tool_call_server(
+            server_name,
+            callback_runtime=self._create_callback_runtime(server_name),
+            **self._attachment_manager_kwargs(server_name),
+        ) as server_connection:
+            client = server_connection.client
+            if client is None:
+                raise RuntimeError(f"MCP client runtime not initialized for '{server_name}'")
+            return await try_execute(client)
+
     async def _execute_persistent_server_operation(
         self,
         server_name: str,
@@ -2805,11 +3098,17 @@ class MCPAggregator(ContextDependent):
             raise RuntimeError(error_msg) from e
 
     def tool_catalog(self) -> MCPToolCatalog:
-        return MCPToolCatalog.snapshot(
-            by_namespaced_name=self._namespaced_tool_map,
-            by_server=self._server_to_tool_map,
-            server_names=self.server_names,
-        )
+        key = (self._tool_list_version, tuple(self.server_names))
+        cached = self._tool_catalog_cache
+        if cached is None or cached[0] != key:
+            catalog = MCPToolCatalog.snapshot(
+                by_namespaced_name=self._namespaced_tool_map,
+                by_server=self._server_to_tool_map,
+                server_names=self.server_names,
+            )
+            cached = (key, catalog)
+            self._tool_catalog_cache = cached
+        return cached[1]
 
     def resolve_tool_name(self, name: str) -> ToolNameResolution:
         return self.tool_catalog().resolve_tool_name(name)
@@ -2839,6 +3138,12 @@ class MCPAggregator(ContextDependent):
         server_name = tool_name_resolution.server_name
         local_tool_name = tool_name_resolution.local_name
 
+        if tool_name_resolution.ambiguous_servers:
+            logger.warning(
+                f"Tool '{name}' is provided by several servers; using '{server_name}'",
+                data={"servers": list(tool_name_resolution.ambiguous_servers)},
+            )
+
         if server_name is None:
             logger.error(f"Error: Tool '{name}' not found")
             return CallToolResult(
@@ -2897,20 +3202,21 @@ class MCPAggregator(ContextDependent):
             )
 
             try:
-                result = await self._execute_on_server(
-                    server_name=server_name,
-                    operation_type="tools/call",
-                    operation_name=local_tool_name,
-                    method_name="call_tool",
-                    method_args={
-                        "name": local_tool_name,
-                        "arguments": arguments,
-                    },
-                    error_factory=lambda msg: CallToolResult(
-                        is_error=True, content=[TextContent(type="text", text=msg)]
-                    ),
-                    progress_callback=progress_callback,
-                )
+                async with self._tool_call_slot(server_name):
+                    result = await self._execute_on_server(
+                        server_name=server_name,
+                        operation_type="tools/call",
+                        operation_name=local_tool_name,
+                        method_name="call_tool",
+                        method_args={
+                            "name": local_tool_name,
+                            "arguments": arguments,
+                        },
+                        error_factory=lambda msg: CallToolResult(
+                            is_error=True, content=[TextContent(type="text", text=msg)]
+                        ),
+                        progress_callback=progress_callback,
+                    )
 
                 await self._complete_tool_execution(
                     active_tool_handler,
@@ -2933,6 +3239,14 @@ class MCPAggregator(ContextDependent):
                 )
                 raise
 
+    def _tool_call_slot(self, server_name: str) -> AbstractAsyncContextManager[None]:
+        """Queue for one of the server's shared tools/call slots, fairly per agent."""
+        server_registry = self.context.server_registry if self.context else None
+        if server_registry is None:
+            return nullcontext()
+        limiter = server_registry.call_limiter(server_name)
+        return limiter.slot(self.agent_name or "default")
+
     async def _tool_permission_error_result(
         self,
         *,
@@ -3526,6 +3840,7 @@ class MCPAggregator(ContextDependent):
     async def _refresh_server_resources(self, server_name: str) -> None:
         _, app_integration_config = await self._evaluate_app_integrations_for_server(server_name)
         self._app_integration_configs[server_name] = app_integration_config
+        self._invalidate_tool_list()
 
     async def _refresh_server_tools(self, server_name: str) -> None:
         """
@@ -3592,6 +3907,18 @@ class MCPAggregator(ContextDependent):
                             namespaced_tool
                         )
                     self._app_integration_configs[server_name] = app_integration_config
+                    self._invalidate_tool_list()
+
+                await self._store_discovery_cache(
+                    server_name,
+                    _AttachmentDiscovery(
+                        tools=new_namespaced_tools,
+                        prompts=list(self._prompt_cache.get(server_name, [])),
+                        skill_registry=None,
+                        app_integration_config=app_integration_config,
+                        capabilities=None,
+                    ),
+                )
 
                 logger.info(
                     f"Successfully refreshed tools for server '{server_name}'",
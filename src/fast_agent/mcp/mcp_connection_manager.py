@@ -9,7 +9,7 @@ import threading
 import time
 import traceback
 from collections import deque
-from contextlib import suppress
+from contextlib import asynccontextmanager, suppress
 from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from pathlib import Path
@@ -38,6 +38,7 @@ from fast_agent.mcp.client_gateway import (
 from fast_agent.mcp.client_gateway import (
     resolve_oauth_mode as _resolve_oauth_mode,
 )
+from fast_agent.mcp.connection_pool import ServerConnectionPool
 from fast_agent.mcp.oauth_client import (
     OAuthEvent,
     OAuthEventHandler,
@@ -55,7 +56,7 @@ from fast_agent.utils.text import strip_casefold
 from fast_agent.utils.transports import is_mcp_client_transport
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import AsyncIterator, Callable
 
     from mcp_types import Implementation, ServerCapabilities
 
@@ -68,6 +69,7 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 STDIO_STDERR_BUFFER_LINES = 12
 PARTIAL_SUBSCRIPTION_REFRESH_SECONDS = 5.0
+POOL_MEMBER_RETRY_SECONDS = 30.0
 
 
 @runtime_checkable
@@ -162,6 +164,8 @@ class ServerConnection:
         self._oauth_abort_event = threading.Event()
         self._stdio_stderr_lines: deque[str] = deque(maxlen=STDIO_STDERR_BUFFER_LINES)
         self._lifecycle_cancel_scope: CancelScope | None = None
+        # Extra pool members only serve tools/call; the primary owns subscriptions.
+        self.pool_member = False
 
     def is_healthy(self) -> bool:
         """Check if the server connection is healthy and ready to use."""
@@ -490,7 +494,7 @@ async def _run_server_lifecycle(server_conn: ServerConnection) -> None:
 
 async def _wait_for_shutdown_with_optional_ping(server_conn: ServerConnection) -> None:
     subscription_task: asyncio.Task[None] | None = None
-    if _subscription_filter(server_conn) is not None:
+    if not server_conn.pool_member and _subscription_filter(server_conn) is not None:
         subscription_task = asyncio.create_task(_run_subscription_loop(server_conn))
     elif server_conn.protocol_era == "modern":
         server_conn.subscription_state = "disabled"
@@ -897,6 +901,12 @@ async def _wait_for_initialized_with_startup_budget(
     await server_conn.wait_for_initialized()
 
 
+async def _shutdown_connections(connections: list[ServerConnection]) -> None:
+    for server_conn in connections:
+        server_conn.shutdown_lifecycle()
+    await asyncio.gather(*(conn.wait_for_lifecycle_completion() for conn in connections))
+
+
 class MCPConnectionManager(ContextDependent):
     """
     Manages the lifecycle of multiple MCP server connections.
@@ -916,6 +926,8 @@ class MCPConnectionManager(ContextDependent):
         self._oauth_required_servers: set[str] = set()
         self._server_oauth_mode: dict[str, OAuthMode] = {}
         self._server_oauth_active: dict[str, bool] = {}
+        self._pools: dict[str, ServerConnectionPool] = {}
+        self._pool_locks: dict[str, asyncio.Lock] = {}
 
     async def __aenter__(self):
         self._task_group = asyncio.TaskGroup()
@@ -1063,7 +1075,48 @@ class MCPConnectionManager(ContextDependent):
             oauth_mode == "auto" and server_name in self._oauth_required_servers
         )
 
-        transport_metrics = self._launch_transport_metrics(config)
+        server_conn = self._new_server_connection(
+            server_name,
+            config,
+            callback_runtime=callback_runtime,
+            oauth_mode=oauth_mode,
+            oauth_active=oauth_active,
+            oauth_event_handler=oauth_event_handler,
+            allow_oauth_paste_fallback=allow_oauth_paste_fallback,
+            transport_metrics=self._launch_transport_metrics(config),
+        )
+
+        async with self._lock:
+            # Check if already running
+            if server_name in self.running_servers:
+                existing = self.running_servers[server_name]
+                if existing.server_config != config:
+                    raise ValueError(
+                        f"MCP server '{server_name}' is already starting with different settings"
+                    )
+                return existing
+
+            self.running_servers[server_name] = server_conn
+            self._server_oauth_mode[server_name] = oauth_mode
+            self._server_oauth_active[server_name] = oauth_active
+            assert self._task_group is not None
+            self._task_group.create_task(_server_lifecycle_task(server_conn))
+
+        logger.info(f"{server_name}: Attached MCP client runtime is ready")
+        return server_conn
+
+    def _new_server_connection(
+        self,
+        server_name: str,
+        config: MCPServerSettings,
+        *,
+        callback_runtime: MCPClientCallbackRuntime,
+        oauth_mode: OAuthMode,
+        oauth_active: bool,
+        oauth_event_handler: OAuthEventHandler | None,
+        allow_oauth_paste_fallback: bool,
+        transport_metrics: TransportChannelMetrics | None,
+    ) -> ServerConnection:
         connection_callback_runtime = replace(
             callback_runtime,
             transport_notification_handler=(
@@ -1093,24 +1146,6 @@ class MCPConnectionManager(ContextDependent):
 
         if transport_metrics is not None:
             server_conn.transport_metrics = transport_metrics
-
-        async with self._lock:
-            # Check if already running
-            if server_name in self.running_servers:
-                existing = self.running_servers[server_name]
-                if existing.server_config != config:
-                    raise ValueError(
-                        f"MCP server '{server_name}' is already starting with different settings"
-                    )
-                return existing
-
-            self.running_servers[server_name] = server_conn
-            self._server_oauth_mode[server_name] = oauth_mode
-            self._server_oauth_active[server_name] = oauth_active
-            assert self._task_group is not None
-            self._task_group.create_task(_server_lifecycle_task(server_conn))
-
-        logger.info(f"{server_name}: Attached MCP client runtime is ready")
         return server_conn
 
     async def _ensure_task_group(self, server_name: str) -> None:
@@ -1247,6 +1282,7 @@ class MCPConnectionManager(ContextDependent):
                 self.running_servers.pop(server_name, None)
                 self._server_oauth_mode.pop(server_name, None)
                 self._server_oauth_active.pop(server_name, None)
+                await self._shutdown_pool(server_name)
 
     async def _retry_server_with_oauth(
         self,
@@ -1433,6 +1469,161 @@ class MCPConnectionManager(ContextDependent):
             return "\n".join(str(line) for line in error_msg)
         return str(error_msg)
 
+    @asynccontextmanager
+    async def lease_tool_call_server(
+        self,
+        server_name: str,
+        *,
+        server_config: MCPServerSettings | None = None,
+        callback_runtime: MCPClientCallbackRuntime,
+        startup_timeout_seconds: float | None = None,
+        oauth_event_handler: OAuthEventHandler | None = None,
+        allow_oauth_paste_fallback: bool = True,
+    ) -> AsyncIterator[ServerConnection]:
+        """
+        Lease a connection for one tools/call request.
+
+        Servers without ``pool_size`` (or with ``pool_size: 1``) always lease the
+        primary connection. Pooled servers lease the healthy member with the
+        fewest outstanding requests, launching or recycling extra members first.
+        """
+        primary = await self.get_server(
+            server_name,
+            server_config=server_config,
+            callback_runtime=callback_runtime,
+            startup_timeout_seconds=startup_timeout_seconds,
+            oauth_event_handler=oauth_event_handler,
+            allow_oauth_paste_fallback=allow_oauth_paste_fallback,
+        )
+        pool_size = primary.server_config.pool_size or 1
+        if pool_size <= 1:
+            yield primary
+            return
+
+        pool = await self._ensure_pool(
+            primary,
+            pool_size,
+            callback_runtime=callback_runtime,
+            startup_timeout_seconds=startup_timeout_seconds,
+            allow_oauth_paste_fallback=allow_oauth_paste_fallback,
+        )
+        with pool.lease() as server_conn:
+            yield server_conn
+
+    def get_pool(self, server_name: str) -> ServerConnectionPool | None:
+        """Return the server's connection pool if one has been started."""
+        return self._pools.get(server_name)
+
+    async def _ensure_pool(
+        self,
+        primary: ServerConnection,
+        pool_size: int,
+        *,
+        callback_runtime: MCPClientCallbackRuntime,
+        startup_timeout_seconds: float | None,
+        allow_oauth_paste_fallback: bool,
+    ) -> ServerConnectionPool:
+        server_name = primary.server_name
+        pool = self._pools.get(server_name)
+        if (
+            pool is not None
+            and pool.server_config == primary.server_config
+            and pool.size == pool_size
+        ):
+            pool.set_primary(primary)
+            if not pool.vacant_slots() or time.monotonic() < pool.retry_after:
+                return pool
+
+        lock = self._pool_locks.setdefault(server_name, asyncio.Lock())
+        async with lock:
+            pool = self._pools.get(server_name)
+            if pool is not None and (
+                pool.server_config != primary.server_config or pool.size != pool_size
+            ):
+                await self._shutdown_pool(server_name)
+                pool = None
+            if pool is None:
+                pool = ServerConnectionPool(primary, pool_size)
+                self._pools[server_name] = pool
+            pool.set_primary(primary)
+
+            stale = pool.take_unhealthy()
+            if stale:
+                logger.info(f"{server_name}: Recycling {len(stale)} unhealthy pool member(s)")
+                await _shutdown_connections(stale)
+
+            vacant = pool.vacant_slots()
+            if not vacant or time.monotonic() < pool.retry_after:
+                return pool
+
+            launched = await asyncio.gather(
+                *(
+                    self._launch_pool_member(
+                        primary,
+                        callback_runtime=callback_runtime,
+                        startup_timeout_seconds=startup_timeout_seconds,
+                        allow_oauth_paste_fallback=allow_oauth_paste_fallback,
+                    )
+                    for _ in vacant
+                )
+            )
+            for index, server_conn in zip(vacant, launched, strict=True):
+                if server_conn is not None:
+                    pool.fill(index, server_conn)
+            if any(server_conn is None for server_conn in launched):
+                pool.retry_after = time.monotonic() + POOL_MEMBER_RETRY_SECONDS
+        return pool
+
+    async def _launch_pool_member(
+        self,
+        primary: ServerConnection,
+        *,
+        callback_runtime: MCPClientCallbackRuntime,
+        startup_timeout_seconds: float | None,
+        allow_oauth_paste_fallback: bool,
+    ) -> ServerConnection | None:
+        server_name = primary.server_name
+        await self._ensure_task_group(server_name)
+        server_conn = self._new_server_connection(
+            server_name,
+            primary.server_config,
+            callback_runtime=callback_runtime,
+            oauth_mode=self._server_oauth_mode.get(server_name, "auto"),
+            oauth_active=self._server_oauth_active.get(server_name, False),
+            oauth_event_handler=None,
+            allow_oauth_paste_fallback=allow_oauth_paste_fallback,
+            transport_metrics=None,
+        )
+        server_conn.pool_member = True
+        assert self._task_group is not None
+        self._task_group.create_task(_server_lifecycle_task(server_conn))
+        try:
+            await _wait_for_initialized_with_startup_budget(server_conn, startup_timeout_seconds)
+        except TimeoutError:
+            server_conn.shutdown_lifecycle()
+            await server_conn.wait_for_lifecycle_completion()
+            logger.warning(f"{server_name}: Pool member startup timed out")
+            return None
+        except asyncio.CancelledError:
+            server_conn.shutdown_lifecycle()
+            await server_conn.wait_for_lifecycle_completion()
+            raise
+
+        if not server_conn.is_healthy():
+            logger.warning(
+                f"{server_name}: Pool member failed to start",
+                data={"error": server_conn._error_message},
+            )
+            server_conn.shutdown_lifecycle()
+            await server_conn.wait_for_lifecycle_completion()
+            return None
+        return server_conn
+
+    async def _shutdown_pool(self, server_name: str) -> None:
+        pool = self._pools.pop(server_name, None)
+        if pool is not None:
+            await _shutdown_connections(pool.connections())
+
     async def get_server_capabilities(self, server_name: str) -> ServerCapabilities | None:
         """Get the capabilities of a specific server."""
         config = self.server_registry.get_server_config(server_name)
@@ -1465,6 +1656,7 @@ class MCPConnectionManager(ContextDependent):
                 logger.info(f"{server_name}: Attached runtime shut down.")
             else:
                 logger.info(f"{server_name}: No attached runtime found. Skipping shutdown")
+            await self._shutdown_pool(server_name)
 
     async def reconnect_server(
         self,
@@ -1572,10 +1764,13 @@ class MCPConnectionManager(ContextDependent):
     async def disconnect_all(self) -> bool:
         """Disconnect all servers that are running under this connection manager."""
         async with self._lock:
-            if not self.running_servers:
+            if not self.running_servers and not self._pools:
                 return False
 
             servers_to_shutdown = list(self.running_servers.items())
+            servers_to_shutdown.extend(
+                (name, conn) for name, pool in self._pools.items() for conn in pool.connections()
+            )
             for name, conn in servers_to_shutdown:
                 logger.info(f"{name}: Requesting shutdown...")
                 conn.shutdown_lifecycle()
@@ -1583,6 +1778,7 @@ class MCPConnectionManager(ContextDependent):
                 *(conn.wait_for_lifecycle_completion() for _, conn in servers_to_shutdown)
             )
             self.running_servers.clear()
+            self._pools.clear()
             self._server_oauth_mode.clear()
             self._server_oauth_active.clear()
         return True
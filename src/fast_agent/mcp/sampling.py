@@ -3,6 +3,7 @@ This simplified implementation directly converts between MCP types and PromptMes
 Supports "sampling with tools" as per MCP specification.
 """
 
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -17,6 +18,7 @@ from mcp_types import (
 
 from fast_agent.agents.agent_types import AgentConfig
 from fast_agent.agents.llm_agent import LlmAgent
+from fast_agent.config import MCPSamplingSettings
 from fast_agent.core.exceptions import ModelConfigError
 from fast_agent.core.logging.logger import get_logger
 from fast_agent.core.model_resolution import (
@@ -27,9 +29,12 @@ from fast_agent.core.model_resolution import (
 )
 from fast_agent.interfaces import FastAgentLLMProtocol
 from fast_agent.llm.sampling_converter import SamplingConverter
+from fast_agent.mcp.sampling_pool import SamplingLLMPool, SamplingPoolKey
 from fast_agent.types.llm_stop_reason import LlmStopReason
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from fast_agent.config import MCPServerSettings
     from fast_agent.context import Context
     from fast_agent.types import PromptMessageExtended
@@ -77,6 +82,50 @@ def create_sampling_llm(
     return llm
 
 
+def _sampling_pool(app_context: "Context | None") -> SamplingLLMPool | None:
+    if app_context is None:
+        return None
+    if app_context.sampling_pool is None:
+        app_context.sampling_pool = SamplingLLMPool()
+    return app_context.sampling_pool
+
+
+@asynccontextmanager
+async def _sampling_llm(
+    params: CreateMessageRequestParams,
+    selection: _SamplingModelSelection,
+    *,
+    server_name: str,
+    server_config: "MCPServerSettings | None",
+) -> "AsyncIterator[FastAgentLLMProtocol]":
+    """Lease a pooled sampling LLM, or build a one-off LLM without an app context."""
+
+    def create() -> FastAgentLLMProtocol:
+        return create_sampling_llm(
+            params, selection.model, selection.api_key, selection.app_context
+        )
+
+    pool = _sampling_pool(selection.app_context)
+    if pool is None:
+        yield create()
+        return
+
+    sampling_settings = (
+        server_config.sampling
+        if server_config is not None and server_config.sampling is not None
+        else MCPSamplingSettings()
+    )
+    key = SamplingPoolKey.build(selection.model, selection.api_key, sampling_settings)
+    async with pool.lease(
+        key,
+        server_name=server_name,
+        max_concurrent=sampling_settings.max_concurrent,
+        create=create,
+        instruction=sampling_agent_config(params).instruction,
+    ) as llm:
+        yield llm
+
+
 def _current_app_context() -> "Context | None":
     try:
         from fast_agent.context import get_current_context
@@ -231,14 +280,6 @@ async def sample(
         )
         model = selection.model
 
-        # Create an LLM instance
-        llm = create_sampling_llm(
-            params,
-            model,
-            selection.api_key,
-            selection.app_context,
-        )
-
         # Extract all messages from the request params
         if not params.messages:
             raise ValueError("No messages provided")
@@ -246,17 +287,21 @@ async def sample(
         # Convert all SamplingMessages to PromptMessageExtended objects
         conversation = SamplingConverter.convert_messages(params.messages)
 
-        # Extract request parameters using our converter
+        # Extract request parameters using our converter; pooled LLMs keep no history
         request_params = SamplingConverter.extract_request_params(params)
+        request_params.use_history = False
 
         # Check if tools are provided in the request
         tools = params.tools
         has_tools = params.tools is not None or params.tool_choice is not None
 
         # Call LLM with tools if provided
-        llm_response: PromptMessageExtended = await llm.generate(
-            conversation, request_params, tools=tools
-        )
+        async with _sampling_llm(
+            params, selection, server_name=server_name, server_config=server_config
+        ) as llm:
+            llm_response: PromptMessageExtended = await llm.generate(
+                conversation, request_params, tools=tools
+            )
 
         # Log response (truncate for brevity)
         response_text = llm_response.first_text()
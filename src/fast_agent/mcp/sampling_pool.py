@@ -0,0 +1,155 @@
+"""Reusable LLM instances for MCP ``sampling/createMessage`` requests.
+
+Servers that sample heavily (summarizers or classifiers running inside tools)
+can send hundreds of requests per session. Rather than resolving the model
+factory and building a new agent and provider client for each one, sampling
+LLMs are kept in a pool keyed by model, API key and the server's sampling
+settings. Sampling is stateless (every request carries its full conversation),
+so an idle LLM can serve any request with the same key once its instruction is
+reset. Each leased instance is used by one request at a time.
+
+Requests from one server share a :class:`ServerCallLimiter`, bounding how many
+sampling calls that server can have in flight.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from fast_agent.mcp.call_limiter import ServerCallLimiter
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+    from fast_agent.config import MCPSamplingSettings
+    from fast_agent.interfaces import FastAgentLLMProtocol
+
+SAMPLING_OWNER = "sampling"
+
+
+@dataclass(frozen=True, slots=True)
+class SamplingPoolKey:
+    """Identity of interchangeable sampling LLMs."""
+
+    model: str
+    api_key_digest: str | None
+    """SHA-256 of the API key override; the key itself is never stored."""
+    sampling_config: str
+
+    @classmethod
+    def build(
+        cls,
+        model: str,
+        api_key: str | None,
+        sampling_settings: MCPSamplingSettings | None,
+    ) -> SamplingPoolKey:
+        digest = hashlib.sha256(api_key.encode("utf-8")).hexdigest() if api_key else None
+        config = (
+            sampling_settings.model_dump_json(exclude={"max_concurrent"})
+            if sampling_settings is not None
+            else ""
+        )
+        return cls(model=model, api_key_digest=digest, sampling_config=config)
+
+
+@dataclass(frozen=True, slots=True)
+class SamplingServerStats:
+    """Point-in-time view of one server's sampling activity."""
+
+    max_concurrent: int | None
+    in_flight: int
+    queue_depth: int
+    requests: int
+    pool_hits: int
+    """Requests served by an already-constructed LLM."""
+    total_latency_seconds: float
+    max_latency_seconds: float
+
+    @property
+    def hit_rate(self) -> float:
+        return self.pool_hits / self.requests if self.requests else 0.0
+
+    @property
+    def mean_latency_seconds(self) -> float:
+        return self.total_latency_seconds / self.requests if self.requests else 0.0
+
+
+@dataclass(slots=True)
+class _ServerCounters:
+    limiter: ServerCallLimiter
+    requests: int = 0
+    pool_hits: int = 0
+    total_latency_seconds: float = 0.0
+    max_latency_seconds: float = 0.0
+
+
+@dataclass(slots=True)
+class SamplingLLMPool:
+    """Idle sampling LLMs per key, plus per-server limits and counters."""
+
+    _idle: dict[SamplingPoolKey, list[FastAgentLLMProtocol]] = field(default_factory=dict)
+    _servers: dict[str, _ServerCounters] = field(default_factory=dict)
+
+    def _counters(self, server_name: str, max_concurrent: int | None) -> _ServerCounters:
+        counters = self._servers.get(server_name)
+        if counters is None:
+            counters = _ServerCounters(limiter=ServerCallLimiter(max_concurrent))
+            self._servers[server_name] = counters
+        elif counters.limiter.max_concurrent != max_concurrent:
+            counters.limiter.set_max_concurrent(max_concurrent)
+        return counters
+
+    @asynccontextmanager
+    async def lease(
+        self,
+        key: SamplingPoolKey,
+        *,
+        server_name: str,
+        max_concurrent: int | None,
+        create: Callable[[], FastAgentLLMProtocol],
+        instruction: str,
+    ) -> AsyncIterator[FastAgentLLMProtocol]:
+        """Hold a sampling slot for ``server_name`` and lend an LLM for ``key``.
+
+        The LLM returns to the pool when the block exits normally; one that
+        raised is dropped so a broken client is not handed out again.
+        """
+        counters = self._counters(server_name, max_concurrent)
+        async with counters.limiter.slot(SAMPLING_OWNER):
+            started = time.perf_counter()
+            idle = self._idle.get(key)
+            reused = bool(idle)
+            llm = idle.pop() if idle else create()
+            llm.instruction = instruction
+            llm.default_request_params.system_prompt = instruction
+            try:
+                yield llm
+            finally:
+                elapsed = time.perf_counter() - started
+                counters.requests += 1
+                counters.pool_hits += int(reused)
+                counters.total_latency_seconds += elapsed
+                counters.max_latency_seconds = max(counters.max_latency_seconds, elapsed)
+            self._idle.setdefault(key, []).append(llm)
+
+    def idle_count(self, key: SamplingPoolKey) -> int:
+        return len(self._idle.get(key, ()))
+
+    def stats(self, server_name: str) -> SamplingServerStats | None:
+        counters = self._servers.get(server_name)
+        if counters is None:
+            return None
+        queue = counters.limiter.stats()
+        return SamplingServerStats(
+            max_concurrent=queue.max_concurrent,
+            in_flight=queue.in_flight,
+            queue_depth=queue.queue_depth,
+            requests=counters.requests,
+            pool_hits=counters.pool_hits,
+            total_latency_seconds=counters.total_latency_seconds,
+            max_latency_seconds=counters.max_latency_seconds,
+        )
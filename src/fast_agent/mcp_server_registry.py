@@ -9,6 +9,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Literal
 
 from fast_agent.core.logging.logger import get_logger
+from fast_agent.mcp.call_limiter import ServerCallLimiter
 
 if TYPE_CHECKING:
     from mcp_types import ServerCapabilities
@@ -49,6 +50,7 @@ class ServerRegistry:
         self._origins: dict[str, ServerOrigin] = dict.fromkeys(self.registry, "central")
         self._runtime_owners: dict[str, set[str]] = {}
         self._attachment_owners: dict[str, set[str]] = {}
+        self._call_limiters: dict[str, ServerCallLimiter] = {}
 
     def register_central(self, server_name: str, config: MCPServerSettings) -> None:
         self._register(server_name, config, "central")
@@ -196,3 +198,23 @@ class ServerRegistry:
 
     def clear_server_capabilities(self, server_name: str) -> None:
         self._capabilities.pop(server_name, None)
+
+    def call_limiter(self, server_name: str) -> ServerCallLimiter:
+        """Return the tools/call limiter shared by every agent using this server.
+
+        The limit follows the server's current ``max_concurrent_calls`` setting, so
+        re-registering a server with a new limit applies it to queued calls too.
+        """
+        server_config = self.registry.get(server_name)
+        max_concurrent = server_config.max_concurrent_calls if server_config else None
+        limiter = self._call_limiters.get(server_name)
+        if limiter is None:
+            limiter = ServerCallLimiter(max_concurrent)
+            self._call_limiters[server_name] = limiter
+        elif limiter.max_concurrent != max_concurrent:
+            limiter.set_max_concurrent(max_concurrent)
+        return limiter
+
+    def get_call_limiter(self, server_name: str) -> ServerCallLimiter | None:
+        """Return the server's limiter if any call has been made through it."""
+        return self._call_limiters.get(server_name)
@@ -16,7 +16,7 @@ from fast_agent.patch.parser import (
     UpdateFileChunk,
     parse_patch,
 )
-from fast_agent.patch.seek_sequence import seek_sequence
+from fast_agent.patch.seek_sequence import LineIndex, seek_sequence
 
 
 @dataclass(frozen=True)
@@ -145,6 +145,7 @@ def compute_replacements(
 ) -> list[tuple[int, int, list[str]]]:
     replacements: list[tuple[int, int, list[str]]] = []
     line_index = 0
+    index = LineIndex(original_lines)
 
     for chunk in chunks:
         if chunk.change_context is not None:
@@ -153,6 +154,7 @@ def compute_replacements(
                 [chunk.change_context],
                 line_index,
                 False,
+                index=index,
             )
             if found is None:
                 raise ApplyPatchError(f"Failed to find context '{chunk.change_context}' in {path}")
@@ -169,13 +171,17 @@ def compute_replacements(
 
         pattern = list(chunk.old_lines)
         new_slice = list(chunk.new_lines)
-        found = seek_sequence(original_lines, pattern, line_index, chunk.is_end_of_file)
+        found = seek_sequence(
+            original_lines, pattern, line_index, chunk.is_end_of_file, index=index
+        )
 
         if found is None and pattern and pattern[-1] == "":
             pattern = pattern[:-1]
             if new_slice and new_slice[-1] == "":
                 new_slice = new_slice[:-1]
-            found = seek_sequence(original_lines, pattern, line_index, chunk.is_end_of_file)
+            found = seek_sequence(
+                original_lines, pattern, line_index, chunk.is_end_of_file, index=index
+            )
 
         if found is None:
             expected = "\n".join(chunk.old_lines)
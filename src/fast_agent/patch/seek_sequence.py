@@ -1,77 +1,32 @@
 """
 Fuzzy match helpers adapted from openai/codex apply_patch (Apache 2.0).
+
+Matching tries four progressively looser comparisons (exact, trim-end, trim,
+unicode-normalised) in priority order. ``LineIndex`` precomputes each
+normalised form of a file once and maps it to line positions, so candidate
+start positions come from a hash lookup on the first pattern line rather than
+a scan of every index.
 """
 
 from __future__ import annotations
 
+from bisect import bisect_left
+from collections import defaultdict
 from collections.abc import Callable
 
-Matcher = Callable[[list[str], list[str], int], bool]
-
-_MATCHERS: tuple[Matcher, ...] = (
-    lambda lines, pattern, index: lines[index : index + len(pattern)] == pattern,
-    lambda lines, pattern, index: _matches_trim_end(lines, pattern, index),
-    lambda lines, pattern, index: _matches_trim(lines, pattern, index),
-    lambda lines, pattern, index: _matches_normalized(lines, pattern, index),
-)
-
-
-def seek_sequence(
-    lines: list[str],
-    pattern: list[str],
-    start: int,
-    eof: bool,
-) -> int | None:
-    if not pattern:
-        return start
-    if len(pattern) > len(lines):
-        return None
-
-    search_range = _search_range(lines=lines, pattern=pattern, start=start, eof=eof)
-    return _first_matching_index(lines, pattern, search_range)
-
-
-def _search_range(
-    *,
-    lines: list[str],
-    pattern: list[str],
-    start: int,
-    eof: bool,
-) -> range:
-    last_start = len(lines) - len(pattern)
-    search_start = last_start if eof else start
-    return range(search_start, last_start + 1)
-
-
-def _first_matching_index(
-    lines: list[str],
-    pattern: list[str],
-    search_range: range,
-) -> int | None:
-    for matcher in _MATCHERS:
-        for index in search_range:
-            if matcher(lines, pattern, index):
-                return index
-    return None
-
-
-def _matches_trim_end(lines: list[str], pattern: list[str], index: int) -> bool:
-    return all(lines[index + offset].rstrip() == pat.rstrip() for offset, pat in enumerate(pattern))
+Normaliser = Callable[[str], str]
 
 
-def _matches_trim(lines: list[str], pattern: list[str], index: int) -> bool:
-    return all(lines[index + offset].strip() == pat.strip() for offset, pat in enumerate(pattern))
+def _exact(value: str) -> str:
+    return value
 
 
-def _matches_normalized(lines: list[str], pattern: list[str], index: int) -> bool:
-    for offset, pat in enumerate(pattern):
-        if _normalise(lines[index + offset]) != _normalise(pat):
-            return False
-    return True
+_trim_end = str.rstrip
+_trim = str.strip
 
 
-def _normalise(value: str) -> str:
-    mapping = {
+_NORMALISE_TABLE = str.maketrans(
+    {
         "\u2010": "-",
         "\u2011": "-",
         "\u2012": "-",
@@ -101,4 +56,97 @@ def _normalise(value: str) -> str:
         "\u205f": " ",
         "\u3000": " ",
     }
-    return "".join(mapping.get(ch, ch) for ch in value.strip())
+)
+
+
+def _normalise(value: str) -> str:
+    stripped = value.strip()
+    if stripped.isascii():
+        return stripped
+    return stripped.translate(_NORMALISE_TABLE)
+
+
+_NORMALISERS: tuple[Normaliser, ...] = (_exact, _trim_end, _trim, _normalise)
+
+
+class LineIndex:
+    """Per-file lookup tables for ``seek_sequence``.
+
+    Each matcher level is built lazily on first use and then reused for every
+    hunk applied to the same file, so a patch normalises each line at most
+    once per level.
+    """
+
+    __slots__ = ("_levels", "lines")
+
+    def __init__(self, lines: list[str]) -> None:
+        self.lines = lines
+        self._levels: list[tuple[list[str], dict[str, list[int]]] | None] = [None] * len(
+            _NORMALISERS
+        )
+
+    def level(self, matcher: int) -> tuple[list[str], dict[str, list[int]]]:
+        built = self._levels[matcher]
+        if built is None:
+            normaliser = _NORMALISERS[matcher]
+            forms = self.lines if normaliser is _exact else list(map(normaliser, self.lines))
+            positions: defaultdict[str, list[int]] = defaultdict(list)
+            for position, form in enumerate(forms):
+                positions[form].append(position)
+            built = (forms, positions)
+            self._levels[matcher] = built
+        return built
+
+
+def seek_sequence(
+    lines: list[str],
+    pattern: list[str],
+    start: int,
+    eof: bool,
+    *,
+    index: LineIndex | None = None,
+) -> int | None:
+    if not pattern:
+        return start
+    if len(pattern) > len(lines):
+        return None
+
+    if index is None or index.lines is not lines:
+        index = LineIndex(lines)
+    search_range = _search_range(lines=lines, pattern=pattern, start=start, eof=eof)
+    return _first_matching_index(index, pattern, search_range)
+
+
+def _search_range(
+    *,
+    lines: list[str],
+    pattern: list[str],
+    start: int,
+    eof: bool,
+) -> range:
+    last_start = len(lines) - len(pattern)
+    search_start = last_start if eof else start
+    return range(search_start, last_start + 1)
+
+
+def _first_matching_index(
+    index: LineIndex,
+    pattern: list[str],
+    search_range: range,
+) -> int | None:
+    if not search_range:
+        return None
+    for matcher, normaliser in enumerate(_NORMALISERS):
+        forms, positions = index.level(matcher)
+        wanted = [normaliser(line) for line in pattern]
+        candidates = positions.get(wanted[0])
+        if not candidates:
+            continue
+        size = len(wanted)
+        stop = search_range.stop
+        for position in candidates[bisect_left(candidates, search_range.start) :]:
+            if position >= stop:
+                break
+            if forms[position : position + size] == wanted:
+                return position
+    return None
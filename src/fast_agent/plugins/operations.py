@@ -254,23 +254,21 @@ def check_plugin_updates_in_roots(
 ) -> list[PluginUpdateInfo]:
     head_cache: HeadCache = {}
     path_cache: PathCache = {}
-    updates: list[PluginUpdateInfo] = []
+    plugin_dirs: list[Path] = []
     for destination_root in destination_roots:
         destination_root = destination_root.resolve()
         if not destination_root.is_dir():
             continue
-        for entry in sorted(destination_root.iterdir()):
-            if not entry.is_dir():
-                continue
-            updates.append(
-                _evaluate_plugin_update(
-                    plugin_dir=entry,
-                    index=len(updates) + 1,
-                    head_cache=head_cache,
-                    path_cache=path_cache,
-                )
-            )
-    return updates
+        plugin_dirs.extend(entry for entry in sorted(destination_root.iterdir()) if entry.is_dir())
+    return marketplace_update_status.evaluate_updates_concurrently(
+        list(enumerate(plugin_dirs, start=1)),
+        lambda entry: _evaluate_plugin_update(
+            plugin_dir=entry[1],
+            index=entry[0],
+            head_cache=head_cache,
+            path_cache=path_cache,
+        ),
+    )
 
 
 def select_plugin_updates(
@@ -296,13 +294,16 @@ def apply_plugin_updates(
     head_cache: HeadCache = {}
     path_cache: PathCache = {}
     results: list[PluginUpdateInfo] = []
-    for update in updates:
-        refreshed = _evaluate_plugin_update(
+    refreshed_updates = marketplace_update_status.evaluate_updates_concurrently(
+        updates,
+        lambda update: _evaluate_plugin_update(
             plugin_dir=update.plugin_dir,
             index=update.index,
             head_cache=head_cache,
             path_cache=path_cache,
-        )
+        ),
+    )
+    for refreshed in refreshed_updates:
         source = refreshed.managed_source
         if not is_update_applicable(refreshed.status):
             results.append(refreshed)
@@ -1,17 +1,21 @@
 """Privacy filtering helpers for session trace export."""
 
 from fast_agent.privacy.sanitizer import (
+    BatchTraceSanitizer,
     PrivacyFilterModelInfo,
     RedactionSpan,
     RedactionSummary,
     SanitizedText,
     TraceSanitizer,
+    sanitize_texts,
 )
 
 __all__ = [
+    "BatchTraceSanitizer",
     "PrivacyFilterModelInfo",
     "RedactionSpan",
     "RedactionSummary",
     "SanitizedText",
     "TraceSanitizer",
+    "sanitize_texts",
 ]
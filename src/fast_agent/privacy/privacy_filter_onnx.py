@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
+from collections import OrderedDict
 from dataclasses import dataclass
 from importlib import import_module
 from typing import TYPE_CHECKING, Any, Literal
@@ -38,7 +40,7 @@ from fast_agent.session.trace_export_errors import SessionExportPrivacyFilterErr
 from fast_agent.utils.text import strip_casefold
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator, Sequence
     from pathlib import Path
 
 _PLACEHOLDERS = {
@@ -56,6 +58,13 @@ _PLACEHOLDERS = {
 # latency manageable while still dwarfing the model's local attention radius.
 _DEFAULT_INFERENCE_WINDOW_TOKENS = 4096
 _DEFAULT_WINDOW_OVERLAP_TOKENS = 128
+# Batched inference packs windows from many texts into one padded ORT call.
+# The token budget bounds padded batch memory; windows are sorted by length
+# first so short texts (tool schemas, chat turns) share batches with little
+# padding.
+_DEFAULT_MAX_BATCH_WINDOWS = 16
+_DEFAULT_MAX_BATCH_TOKENS = 16_384
+_DEFAULT_CACHE_ENTRIES = 4096
 _DEFAULT_DEVICE: Literal["auto"] = "auto"
 _SUPPORTED_DEVICES = ("auto", "cpu", "cuda")
 
@@ -67,6 +76,16 @@ class _ModelFiles:
     model: Path
 
 
+@dataclass(frozen=True, slots=True)
+class _Window:
+    """A slice of one tokenized text, ready for inference."""
+
+    text_index: int
+    ids: list[int]
+    attention: list[int]
+    offsets: list[tuple[int, int]]
+
+
 class OpenAIPrivacyFilterOnnxSanitizer(TraceSanitizer):
     """Local ONNX Runtime wrapper around OpenAI Privacy Filter."""
 
@@ -115,6 +134,26 @@ class OpenAIPrivacyFilterOnnxSanitizer(TraceSanitizer):
         )
         if self._window_overlap_tokens >= self._max_window_tokens:
             self._window_overlap_tokens = max(0, self._max_window_tokens // 8)
+        self._max_batch_windows = _env_int(
+            "FAST_AGENT_PRIVACY_FILTER_BATCH_WINDOWS",
+            default=_DEFAULT_MAX_BATCH_WINDOWS,
+            minimum=1,
+        )
+        self._max_batch_tokens = max(
+            self._max_window_tokens,
+            _env_int(
+                "FAST_AGENT_PRIVACY_FILTER_BATCH_TOKENS",
+                default=_DEFAULT_MAX_BATCH_TOKENS,
+                minimum=128,
+            ),
+        )
+        self._pad_token_id = _pad_token_id(self._config)
+        self._cache: OrderedDict[bytes, SanitizedText] = OrderedDict()
+        self._cache_entries = _env_int(
+            "FAST_AGENT_PRIVACY_FILTER_CACHE_ENTRIES",
+            default=_DEFAULT_CACHE_ENTRIES,
+            minimum=0,
+        )
         self._input_names = {item.name for item in self._session.get_inputs()}
         if not {"input_ids", "attention_mask"}.issubset(self._input_names):
             raise SessionExportPrivacyFilterError(
@@ -138,15 +177,113 @@ class OpenAIPrivacyFilterOnnxSanitizer(TraceSanitizer):
     def sanitize_text(self, text: str) -> SanitizedText:
         if not text:
             return SanitizedText(text=text)
+        key = _content_key(text)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
         spans = self.detect_spans(text)
         if self._show_redactions:
             self._emit_redactions(text, spans)
-        return SanitizedText(
+        sanitized = SanitizedText(
             text=_replace_spans(text, spans),
             spans=tuple(spans),
         )
+        self._cache_put(key, sanitized)
+        return sanitized
+
+    def sanitize_texts(self, texts: Sequence[str]) -> list[SanitizedText]:
+        """Sanitize many texts with batched inference.
+
+        Identical texts (repeated system prompts, tool schemas) are detected
+        once, both within the call and across calls via the content-hash cache.
+        """
+
+        results: list[SanitizedText | None] = [None] * len(texts)
+        pending: dict[bytes, list[int]] = {}
+        for index, text in enumerate(texts):
+            if not text:
+                results[index] = SanitizedText(text=text)
+                continue
+            key = _content_key(text)
+            cached = self._cache_get(key)
+            if cached is not None:
+                results[index] = cached
+                continue
+            pending.setdefault(key, []).append(index)
+
+        if pending:
+            keys = list(pending)
+            unique_texts = [texts[pending[key][0]] for key in keys]
+            detected = self.detect_spans_batch(unique_texts)
+            for key, text, spans in zip(keys, unique_texts, detected, strict=True):
+                if self._show_redactions:
+                    self._emit_redactions(text, spans)
+                sanitized = SanitizedText(text=_replace_spans(text, spans), spans=tuple(spans))
+                self._cache_put(key, sanitized)
+                for index in pending[key]:
+                    results[index] = sanitized
+
+        return [
+            result if result is not None else SanitizedText(text=text)
+            for result, text in zip(results, texts, strict=True)
+        ]
 
     def detect_spans(self, text: str) -> list[RedactionSpan]:
+        windows = self._text_windows(text, text_index=0)
+        if not windows:
+            return []
+        if len(windows) == 1:
+            window = windows[0]
+            return self._run_window(
+                ids=window.ids,
+                attention=window.attention,
+                offsets=window.offsets,
+                text=text,
+            )
+
+        spans: list[RedactionSpan] = []
+        total_windows = len(windows)
+        for window_number, window in enumerate(windows, start=1):
+            if _should_emit_window_progress(window_number, total_windows):
+                self._emit_progress(
+                    f"Privacy filter: large text window {window_number:,}/{total_windows:,} "
+                    f"({_percent(window_number, total_windows)}%)..."
+                )
+            spans.extend(
+                self._run_window(
+                    ids=window.ids,
+                    attention=window.attention,
+                    offsets=window.offsets,
+                    text=text,
+                )
+            )
+        return _merge_spans(spans)
+
+    def detect_spans_batch(self, texts: Sequence[str]) -> list[list[RedactionSpan]]:
+        """Detect spans for many texts, packing their windows into padded batches."""
+
+        windows: list[_Window] = []
+        for text_index, text in enumerate(texts):
+            windows.extend(self._text_windows(text, text_index=text_index))
+        spans_by_text: list[list[RedactionSpan]] = [[] for _ in texts]
+        if not windows:
+            return spans_by_text
+
+        # Longest first: each batch pads to its first window, so sorting keeps
+        # padding waste low when short and long texts are mixed.
+        windows.sort(key=lambda window: len(window.ids), reverse=True)
+        batches = list(self._pack_batches(windows))
+        if len(batches) > 1:
+            self._emit_progress(
+                f"Privacy filter: batched {len(windows):,} windows from "
+                f"{len(texts):,} texts into {len(batches):,} inference calls..."
+            )
+        for batch in batches:
+            for window, spans in zip(batch, self._run_batch(batch, texts), strict=True):
+                spans_by_text[window.text_index].extend(spans)
+        return [_merge_spans(spans) for spans in spans_by_text]
+
+    def _text_windows(self, text: str, *, text_index: int) -> list[_Window]:
         if not text:
             return []
         encoding = self._tokenizer.encode(text)
@@ -161,33 +298,22 @@ class OpenAIPrivacyFilterOnnxSanitizer(TraceSanitizer):
 
         # Single-window fast path.
         if len(real_token_indices) <= self._max_window_tokens:
-            return self._run_window(
-                ids=ids,
-                attention=attention,
-                offsets=offsets,
-                text=text,
-            )
+            return [_Window(text_index, ids, attention, offsets)]
 
         # Slide over real-token positions; slice the *already tokenized* sequence
         # rather than re-encoding substrings (which doubles tokenizer cost and
         # changes BPE boundaries at window seams).
-        spans: list[RedactionSpan] = []
+        windows: list[_Window] = []
         step = self._max_window_tokens - self._window_overlap_tokens
         window_starts = list(range(0, len(real_token_indices), step))
-        total_windows = len(window_starts)
         self._emit_progress(
             f"Privacy filter: scanning large text ({len(text):,} chars, "
-            f"{total_windows:,} windows)..."
+            f"{len(window_starts):,} windows)..."
         )
-        for window_number, start_real in enumerate(window_starts, start=1):
+        for start_real in window_starts:
             end_real = min(start_real + self._max_window_tokens, len(real_token_indices))
             if start_real >= end_real:
                 continue
-            if _should_emit_window_progress(window_number, total_windows):
-                self._emit_progress(
-                    f"Privacy filter: large text window {window_number:,}/{total_windows:,} "
-                    f"({_percent(window_number, total_windows)}%)..."
-                )
             # Map real-token indices to absolute positions in the tokenized
             # sequence. Include any leading/trailing special tokens at the
             # boundaries of the full encoding so the model still sees them.
@@ -197,17 +323,72 @@ class OpenAIPrivacyFilterOnnxSanitizer(TraceSanitizer):
                 if end_real < len(real_token_indices)
                 else len(ids)
             )
-            spans.extend(
-                self._run_window(
-                    ids=ids[token_start:token_end],
-                    attention=attention[token_start:token_end],
-                    offsets=offsets[token_start:token_end],
-                    text=text,
+            windows.append(
+                _Window(
+                    text_index,
+                    ids[token_start:token_end],
+                    attention[token_start:token_end],
+                    offsets[token_start:token_end],
                 )
             )
             if end_real == len(real_token_indices):
                 break
-        return _merge_spans(spans)
+        return windows
+
+    def _pack_batches(self, windows: list[_Window]) -> Iterator[list[_Window]]:
+        batch: list[_Window] = []
+        padded_length = 0
+        for window in windows:
+            length = max(padded_length, len(window.ids))
+            if batch and (
+                len(batch) >= self._max_batch_windows
+                or length * (len(batch) + 1) > self._max_batch_tokens
+            ):
+                yield batch
+                batch = []
+                length = len(window.ids)
+            batch.append(window)
+            padded_length = length
+        if batch:
+            yield batch
+
+    def _run_batch(
+        self,
+        batch: list[_Window],
+        texts: Sequence[str],
+    ) -> list[list[RedactionSpan]]:
+        if len(batch) == 1:
+            window = batch[0]
+            return [
+                self._run_window(
+                    ids=window.ids,
+                    attention=window.attention,
+                    offsets=window.offsets,
+                    text=texts[window.text_index],
+                )
+            ]
+
+        np = self._np
+        padded_length = max(len(window.ids) for window in batch)
+        input_ids = np.full((len(batch), padded_length), self._pad_token_id, dtype=np.int64)
+        attention_mask = np.zeros((len(batch), padded_length), dtype=np.int64)
+        for row, window in enumerate(batch):
+            input_ids[row, : len(window.ids)] = window.ids
+            attention_mask[row, : len(window.attention)] = window.attention
+        logits = self._infer(input_ids, attention_mask, batch_size=len(batch))
+        if logits.shape[1] != padded_length:
+            raise SessionExportPrivacyFilterError(
+                "Privacy filter logits length does not match batch token count "
+                f"(got {logits.shape[1]}, expected {padded_length})."
+            )
+        return [
+            self._decode_window(
+                logits[row, : len(window.ids)],
+                offsets=window.offsets,
+                text=texts[window.text_index],
+            )
+            for row, window in enumerate(batch)
+        ]
 
     def _run_window(
         self,
@@ -222,6 +403,15 @@ class OpenAIPrivacyFilterOnnxSanitizer(TraceSanitizer):
 
         input_ids = self._np.asarray([ids], dtype=self._np.int64)
         attention_mask = self._np.asarray([attention], dtype=self._np.int64)
+        logits = self._infer(input_ids, attention_mask, batch_size=1)
+        if logits.shape[1] != len(ids):
+            raise SessionExportPrivacyFilterError(
+                "Privacy filter logits length does not match window token count "
+                f"(got {logits.shape[1]}, expected {len(ids)})."
+            )
+        return self._decode_window(logits[0], offsets=offsets, text=text)
+
+    def _infer(self, input_ids: Any, attention_mask: Any, *, batch_size: int) -> Any:
         outputs = self._session.run(
             None,
             {
@@ -230,7 +420,7 @@ class OpenAIPrivacyFilterOnnxSanitizer(TraceSanitizer):
             },
         )
         logits = outputs[0]
-        if len(logits.shape) != 3 or logits.shape[0] != 1:
+        if len(logits.shape) != 3 or logits.shape[0] != batch_size:
             raise SessionExportPrivacyFilterError(
                 f"Unexpected privacy filter logits shape: {logits.shape}"
             )
@@ -238,15 +428,19 @@ class OpenAIPrivacyFilterOnnxSanitizer(TraceSanitizer):
             raise SessionExportPrivacyFilterError(
                 "Privacy filter label count does not match ONNX logits dimension."
             )
-        if logits.shape[1] != len(ids):
-            raise SessionExportPrivacyFilterError(
-                "Privacy filter logits length does not match window token count "
-                f"(got {logits.shape[1]}, expected {len(ids)})."
-            )
+        return logits
+
+    def _decode_window(
+        self,
+        logits: Any,
+        *,
+        offsets: list[tuple[int, int]],
+        text: str,
+    ) -> list[RedactionSpan]:
         # Softmax normalization is unnecessary for Viterbi: subtracting the
         # per-token logsumexp adds the same constant to every label score for
         # that token and cannot change the best path.
-        path = constrained_viterbi_np(logits[0], self._viterbi_tables, self._np)
+        path = constrained_viterbi_np(logits, self._viterbi_tables, self._np)
         spans: list[RedactionSpan] = []
         for token_span in token_spans_from_path(path, self._labels):
             start_char, _ = offsets[token_span.start]
@@ -266,6 +460,20 @@ class OpenAIPrivacyFilterOnnxSanitizer(TraceSanitizer):
             )
         return _merge_spans(spans)
 
+    def _cache_get(self, key: bytes) -> SanitizedText | None:
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+        return cached
+
+    def _cache_put(self, key: bytes, sanitized: SanitizedText) -> None:
+        if self._cache_entries <= 0:
+            return
+        self._cache[key] = sanitized
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_entries:
+            self._cache.popitem(last=False)
+
     def _emit_progress(self, message: str) -> None:
         if self._progress_callback is not None:
             self._progress_callback(message)
@@ -439,6 +647,17 @@ def _load_viterbi_transition_biases(path: Path) -> dict[str, float]:
     return biases
 
 
+def _pad_token_id(config: dict[str, Any]) -> int:
+    value = config.get("pad_token_id")
+    if isinstance(value, int) and not isinstance(value, bool) and value >= 0:
+        return value
+    return 0
+
+
+def _content_key(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
 def _real_token_indices(offsets: list[tuple[int, int]]) -> list[int]:
     return [index for index, (start, end) in enumerate(offsets) if end > start]
 
@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Sequence
     from datetime import timedelta
 
 
@@ -45,6 +45,18 @@ class RedactionSummary:
     by_label: dict[str, int]
     model: PrivacyFilterModelInfo | None = None
     elapsed: timedelta | None = None
+    characters: int = 0
+
+    @property
+    def characters_per_second(self) -> float | None:
+        """Sanitizer throughput over unique text, when timing is known."""
+
+        if self.elapsed is None or self.characters <= 0:
+            return None
+        seconds = self.elapsed.total_seconds()
+        if seconds <= 0:
+            return None
+        return self.characters / seconds
 
 
 class TraceSanitizer(Protocol):
@@ -56,6 +68,21 @@ class TraceSanitizer(Protocol):
     def sanitize_text(self, text: str) -> SanitizedText: ...
 
 
+class BatchTraceSanitizer(TraceSanitizer, Protocol):
+    """Sanitizer that can process many texts in one call."""
+
+    def sanitize_texts(self, texts: Sequence[str]) -> list[SanitizedText]: ...
+
+
+def sanitize_texts(sanitizer: TraceSanitizer, texts: Sequence[str]) -> list[SanitizedText]:
+    """Sanitize ``texts`` in order, batching when the sanitizer supports it."""
+
+    batch = getattr(sanitizer, "sanitize_texts", None)
+    if callable(batch):
+        return list(batch(texts))
+    return [sanitizer.sanitize_text(text) for text in texts]
+
+
 @dataclass(slots=True)
 class RedactionAccumulator:
     """Mutable redaction-count accumulator for one export."""
@@ -64,6 +91,7 @@ class RedactionAccumulator:
     total: int = 0
     by_label: dict[str, int] = field(default_factory=dict)
     elapsed: timedelta | None = None
+    characters: int = 0
 
     def add(self, spans: Iterable[RedactionSpan]) -> None:
         for span in spans:
@@ -76,4 +104,5 @@ class RedactionAccumulator:
             by_label=dict(sorted(self.by_label.items())),
             model=self.model,
             elapsed=self.elapsed,
+            characters=self.characters,
         )
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 import subprocess
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Literal
 from urllib.parse import urlparse, urlunparse
 
+GitDirtyCheck = Literal["full", "tracked", "index"]
+
+_GIT_TIMEOUT_SECONDS = 2.0
+
 
 @dataclass(frozen=True, slots=True)
 class GitMetadata:
@@ -42,6 +49,250 @@ def capture_git_metadata(cwd: Path) -> GitMetadata | None:
     )
 
 
+@dataclass(frozen=True, slots=True)
+class _RepositoryFacts:
+    """Facts that do not change for the lifetime of a checkout."""
+
+    repository_root: str
+    git_dir: Path
+    common_dir: Path
+    remote_url: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class _RepositoryState:
+    """HEAD/branch/dirty facts, valid while the repository fingerprint is unchanged."""
+
+    fingerprint: tuple[int, ...]
+    dirty_check: GitDirtyCheck
+    captured_monotonic: float
+    commit: str
+    branch: str | None
+    dirty: bool
+
+
+class GitProvenanceService:
+    """Async, cached git provenance capture for session saves.
+
+    Git commands run as asyncio subprocesses in parallel, so turn-boundary saves
+    do not block the event loop. Repository root and remote are cached per
+    working directory; HEAD, branch and dirty state are re-queried only when
+    ``.git/HEAD``, refs or the index change, or the cached state is older than
+    ``max_age_seconds`` (work-tree edits do not touch ``.git``). Callers with
+    their own setting pass ``max_age_seconds`` per capture rather than changing
+    the shared default.
+    """
+
+    def __init__(
+        self,
+        *,
+        dirty_check: GitDirtyCheck = "full",
+        max_age_seconds: float = 30.0,
+        timeout: float = _GIT_TIMEOUT_SECONDS,
+    ) -> None:
+        self.dirty_check: GitDirtyCheck = dirty_check
+        self.max_age_seconds = max_age_seconds
+        self._timeout = timeout
+        self._facts: dict[Path, _RepositoryFacts] = {}
+        self._states: dict[Path, _RepositoryState] = {}
+        self._locks: dict[Path, asyncio.Lock] = {}
+
+    def clear(self) -> None:
+        self._facts.clear()
+        self._states.clear()
+
+    async def capture(
+        self,
+        cwd: Path,
+        *,
+        dirty_check: GitDirtyCheck | None = None,
+        max_age_seconds: float | None = None,
+    ) -> GitMetadata | None:
+        """Return git metadata for ``cwd`` when it is inside a git repository."""
+        resolved_cwd = cwd.expanduser().resolve()
+        mode = dirty_check or self.dirty_check
+        max_age = self.max_age_seconds if max_age_seconds is None else max_age_seconds
+        lock = self._locks.setdefault(resolved_cwd, asyncio.Lock())
+        async with lock:
+            facts = self._facts.get(resolved_cwd)
+            state = self._states.get(resolved_cwd)
+            if facts is None:
+                facts, state = await self._capture_all(resolved_cwd, mode)
+                if facts is None or state is None:
+                    return None
+            else:
+                fingerprint = _repository_fingerprint(facts)
+                if state is None or not self._state_is_fresh(state, fingerprint, mode, max_age):
+                    state = await self._capture_state(resolved_cwd, fingerprint, mode)
+                    if state is None:
+                        self._facts.pop(resolved_cwd, None)
+                        self._states.pop(resolved_cwd, None)
+                        return None
+            self._facts[resolved_cwd] = facts
+            self._states[resolved_cwd] = state
+
+        return GitMetadata(
+            cwd=str(resolved_cwd),
+            repository_root=facts.repository_root,
+            commit=state.commit,
+            captured_at=datetime.now(timezone.utc),
+            remote_url=facts.remote_url,
+            github_repository=_github_repository(facts.remote_url),
+            branch=state.branch,
+            dirty=state.dirty,
+        )
+
+    def _state_is_fresh(
+        self,
+        state: _RepositoryState,
+        fingerprint: tuple[int, ...],
+        dirty_check: GitDirtyCheck,
+        max_age_seconds: float,
+    ) -> bool:
+        if state.fingerprint != fingerprint or state.dirty_check != dirty_check:
+            return False
+        return time.monotonic() - state.captured_monotonic < max_age_seconds
+
+    async def _capture_all(
+        self,
+        cwd: Path,
+        dirty_check: GitDirtyCheck,
+    ) -> tuple[_RepositoryFacts | None, _RepositoryState | None]:
+        locations, remote, commit, branch, dirty = await asyncio.gather(
+            self._git(
+                cwd, "rev-parse", "--show-toplevel", "--absolute-git-dir", "--git-common-dir"
+            ),
+            self._git(cwd, "remote", "get-url", "origin"),
+            self._git(cwd, "rev-parse", "HEAD"),
+            self._git(cwd, "branch", "--show-current"),
+            self._dirty(cwd, dirty_check),
+        )
+        if locations is None or commit is None:
+            return None, None
+        parts = locations
+        if len(parts) < 3:
+            return None, None
+        git_dir = Path(parts[1])
+        common_dir = Path(parts[2])
+        if not common_dir.is_absolute():
+            common_dir = cwd / common_dir
+        facts = _RepositoryFacts(
+            repository_root=str(Path(parts[0]).expanduser().resolve()),
+            git_dir=git_dir,
+            common_dir=common_dir.resolve(),
+            remote_url=_sanitize_remote_url(remote[0] if remote else None),
+        )
+        state = _RepositoryState(
+            fingerprint=_repository_fingerprint(facts),
+            dirty_check=dirty_check,
+            captured_monotonic=time.monotonic(),
+            commit=commit[0],
+            branch=(branch[0] if branch else None) or None,
+            dirty=dirty,
+        )
+        return facts, state
+
+    async def _capture_state(
+        self,
+        cwd: Path,
+        fingerprint: tuple[int, ...],
+        dirty_check: GitDirtyCheck,
+    ) -> _RepositoryState | None:
+        commit, branch, dirty = await asyncio.gather(
+            self._git(cwd, "rev-parse", "HEAD"),
+            self._git(cwd, "branch", "--show-current"),
+            self._dirty(cwd, dirty_check),
+        )
+        if commit is None:
+            return None
+        return _RepositoryState(
+            fingerprint=fingerprint,
+            dirty_check=dirty_check,
+            captured_monotonic=time.monotonic(),
+            commit=commit[0],
+            branch=(branch[0] if branch else None) or None,
+            dirty=dirty,
+        )
+
+    async def _dirty(self, cwd: Path, dirty_check: GitDirtyCheck) -> bool:
+        if dirty_check == "index":
+            # Exit status 1 means the work tree differs from the index/HEAD.
+            return await self._git_returncode(cwd, "diff-index", "--quiet", "HEAD", "--") == 1
+        args = ["status", "--porcelain"]
+        if dirty_check == "tracked":
+            args.append("--untracked-files=no")
+        output = await self._git(cwd, *args)
+        return bool(output)
+
+    async def _git(self, cwd: Path, *args: str) -> list[str] | None:
+        result = await self._run(cwd, *args)
+        if result is None or result[0] != 0:
+            return None
+        output = result[1].strip()
+        return output.splitlines() if output else None
+
+    async def _git_returncode(self, cwd: Path, *args: str) -> int | None:
+        result = await self._run(cwd, *args)
+        return result[0] if result is not None else None
+
+    async def _run(self, cwd: Path, *args: str) -> tuple[int, str] | None:
+        try:
+            process = await asyncio.create_subprocess_exec(
+                "git",
+                "-C",
+                str(cwd),
+                *args,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+        except OSError:
+            return None
+        try:
+            stdout, _ = await asyncio.wait_for(process.communicate(), timeout=self._timeout)
+        except TimeoutError:
+            process.kill()
+            await process.wait()
+            return None
+        returncode = process.returncode if process.returncode is not None else -1
+        return returncode, stdout.decode("utf-8", errors="replace")
+
+
+_default_service: GitProvenanceService | None = None
+
+
+def git_provenance_service() -> GitProvenanceService:
+    """Return the process-wide provenance service shared by session saves."""
+    global _default_service
+    if _default_service is None:
+        _default_service = GitProvenanceService()
+    return _default_service
+
+
+def _repository_fingerprint(facts: _RepositoryFacts) -> tuple[int, ...]:
+    head = facts.git_dir / "HEAD"
+    paths = [
+        head,
+        facts.git_dir / "index",
+        facts.common_dir / "packed-refs",
+        facts.common_dir / "refs" / "heads",
+    ]
+    try:
+        head_text = head.read_text(encoding="utf-8").strip()
+    except OSError:
+        head_text = ""
+    if head_text.startswith("ref:"):
+        paths.append(facts.common_dir / head_text.removeprefix("ref:").strip())
+    return tuple(_mtime_ns(path) for path in paths)
+
+
+def _mtime_ns(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return -1
+
+
 def _git_output(cwd: Path, *args: str) -> str | None:
     try:
         result = subprocess.run(
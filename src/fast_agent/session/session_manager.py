@@ -35,6 +35,7 @@ from fast_agent.session.snapshot import (
     capture_session_snapshot,
     clone_session_snapshot_for_fork,
     load_session_snapshot,
+    prefetch_session_git_metadata,
     session_info_from_snapshot,
     snapshot_from_session_info,
 )
@@ -379,13 +380,21 @@ class Session:
             if preview:
                 self.info.metadata["first_user_preview"] = preview
 
+        save_identity = identity or self._default_save_identity()
+        git_metadata = (
+            None
+            if checkpoint
+            else await prefetch_session_git_metadata(session=self, identity=save_identity)
+        )
         snapshot = capture_session_snapshot(
             session=self,
             active_agent=agent,
             agent_registry=agent_registry,
-            identity=identity or self._default_save_identity(),
+            identity=save_identity,
             resolved_prompts=resolved_prompts,
             refresh_git=not checkpoint,
+            git_metadata=git_metadata,
+            git_prefetched=not checkpoint,
         )
         self._save_snapshot(snapshot)
         return result
@@ -18,6 +18,7 @@ from fast_agent.llm.usage_tracking import UsageAccumulator
 if TYPE_CHECKING:
     from fast_agent.interfaces import AgentProtocol
     from fast_agent.llm.request_params import RequestParams
+    from fast_agent.session.git_metadata import GitMetadata
     from fast_agent.session.identity import SessionSaveIdentity
     from fast_agent.session.session_manager import Session, SessionInfo
 
@@ -414,12 +415,17 @@ def capture_session_snapshot(
     identity: "SessionSaveIdentity",
     resolved_prompts: Mapping[str, str] | None = None,
     refresh_git: bool = True,
+    git_metadata: "GitMetadata | None" = None,
+    git_prefetched: bool = False,
 ) -> SessionSnapshot:
     """Capture the authoritative persisted snapshot for the current runtime state.
 
     Set ``refresh_git=False`` on frequent mid-turn checkpoints to reuse the
     previously captured git state instead of shelling out to git on every save;
-    turn boundaries refresh it.
+    turn boundaries refresh it. Async callers pass ``git_metadata`` from
+    ``prefetch_session_git_metadata`` with ``git_prefetched=True`` so git runs
+    off the event loop; git is then never run synchronously, even when the
+    prefetch found no repository.
     """
     snapshot = snapshot_from_session_info(session.info)
     existing_snapshot = _load_existing_session_snapshot(session)
@@ -437,6 +443,8 @@ def capture_session_snapshot(
         existing_snapshot=existing_snapshot,
         identity=identity,
         refresh=refresh_git,
+        prefetched=git_metadata,
+        git_prefetched=git_prefetched,
     )
     snapshot.continuation.lineage = _capture_lineage_snapshot(
         compatibility_snapshot=snapshot,
@@ -788,6 +796,8 @@ def _capture_git_state_snapshot(
     existing_snapshot: SessionSnapshot | None,
     identity: "SessionSaveIdentity",
     refresh: bool = True,
+    prefetched: "GitMetadata | None" = None,
+    git_prefetched: bool = False,
 ) -> SessionGitStateSnapshot | None:
     existing_git = existing_snapshot.continuation.git if existing_snapshot is not None else None
     if not refresh and (snapshot.continuation.git or existing_git):
@@ -803,9 +813,13 @@ def _capture_git_state_snapshot(
     if cwd is None:
         return snapshot.continuation.git or existing_git
 
-    from fast_agent.session.git_metadata import capture_git_metadata
+    captured = prefetched
+    if captured is not None and Path(captured.cwd).expanduser().resolve() != cwd:
+        captured = None
+    if captured is None and not git_prefetched:
+        from fast_agent.session.git_metadata import capture_git_metadata
 
-    captured = capture_git_metadata(cwd)
+        captured = capture_git_metadata(cwd)
     if captured is None:
         return snapshot.continuation.git or existing_git
 
@@ -829,6 +843,38 @@ def _capture_git_state_snapshot(
     )
 
 
+async def prefetch_session_git_metadata(
+    *,
+    session: "Session",
+    identity: "SessionSaveIdentity",
+) -> "GitMetadata | None":
+    """Capture git provenance for a session save without blocking the event loop."""
+    if not _git_aware_enabled():
+        return None
+    snapshot = snapshot_from_session_info(session.info)
+    existing_snapshot = None
+    if identity.session_cwd is None and snapshot.continuation.cwd is None:
+        existing_snapshot = _load_existing_session_snapshot(session)
+    snapshot.continuation.cwd = _capture_continuation_cwd(
+        compatibility_snapshot=snapshot,
+        existing_snapshot=existing_snapshot,
+        identity=identity,
+    )
+    cwd = _git_capture_cwd(snapshot=snapshot, identity=identity)
+    if cwd is None:
+        return None
+
+    from fast_agent.config import get_settings
+    from fast_agent.session.git_metadata import git_provenance_service
+
+    settings = get_settings()
+    return await git_provenance_service().capture(
+        cwd,
+        dirty_check=settings.git_dirty_check,
+        max_age_seconds=settings.git_state_max_age_seconds,
+    )
+
+
 def _git_aware_enabled() -> bool:
     try:
         from fast_agent.config import get_settings
@@ -847,7 +893,7 @@ def _git_capture_cwd(
         return Path(snapshot.continuation.cwd).expanduser().resolve()
     if identity.session_cwd is not None:
         return identity.session_cwd.expanduser().resolve()
-    return identity.manager.workspace_dir
+    return identity.manager.workspace_dir.expanduser().resolve()
 
 
 def _capture_lineage_snapshot(
@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import json
 import tempfile
+import time
 import uuid
 from dataclasses import dataclass
+from datetime import timedelta
 from functools import cache
 from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
@@ -33,7 +35,7 @@ from fast_agent.history.process_poll_fold_audit import (
 from fast_agent.llm.usage_tracking import UsageReport, UsageSummary
 from fast_agent.mcp.prompt_message_extended import PromptMessageExtended
 from fast_agent.mcp.prompt_serialization import load_messages
-from fast_agent.privacy.sanitizer import RedactionAccumulator
+from fast_agent.privacy.sanitizer import RedactionAccumulator, SanitizedText, sanitize_texts
 from fast_agent.session.atif_models import (
     AtifAgent,
     AtifContent,
@@ -50,9 +52,10 @@ from fast_agent.session.atif_models import (
 )
 from fast_agent.session.snapshot import load_session_snapshot
 from fast_agent.session.trace_export_models import ExportResult
+from fast_agent.session.trace_export_stream import ATTACHMENTS_DIRNAME, AttachmentStore
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Mapping
+    from collections.abc import Callable, Iterable, Iterator, Mapping
     from datetime import datetime
     from typing import Literal, TypeGuard
 
@@ -60,6 +63,8 @@ if TYPE_CHECKING:
     from fast_agent.session.trace_export_models import ResolvedSessionExport
     from fast_agent.session.trajectory import TrajectoryRecord
 
+    _SanitizeText = Callable[[str], SanitizedText]
+
 
 @dataclass(frozen=True, slots=True)
 class AtifRunSource:
@@ -1181,8 +1186,14 @@ def _attach_subagent_ref(
 
 
 class AtifTraceWriter:
-    def __init__(self, sanitizer: TraceSanitizer | None = None) -> None:
+    def __init__(
+        self,
+        sanitizer: TraceSanitizer | None = None,
+        *,
+        hash_attachments: bool = False,
+    ) -> None:
         self._sanitizer = sanitizer
+        self._hash_attachments = hash_attachments
 
     def write(self, resolved: ResolvedSessionExport, output_path: Path) -> ExportResult:
         snapshot_agent = resolved.snapshot.continuation.agents[resolved.agent_name]
@@ -1203,6 +1214,13 @@ class AtifTraceWriter:
             )
         )
         redaction = _sanitize_trajectory(trajectory, self._sanitizer)
+        attachments = None
+        if self._hash_attachments:
+            attachments = AttachmentStore(
+                output_path.parent / ATTACHMENTS_DIRNAME,
+                relative_to=output_path.parent,
+            )
+            _externalize_images(trajectory, attachments)
         write_atif_trajectory(trajectory, output_path)
         return ExportResult(
             session_id=resolved.session_id,
@@ -1211,43 +1229,67 @@ class AtifTraceWriter:
             output_path=output_path,
             record_count=len(trajectory.steps),
             redaction=redaction,
+            output_paths=(output_path,),
+            attachments_dir=attachments.directory if attachments is not None else None,
+        )
+
+
+def _externalize_images(trajectory: AtifTrajectory, attachments: AttachmentStore) -> None:
+    """Point inline data-URL image sources at hashed attachment files."""
+    contents: list[AtifContent] = []
+    for step in trajectory.steps:
+        contents.append(step.message)
+        contents.extend(
+            result.content
+            for result in (step.observation.results if step.observation else [])
+            if result.content is not None
         )
+    for content in contents:
+        if isinstance(content, str):
+            continue
+        for part in content:
+            if part.source is not None:
+                part.source.path = (
+                    attachments.data_url_reference(part.source.path) or part.source.path
+                )
+    for child in trajectory.subagent_trajectories or []:
+        _externalize_images(child, attachments)
 
 
 def _sanitize_text(
     value: str,
-    sanitizer: TraceSanitizer,
+    sanitize: _SanitizeText,
     redactions: RedactionAccumulator,
 ) -> str:
-    sanitized = sanitizer.sanitize_text(value)
+    sanitized = sanitize(value)
     redactions.add(sanitized.spans)
     return sanitized.text
 
 
 def _sanitize_value(
     value: object,
-    sanitizer: TraceSanitizer,
+    sanitize: _SanitizeText,
     redactions: RedactionAccumulator,
 ) -> object:
     if isinstance(value, str):
-        return _sanitize_text(value, sanitizer, redactions)
+        return _sanitize_text(value, sanitize, redactions)
     if isinstance(value, list):
-        return [_sanitize_value(item, sanitizer, redactions) for item in value]
+        return [_sanitize_value(item, sanitize, redactions) for item in value]
     if isinstance(value, dict):
-        return {key: _sanitize_value(item, sanitizer, redactions) for key, item in value.items()}
+        return {key: _sanitize_value(item, sanitize, redactions) for key, item in value.items()}
     return value
 
 
 def _sanitize_content(
     content: AtifContent,
-    sanitizer: TraceSanitizer,
+    sanitize: _SanitizeText,
     redactions: RedactionAccumulator,
 ) -> AtifContent:
     if isinstance(content, str):
-        return _sanitize_text(content, sanitizer, redactions)
+        return _sanitize_text(content, sanitize, redactions)
     for part in content:
         if part.type == "text" and part.text is not None:
-            part.text = _sanitize_text(part.text, sanitizer, redactions)
+            part.text = _sanitize_text(part.text, sanitize, redactions)
     return content
 
 
@@ -1257,26 +1299,53 @@ def _sanitize_trajectory(
 ) -> RedactionSummary | None:
     if sanitizer is None:
         return None
-    redactions = RedactionAccumulator(model=sanitizer.model_info)
+    started = time.perf_counter()
+
+    # First pass collects every unique text so batching sanitizers can pack
+    # them into as few inference calls as possible; the second pass rewrites
+    # the trajectory from the precomputed results.
+    planned: dict[str, None] = {}
+
+    def plan(value: str) -> SanitizedText:
+        planned.setdefault(value)
+        return SanitizedText(text=value)
+
+    _apply_sanitizer(trajectory, plan, RedactionAccumulator())
+    texts = list(planned)
+    sanitized = dict(zip(texts, sanitize_texts(sanitizer, texts), strict=True))
+
+    def lookup(value: str) -> SanitizedText:
+        cached = sanitized.get(value)
+        return cached if cached is not None else sanitizer.sanitize_text(value)
+
+    redactions = RedactionAccumulator(
+        model=sanitizer.model_info,
+        characters=sum(len(text) for text in texts),
+    )
+    _apply_sanitizer(trajectory, lookup, redactions)
+    redactions.elapsed = timedelta(seconds=time.perf_counter() - started)
+    return redactions.summary()
+
+
+def _apply_sanitizer(
+    trajectory: AtifTrajectory,
+    sanitize: _SanitizeText,
+    redactions: RedactionAccumulator,
+) -> None:
     for step in trajectory.steps:
-        step.message = _sanitize_content(step.message, sanitizer, redactions)
+        step.message = _sanitize_content(step.message, sanitize, redactions)
         if step.reasoning_content is not None:
-            step.reasoning_content = _sanitize_text(step.reasoning_content, sanitizer, redactions)
+            step.reasoning_content = _sanitize_text(step.reasoning_content, sanitize, redactions)
         for call in step.tool_calls or []:
             call.arguments = {
-                key: _sanitize_value(value, sanitizer, redactions)
+                key: _sanitize_value(value, sanitize, redactions)
                 for key, value in call.arguments.items()
             }
         for result in step.observation.results if step.observation else []:
             if result.content is not None:
-                result.content = _sanitize_content(result.content, sanitizer, redactions)
+                result.content = _sanitize_content(result.content, sanitize, redactions)
     for child in trajectory.subagent_trajectories or []:
-        child_summary = _sanitize_trajectory(child, sanitizer)
-        if child_summary is not None:
-            for label, count in child_summary.by_label.items():
-                redactions.total += count
-                redactions.by_label[label] = redactions.by_label.get(label, 0) + count
-    return redactions.summary()
+        _apply_sanitizer(child, sanitize, redactions)
 
 
 def write_atif_trajectory(trajectory: AtifTrajectory, output_path: Path) -> None:
@@ -1287,7 +1356,58 @@ def write_atif_trajectory(trajectory: AtifTrajectory, output_path: Path) -> None
         mode="w", encoding="utf-8", dir=output_path.parent, delete=False
     ) as handle:
         temporary_path = Path(handle.name)
-        json.dump(trajectory.to_json_dict(), handle, ensure_ascii=False, indent=2)
+        handle.writelines(atif_json_chunks(trajectory))
         handle.write("\n")
         handle.flush()
     temporary_path.replace(output_path)
+
+
+_STREAMED_TRAJECTORY_FIELDS = frozenset({"steps", "subagent_trajectories"})
+
+
+def atif_json_chunks(trajectory: AtifTrajectory, *, level: int = 0) -> Iterator[str]:
+    """Serialize a trajectory step by step.
+
+    The output matches ``json.dumps(trajectory.to_json_dict(), indent=2)``, but
+    only one step is converted to plain JSON data at a time.
+    """
+
+    head = trajectory.model_dump(
+        mode="json", exclude_none=True, exclude=set(_STREAMED_TRAJECTORY_FIELDS)
+    )
+    pad = "  " * (level + 1)
+    separator = "{"
+    for name in type(trajectory).model_fields:
+        if name in _STREAMED_TRAJECTORY_FIELDS:
+            items = getattr(trajectory, name)
+            if items is None:
+                continue
+            yield f"{separator}\n{pad}{json.dumps(name)}: "
+            yield from _json_list_chunks(items, level=level + 1)
+        elif name in head:
+            yield f"{separator}\n{pad}{json.dumps(name)}: {_indented_json(head[name], pad)}"
+        else:
+            continue
+        separator = ","
+    yield "{}" if separator == "{" else f"\n{'  ' * level}}}"
+
+
+def _json_list_chunks(items: list[AtifStep] | list[AtifTrajectory], *, level: int) -> Iterator[str]:
+    if not items:
+        yield "[]"
+        return
+    pad = "  " * (level + 1)
+    separator = "["
+    for item in items:
+        yield f"{separator}\n{pad}"
+        if isinstance(item, AtifTrajectory):
+            yield from atif_json_chunks(item, level=level + 1)
+        else:
+            yield _indented_json(item.model_dump(mode="json", exclude_none=True), pad)
+        separator = ","
+    yield f"\n{'  ' * level}]"
+
+
+def _indented_json(value: object, pad: str) -> str:
+    # Newlines only occur between tokens; string contents are escaped.
+    return json.dumps(value, ensure_ascii=False, indent=2).replace("\n", "\n" + pad)
@@ -40,17 +40,28 @@ from fast_agent.mcp.helpers.content_helpers import (
     is_text_content,
 )
 from fast_agent.mcp.mime_utils import is_image_mime_type, is_text_mime_type
-from fast_agent.privacy.sanitizer import RedactionAccumulator, RedactionSummary, TraceSanitizer
+from fast_agent.privacy.sanitizer import (
+    RedactionAccumulator,
+    RedactionSummary,
+    TraceSanitizer,
+    sanitize_texts,
+)
 from fast_agent.session.trace_export_models import ExportResult, ResolvedSessionExport
+from fast_agent.session.trace_export_stream import (
+    ATTACHMENTS_DIRNAME,
+    AttachmentStore,
+    JsonlRecordSink,
+)
 from fast_agent.utils.count_display import format_count
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable
+    from collections.abc import Callable, Iterable, Iterator
     from pathlib import Path
 
     from fast_agent.mcp.prompt_message_extended import PromptMessageExtended
     from fast_agent.privacy.sanitizer import SanitizedText
     from fast_agent.session.snapshot import SessionAgentSnapshot
+    from fast_agent.session.trace_export_models import TraceCompression
 
 
 @dataclass(frozen=True, slots=True)
@@ -109,6 +120,10 @@ def _json_arguments(arguments: object) -> str:
 
 
 class _TraceSanitization:
+    # Unique texts per batched sanitizer call; small enough that overall
+    # progress still advances regularly on large traces.
+    _BATCH_TEXTS = 64
+
     def __init__(
         self,
         sanitizer: TraceSanitizer,
@@ -120,6 +135,7 @@ class _TraceSanitization:
         self._sanitizer = sanitizer
         self._redactions = RedactionAccumulator(model=sanitizer.model_info)
         self._cache: dict[str, SanitizedText] = {}
+        self._counted: set[str] = set()
         self._started = time.perf_counter()
         self._total_texts = total_texts
         self._total_characters = total_characters
@@ -134,21 +150,45 @@ class _TraceSanitization:
                 f"{format_count(total_characters, 'character')} total..."
             )
 
+    def prefetch(self, texts: list[str]) -> None:
+        """Sanitize planned texts up front so batching sanitizers see many at once."""
+
+        pending = [text for text in texts if text not in self._cache]
+        for start in range(0, len(pending), self._BATCH_TEXTS):
+            chunk = pending[start : start + self._BATCH_TEXTS]
+            for text, sanitized in zip(chunk, sanitize_texts(self._sanitizer, chunk), strict=True):
+                self._store(text, sanitized)
+            self._emit_overall_progress()
+
+    def count_planned(self, plan: _TraceSanitizationPlan) -> None:
+        """Count redactions for every planned text occurrence without rewriting."""
+
+        for value, count in plan.occurrences.items():
+            spans = self._cache[value].spans
+            for _ in range(count):
+                self._redactions.add(spans)
+        self._counted = set(plan.occurrences)
+
     def text(self, value: str) -> str:
         sanitized = self._cache.get(value)
         if sanitized is None:
             sanitized = self._sanitizer.sanitize_text(value)
-            self._cache[value] = sanitized
-            self._processed_texts += 1
-            self._processed_characters += len(value)
+            self._store(value, sanitized)
             self._emit_overall_progress()
-        self._redactions.add(sanitized.spans)
+        if value not in self._counted:
+            self._redactions.add(sanitized.spans)
         return sanitized.text
 
     def summary(self) -> RedactionSummary:
         self._redactions.elapsed = timedelta(seconds=time.perf_counter() - self._started)
+        self._redactions.characters = self._processed_characters
         return self._redactions.summary()
 
+    def _store(self, value: str, sanitized: SanitizedText) -> None:
+        self._cache[value] = sanitized
+        self._processed_texts += 1
+        self._processed_characters += len(value)
+
     def _emit_overall_progress(self) -> None:
         if self._progress_callback is None or self._total_texts <= 0:
             return
@@ -174,15 +214,20 @@ class _TraceSanitization:
 
 class _TraceSanitizationPlan:
     def __init__(self) -> None:
-        self._seen: set[str] = set()
+        self.occurrences: dict[str, int] = {}
         self.unique_text_count = 0
         self.total_characters = 0
 
+    @property
+    def texts(self) -> list[str]:
+        return list(self.occurrences)
+
     def text(self, value: str) -> str:
-        if value not in self._seen:
-            self._seen.add(value)
+        count = self.occurrences.get(value)
+        if count is None:
             self.unique_text_count += 1
             self.total_characters += len(value)
+        self.occurrences[value] = (count or 0) + 1
         return value
 
 
@@ -1342,6 +1387,9 @@ def _privacy_filter_metadata(summary: RedactionSummary) -> dict[str, object]:
     }
     if summary.elapsed is not None:
         redactions["elapsed_seconds"] = round(summary.elapsed.total_seconds(), 3)
+    if summary.characters_per_second is not None:
+        redactions["characters"] = summary.characters
+        redactions["characters_per_second"] = round(summary.characters_per_second, 1)
     metadata: dict[str, object] = {
         "applied": True,
         "mode": "content-only",
@@ -1363,17 +1411,48 @@ def _privacy_filter_metadata(summary: RedactionSummary) -> dict[str, object]:
 
 
 def _add_privacy_filter_metadata(
-    records: list[dict[str, object]],
+    record: dict[str, object],
     summary: RedactionSummary,
 ) -> None:
-    if not records:
-        return
-    payload = records[0].get("payload")
+    payload = record.get("payload")
     if isinstance(payload, dict):
         payload_map = cast("dict[str, object]", payload)
         payload_map["privacy_filter"] = _privacy_filter_metadata(summary)
 
 
+def _externalize_attachments(value: object, attachments: AttachmentStore) -> None:
+    """Replace inline base64 images and files with hashed attachment references."""
+    if isinstance(value, list):
+        for item in cast("list[object]", value):
+            _externalize_attachments(item, attachments)
+        return
+    if not isinstance(value, dict):
+        return
+    mapping = cast("dict[str, object]", value)
+    image_url = mapping.get("image_url")
+    if isinstance(image_url, str):
+        mapping["image_url"] = attachments.data_url_reference(image_url) or image_url
+    images = mapping.get("images")
+    if isinstance(images, list):
+        mapping["images"] = [
+            attachments.data_url_reference(image) or image if isinstance(image, str) else image
+            for image in cast("list[object]", images)
+        ]
+    file_data = mapping.get("file_data")
+    if isinstance(file_data, str):
+        filename = mapping.get("filename")
+        reference = attachments.store_base64(
+            file_data,
+            filename=filename if isinstance(filename, str) else None,
+        )
+        if reference is not None:
+            del mapping["file_data"]
+            mapping["file_url"] = reference
+    for item in mapping.values():
+        if isinstance(item, dict | list):
+            _externalize_attachments(item, attachments)
+
+
 def _turn_timestamps(resolved: ResolvedSessionExport) -> list[datetime | None]:
     turn_timestamps: list[datetime | None] = []
     for message, message_timestamp in zip(
@@ -1395,37 +1474,63 @@ class CodexTraceWriter:
         sanitizer: TraceSanitizer | None = None,
         *,
         progress_callback: Callable[[str], None] | None = None,
+        compression: TraceCompression | None = None,
+        shard_records: int | None = None,
+        hash_attachments: bool = False,
+        attachments_dir: Path | None = None,
     ) -> None:
         self._sanitizer = sanitizer
         self._progress_callback = progress_callback
+        self._compression = compression
+        self._shard_records = shard_records
+        self._hash_attachments = hash_attachments
+        self._attachments_dir = attachments_dir
 
     def write(self, resolved: ResolvedSessionExport, output_path: Path) -> ExportResult:
         sanitization = None
+        redaction = None
         if self._sanitizer is not None:
             plan = _TraceSanitizationPlan()
-            self._records(resolved, sanitization=plan)
+            for _ in self._records(resolved, sanitization=plan):
+                pass
             sanitization = _TraceSanitization(
                 self._sanitizer,
                 total_texts=plan.unique_text_count,
                 total_characters=plan.total_characters,
                 progress_callback=self._progress_callback,
             )
-        records = list(self._records(resolved, sanitization=sanitization))
-        redaction = sanitization.summary() if sanitization is not None else None
-        if redaction is not None:
-            _add_privacy_filter_metadata(records, redaction)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with output_path.open("w", encoding="utf-8") as handle:
-            for record in records:
-                handle.write(json.dumps(record, ensure_ascii=False))
-                handle.write("\n")
+            sanitization.prefetch(plan.texts)
+            # Count redactions from the plan so the summary can go into the
+            # first record before the rest of the trace is streamed.
+            sanitization.count_planned(plan)
+            redaction = sanitization.summary()
+
+        attachments = None
+        if self._hash_attachments:
+            attachments = AttachmentStore(
+                self._attachments_dir or output_path.parent / ATTACHMENTS_DIRNAME,
+                relative_to=output_path.parent,
+            )
+        with JsonlRecordSink(
+            output_path,
+            compression=self._compression,
+            shard_records=self._shard_records,
+        ) as sink:
+            for record in self._records(resolved, sanitization=sanitization):
+                if redaction is not None and sink.record_count == 0:
+                    _add_privacy_filter_metadata(record, redaction)
+                if attachments is not None:
+                    _externalize_attachments(record, attachments)
+                sink.write(record)
         return ExportResult(
             session_id=resolved.session_id,
             agent_name=resolved.agent_name,
             format="codex",
-            output_path=output_path,
-            record_count=len(records),
+            output_path=sink.paths[0],
+            record_count=sink.record_count,
             redaction=redaction,
+            output_paths=tuple(sink.paths),
+            attachments_dir=attachments.directory if attachments is not None else None,
         )
 
     def _records(
@@ -1433,62 +1538,46 @@ class CodexTraceWriter:
         resolved: ResolvedSessionExport,
         *,
         sanitization: _TextSanitization | None = None,
-    ) -> list[dict[str, object]]:
+    ) -> Iterator[dict[str, object]]:
         meta = _trace_meta(resolved)
         turn_timestamps = _turn_timestamps(resolved)
-        records = _initial_session_records(resolved, meta, sanitization)
+        yield from _initial_session_records(resolved, meta, sanitization)
 
         turn_counter = 0
         current_turn: _TurnState | None = None
-
-        def start_turn(user_message: PromptMessageExtended | None) -> None:
-            nonlocal turn_counter, current_turn
-            turn_timestamp = (
-                turn_timestamps[turn_counter] if turn_counter < len(turn_timestamps) else None
-            )
-            turn_counter += 1
-            current_turn = _TurnState(
-                turn_id=f"turn-{turn_counter}",
-                started_at=turn_timestamp,
-            )
-            records.extend(
-                _start_turn_records(
-                    resolved,
-                    meta,
-                    current_turn,
-                    user_message,
-                    sanitization,
-                )
-            )
-
-        def finish_turn() -> None:
-            nonlocal current_turn
-            if current_turn is None:
-                return
-            records.append(_finish_turn_record(current_turn, sanitization))
-            current_turn = None
-
         usage_accumulator = UsageAccumulator()
         for message, message_timestamp in zip(
             resolved.history, resolved.message_timestamps, strict=True
         ):
-            if _is_turn_start(message):
-                finish_turn()
-                start_turn(message)
-            elif current_turn is None:
-                start_turn(None)
-
-            if current_turn is not None:
-                _observe_turn_message(current_turn, message, message_timestamp)
-            records.extend(
-                _message_records(
-                    message,
-                    message_timestamp,
+            starts_turn = _is_turn_start(message)
+            if starts_turn and current_turn is not None:
+                yield _finish_turn_record(current_turn, sanitization)
+                current_turn = None
+            if current_turn is None:
+                turn_timestamp = (
+                    turn_timestamps[turn_counter] if turn_counter < len(turn_timestamps) else None
+                )
+                turn_counter += 1
+                current_turn = _TurnState(
+                    turn_id=f"turn-{turn_counter}",
+                    started_at=turn_timestamp,
+                )
+                yield from _start_turn_records(
+                    resolved,
                     meta,
+                    current_turn,
+                    message if starts_turn else None,
                     sanitization,
-                    usage_accumulator,
                 )
+
+            _observe_turn_message(current_turn, message, message_timestamp)
+            yield from _message_records(
+                message,
+                message_timestamp,
+                meta,
+                sanitization,
+                usage_accumulator,
             )
 
-        finish_turn()
-        return records
+        if current_turn is not None:
+            yield _finish_turn_record(current_turn, sanitization)
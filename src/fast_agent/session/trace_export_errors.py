@@ -45,3 +45,7 @@ class SessionExportWriteError(TraceExportError):
 
 class SessionExportPrivacyFilterError(TraceExportError):
     """Raised when a privacy-filtered export cannot be completed."""
+
+
+class SessionExportOptionsError(TraceExportError):
+    """Raised when export output options are invalid or cannot be combined."""
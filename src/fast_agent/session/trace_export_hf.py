@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import shutil
 from importlib import import_module
 from typing import TYPE_CHECKING, Protocol
 from urllib.parse import quote, urlparse
@@ -13,6 +14,9 @@ if TYPE_CHECKING:
     from pathlib import Path
     from typing import BinaryIO
 
+# Traces are copied to the Hub in chunks rather than read into memory whole.
+_UPLOAD_CHUNK_BYTES = 8 * 1024 * 1024
+
 
 def _build_dataset_file_url(repo_id: str, path_in_repo: str) -> str:
     return f"https://huggingface.co/datasets/{repo_id}/blob/main/{quote(path_in_repo, safe='/')}"
@@ -110,7 +114,7 @@ class HuggingFaceDatasetTraceUploader:
                     exist_ok=True,
                 )
             with trace_path.open("rb") as source, self._filesystem.open(resolved_url, "wb") as dest:
-                dest.write(source.read())
+                shutil.copyfileobj(source, dest, _UPLOAD_CHUNK_BYTES)
         except Exception as exc:
             raise SessionExportUploadError(
                 f"Failed to upload trace to Hugging Face URL '{resolved_url}': {exc}"
@@ -14,6 +14,7 @@ if TYPE_CHECKING:
     from fast_agent.session.snapshot import SessionSnapshot
 
 ExportFormat = Literal["codex", "atif"]
+TraceCompression = Literal["zstd"]
 
 
 @dataclass(frozen=True, slots=True)
@@ -32,6 +33,12 @@ class ExportRequest:
     privacy_filter_path: Path | None = None
     download_privacy_filter: bool = False
     privacy_filter_variant: str | None = None
+    compression: TraceCompression | None = None
+    """Compress Codex JSONL output; ``"zstd"`` appends ``.zst`` to each file."""
+    shard_records: int | None = None
+    """Split Codex JSONL output into files of at most this many records."""
+    hash_attachments: bool = False
+    """Store inline images and files once under ``attachments/`` and reference them by hash."""
 
 
 @dataclass(frozen=True, slots=True)
@@ -70,3 +77,7 @@ class ExportResult:
     record_count: int
     upload: DatasetUploadResult | None = None
     redaction: RedactionSummary | None = None
+    output_paths: tuple[Path, ...] = ()
+    """Every file written, in order; more than one when the output is sharded."""
+    attachments_dir: Path | None = None
+    """Directory holding hashed attachments, when they were written separately."""
@@ -0,0 +1,205 @@
+"""Streaming output for session trace exports.
+
+Writers hand records to a :class:`JsonlRecordSink` one at a time instead of
+building the whole trace in memory, so memory use stays flat however long the
+session is. The sink can write zstd-compressed files and split output into
+fixed-size shards.
+
+Inline base64 payloads (images, audio and files) usually dominate the size of a
+trace. An :class:`AttachmentStore` moves them into a side directory named by
+their SHA-256 digest, so repeated attachments are stored once and records carry
+a short relative reference instead of the payload.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import tempfile
+from importlib import import_module
+from pathlib import Path, PurePath
+from typing import IO, TYPE_CHECKING, Any
+
+from fast_agent.session.trace_export_errors import SessionExportOptionsError
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from types import ModuleType
+
+    from fast_agent.session.trace_export_models import TraceCompression
+
+ATTACHMENTS_DIRNAME = "attachments"
+"""Directory, next to the trace, holding content-addressed attachments."""
+
+_DATA_URL = re.compile(r"^data:(?P<mime>[^;,]+);base64,", re.ASCII)
+_ZSTD_SUFFIX = ".zst"
+
+
+def zstd_module() -> ModuleType:
+    """Return the stdlib ``compression.zstd`` module or the ``zstandard`` package."""
+    for name in ("compression.zstd", "zstandard"):
+        try:
+            return import_module(name)
+        except ImportError:
+            continue
+    raise SessionExportOptionsError(
+        "zstd trace compression requires Python 3.14+ or the `zstandard` package. "
+        "Install it first, then retry the export."
+    )
+
+
+def open_trace_text(path: Path) -> IO[str]:
+    """Open an exported JSONL trace for reading, decompressing ``.zst`` files."""
+    if path.suffix == _ZSTD_SUFFIX:
+        return zstd_module().open(path, "rt", encoding="utf-8")
+    return path.open(encoding="utf-8")
+
+
+class JsonlRecordSink:
+    """Write JSON records one per line, optionally compressed and sharded.
+
+    With ``shard_records`` set, ``trace.jsonl`` becomes ``trace-00000.jsonl``,
+    ``trace-00001.jsonl`` and so on. Compressed files get a ``.zst`` suffix.
+    """
+
+    def __init__(
+        self,
+        output_path: Path,
+        *,
+        compression: TraceCompression | None = None,
+        shard_records: int | None = None,
+    ) -> None:
+        if shard_records is not None and shard_records < 1:
+            raise SessionExportOptionsError("Trace shards must hold at least one record.")
+        self._zstd = zstd_module() if compression == "zstd" else None
+        self._base_path = _without_suffix(output_path, _ZSTD_SUFFIX)
+        self._shard_records = shard_records
+        self._handle: IO[str] | None = None
+        self._shard_count = 0
+        self.paths: list[Path] = []
+        self.record_count = 0
+
+    def __enter__(self) -> JsonlRecordSink:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def write(self, record: Mapping[str, Any]) -> None:
+        if self._handle is None or (
+            self._shard_records is not None and self._shard_count >= self._shard_records
+        ):
+            self._open_next()
+        assert self._handle is not None
+        self._handle.write(json.dumps(record, ensure_ascii=False))
+        self._handle.write("\n")
+        self._shard_count += 1
+        self.record_count += 1
+
+    def close(self) -> None:
+        if self._handle is None and not self.paths:
+            # Always leave a (possibly empty) file behind, like a plain write would.
+            self._open_next()
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def _open_next(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+        path = self._path_for(len(self.paths))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if self._zstd is None:
+            self._handle = path.open("w", encoding="utf-8")
+        else:
+            self._handle = self._zstd.open(path, "wt", encoding="utf-8")
+        self.paths.append(path)
+        self._shard_count = 0
+
+    def _path_for(self, shard_index: int) -> Path:
+        path = self._base_path
+        if self._shard_records is not None:
+            path = path.with_name(f"{path.stem}-{shard_index:05d}{path.suffix}")
+        if self._zstd is not None:
+            path = path.with_name(f"{path.name}{_ZSTD_SUFFIX}")
+        return path
+
+
+class AttachmentStore:
+    """Content-addressed attachment directory shared by one or more traces."""
+
+    def __init__(self, directory: Path, *, relative_to: Path | None = None) -> None:
+        self.directory = directory
+        self._relative_to = relative_to
+        self._known: set[str] = set()
+        self.stored_count = 0
+        self.stored_bytes = 0
+        self.reused_count = 0
+
+    def store(self, data: bytes, *, suffix: str = ".bin") -> str:
+        """Store ``data`` once and return its reference."""
+        name = f"{hashlib.sha256(data).hexdigest()}{suffix}"
+        path = self.directory / name
+        if name in self._known or path.exists():
+            self.reused_count += 1
+        else:
+            _write_atomic(path, data)
+            self.stored_count += 1
+            self.stored_bytes += len(data)
+        self._known.add(name)
+        return self._reference(path)
+
+    def store_base64(
+        self,
+        data: str,
+        *,
+        mime_type: str | None = None,
+        filename: str | None = None,
+    ) -> str | None:
+        """Decode and store a base64 payload; ``None`` if it is not valid base64."""
+        try:
+            decoded = base64.b64decode(data, validate=True)
+        except (binascii.Error, ValueError):
+            return None
+        return self.store(decoded, suffix=_attachment_suffix(mime_type, filename))
+
+    def data_url_reference(self, value: str) -> str | None:
+        """Store the payload of a base64 ``data:`` URL; ``None`` for anything else."""
+        match = _DATA_URL.match(value)
+        if match is None:
+            return None
+        return self.store_base64(value[match.end() :], mime_type=match.group("mime"))
+
+    def _reference(self, path: Path) -> str:
+        if self._relative_to is None:
+            return path.as_posix()
+        return PurePath(os.path.relpath(path, self._relative_to)).as_posix()
+
+
+def _attachment_suffix(mime_type: str | None, filename: str | None) -> str:
+    if mime_type:
+        guessed = mimetypes.guess_extension(mime_type, strict=False)
+        if guessed:
+            return guessed
+    if filename:
+        suffix = PurePath(filename).suffix
+        if suffix and suffix[1:].isalnum():
+            return suffix.lower()
+    return ".bin"
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as handle:
+        temporary_path = Path(handle.name)
+        handle.write(data)
+    temporary_path.replace(path)
+
+
+def _without_suffix(path: Path, suffix: str) -> Path:
+    return path.with_suffix("") if path.suffix == suffix else path
@@ -21,6 +21,7 @@ from fast_agent.session.trace_export_errors import (
     SessionExportAmbiguousAgentError,
     SessionExportNoAgentsError,
     SessionExportNotFoundError,
+    SessionExportOptionsError,
     SessionExportPrivacyFilterError,
     SessionExportReadError,
     SessionExportWriteError,
@@ -108,10 +109,11 @@ class SessionTraceExporter:
         self._progress_callback = progress_callback
 
     def export(self, request: ExportRequest) -> ExportResult:
+        _validate_output_options(request)
         resolved = self._resolve_request(request)
         output_path = self._resolve_output_path(request, resolved)
         self._emit_progress(_export_summary_message(resolved, export_format=request.format))
-        writer = self._writer_for_format(request.format, privacy_filter=request.privacy_filter)
+        writer = self._writer_for_request(request)
         try:
             result = writer.write(resolved, output_path)
         except OSError as exc:
@@ -140,6 +142,8 @@ class SessionTraceExporter:
             record_count=result.record_count,
             upload=upload,
             redaction=result.redaction,
+            output_paths=result.output_paths,
+            attachments_dir=result.attachments_dir,
         )
 
     def _emit_progress(self, message: str) -> None:
@@ -339,23 +343,41 @@ class SessionTraceExporter:
             timestamps.append(_message_timestamp(cast("dict[object, object]", item)))
         return tuple(timestamps)
 
-    def _writer_for_format(self, export_format: str, *, privacy_filter: bool):
-        if export_format == "codex":
-            sanitizer = self._privacy_sanitizer if privacy_filter else None
-            if privacy_filter and sanitizer is None:
-                raise SessionExportPrivacyFilterError(
-                    "Privacy filtering was requested, but no privacy filter backend is configured."
-                )
-            return CodexTraceWriter(sanitizer=sanitizer, progress_callback=self._progress_callback)
-        if export_format == "atif":
-            sanitizer = self._privacy_sanitizer if privacy_filter else None
-            if privacy_filter and sanitizer is None:
-                raise SessionExportPrivacyFilterError(
-                    "Privacy filtering was requested, but no privacy filter backend is configured."
-                )
-            return AtifTraceWriter(sanitizer=sanitizer)
-        raise UnsupportedTraceExportFormatError(
-            f"Unsupported session export format: {export_format}"
+    def _writer_for_request(self, request: ExportRequest) -> CodexTraceWriter | AtifTraceWriter:
+        if request.format not in ("codex", "atif"):
+            raise UnsupportedTraceExportFormatError(
+                f"Unsupported session export format: {request.format}"
+            )
+        sanitizer = self._privacy_sanitizer if request.privacy_filter else None
+        if request.privacy_filter and sanitizer is None:
+            raise SessionExportPrivacyFilterError(
+                "Privacy filtering was requested, but no privacy filter backend is configured."
+            )
+        if request.format == "codex":
+            return CodexTraceWriter(
+                sanitizer=sanitizer,
+                progress_callback=self._progress_callback,
+                compression=request.compression,
+                shard_records=request.shard_records,
+                hash_attachments=request.hash_attachments,
+            )
+        return AtifTraceWriter(sanitizer=sanitizer, hash_attachments=request.hash_attachments)
+
+
+def _validate_output_options(request: ExportRequest) -> None:
+    if request.shard_records is not None and request.shard_records < 1:
+        raise SessionExportOptionsError("--shard-records must be at least 1.")
+    if request.format == "atif" and (
+        request.compression is not None or request.shard_records is not None
+    ):
+        raise SessionExportOptionsError(
+            "Compression and sharding are only supported for codex JSONL exports."
+        )
+    uploading = request.hf_url is not None or request.hf_dataset is not None
+    if uploading and (request.shard_records is not None or request.hash_attachments):
+        raise SessionExportOptionsError(
+            "Sharded exports and hashed attachments write several files and cannot be "
+            "uploaded to Hugging Face; export locally and upload the directory instead."
         )
 
 
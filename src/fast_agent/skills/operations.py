@@ -226,15 +226,17 @@ def apply_skill_updates(
     head_cache: HeadCache = {}
     path_cache: PathCache = {}
     results: list[SkillUpdateInfo] = []
-    for update in updates:
-        refreshed = _evaluate_skill_update(
+    refreshed_updates = marketplace_update_status.evaluate_updates_concurrently(
+        updates,
+        lambda update: _evaluate_skill_update(
             name=update.name,
             skill_dir=update.skill_dir,
             index=update.index,
             head_cache=head_cache,
             path_cache=path_cache,
-        )
-
+        ),
+    )
+    for refreshed in refreshed_updates:
         if not is_update_applicable(refreshed.status):
             results.append(refreshed)
             continue
@@ -351,22 +353,24 @@ def _check_skill_updates(*, destination_root: Path) -> list[SkillUpdateInfo]:
     }
     head_cache: HeadCache = {}
     path_cache: PathCache = {}
-    updates: list[SkillUpdateInfo] = []
 
-    skill_dirs = [entry for entry in sorted(destination_root.iterdir()) if entry.is_dir()]
-    for index, skill_dir in enumerate(skill_dirs, start=1):
+    def evaluate(entry: tuple[int, Path]) -> SkillUpdateInfo:
+        index, skill_dir = entry
         manifest = manifests_by_dir.get(skill_dir)
-        name = manifest.name if manifest else skill_dir.name
-        updates.append(
-            _evaluate_skill_update(
-                name=name,
-                skill_dir=skill_dir,
-                index=index,
-                head_cache=head_cache,
-                path_cache=path_cache,
-            )
+        return _evaluate_skill_update(
+            name=manifest.name if manifest else skill_dir.name,
+            skill_dir=skill_dir,
+            index=index,
+            head_cache=head_cache,
+            path_cache=path_cache,
         )
 
+    skill_dirs = [entry for entry in sorted(destination_root.iterdir()) if entry.is_dir()]
+    updates = marketplace_update_status.evaluate_updates_concurrently(
+        list(enumerate(skill_dirs, start=1)),
+        evaluate,
+    )
+
     errors_by_dir = {Path(error["path"]).parent: error["error"] for error in parse_errors}
     for update in updates:
         parse_error = errors_by_dir.get(update.skill_dir)
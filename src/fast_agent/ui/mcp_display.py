@@ -1135,6 +1135,105 @@ def _render_server_calls(status: ServerStatus, *, indent: str) -> None:
         _status_console().print(reconnect_line)
 
 
+def _render_server_call_queue(status: ServerStatus, *, indent: str) -> None:
+    if status.call_concurrency_limit is None and not status.calls_queued:
+        return
+
+    queue_line = Text(indent + "  ")
+    queue_line.append("tool calls: ", style=Colours.TEXT_DIM)
+    limit = status.call_concurrency_limit
+    in_flight = status.calls_in_flight or 0
+    queue_line.append(
+        f"{in_flight}/{limit}" if limit is not None else str(in_flight),
+        style=Colours.TEXT_DEFAULT,
+    )
+    queue_line.append(" in flight", style=Colours.TEXT_DIM)
+    if status.call_queue_depth:
+        queue_line.append("  |  ", style="dim")
+        queue_line.append("waiting: ", style=Colours.TEXT_DIM)
+        queue_line.append(str(status.call_queue_depth), style=Colours.TEXT_WARNING)
+    if status.calls_queued:
+        queue_line.append("  |  ", style="dim")
+        queue_line.append("queue wait: ", style=Colours.TEXT_DIM)
+        queue_line.append(
+            f"avg {status.call_queue_wait_mean_ms or 0:.0f}ms "
+            f"max {status.call_queue_wait_max_ms or 0:.0f}ms",
+            style=Colours.TEXT_DEFAULT,
+        )
+        queue_line.append(f" ({status.calls_queued} queued)", style=Colours.TEXT_DIM)
+    _status_console().print(queue_line)
+
+
+def _render_server_pool(status: ServerStatus, *, indent: str) -> None:
+    if status.pool_size is None:
+        return
+
+    pool_line = Text(indent + "  ")
+    pool_line.append("pool: ", style=Colours.TEXT_DIM)
+    if status.pool_healthy is None:
+        pool_line.append(f"{status.pool_size} connections", style=Colours.TEXT_DEFAULT)
+        pool_line.append(" (starts on first tool call)", style=Colours.TEXT_DIM)
+        _status_console().print(pool_line)
+        return
+
+    healthy_style = (
+        Colours.TEXT_DEFAULT if status.pool_healthy >= status.pool_size else Colours.TEXT_WARNING
+    )
+    pool_line.append(f"{status.pool_healthy}/{status.pool_size}", style=healthy_style)
+    pool_line.append(" healthy", style=Colours.TEXT_DIM)
+    pool_line.append("  |  ", style="dim")
+    pool_line.append(str(status.pool_in_flight or 0), style=Colours.TEXT_DEFAULT)
+    pool_line.append(" in flight", style=Colours.TEXT_DIM)
+    if status.pool_member_calls:
+        pool_line.append("  |  ", style="dim")
+        pool_line.append("calls: ", style=Colours.TEXT_DIM)
+        pool_line.append(
+            "/".join(str(count) for count in status.pool_member_calls),
+            style=Colours.TEXT_DEFAULT,
+        )
+    if status.pool_recycled:
+        pool_line.append("  |  ", style="dim")
+        pool_line.append(f"{status.pool_recycled} recycled", style=Colours.TEXT_WARNING)
+    _status_console().print(pool_line)
+
+
+def _render_server_sampling(status: ServerStatus, *, indent: str) -> None:
+    if not status.sampling_requests and not status.sampling_in_flight:
+        return
+
+    sampling_line = Text(indent + "  ")
+    sampling_line.append("sampling: ", style=Colours.TEXT_DIM)
+    sampling_line.append(str(status.sampling_requests or 0), style=Colours.TEXT_DEFAULT)
+    sampling_line.append(" requests", style=Colours.TEXT_DIM)
+    sampling_line.append("  |  ", style="dim")
+    sampling_line.append("pool hits: ", style=Colours.TEXT_DIM)
+    sampling_line.append(
+        f"{(status.sampling_pool_hit_rate or 0) * 100:.0f}%", style=Colours.TEXT_DEFAULT
+    )
+    sampling_line.append("  |  ", style="dim")
+    sampling_line.append("latency: ", style=Colours.TEXT_DIM)
+    sampling_line.append(
+        f"avg {status.sampling_latency_mean_ms or 0:.0f}ms "
+        f"max {status.sampling_latency_max_ms or 0:.0f}ms",
+        style=Colours.TEXT_DEFAULT,
+    )
+    if status.sampling_in_flight:
+        limit = status.sampling_concurrency_limit
+        sampling_line.append("  |  ", style="dim")
+        sampling_line.append(
+            f"{status.sampling_in_flight}/{limit}"
+            if limit is not None
+            else str(status.sampling_in_flight),
+            style=Colours.TEXT_DEFAULT,
+        )
+        sampling_line.append(" in flight", style=Colours.TEXT_DIM)
+    if status.sampling_queue_depth:
+        sampling_line.append("  |  ", style="dim")
+        sampling_line.append("waiting: ", style=Colours.TEXT_DIM)
+        sampling_line.append(str(status.sampling_queue_depth), style=Colours.TEXT_WARNING)
+    _status_console().print(sampling_line)
+
+
 def _render_mcp_skills_hint(server: str, status: ServerStatus, *, indent: str) -> None:
     if not status.mcp_skills_enabled:
         return
@@ -1189,6 +1288,9 @@ def _render_server_status_block(
     _render_server_metadata(status, indent=indent)
     _render_server_state(status, indent=indent, template_expected=template_expected)
     _render_server_calls(status, indent=indent)
+    _render_server_call_queue(status, indent=indent)
+    _render_server_pool(status, indent=indent)
+    _render_server_sampling(status, indent=indent)
     _render_channel_summary(status, indent, total_width)
     _render_mcp_skills_hint(server, status, indent=indent)
     _render_capability_banner(
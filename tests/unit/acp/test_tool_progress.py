@@ -14,7 +14,10 @@ import pytest_asyncio
 from mcp_types import ResourceLink
 
 from fast_agent.acp.tool_call_context import acp_tool_call_context
-from fast_agent.acp.tool_progress import ACPToolProgressManager
+from fast_agent.acp.tool_progress import (
+    ACPToolProgressManager,
+    client_supports_tool_call_argument_deltas,
+)
 
 
 @pytest_asyncio.fixture(autouse=True)
@@ -152,6 +155,29 @@ class TestACPToolProgressManager:
         assert notification.rawInput == arguments
         assert notification.content == []
 
+    @pytest.mark.asyncio
+    async def test_tool_notifications_wait_for_queued_assistant_text(self) -> None:
+        """Text queued in the stream pipeline should reach the client before a later tool call."""
+        from fast_agent.acp.server.stream_pipeline import ACPStreamPipeline
+
+        connection = FakeAgentSideConnection()
+
+        async def send_text(text: str, is_reasoning: bool) -> None:
+            await connection.session_update(session_id="test-session", update=text)
+
+        pipeline = ACPStreamPipeline(send_text, latency_budget_seconds=0.05)
+        manager = ACPToolProgressManager(connection, "test-session")
+        manager.set_text_flush(pipeline.flush)
+
+        pipeline.submit("first ", is_reasoning=False)
+        await asyncio.sleep(0)
+        pipeline.submit("second", is_reasoning=False)
+        await manager.on_tool_start(tool_name="read_file", server_name="fs", arguments={})
+        await pipeline.close()
+
+        assert connection.notifications[:2] == ["first ", "second"]
+        assert connection.notifications[2].sessionUpdate == "tool_call"
+
     @pytest.mark.asyncio
     async def test_on_tool_start_omits_builtin_server_name(self) -> None:
         """Built-in ACP tools should not display the server name in titles."""
@@ -423,6 +449,101 @@ class TestACPToolProgressManager:
         # Title should show 25 chunks
         assert "(streaming: 25)" in delta_notification.title
 
+    @pytest.mark.asyncio
+    async def test_delta_snapshots_are_rate_limited(self) -> None:
+        """Chunks arriving within the interval are folded into the next snapshot."""
+        connection = FakeAgentSideConnection()
+        manager = ACPToolProgressManager(connection, "test-session", stream_interval_seconds=0.05)
+
+        manager.handle_tool_stream_event(
+            "start",
+            {
+                "tool_name": "server__write_file",
+                "tool_use_id": "use-123",
+            },
+        )
+
+        def send_chunks(indices: range) -> None:
+            for i in indices:
+                manager.handle_tool_stream_event(
+                    "delta",
+                    {
+                        "tool_use_id": "use-123",
+                        "chunk": f"chunk{i}_",
+                    },
+                )
+
+        send_chunks(range(25))
+        await asyncio.sleep(0.01)
+        # Start + the first snapshot at the threshold chunk
+        assert len(connection.notifications) == 2
+
+        for start in range(25, 200, 25):
+            send_chunks(range(start, start + 25))
+            await asyncio.sleep(0)
+        assert len(connection.notifications) == 2
+
+        await asyncio.sleep(0.1)
+        assert len(connection.notifications) == 3
+        snapshot = connection.notifications[-1]
+        assert snapshot.content[0].content.text == "".join(f"chunk{i}_" for i in range(200))
+        assert "(streaming: 200)" in snapshot.title
+
+    @pytest.mark.asyncio
+    async def test_delta_mode_sends_only_new_text_with_offsets(self) -> None:
+        """Clients that opt in receive appended deltas instead of snapshots."""
+        connection = FakeAgentSideConnection()
+        manager = ACPToolProgressManager(
+            connection,
+            "test-session",
+            argument_deltas=True,
+            stream_interval_seconds=0.01,
+        )
+
+        manager.handle_tool_stream_event(
+            "start",
+            {
+                "tool_name": "server__write_file",
+                "tool_use_id": "use-123",
+            },
+        )
+        for i in range(30):
+            manager.handle_tool_stream_event(
+                "delta",
+                {
+                    "tool_use_id": "use-123",
+                    "chunk": f"chunk{i}_",
+                },
+            )
+        await asyncio.sleep(0)
+        for i in range(30, 40):
+            manager.handle_tool_stream_event(
+                "delta",
+                {
+                    "tool_use_id": "use-123",
+                    "chunk": f"chunk{i}_",
+                },
+            )
+        await asyncio.sleep(0.05)
+
+        updates = connection.notifications[1:]
+        assert len(updates) >= 2
+        offsets = [
+            update.field_meta["co.huggingface"]["toolCallArgumentDelta"]["offset"]
+            for update in updates
+        ]
+        texts = [update.content[0].content.text for update in updates]
+        assert "".join(texts) == "".join(f"chunk{i}_" for i in range(40))
+        assert offsets[0] == 0
+        assert offsets[1] == len(texts[0])
+
+    def test_client_argument_delta_capability(self) -> None:
+        assert client_supports_tool_call_argument_deltas(
+            {"co.huggingface": {"toolCallArgumentDeltas": True}}
+        )
+        assert not client_supports_tool_call_argument_deltas(None)
+        assert not client_supports_tool_call_argument_deltas({"co.huggingface": True})
+
     @pytest.mark.asyncio
     async def test_delta_before_start_is_dropped(self) -> None:
         """Delta event without prior start should be dropped (no notification)."""
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+
+def test_benchmark_cli_writes_comparable_json(tmp_path: Path) -> None:
+    baseline = tmp_path / "baseline.json"
+    output = tmp_path / "bench.json"
+    command = [
+        sys.executable,
+        "-m",
+        "benchmarks",
+        "--in-process",
+        "--workload",
+        "chain",
+        "--scale",
+        "0.02",
+    ]
+
+    first = subprocess.run(
+        [*command, "--output", str(baseline)],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    second = subprocess.run(
+        [*command, "--output", str(output), "--compare", str(baseline)],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert first.returncode == 0, first.stderr
+    assert second.returncode == 0, second.stderr
+    payload = json.loads(output.read_text(encoding="utf-8"))
+    assert payload["schema"] == "fast-agent.benchmarks/v1"
+    [result] = payload["results"]
+    assert result["workload"] == "chain"
+    assert result["operations"] == 6
+    assert 0 < result["p50_ms"] <= result["p99_ms"]
+    assert result["peak_rss_bytes"] > 0
+    assert "p50_ms_change_pct" in payload["comparison"]["workloads"]["chain"]
+
+
+def test_benchmark_cli_lists_workloads() -> None:
+    completed = subprocess.run(
+        [sys.executable, "-m", "benchmarks", "--list"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    names = [line.split()[0] for line in completed.stdout.splitlines()]
+    assert names == [
+        "tool_loop",
+        "parallel_fan_out",
+        "chain",
+        "router",
+        "agents_as_tools",
+        "session_save_resume",
+        "batch",
+        "stream_replay",
+    ]
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from benchmarks.stream_captures import write_captures  # noqa: E402
+from benchmarks.stream_replay import (  # noqa: E402
+    compare_results,
+    decode_capture,
+    load_captures,
+    replay_capture,
+)
+
+
+def test_committed_capture_corpus_matches_generator() -> None:
+    assert write_captures(check=True) == []
+
+
+def test_every_capture_decodes() -> None:
+    captures = load_captures()
+    families = {capture.family for capture in captures}
+
+    assert {"anthropic", "google", "openai-chat", "openresponses", "responses"} <= families
+    for capture in captures:
+        assert len(decode_capture(capture)) > 0, capture.name
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "capture",
+    load_captures(include_traces=False),
+    ids=lambda capture: capture.name,
+)
+async def test_synthetic_capture_replays_through_listeners(capture) -> None:
+    result = await replay_capture(capture, iterations=1, listener_counts=(0, 2))
+
+    assert result["chunks"] > 500
+    assert result["runs"]["0"]["listener_calls_per_stream"] == 0
+    with_listeners = result["runs"]["2"]
+    assert with_listeners["listener_calls_per_stream"] > 0
+    assert with_listeners["cpu_us_per_chunk"] > 0
+    assert "fan_out_us_per_chunk" in with_listeners
+
+
+def test_compare_flags_cpu_regressions() -> None:
+    baseline = {"results": [{"capture": "c", "runs": {"1": {"cpu_us_per_chunk": 10.0}}}]}
+    results = [{"capture": "c", "runs": {"1": {"cpu_us_per_chunk": 13.0}}}]
+
+    comparison, regressions = compare_results(results, baseline, max_regression=20)
+
+    assert comparison["c"] == {"listeners_1_cpu_us_per_chunk_change_pct": 30.0}
+    assert len(regressions) == 1
+    assert compare_results(results, baseline, max_regression=50)[1] == []
@@ -1,9 +1,13 @@
 """Unit tests for InstructionBuilder."""
 
+import asyncio
+from typing import ClassVar
+
 import pytest
 
 from fast_agent.core.exceptions import AgentConfigError
 from fast_agent.core.instruction import InstructionBuilder
+from fast_agent.core.template_sources import TemplateSourceCache
 
 
 class TestInstructionBuilder:
@@ -245,6 +249,8 @@ class TestInstructionBuilderUrlPatterns:
 
         class MockResponse:
             encoding = None
+            status_code = 200
+            headers: ClassVar[dict[str, str]] = {}
             text = "Remote content"
 
             def raise_for_status(self):
@@ -274,3 +280,92 @@ class TestInstructionBuilderUrlPatterns:
         result = await builder.build()
 
         assert result == "Data: "
+
+
+class TestInstructionBuilderSourceCache:
+    """Tests for cached url/file template sources."""
+
+    @pytest.mark.asyncio
+    async def test_url_revalidates_with_etag_and_serves_stale_on_failure(self, monkeypatch):
+        """Expired URL content is revalidated; a failed refresh keeps the cached text."""
+        import requests
+
+        class MockResponse:
+            encoding = "utf-8"
+
+            def __init__(self, status_code: int, text: str = "") -> None:
+                self.status_code = status_code
+                self.text = text
+                self.headers = {"ETag": '"v1"'} if status_code == 200 else {}
+
+            def raise_for_status(self):
+                pass
+
+        sent_headers: list[dict[str, str]] = []
+        responses = [MockResponse(200, "Guide v1"), MockResponse(304)]
+
+        def mock_get(url, *, headers, timeout):
+            sent_headers.append(headers)
+            if not responses:
+                raise requests.ConnectionError("offline")
+            return responses.pop(0)
+
+        monkeypatch.setattr(requests, "get", mock_get)
+        sources = TemplateSourceCache(ttl_seconds=0)
+        template = "Guide: {{url:https://example.com/guide.md}}"
+
+        for _ in range(3):
+            result = await InstructionBuilder(template, sources=sources).build()
+            assert result == "Guide: Guide v1"
+
+        assert sent_headers == [{}, {"If-None-Match": '"v1"'}, {"If-None-Match": '"v1"'}]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_builds_share_one_fetch(self, monkeypatch):
+        """Builds running at once fetch each URL only once within the TTL."""
+        import requests
+
+        calls: list[str] = []
+
+        class MockResponse:
+            encoding = "utf-8"
+            status_code = 200
+            headers: ClassVar[dict[str, str]] = {}
+
+            def __init__(self, url: str) -> None:
+                self.text = url.rsplit("/", 1)[-1]
+
+            def raise_for_status(self):
+                pass
+
+        def mock_get(url, **kwargs):
+            calls.append(url)
+            return MockResponse(url)
+
+        monkeypatch.setattr(requests, "get", mock_get)
+        sources = TemplateSourceCache()
+        template = "{{url:https://example.com/a}} {{url:https://example.com/b}}"
+
+        results = await asyncio.gather(
+            *(InstructionBuilder(template, sources=sources).build() for _ in range(4))
+        )
+
+        assert results == ["a b"] * 4
+        assert sorted(calls) == ["https://example.com/a", "https://example.com/b"]
+
+    @pytest.mark.asyncio
+    async def test_file_reread_only_when_changed(self, tmp_path):
+        """{{file:...}} content is reused until the file's mtime or size changes."""
+        notes = tmp_path / "notes.md"
+        notes.write_text("first")
+        sources = TemplateSourceCache()
+        builder = InstructionBuilder("{{file:notes.md}}", sources=sources)
+        builder.set("workspaceRoot", str(tmp_path))
+
+        assert await builder.build() == "first"
+        entry = sources._files[notes.resolve()]
+        assert await builder.copy().build() == "first"
+        assert sources._files[notes.resolve()] is entry
+
+        notes.write_text("second version")
+        assert await builder.build() == "second version"
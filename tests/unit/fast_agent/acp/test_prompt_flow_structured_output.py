@@ -11,6 +11,7 @@ from acp.helpers import text_block, update_agent_thought_text
 from fast_agent.acp.server.live_session_registry import ACPLiveSessionRegistry
 from fast_agent.acp.server.prompt_flow import ACPPromptFlow
 from fast_agent.acp.server.prompt_flow import PromptFlowHost as ACPPromptFlowHost
+from fast_agent.acp.server.stream_pipeline import ACPStreamPipeline
 from fast_agent.core.agent_app import AgentApp
 from fast_agent.interfaces import StreamingAgentProtocol
 from fast_agent.llm.stream_types import StreamChunk
@@ -157,7 +158,7 @@ async def test_stream_retry_delivers_failed_and_recovered_attempts_live() -> Non
 
     listener(StreamChunk(text="recovered"))
     listener(StreamChunk(event="commit"))
-    await asyncio.gather(*context["streaming_tasks"])
+    await context["stream_pipeline"].flush()
 
     assert context["stream_state"].assistant_text_seen is True
     assert [
@@ -184,7 +185,7 @@ async def test_stream_retry_control_events_do_not_interrupt_live_delivery() -> N
     listener = listeners[0]
     listener(StreamChunk(text="before tool"))
     listener(StreamChunk(event="commit"))
-    await asyncio.gather(*context["streaming_tasks"])
+    await context["stream_pipeline"].flush()
 
     assert [
         notification["update"].content.text for notification in host._connection.notifications
@@ -197,11 +198,11 @@ async def test_stream_retry_control_events_do_not_interrupt_live_delivery() -> N
     listener(StreamChunk(text="recovered follow-up"))
     listener(StreamChunk(event="commit"))
 
-    await asyncio.gather(*context["streaming_tasks"])
+    await context["stream_pipeline"].flush()
 
-    assert [
-        notification["update"].content.text for notification in host._connection.notifications
-    ] == ["before tool", "failed follow-up", "recovered follow-up"]
+    texts = [notification["update"].content.text for notification in host._connection.notifications]
+    assert texts[0] == "before tool"
+    assert "".join(texts[1:]) == "failed follow-uprecovered follow-up"
 
 
 @pytest.mark.asyncio
@@ -221,7 +222,7 @@ async def test_stream_completion_delivers_delta_only_agent_output_live() -> None
         session_id="session-1",
     )
     listeners[0](StreamChunk(text="remote response"))
-    await asyncio.gather(*context["streaming_tasks"])
+    await context["stream_pipeline"].flush()
 
     assert [
         notification["update"].content.text for notification in host._connection.notifications
@@ -273,7 +274,7 @@ async def test_structured_output_streaming_emits_final_status_line_update(
         return {
             "stream_listener": None,
             "remove_listener": None,
-            "streaming_tasks": [],
+            "stream_pipeline": None,
             "stream_state": SimpleNamespace(assistant_text_seen=True),
         }
 
@@ -322,16 +323,19 @@ async def test_reasoning_only_streaming_preserves_final_status_line_update(
     async def fake_prepare_streaming_context(*, agent: Any, session_id: str) -> dict[str, Any]:
         _ = agent
 
-        async def send_reasoning_update() -> None:
+        async def send_reasoning_update(text: str, is_reasoning: bool) -> None:
+            assert is_reasoning
             await host._connection.session_update(
                 session_id=session_id,
-                update=update_agent_thought_text("thinking"),
+                update=update_agent_thought_text(text),
             )
 
+        pipeline = ACPStreamPipeline(send_reasoning_update)
+        pipeline.submit("thinking", is_reasoning=True)
         return {
             "stream_listener": None,
             "remove_listener": None,
-            "streaming_tasks": [asyncio.create_task(send_reasoning_update())],
+            "stream_pipeline": pipeline,
             "stream_state": SimpleNamespace(assistant_text_seen=False),
         }
 
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from fast_agent.acp.server.stream_pipeline import ACPStreamPipeline, stream_latency_budget_seconds
+
+
+class RecordingSender:
+    def __init__(self, *, gate: asyncio.Event | None = None) -> None:
+        self.frames: list[tuple[str, bool]] = []
+        self._gate = gate
+
+    async def __call__(self, text: str, is_reasoning: bool) -> None:
+        if self._gate is not None:
+            await self._gate.wait()
+        self.frames.append((text, is_reasoning))
+
+
+@pytest.mark.asyncio
+async def test_burst_is_coalesced_in_order_by_kind() -> None:
+    sender = RecordingSender()
+    pipeline = ACPStreamPipeline(sender, latency_budget_seconds=0.01)
+
+    for index in range(3):
+        pipeline.submit(f"think-{index} ", is_reasoning=True)
+    for index in range(200):
+        pipeline.submit(f"{index} ", is_reasoning=False)
+    pipeline.submit("more thought", is_reasoning=True)
+    await pipeline.close()
+
+    assert sender.frames == [
+        ("think-0 think-1 think-2 ", True),
+        ("".join(f"{index} " for index in range(200)), False),
+        ("more thought", True),
+    ]
+    stats = pipeline.stats()
+    assert stats.chunks == 204
+    assert stats.notifications == 3
+    assert stats.max_queue_depth == 3
+
+
+@pytest.mark.asyncio
+async def test_first_chunk_after_idle_is_sent_without_waiting_for_budget() -> None:
+    sender = RecordingSender()
+    pipeline = ACPStreamPipeline(sender, latency_budget_seconds=10.0)
+
+    pipeline.submit("hello", is_reasoning=False)
+    await asyncio.sleep(0)
+
+    assert sender.frames == [("hello", False)]
+    await pipeline.close()
+
+
+@pytest.mark.asyncio
+async def test_slow_client_bounds_pending_frames() -> None:
+    gate = asyncio.Event()
+    sender = RecordingSender(gate=gate)
+    pipeline = ACPStreamPipeline(
+        sender,
+        latency_budget_seconds=0,
+        max_pending_frames=4,
+        max_frame_chars=1,
+    )
+
+    pipeline.submit("blocked", is_reasoning=False)
+    await asyncio.sleep(0)
+    for index in range(100):
+        pipeline.submit(str(index % 10), is_reasoning=False)
+    gate.set()
+    await pipeline.close()
+
+    texts = [text for text, _ in sender.frames]
+    assert "".join(texts) == "blocked" + "".join(str(index % 10) for index in range(100))
+    assert pipeline.stats().max_queue_depth == 4
+    assert len(sender.frames) == 5
+
+
+@pytest.mark.asyncio
+async def test_send_errors_do_not_stop_later_frames() -> None:
+    sent: list[str] = []
+
+    async def flaky_send(text: str, _is_reasoning: bool) -> None:
+        if text == "bad":
+            raise RuntimeError("connection reset")
+        sent.append(text)
+
+    pipeline = ACPStreamPipeline(flaky_send, latency_budget_seconds=0)
+    pipeline.submit("bad", is_reasoning=False)
+    await pipeline.flush()
+    pipeline.submit("good", is_reasoning=False)
+    await pipeline.close()
+
+    assert sent == ["good"]
+    assert pipeline.stats().notifications == 2
+
+
+def test_latency_budget_reads_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("FAST_AGENT_ACP_STREAM_LATENCY_MS", "40")
+    assert stream_latency_budget_seconds() == pytest.approx(0.04)
+
+    monkeypatch.setenv("FAST_AGENT_ACP_STREAM_LATENCY_MS", "nope")
+    assert stream_latency_budget_seconds() == pytest.approx(0.016)
@@ -0,0 +1,140 @@
+import pytest
+from pydantic import BaseModel, ConfigDict
+
+from fast_agent.batch import BatchRunner
+from fast_agent.batch.output import BatchOutputRows
+from fast_agent.batch.parquet import (
+    ParquetRecordWriter,
+    duckdb_type_for_schema,
+    envelope_columns,
+    parquet_part_paths,
+)
+from fast_agent.batch.resume import load_completed_ids
+
+
+class Ticket(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    label: str
+    score: float
+    tags: list[str]
+    priority: int | None = None
+
+
+def test_json_schema_maps_to_typed_duckdb_columns() -> None:
+    assert duckdb_type_for_schema(Ticket.model_json_schema()) == (
+        'STRUCT("label" VARCHAR, "score" DOUBLE, "tags" VARCHAR[], "priority" BIGINT)'
+    )
+    assert duckdb_type_for_schema({"type": "string", "enum": ["a", "b"]}) == "VARCHAR"
+    assert duckdb_type_for_schema({"type": "object", "properties": {"a": {"type": "string"}}}) == (
+        "JSON"
+    )
+    assert duckdb_type_for_schema({"type": "object", "additionalProperties": True}) == "JSON"
+    assert duckdb_type_for_schema({"anyOf": [{"type": "string"}, {"type": "integer"}]}) == "JSON"
+
+
+def test_envelope_columns_store_text_results_as_varchar() -> None:
+    columns = envelope_columns(None, include_input=True)
+
+    assert columns["result"] == "VARCHAR"
+    assert columns["input"] == "JSON"
+    assert "input" not in envelope_columns(None, include_input=False)
+
+
+def _envelope(identity: int | str, *, ok: bool = True) -> dict[str, object]:
+    return {
+        "id": identity,
+        "row_number": identity if isinstance(identity, int) else 1,
+        "ok": ok,
+        "result": {"label": "A", "score": 0.5, "tags": ["x"]} if ok else None,
+        "error": None if ok else {"type": "Oops", "message": "bad"},
+        "input": {"nested": [1, {"k": "v"}]},
+    }
+
+
+def test_parquet_writer_appends_row_group_parts_and_resume_reads_ids(tmp_path) -> None:
+    pytest.importorskip("duckdb")
+    path = tmp_path / "out.parquet"
+    columns = envelope_columns(Ticket.model_json_schema(), include_input=True)
+
+    with ParquetRecordWriter(path, columns, append=False, row_group_rows=2) as writer:
+        for identity in (1, 2, 3):
+            writer.write(_envelope(identity, ok=identity != 2))
+    assert [part.name for part in parquet_part_paths(path)] == [
+        "part-00000.parquet",
+        "part-00001.parquet",
+    ]
+    assert load_completed_ids(path) == {1, 3}
+
+    with ParquetRecordWriter(path, columns, append=True) as writer:
+        writer.write(_envelope(4))
+    assert len(parquet_part_paths(path)) == 3
+
+    rows = BatchOutputRows(path)
+    assert len(rows) == 4
+    assert [row["id"] for row in rows] == [1, 2, 3, 4]
+    assert rows[0]["result"] == {"label": "A", "score": 0.5, "tags": ["x"], "priority": None}
+    assert rows[0]["input"] == {"nested": [1, {"k": "v"}]}
+    assert rows[1]["error"] == {"type": "Oops", "message": "bad"}
+
+
+def test_parquet_writer_keeps_row_group_when_one_result_does_not_fit(tmp_path) -> None:
+    pytest.importorskip("duckdb")
+    path = tmp_path / "out.parquet"
+    columns = envelope_columns(Ticket.model_json_schema(), include_input=False)
+
+    with ParquetRecordWriter(path, columns, append=False) as writer:
+        writer.write(_envelope(1))
+        writer.write({**_envelope(2), "result": {"label": "B", "score": "high", "tags": []}})
+        writer.write(_envelope(3))
+
+    rows = list(BatchOutputRows(path))
+    assert [row["ok"] for row in rows] == [True, False, True]
+    assert rows[1]["result"] is None
+    assert rows[1]["error"]["type"] == "ParquetTypeError"
+    assert load_completed_ids(path) == {1, 3}
+
+
+def test_parquet_writer_rejects_mixed_id_types(tmp_path) -> None:
+    pytest.importorskip("duckdb")
+    columns = envelope_columns(None, include_input=False)
+
+    with ParquetRecordWriter(tmp_path / "out.parquet", columns, append=False) as writer:
+        writer.write({"id": 1, "row_number": 1, "ok": True, "result": "a", "error": None})
+        with pytest.raises(ValueError, match="mixes integer and string ids"):
+            writer.write({"id": "2", "row_number": 2, "ok": True, "result": "b", "error": None})
+
+
+@pytest.mark.asyncio
+async def test_batch_runner_writes_and_resumes_parquet_output(tmp_path) -> None:
+    pytest.importorskip("duckdb")
+    home = tmp_path / "env"
+    home.mkdir()
+    input_path = tmp_path / "rows.jsonl"
+    output_path = tmp_path / "out.parquet"
+    telemetry_path = tmp_path / "telemetry.parquet"
+    input_path.write_text('{"topic":"billing"}\n{"topic":"refunds"}\n', encoding="utf-8")
+
+    runner = BatchRunner(home=home)
+    result = await runner.run(
+        input=input_path,
+        output_path=output_path,
+        template="Topic: {{topic}}",
+        model="passthrough",
+        telemetry_path=telemetry_path,
+        limit=1,
+    )
+    assert [row["result"] for row in result.rows] == ["Topic: billing"]
+
+    resumed = await runner.run(
+        input=input_path,
+        output_path=output_path,
+        template="Topic: {{topic}}",
+        model="passthrough",
+        telemetry_path=telemetry_path,
+        resume=True,
+    )
+
+    assert resumed.summary["skipped_rows"] == 1
+    assert [row["result"] for row in resumed.rows] == ["Topic: billing", "Topic: refunds"]
+    assert len(BatchOutputRows(telemetry_path)) == 2
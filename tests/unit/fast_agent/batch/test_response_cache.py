@@ -0,0 +1,105 @@
+import pytest
+
+from fast_agent.batch import BatchRunner
+from fast_agent.batch.cache import BatchResponseCache, response_cache_key
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_key_covers_prompt_and_worker_identity() -> None:
+    identity = {"model": "gpt-test", "instruction": "Classify.", "schema": None}
+
+    key = response_cache_key(identity, "row one")
+
+    assert key == response_cache_key(dict(identity), "row one")
+    assert key != response_cache_key(identity, "row two")
+    assert key != response_cache_key({**identity, "model": "other"}, "row one")
+    assert key != response_cache_key({**identity, "schema": {"type": "object"}}, "row one")
+
+
+def test_cache_round_trips_results_and_expires_by_ttl(tmp_path) -> None:
+    clock = _Clock()
+    path = tmp_path / "cache.sqlite"
+
+    with BatchResponseCache(path, ttl_seconds=60, clock=clock) as cache:
+        cache.put("a", {"label": "A", "tags": ["x"]})
+        hit = cache.get("a")
+        clock.now += 61
+        expired = cache.get("a")
+        summary = cache.summary()
+
+    assert hit is not None
+    assert hit.result == {"label": "A", "tags": ["x"]}
+    assert expired is None
+    assert summary["hits"] == 1
+    assert summary["misses"] == 1
+    assert summary["writes"] == 1
+    assert summary["expired"] == 1
+    assert summary["entries"] == 0
+
+
+def test_cache_size_budget_evicts_least_recently_used(tmp_path) -> None:
+    clock = _Clock()
+    path = tmp_path / "cache.sqlite"
+    with BatchResponseCache(path, clock=clock) as cache:
+        for key in ("a", "b", "c"):
+            clock.now += 1
+            cache.put(key, "x" * 100)
+        clock.now += 1
+        assert cache.get("a") is not None
+
+    with BatchResponseCache(path, max_bytes=250, clock=clock) as cache:
+        assert cache.stats.evicted == 1
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+
+@pytest.mark.asyncio
+async def test_batch_runner_serves_repeated_rows_from_cache(tmp_path) -> None:
+    home = tmp_path / "env"
+    home.mkdir()
+    input_path = tmp_path / "rows.jsonl"
+    cache_path = tmp_path / "responses.sqlite"
+    input_path.write_text('{"topic":"billing"}\n{"topic":"refunds"}\n', encoding="utf-8")
+    runner = BatchRunner(home=home)
+
+    first = await runner.run(
+        input=input_path,
+        output_path=tmp_path / "first.jsonl",
+        template="Topic: {{topic}}",
+        model="passthrough",
+        cache_path=cache_path,
+    )
+    assert [row["cached"] for row in first.rows] == [False, False]
+    assert first.summary["response_cache"]["writes"] == 2
+
+    input_path.write_text(
+        '{"topic":"billing"}\n{"topic":"refunds"}\n{"topic":"shipping"}\n',
+        encoding="utf-8",
+    )
+    dry_run = await runner.run(
+        input=input_path,
+        output_path=tmp_path / "dry-run.jsonl",
+        template="Topic: {{topic}}",
+        model="passthrough",
+        cache_path=cache_path,
+        cache_only=True,
+    )
+
+    assert [(row["ok"], row["cached"]) for row in dry_run.rows] == [
+        (True, True),
+        (True, True),
+        (False, False),
+    ]
+    assert dry_run.rows[0]["result"] == "Topic: billing"
+    assert dry_run.rows[2]["error"]["type"] == "CacheMiss"
+    assert dry_run.summary["response_cache"]["hits"] == 2
+    assert dry_run.summary["response_cache"]["misses"] == 1
+    assert dry_run.summary["response_cache"]["entries"] == 2
@@ -1,8 +1,13 @@
+import json
 from pathlib import Path
+from types import SimpleNamespace
 from typing import cast
 
+from mcp_types import ImageContent, TextContent
+
 from fast_agent.batch.traces import BatchTraceRecorder, HuggingFaceDatasetFolderUploader
 from fast_agent.interfaces import AgentProtocol
+from fast_agent.mcp.prompt_message_extended import PromptMessageExtended
 
 
 class RecordingHubApi:
@@ -71,6 +76,41 @@ def test_trace_recorder_initialize_preserves_manifest_for_resume(tmp_path: Path)
     assert manifest.read_text(encoding="utf-8") == '{"row_number":1}\n'
 
 
+def test_trace_recorder_shares_hashed_attachments_across_rows(tmp_path: Path) -> None:
+    trace_dir = tmp_path / "traces"
+    agent = SimpleNamespace(
+        name="worker", instruction="", llm=None, config=SimpleNamespace(model=None)
+    )
+    recorder = BatchTraceRecorder(
+        trace_dir=trace_dir,
+        agent=cast("AgentProtocol", agent),
+        run_metadata={},
+        hash_attachments=True,
+    )
+    recorder.initialize()
+    image = ImageContent(type="image", data="aW1hZ2U=", mime_type="image/png")
+
+    for row in (1, 2):
+        recorder.start_row(row_number=row, identity=row, rendered="describe")
+        recorder.finish_row(
+            ok=True,
+            response=PromptMessageExtended(
+                role="assistant",
+                content=[TextContent(type="text", text="see"), image],
+            ),
+        )
+
+    assert len(list((trace_dir / "attachments").iterdir())) == 1
+    manifest = [
+        json.loads(line)
+        for line in (trace_dir / "manifest.jsonl").read_text(encoding="utf-8").splitlines()
+    ]
+    for entry in manifest:
+        trace = (trace_dir / entry["trace"]).read_text(encoding="utf-8")
+        assert "base64" not in trace
+        assert '"attachments/' in trace
+
+
 def test_hf_dataset_folder_uploader_uploads_directory_once(tmp_path: Path) -> None:
     api = RecordingHubApi()
     trace_dir = tmp_path / "traces"
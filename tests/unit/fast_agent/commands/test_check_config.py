@@ -3,17 +3,20 @@ from fast_agent.cli.commands.check_config import (
     DEFAULT_OPENRESPONSES_BASE_URL,
     Provider,
     _adjacent_settings_pairs,
+    _CheckSummaryContext,
     _collect_environment_rows,
     _effective_home_override,
     _extract_skills_directories,
     _format_provider_row,
     _format_step_interval,
+    _render_startup_timings_panel,
     _should_warn_for_provider,
     _split_model_specs,
     _split_provider_status_rows,
     _truncate_server_display,
     _truncate_summary_text,
     check_api_keys,
+    console,
 )
 
 
@@ -227,3 +230,34 @@ def test_collect_environment_rows_reports_custom_import_errors(tmp_path, monkeyp
     assert row_by_name["staging"][0] == "custom"
     assert "Could not import custom environment module missing.module" in row_by_name["staging"][2]
     assert "Valid names: local, staging" in row_by_name["staging"][2]
+
+
+def test_startup_timings_panel_shows_last_recorded_startup(tmp_path) -> None:
+    from types import SimpleNamespace
+    from typing import cast
+
+    from fast_agent.config import Settings
+    from fast_agent.core.startup_timings import StartupTimings, save_startup_timings
+
+    # The panel only reads home_paths.root from the check context.
+    context = cast(
+        "_CheckSummaryContext", SimpleNamespace(home_paths=SimpleNamespace(root=tmp_path))
+    )
+    with console.capture() as empty:
+        _render_startup_timings_panel(context)
+    assert empty.get() == ""
+
+    timings = StartupTimings(concurrency=4)
+    origin = timings._origin
+    timings.record("worker", "basic", level=0, started=origin, finished=origin + 1.5)
+    timings.record("lead", "chain", level=1, started=origin + 1.5, finished=origin + 1.75)
+    timings.finish()
+    save_startup_timings(timings, Settings(home=str(tmp_path)))
+
+    with console.capture() as captured:
+        _render_startup_timings_panel(context)
+    output = captured.get()
+    assert "2 agents" in output
+    assert "up to 4 at once" in output
+    assert "worker" in output and "1.50s" in output
+    assert "lead" in output and "+1.50s" in output
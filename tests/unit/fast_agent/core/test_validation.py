@@ -409,3 +409,151 @@ async def test_create_custom_agent_requires_class_reference(tmp_path) -> None:
             )
     finally:
         await core.cleanup()
+
+
+class _StartupProbe:
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+        self.shutdown: list[str] = []
+        self.hanging = asyncio.Event()
+
+
+_STARTUP_PROBE = _StartupProbe()
+
+
+class _SlowStartAgent(LlmAgent):
+    async def initialize(self) -> None:
+        _STARTUP_PROBE.active += 1
+        _STARTUP_PROBE.peak = max(_STARTUP_PROBE.peak, _STARTUP_PROBE.active)
+        try:
+            await asyncio.sleep(0.02)
+            if self.name.startswith("broken"):
+                raise AgentConfigError(f"{self.name} failed to start")
+        finally:
+            _STARTUP_PROBE.active -= 1
+        await super().initialize()
+
+    async def shutdown(self) -> None:
+        _STARTUP_PROBE.shutdown.append(self.name)
+        await super().shutdown()
+
+    def add_agent_tool(self, child, *, name=None, description=None) -> str:
+        return name or child.name
+
+
+class _HangingStartAgent(_SlowStartAgent):
+    async def initialize(self) -> None:
+        _STARTUP_PROBE.hanging.set()
+        await asyncio.Event().wait()
+
+
+def _slow_start_agents(
+    names: list[str], **extra: dict[str, object]
+) -> dict[str, dict[str, object]]:
+    return {
+        name: {
+            "config": AgentConfig(name=name, instruction="Work.", model="passthrough"),
+            "type": AgentType.CUSTOM.value,
+            "cls": _SlowStartAgent,
+            **extra.get(name, {}),
+        }
+        for name in names
+    }
+
+
+@pytest.mark.asyncio
+async def test_dependency_level_builds_concurrently_in_declaration_order(tmp_path) -> None:
+    from fast_agent.core.startup_timings import StartupTimings
+
+    global _STARTUP_PROBE
+    _STARTUP_PROBE = _StartupProbe()
+    config_path = tmp_path / "fastagent.config.yaml"
+    config_path.write_text("agent_startup_concurrency: 2\n", encoding="utf-8")
+    names = ["delta", "alpha", "charlie", "bravo"]
+    agents_dict = _slow_start_agents(names + ["lead"], lead={"child_agents": names})
+
+    timings = StartupTimings()
+    core = Core(settings=str(config_path))
+    await core.initialize()
+    try:
+        agents = await create_agents_in_dependency_order(
+            _ContextCoreShim(core.context),
+            agents_dict,
+            cast("ModelFactoryFunctionProtocol", _passthrough_model_factory),
+            startup_timings=timings,
+        )
+    finally:
+        await core.cleanup()
+
+    assert _STARTUP_PROBE.peak == 2
+    assert list(agents) == [*names, "lead"]
+    assert [(t.name, t.level) for t in timings.agents] == [
+        *((name, 0) for name in names),
+        ("lead", 1),
+    ]
+    assert timings.concurrency == 2
+    assert timings.total_seconds >= sum(timings.level_seconds().values())
+
+
+@pytest.mark.asyncio
+async def test_failed_startup_shuts_down_built_agents(tmp_path) -> None:
+    global _STARTUP_PROBE
+    _STARTUP_PROBE = _StartupProbe()
+    config_path = tmp_path / "fastagent.config.yaml"
+    config_path.write_text("", encoding="utf-8")
+    agents_dict = _slow_start_agents(
+        ["worker", "broken_b", "sibling", "broken_a", "lead"],
+        lead={"child_agents": ["worker"]},
+        broken_b={"child_agents": ["worker"]},
+        sibling={"child_agents": ["worker"]},
+        broken_a={"child_agents": ["worker"]},
+    )
+
+    core = Core(settings=str(config_path))
+    await core.initialize()
+    try:
+        with pytest.raises(AgentConfigError, match="broken_b failed to start"):
+            await create_agents_in_dependency_order(
+                _ContextCoreShim(core.context),
+                agents_dict,
+                cast("ModelFactoryFunctionProtocol", _passthrough_model_factory),
+            )
+    finally:
+        await core.cleanup()
+
+    # Level 1 siblings that finished are released first, then the level 0 worker.
+    assert _STARTUP_PROBE.shutdown == ["sibling", "lead", "worker"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_startup_shuts_down_agents_built_in_current_level(tmp_path) -> None:
+    global _STARTUP_PROBE
+    _STARTUP_PROBE = _StartupProbe()
+    config_path = tmp_path / "fastagent.config.yaml"
+    # One build at a time, so "sibling" is registered before "hanging" starts.
+    config_path.write_text("agent_startup_concurrency: 1\n", encoding="utf-8")
+    agents_dict = _slow_start_agents(
+        ["worker", "sibling", "hanging"],
+        sibling={"child_agents": ["worker"]},
+        hanging={"child_agents": ["worker"], "cls": _HangingStartAgent},
+    )
+
+    core = Core(settings=str(config_path))
+    await core.initialize()
+    try:
+        startup = asyncio.create_task(
+            create_agents_in_dependency_order(
+                _ContextCoreShim(core.context),
+                agents_dict,
+                cast("ModelFactoryFunctionProtocol", _passthrough_model_factory),
+            )
+        )
+        await _STARTUP_PROBE.hanging.wait()
+        startup.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await startup
+    finally:
+        await core.cleanup()
+
+    assert _STARTUP_PROBE.shutdown == ["sibling", "worker"]
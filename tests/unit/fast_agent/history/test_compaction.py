@@ -1,5 +1,6 @@
 """Unit tests for conversation history compaction."""
 
+import asyncio
 import json
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -24,6 +25,7 @@ from fast_agent.history.compaction import (
     LEGACY_SUMMARY_NOTICE,
     SUMMARY_NOTICE,
     CompactionSkipped,
+    Precompactor,
     _plan_compaction_with_budget,
     _plan_mid_turn_compaction,
     build_summary_message,
@@ -626,6 +628,97 @@ class TestCompactConversation:
         await persist_compacted_session(agent, no_home=True)
 
 
+class _SideLLM(_FakeLLM):
+    """Summarizer that waits for ``release`` and records a priced usage turn."""
+
+    def __init__(self, summary: str) -> None:
+        super().__init__(summary)
+        self.release = asyncio.Event()
+        self.usage_accumulator = UsageAccumulator()
+
+    async def generate(self, messages, request_params=None, tools=None):
+        from fast_agent.llm.provider_types import Provider
+        from fast_agent.llm.usage_tracking import (
+            CompletionTokenUsage,
+            PromptTokenUsage,
+            TurnUsage,
+            UsageSchema,
+        )
+
+        await self.release.wait()
+        self.usage_accumulator.add_turn(
+            TurnUsage(
+                provider=Provider.OPENAI,
+                usage_schema=UsageSchema.OPENAI_CHAT,
+                model="fake",
+                prompt=PromptTokenUsage(total=900),
+                completion=CompletionTokenUsage(total=100),
+                cost_usd=0.25,
+            )
+        )
+        return await super().generate(messages, request_params, tools)
+
+
+class _PrecompactingAgent(_FakeAgent):
+    def __init__(self, history: list[PromptMessageExtended]) -> None:
+        super().__init__(history)
+        self.side_llm = _SideLLM("background summary")
+
+    def spawn_side_llm(self) -> _SideLLM:
+        return self.side_llm
+
+
+@pytest.mark.unit
+@pytest.mark.anyio
+class TestPrecompactor:
+    async def test_applies_finished_summary_and_keeps_newer_turns(self):
+        agent = _PrecompactingAgent(_turn("one", "1") + _turn("two", "2") + _turn("three", "3"))
+        settings = CompactionSettings(keep_turns=1, precompact_threshold=0.5)
+        precompactor = Precompactor()
+
+        assert precompactor.start(agent, settings)
+        assert await precompactor.apply(agent, settings, wait=False) is None
+
+        # The conversation keeps going while the summary is generated.
+        agent.message_history.extend(_turn("four", "4"))
+        agent.side_llm.release.set()
+        applied = await precompactor.apply(agent, settings, wait=True)
+
+        assert applied is not None
+        assert agent.llm.requests == []
+        summarized = agent.side_llm.requests[0]
+        assert [m.first_text() for m in summarized[:-1]] == ["one", "1", "two", "2"]
+        assert is_compaction_message(agent.message_history[0])
+        assert [m.first_text() for m in agent.message_history[1:]] == ["three", "3", "four", "4"]
+        assert applied.result.tokens_before == 90_000
+        assert agent.usage_accumulator.current_context_tokens == (
+            applied.result.tokens_after_estimate
+        )
+        assert agent.usage_accumulator.summary.total == 1000
+        assert precompactor.stats.applied == 1
+        assert not precompactor.pending
+
+    async def test_changed_prefix_discards_summary_as_wasted(self):
+        history = _turn("one", "1") + _turn("two", "2") + _turn("three", "3")
+        agent = _PrecompactingAgent(history)
+        settings = CompactionSettings(keep_turns=1, precompact_threshold=0.5)
+        precompactor = Precompactor()
+
+        assert precompactor.start(agent, settings)
+        agent.side_llm.release.set()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        agent.load_message_history(_turn("fresh", "start"))
+
+        assert await precompactor.apply(agent, settings, wait=True) is None
+        assert [m.first_text() for m in agent.message_history] == ["fresh", "start"]
+        assert precompactor.stats.discarded == 1
+        assert precompactor.stats.wasted_tokens == 1000
+        assert precompactor.stats.wasted_cost_usd == pytest.approx(0.25)
+        # The summary call's prompt does not replace the conversation's context size.
+        assert agent.usage_accumulator.current_context_tokens == 90_000
+
+
 @pytest.mark.unit
 class TestUsageEstimateOverride:
     def test_add_turn_clears_estimate(self):
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 from types import SimpleNamespace
 from typing import Any, cast
 
 import pytest
+from mcp_types import TextContent
 
 from fast_agent.agents.agent_types import AgentConfig
 from fast_agent.config import CompactionSettings, Settings
@@ -132,3 +134,62 @@ async def test_mid_turn_auto_compaction_preserves_active_turn(
 
     assert kwargs_seen
     assert kwargs_seen[0]["recent_tool_exchanges"] == MID_TURN_RECENT_TOOL_EXCHANGES
+
+
+@pytest.mark.asyncio
+async def test_background_precompaction_applies_at_next_turn_boundary(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    agent = _Agent("source")
+    agent.context = Context(
+        config=Settings(
+            session_history=False,
+            compaction=CompactionSettings(threshold=0.8, precompact_threshold=0.5, keep_turns=1),
+        )
+    )
+    agent.usage_accumulator.set_context_window_size(100_000)
+    agent.usage_accumulator.set_context_estimate(60_000)
+    for text in ("one", "two", "three"):
+        agent.message_history.append(
+            PromptMessageExtended(role="user", content=[TextContent(type="text", text=text)])
+        )
+        agent.message_history.append(_complete_message())
+
+    summaries: list[str] = []
+
+    class _SideLlm:
+        verb = None
+        usage_accumulator = UsageAccumulator()
+
+        async def generate(self, messages: list[PromptMessageExtended], *_args, **_kwargs):
+            summaries.append(messages[0].first_text())
+            return PromptMessageExtended(
+                role="assistant", content=[TextContent(type="text", text="summary")]
+            )
+
+    cast("Any", agent).spawn_side_llm = _SideLlm
+
+    async def fail_compact(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError("a ready background summary must replace synchronous compaction")
+
+    monkeypatch.setattr("fast_agent.hooks.compaction.compact_conversation", fail_compact)
+
+    def after_turn() -> HookContext:
+        return HookContext(
+            runner=_Runner(agent),
+            agent=agent,
+            message=_complete_message(),
+            hook_type="after_turn_complete",
+        )
+
+    await auto_compact_history(after_turn())
+    assert len(agent.message_history) == 6
+    await asyncio.sleep(0)
+
+    agent.usage_accumulator.set_context_estimate(85_000)
+    await auto_compact_history(after_turn())
+
+    assert summaries == ["one"]
+    assert len(agent.message_history) == 3
+    assert agent.message_history[0].first_text().startswith("[COMPACTED HISTORY]")
+    assert agent.message_history[1].first_text() == "three"
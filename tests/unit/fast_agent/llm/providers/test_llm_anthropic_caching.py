@@ -564,6 +564,7 @@ class TestAnthropicCaching:
 
         assert [tool["name"] for tool in first] == ["zeta", "alpha"]
         assert second == first
+        assert all(a is b for a, b in zip(first, second, strict=True))
 
     @pytest.mark.asyncio
     async def test_cache_diagnostics_links_consecutive_requests(self):
@@ -5,7 +5,9 @@ from contextlib import asynccontextmanager
 from types import SimpleNamespace
 from typing import TYPE_CHECKING, Any, cast
 
+import httpx
 import pytest
+from openai import BadRequestError
 from openai.types.responses import (
     Response,
     ResponseCreatedEvent,
@@ -245,3 +247,122 @@ async def test_safety_buffering_notice_reaches_listener_before_response_complete
     assert response.stop_reason == LlmStopReason.SAFETY
     assert "gpt-test-fast" in (response.last_text() or "")
     assert not harness.sse_stream.release_terminal.is_set()
+
+
+def _user_item(text: str) -> dict[str, Any]:
+    return {
+        "type": "message",
+        "role": "user",
+        "content": [{"type": "input_text", "text": text}],
+    }
+
+
+def _assistant_item(text: str) -> dict[str, Any]:
+    return {
+        "type": "message",
+        "role": "assistant",
+        "content": [{"type": "output_text", "text": text}],
+    }
+
+
+class _ContinuationSseHarness(_SimulatedSseMixin, ResponsesLLM):
+    def __init__(self, *, http_continuation: bool = True) -> None:
+        ResponsesLLM.__init__(
+            self,
+            model="gpt-test",
+            transport="sse",
+            http_continuation=http_continuation,
+        )
+        self.sent_arguments: list[dict[str, Any]] = []
+        self.missing_previous_response = False
+
+    def _build_response_args(
+        self,
+        input_items: list[dict[str, Any]],
+        request_params: RequestParams,
+        tools: list[Tool] | None,
+    ) -> dict[str, Any]:
+        arguments = super()._build_response_args(input_items, request_params, tools)
+        arguments["store"] = False
+        return arguments
+
+    @asynccontextmanager
+    async def _response_sse_stream(
+        self,
+        *,
+        client: Any,
+        arguments: dict[str, Any],
+        timeout_seconds: float | None = None,
+    ) -> AsyncIterator[_DelayedResponsesSseStream]:
+        del client, timeout_seconds
+        self.sent_arguments.append(arguments)
+        if self.missing_previous_response and "previous_response_id" in arguments:
+            request = httpx.Request("POST", "https://api.openai.com/v1/responses")
+            raise BadRequestError(
+                "Previous response with id 'resp_1' not found.",
+                response=httpx.Response(400, request=request),
+                body={"code": "previous_response_not_found"},
+            )
+        stream = _DelayedResponsesSseStream()
+        stream.final_response.id = f"resp_{len(self.sent_arguments)}"
+        stream.release_terminal.set()
+        yield stream
+
+    async def run(self, input_items: list[dict[str, Any]]) -> None:
+        await self._responses_completion_sse(
+            input_items=input_items,
+            request_params=RequestParams(model="gpt-test", streaming_timeout=1.0),
+            tools=None,
+            model_name="gpt-test",
+        )
+        self._last_transport_used = "sse"
+
+
+@pytest.mark.asyncio
+async def test_http_continuation_sends_incremental_input_with_previous_response_id() -> None:
+    harness = _ContinuationSseHarness()
+
+    await harness.run([_user_item("hello")])
+    await harness.run([_user_item("hello"), _assistant_item("hi"), _user_item("again")])
+
+    first, second = harness.sent_arguments
+    assert first["store"] is True
+    assert "previous_response_id" not in first
+    assert second["store"] is True
+    assert second["previous_response_id"] == "resp_1"
+    assert second["input"] == [_user_item("again")]
+
+    diagnostics = harness._transport_diagnostics_payload()
+    assert diagnostics["http_request_mode"] == "continuation"
+    assert diagnostics["http_payload_saved_bytes"] > 0
+    assert diagnostics["http_payload_saved_bytes_total"] == diagnostics["http_payload_saved_bytes"]
+
+
+@pytest.mark.asyncio
+async def test_http_continuation_resends_full_input_when_stored_response_missing() -> None:
+    harness = _ContinuationSseHarness()
+    await harness.run([_user_item("hello")])
+    harness.missing_previous_response = True
+
+    full_input = [_user_item("hello"), _assistant_item("hi"), _user_item("again")]
+    await harness.run(full_input)
+
+    _first, continuation, resend = harness.sent_arguments
+    assert continuation["previous_response_id"] == "resp_1"
+    assert "previous_response_id" not in resend
+    assert resend["input"] == full_input
+    assert harness._transport_diagnostics_payload()["http_request_mode"] == "create"
+
+
+@pytest.mark.asyncio
+async def test_http_continuation_is_opt_in() -> None:
+    harness = _ContinuationSseHarness(http_continuation=False)
+
+    await harness.run([_user_item("hello")])
+    await harness.run([_user_item("hello"), _assistant_item("hi"), _user_item("again")])
+
+    assert all("previous_response_id" not in args for args in harness.sent_arguments)
+    assert all(args["store"] is False for args in harness.sent_arguments)
+    assert len(harness.sent_arguments[1]["input"]) == 3
+    assert "http_request_mode" not in harness._transport_diagnostics_payload()
+    assert harness._sse_request_planner is None
@@ -0,0 +1,174 @@
+import random
+import sys
+from types import SimpleNamespace
+
+import pytest
+from mcp_types import CallToolRequest, CallToolRequestParams, ImageContent, TextContent
+
+from fast_agent.history.compaction import estimate_tokens
+from fast_agent.llm.token_estimation import (
+    HeuristicTokenCounter,
+    TiktokenCounter,
+    TokenCounts,
+    TokenEstimator,
+)
+from fast_agent.types import PromptMessageExtended
+
+
+class _CountingCounter(HeuristicTokenCounter):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def count(self, text: str, *, model: str | None = None) -> int:
+        self.calls += 1
+        return super().count(text, model=model)
+
+
+def _user(text: str) -> PromptMessageExtended:
+    return PromptMessageExtended(role="user", content=[TextContent(type="text", text=text)])
+
+
+def test_heuristic_counts_cjk_per_character() -> None:
+    counter = HeuristicTokenCounter()
+
+    assert counter.count("x" * 1200) == 300
+    assert counter.count("你好世界" * 100) == 400
+    assert counter.count("") == 0
+
+
+def test_message_counts_are_cached_until_the_message_changes() -> None:
+    counter = _CountingCounter()
+    estimator = TokenEstimator(counter)
+    history = [_user("hello there"), _user("general kenobi")]
+
+    first = estimator.estimate_messages(history)
+    calls = counter.calls
+    assert estimator.estimate_messages(history) == first
+    assert counter.calls == calls
+
+    history[1].content.append(TextContent(type="text", text="more"))
+    assert estimator.estimate_messages(history) > first
+    assert counter.calls > calls
+
+
+def test_cached_counts_are_keyed_by_model_and_loaded_encoding(monkeypatch) -> None:
+    monkeypatch.setitem(sys.modules, "tiktoken", _fake_tiktoken(str.split))
+    counter = TiktokenCounter()
+    estimator = TokenEstimator(counter)
+    history = [_user("one two three " * 10)]
+
+    # Until the encoding loads, the heuristic counts the characters.
+    assert estimator.estimate_messages(history, model="m") == 35
+    counter.load("cl100k_base")
+
+    assert estimator.estimate_messages(history, model="m") == 30
+    assert estimator.estimate_messages(history, model="other") == 30
+    assert len(estimator._cache) == 3
+
+
+def test_images_and_tool_traffic_are_counted_by_kind() -> None:
+    estimator = TokenEstimator()
+    message = _user("look")
+    message.content.append(ImageContent(type="image", data="x" * 400_000, mime_type="image/png"))
+    message.tool_calls = {
+        "call-1": CallToolRequest(
+            method="tools/call",
+            params=CallToolRequestParams(name="search", arguments={"q": "x" * 400}),
+        )
+    }
+
+    counts = estimator.count_messages([message])
+
+    assert counts.image > 100_000
+    assert counts.structured > 100
+    assert counts.text == 1
+
+
+def test_calibration_learns_per_kind_factors_from_prompt_totals() -> None:
+    rng = random.Random(7)
+    estimator = TokenEstimator()
+
+    def provider_total(counts: TokenCounts) -> int:
+        # Text tokenizes densely, JSON sparsely, and images cost far less than
+        # their base64 size suggests.
+        return round(1.6 * counts.text + 0.7 * counts.structured + 0.02 * counts.image)
+
+    for _ in range(300):
+        counts = TokenCounts(
+            text=rng.randint(100, 5000),
+            structured=rng.randint(0, 5000),
+            image=rng.choice((0, 0, rng.randint(50_000, 200_000))),
+        )
+        estimator.observe("dense-model", counts, provider_total(counts))
+
+    for text, structured, image in ((4000, 100, 0), (200, 4000, 0), (2000, 2000, 100_000)):
+        counts = TokenCounts(text=text, structured=structured, image=image)
+        calibration = estimator.calibration("dense-model")
+        assert calibration is not None
+        assert calibration.apply(counts) == pytest.approx(provider_total(counts), rel=0.05)
+
+    # Other models are unaffected.
+    assert estimator.calibration("other-model") is None
+
+
+def test_compaction_estimate_applies_model_calibration(monkeypatch) -> None:
+    estimator = TokenEstimator()
+    monkeypatch.setattr("fast_agent.history.compaction.token_estimator", lambda: estimator)
+    history = [_user("x" * 4000)]
+
+    assert estimate_tokens(history, model="m") == 1000
+    for _ in range(20):
+        estimator.observe("m", TokenCounts(text=1000), 1500)
+
+    assert estimate_tokens(history, model="m") == pytest.approx(1500, rel=0.02)
+    assert estimate_tokens(history) == 1000
+
+
+def _fake_tiktoken(encode, *, known_models: tuple[str, ...] = ()) -> SimpleNamespace:
+    def encoding_name_for_model(model: str) -> str:
+        if model not in known_models:
+            raise KeyError(model)
+        return "o200k_base"
+
+    return SimpleNamespace(
+        encoding_name_for_model=encoding_name_for_model,
+        get_encoding=lambda name: SimpleNamespace(name=name, encode=encode),
+    )
+
+
+def test_tiktoken_counter_uses_default_encoding_for_unknown_models(monkeypatch) -> None:
+    monkeypatch.setitem(sys.modules, "tiktoken", _fake_tiktoken(str.split))
+    counter = TiktokenCounter()
+
+    assert counter.encoding_name("unknown-model") == "cl100k_base"
+    counter.load("cl100k_base")
+    assert counter.count("abcdefgh ijkl", model="unknown-model") == 2
+
+
+def test_tiktoken_counter_does_not_hide_encoder_runtime_failures(monkeypatch) -> None:
+    def broken_encode(_text: str) -> list[int]:
+        raise RuntimeError("encoder failed")
+
+    monkeypatch.setitem(
+        sys.modules, "tiktoken", _fake_tiktoken(broken_encode, known_models=("known-model",))
+    )
+    counter = TiktokenCounter()
+    counter.load("o200k_base")
+
+    with pytest.raises(RuntimeError, match="encoder failed"):
+        counter.count("hello", model="known-model")
+
+
+def test_tiktoken_counter_falls_back_when_encoding_cannot_load(monkeypatch) -> None:
+    def offline(_name: str):
+        raise OSError("network unreachable")
+
+    monkeypatch.setitem(
+        sys.modules,
+        "tiktoken",
+        SimpleNamespace(encoding_name_for_model=lambda model: "cl100k_base", get_encoding=offline),
+    )
+    counter = TiktokenCounter()
+    counter.load("cl100k_base")
+
+    assert counter.count("x" * 40) == 10
@@ -0,0 +1,47 @@
+from mcp import Tool
+
+from fast_agent.llm.tool_payload_cache import ToolPayloadCache
+
+
+def _tool(name: str) -> Tool:
+    return Tool(name=name, description=name, input_schema={"type": "object"})
+
+
+def _build(tool: Tool) -> dict[str, str]:
+    return {"name": tool.name}
+
+
+def test_payloads_are_reused_for_identical_tool_objects() -> None:
+    cache: ToolPayloadCache[dict[str, str]] = ToolPayloadCache()
+    tools = [_tool("alpha"), _tool("beta")]
+
+    first = cache.payloads(tools, "model-a", _build)
+    second = cache.payloads(list(tools), "model-a", _build)
+
+    assert first == [{"name": "alpha"}, {"name": "beta"}]
+    assert first is not second
+    assert all(a is b for a, b in zip(first, second, strict=True))
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_payloads_rebuild_for_new_tool_objects_and_variants() -> None:
+    cache: ToolPayloadCache[dict[str, str]] = ToolPayloadCache()
+    alpha = _tool("alpha")
+    cache.payloads([alpha], "model-a", _build)
+
+    cache.payloads([alpha, _tool("beta")], "model-a", _build)
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    cache.payloads([alpha], "model-b", _build)
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_payloads_drop_tools_missing_from_latest_call() -> None:
+    cache: ToolPayloadCache[dict[str, str]] = ToolPayloadCache()
+    alpha, beta = _tool("alpha"), _tool("beta")
+    cache.payloads([alpha, beta], "model-a", _build)
+
+    cache.payloads([alpha], "model-a", _build)
+    cache.payloads([alpha, beta], "model-a", _build)
+
+    assert (cache.hits, cache.misses) == (2, 3)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import random
 from pathlib import Path
 
 import pytest
@@ -18,8 +19,10 @@ from fast_agent.llm.usage_tracking import (
     PromptTokenUsage,
     TurnUsage,
     UsageAccumulator,
+    UsageColumns,
     UsageReport,
     UsageSchema,
+    summarize_usage,
     usage_from_anthropic,
     usage_from_google_generate_content,
     usage_from_google_usage_metadata,
@@ -337,6 +340,87 @@ def test_aggregation_uses_complete_data_semantics_per_metric() -> None:
     assert accumulator.summary.total == 35
 
 
+def _random_turn(rng: random.Random, timestamp: float) -> TurnUsage:
+    def maybe(value: int) -> int | None:
+        return None if rng.random() < 0.05 else value
+
+    prompt_total = rng.randint(0, 5000)
+    completion_total = rng.randint(0, 800)
+    return TurnUsage(
+        provider=Provider.OPENAI,
+        usage_schema=UsageSchema.OPENAI_CHAT,
+        model="gpt",
+        prompt=PromptTokenUsage(
+            total=maybe(prompt_total),
+            uncached=maybe(rng.randint(0, prompt_total)),
+            cache_read=maybe(rng.randint(0, prompt_total)),
+            cache_write=maybe(rng.randint(0, prompt_total)),
+            tool_use=maybe(rng.randint(0, prompt_total)),
+        ),
+        completion=CompletionTokenUsage(
+            total=maybe(completion_total),
+            reasoning=maybe(rng.randint(0, completion_total)),
+        ),
+        tool_calls=rng.randint(0, 3),
+        timestamp=timestamp,
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_incremental_summary_matches_summarize_usage(seed: int) -> None:
+    rng = random.Random(seed)
+    accumulator = UsageAccumulator()
+    reference: list[TurnUsage] = []
+
+    for index in range(300):
+        turn = _random_turn(rng, timestamp=1000.0 + index)
+        accumulator.add_turn(turn)
+        reference.append(turn)
+        if rng.random() < 0.3:
+            accumulator.count_tools(rng.randint(0, 5))
+        if index % 37 == 0:
+            assert accumulator.summary == summarize_usage(reference)
+
+    assert accumulator.summary == summarize_usage(reference)
+    for start in (0, 1, 150, 299, 300):
+        assert accumulator.columns.summarize(start) == summarize_usage(reference[start:])
+    assert accumulator.columns.summarize(10, 20) == summarize_usage(reference[10:20])
+
+    # Turns restored or appended without add_turn are folded in on the next read.
+    accumulator.turns = reference[:40]
+    assert accumulator.summary == summarize_usage(reference[:40])
+    accumulator.turns.extend(reference[40:50])
+    assert accumulator.summary == summarize_usage(reference[:50])
+    assert UsageColumns().summarize() == summarize_usage([])
+
+
+def test_rolling_rates_cover_the_trailing_window() -> None:
+    accumulator = UsageAccumulator()
+    for second, cost in ((0.0, 0.01), (50.0, 0.02), (90.0, 0.03)):
+        accumulator.add_turn(
+            TurnUsage(
+                provider=Provider.OPENAI,
+                usage_schema=UsageSchema.OPENAI_CHAT,
+                model="gpt",
+                prompt=PromptTokenUsage(total=100),
+                completion=CompletionTokenUsage(total=20),
+                cost_usd=cost,
+                timestamp=second,
+            )
+        )
+
+    rate = accumulator.rate(60.0, now=100.0)
+    assert (rate.provider_attempts, rate.prompt_tokens, rate.completion_tokens) == (2, 200, 40)
+    assert rate.tokens_per_second == pytest.approx(4.0)
+    assert rate.completion_tokens_per_second == pytest.approx(40 / 60)
+    assert rate.cost_usd_per_hour == pytest.approx(0.05 * 60)
+
+    assert accumulator.rate(5.0, now=1000.0).tokens_per_second == 0.0
+    accumulator.turns[-1].cost_usd = None
+    accumulator.turns = list(accumulator.turns)
+    assert accumulator.rate(60.0, now=100.0).cost_usd is None
+
+
 def test_versioned_usage_payload_has_no_legacy_fields() -> None:
     turn = TurnUsage(
         provider=Provider.OPENAI,
@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+import subprocess
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from fast_agent.marketplace import git_mirror, git_sources, update_status
+from fast_agent.marketplace.git_mirror import GitMirrorCache, GitMirrorError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _git(repo: Path, *args: str) -> str:
+    result = subprocess.run(
+        [
+            "git",
+            "-C",
+            str(repo),
+            "-c",
+            "user.name=test",
+            "-c",
+            "user.email=test@example.com",
+            *args,
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+def _commit_file(repo: Path, relative: str, content: str) -> str:
+    path = repo / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", f"update {relative}")
+    return _git(repo, "rev-parse", "HEAD")
+
+
+@pytest.fixture
+def upstream(tmp_path: Path) -> tuple[Path, str]:
+    repo = tmp_path / "upstream"
+    repo.mkdir()
+    _git(repo, "init", "-q", "-b", "main")
+    _commit_file(repo, "skills/alpha/SKILL.md", "alpha v1")
+    _commit_file(repo, "skills/beta/SKILL.md", "beta v1")
+    return repo, repo.as_uri()
+
+
+class _CountingRunner:
+    def __init__(self) -> None:
+        self.commands: list[list[str]] = []
+
+    def __call__(self, args: list[str], **kwargs: Any) -> subprocess.CompletedProcess[str]:
+        self.commands.append(args)
+        return subprocess.run(args, **kwargs)  # noqa: PLW1510
+
+    def network_commands(self) -> list[list[str]]:
+        return [command for command in self.commands if "--mirror" in command or "fetch" in command]
+
+
+def test_installs_from_one_repo_share_a_single_mirror_fetch(
+    tmp_path: Path, upstream: tuple[Path, str]
+) -> None:
+    _, url = upstream
+    runner = _CountingRunner()
+    cache = GitMirrorCache(tmp_path / "mirrors", run_subprocess_fn=runner)
+
+    for index, subdir in enumerate(["skills/alpha", "skills/beta", "skills/alpha"]):
+        destination = tmp_path / f"checkout-{index}"
+        destination.mkdir()
+        cache.checkout(
+            repo_url=url,
+            repo_ref="main",
+            repo_subdir=subdir,
+            destination_dir=destination,
+        )
+        assert (destination / subdir / "SKILL.md").is_file()
+
+    assert cache.fetch_count == 1
+    assert len(runner.network_commands()) == 1
+    assert not (tmp_path / "checkout-0" / "skills" / "beta").exists()
+    assert git_sources.resolve_git_commit(tmp_path / "checkout-0", "HEAD") is not None
+
+
+def test_next_run_fetches_new_commits_into_existing_mirror(
+    tmp_path: Path, upstream: tuple[Path, str]
+) -> None:
+    repo, url = upstream
+    GitMirrorCache(tmp_path / "mirrors").ensure_mirror(url)
+    new_head = _commit_file(repo, "skills/alpha/SKILL.md", "alpha v2")
+
+    runner = _CountingRunner()
+    cache = GitMirrorCache(tmp_path / "mirrors", run_subprocess_fn=runner)
+
+    assert cache.resolve_commit(url, "main") == new_head
+    assert [command[3:5] for command in runner.network_commands()] == [["fetch", "--prune"]]
+
+
+def test_checkout_pins_revision_from_mirror(tmp_path: Path, upstream: tuple[Path, str]) -> None:
+    repo, url = upstream
+    pinned = _git(repo, "rev-parse", "HEAD")
+    _commit_file(repo, "skills/alpha/SKILL.md", "alpha v2")
+    cache = GitMirrorCache(tmp_path / "mirrors")
+    destination = tmp_path / "checkout"
+    destination.mkdir()
+
+    cache.checkout(
+        repo_url=url,
+        repo_ref="main",
+        repo_subdir="skills/alpha",
+        destination_dir=destination,
+        checkout_ref=pinned,
+    )
+
+    assert (destination / "skills/alpha/SKILL.md").read_text(encoding="utf-8") == "alpha v1"
+
+
+def test_missing_branch_raises(tmp_path: Path, upstream: tuple[Path, str]) -> None:
+    _, url = upstream
+    destination = tmp_path / "checkout"
+    destination.mkdir()
+
+    with pytest.raises(GitMirrorError, match="not found"):
+        GitMirrorCache(tmp_path / "mirrors").checkout(
+            repo_url=url,
+            repo_ref="missing",
+            repo_subdir="skills/alpha",
+            destination_dir=destination,
+        )
+
+
+def test_clone_sparse_checkout_and_path_oid_use_active_mirror(
+    tmp_path: Path,
+    upstream: tuple[Path, str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    repo, url = upstream
+    cache = GitMirrorCache(tmp_path / "mirrors")
+    monkeypatch.setattr(git_sources, "_active_git_mirror_cache", lambda: cache)
+    commit = _git(repo, "rev-parse", "HEAD")
+    destination = tmp_path / "checkout"
+    destination.mkdir()
+
+    git_sources.clone_sparse_checkout(
+        repo_url=url,
+        repo_ref=None,
+        repo_subdir="skills/beta",
+        destination_dir=destination,
+    )
+    path_cache: dict = {}
+    found = git_sources.resolve_source_path_oid(
+        repo_url=url,
+        repo_ref="main",
+        repo_path="skills/beta",
+        commit=commit,
+        path_cache=path_cache,
+        source_ref_missing_status="ref_missing",
+        source_unreachable_status="unreachable",
+        source_path_missing_status="path_missing",
+        resolve_local_repo_fn=lambda _url: None,
+    )
+    missing_ref = git_sources.resolve_source_path_oid(
+        repo_url=url,
+        repo_ref="gone",
+        repo_path="skills/beta",
+        commit=commit,
+        path_cache=path_cache,
+        source_ref_missing_status="ref_missing",
+        source_unreachable_status="unreachable",
+        source_path_missing_status="path_missing",
+        resolve_local_repo_fn=lambda _url: None,
+    )
+
+    assert (destination / "skills/beta/SKILL.md").is_file()
+    assert found.status is None
+    assert found.path_oid == _git(repo, "rev-parse", f"{commit}:skills/beta")
+    assert missing_ref.status == "ref_missing"
+    assert cache.fetch_count == 1
+
+
+def test_mirror_is_blobless_and_checkout_fetches_only_needed_blobs(
+    tmp_path: Path, upstream: tuple[Path, str]
+) -> None:
+    repo, url = upstream
+    _git(repo, "config", "uploadpack.allowFilter", "true")
+    _git(repo, "config", "uploadpack.allowAnySHA1InWant", "true")
+    cache = GitMirrorCache(tmp_path / "mirrors")
+    destination = tmp_path / "checkout"
+    destination.mkdir()
+
+    cache.checkout(
+        repo_url=url,
+        repo_ref="main",
+        repo_subdir="skills/alpha",
+        destination_dir=destination,
+    )
+
+    mirror = cache.mirror_path(url)
+    assert _git(mirror, "config", "remote.origin.partialclonefilter") == "blob:none"
+    missing = _git(mirror, "rev-list", "--objects", "--all", "--missing=print")
+    assert sum(line.startswith("?") for line in missing.splitlines()) == 2
+    assert (destination / "skills/alpha/SKILL.md").read_text(encoding="utf-8") == "alpha v1"
+
+
+def test_directory_without_head_is_replaced_by_a_fresh_mirror(
+    tmp_path: Path, upstream: tuple[Path, str]
+) -> None:
+    _, url = upstream
+    cache = GitMirrorCache(tmp_path / "mirrors")
+    broken = cache.mirror_path(url)
+    broken.mkdir(parents=True)
+    (broken / "leftover").write_text("partial", encoding="utf-8")
+
+    mirror = cache.ensure_mirror(url)
+
+    assert (mirror / "HEAD").is_file()
+    assert not (mirror / "leftover").exists()
+
+
+def test_clone_sparse_checkout_falls_back_to_direct_clone_when_mirror_fails(
+    tmp_path: Path,
+    upstream: tuple[Path, str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _, url = upstream
+
+    def failing_git(args: list[str], **kwargs: Any) -> subprocess.CompletedProcess[str]:
+        return subprocess.CompletedProcess(args, 128, "", "fatal: mirror unavailable")
+
+    cache = GitMirrorCache(tmp_path / "mirrors", run_subprocess_fn=failing_git)
+    monkeypatch.setattr(git_sources, "_active_git_mirror_cache", lambda: cache)
+    destination = tmp_path / "checkout"
+    destination.mkdir()
+
+    git_sources.clone_sparse_checkout(
+        repo_url=url,
+        repo_ref="main",
+        repo_subdir="skills/alpha",
+        destination_dir=destination,
+    )
+
+    assert (destination / "skills/alpha/SKILL.md").read_text(encoding="utf-8") == "alpha v1"
+
+
+def test_active_cache_disabled_by_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(git_mirror.GIT_MIRROR_CACHE_ENV, "0")
+
+    assert git_mirror.active_git_mirror_cache() is None
+
+
+def test_update_checks_run_concurrently_and_keep_order() -> None:
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def evaluate(item: int) -> int:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+        return item * 10
+
+    results = update_status.evaluate_updates_concurrently(
+        list(range(20)),
+        evaluate,
+        max_workers=4,
+    )
+
+    assert results == [item * 10 for item in range(20)]
+    assert 1 < peak <= 4
+
+
+def test_concurrent_update_checks_probe_each_source_once() -> None:
+    probes: list[str] = []
+    lock = threading.Lock()
+
+    def ls_remote(args: list[str], **kwargs: Any) -> subprocess.CompletedProcess[str]:
+        with lock:
+            probes.append(args[2])
+        time.sleep(0.05)
+        return subprocess.CompletedProcess(args, 0, stdout=f"{'a' * 40}\tHEAD\n", stderr="")
+
+    head_cache: dict[tuple[str, str | None], Any] = {}
+
+    def evaluate(repo_url: str) -> str | None:
+        return git_sources.resolve_source_revision(
+            repo_url=repo_url,
+            repo_ref=None,
+            head_cache=head_cache,
+            local_revision="HEAD",
+            source_ref_missing_status="source_ref_missing",
+            source_unreachable_status="source_unreachable",
+            resolve_local_repo_fn=lambda _url: None,
+            run_subprocess_fn=ls_remote,
+        ).revision
+
+    repos = ["https://example.com/one.git", "https://example.com/two.git"] * 4
+    results = update_status.evaluate_updates_concurrently(repos, evaluate, max_workers=8)
+
+    assert results == ["a" * 40] * 8
+    assert sorted(probes) == sorted(set(repos))
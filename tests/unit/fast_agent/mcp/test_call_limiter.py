@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+
+from fast_agent.config import MCPServerSettings
+from fast_agent.mcp.call_limiter import ServerCallLimiter
+from fast_agent.mcp_server_registry import ServerRegistry
+
+
+async def _hold(limiter: ServerCallLimiter, owner: str, order: list[str], release: asyncio.Event):
+    async with limiter.slot(owner):
+        order.append(owner)
+        await release.wait()
+
+
+@pytest.mark.asyncio
+async def test_limiter_bounds_in_flight_calls_and_records_waits() -> None:
+    limiter = ServerCallLimiter(2)
+    release = asyncio.Event()
+    order: list[str] = []
+    tasks = [asyncio.create_task(_hold(limiter, "agent", order, release)) for _ in range(5)]
+    await asyncio.sleep(0)
+
+    stats = limiter.stats()
+    assert (stats.in_flight, stats.queue_depth) == (2, 3)
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+    stats = limiter.stats()
+    assert (stats.in_flight, stats.queue_depth, stats.queued_calls) == (0, 0, 3)
+    assert stats.max_wait_seconds >= stats.mean_wait_seconds > 0
+
+
+@pytest.mark.asyncio
+async def test_limiter_serves_waiting_owners_round_robin() -> None:
+    limiter = ServerCallLimiter(1)
+    gate = asyncio.Event()
+    order: list[str] = []
+    blocker = asyncio.create_task(_hold(limiter, "blocker", order, gate))
+    await asyncio.sleep(0)
+
+    done = asyncio.Event()
+    done.set()
+    burst = [asyncio.create_task(_hold(limiter, "busy", order, done)) for _ in range(3)]
+    await asyncio.sleep(0)
+    single = asyncio.create_task(_hold(limiter, "quiet", order, done))
+    await asyncio.sleep(0)
+
+    gate.set()
+    await asyncio.gather(blocker, *burst, single)
+
+    assert order == ["blocker", "busy", "quiet", "busy", "busy"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_queue_without_leaking_slots() -> None:
+    limiter = ServerCallLimiter(1)
+    release = asyncio.Event()
+    order: list[str] = []
+    holder = asyncio.create_task(_hold(limiter, "a", order, release))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(_hold(limiter, "b", order, release))
+    await asyncio.sleep(0)
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert limiter.stats().queue_depth == 0
+
+    release.set()
+    await holder
+    assert limiter.stats().in_flight == 0
+    assert order == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_registry_shares_limiter_and_tracks_config_changes() -> None:
+    registry = ServerRegistry()
+    registry.register_runtime(
+        "slow",
+        MCPServerSettings(name="slow", transport="stdio", command="echo", max_concurrent_calls=1),
+    )
+
+    limiter = registry.call_limiter("slow")
+    assert registry.call_limiter("slow") is limiter
+    assert limiter.max_concurrent == 1
+
+    registry.remove_runtime("slow")
+    registry.register_runtime(
+        "slow",
+        MCPServerSettings(name="slow", transport="stdio", command="echo", max_concurrent_calls=4),
+    )
+    assert registry.call_limiter("slow").max_concurrent == 4
+    assert registry.get_call_limiter("unused") is None
+
+
+def test_max_concurrent_calls_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="greater than zero"):
+        MCPServerSettings(name="bad", transport="stdio", command="echo", max_concurrent_calls=0)
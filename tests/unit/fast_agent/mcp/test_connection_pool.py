@@ -0,0 +1,139 @@
+import asyncio
+from typing import Any, cast
+
+import pytest
+
+from fast_agent.config import MCPServerSettings
+from fast_agent.mcp.client_callback_runtime import MCPClientCallbackRuntime
+from fast_agent.mcp.mcp_connection_manager import MCPConnectionManager
+
+
+class _FakeClient:
+    protocol_version = "2025-06-18"
+    discover_result = None
+    server_capabilities = None
+    server_info = None
+    instructions = None
+
+    def __init__(self, launched: list["_FakeClient"]) -> None:
+        self.exited = False
+        launched.append(self)
+
+    async def __aenter__(self) -> "_FakeClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.exited = True
+
+
+class _PoolRegistry:
+    active_home = None
+    no_home = False
+
+    def __init__(self, config: MCPServerSettings) -> None:
+        self._config = config
+
+    def get_server_config(self, _server_name: str) -> MCPServerSettings:
+        return self._config
+
+
+def _pooled_manager(
+    monkeypatch: pytest.MonkeyPatch,
+    pool_size: int | None,
+) -> tuple[MCPConnectionManager, list[_FakeClient], MCPClientCallbackRuntime]:
+    config = MCPServerSettings(name="demo", transport="stdio", command="demo", pool_size=pool_size)
+    manager = MCPConnectionManager(server_registry=cast("Any", _PoolRegistry(config)))
+    launched: list[_FakeClient] = []
+    monkeypatch.setattr(
+        manager,
+        "_client_connection_factory",
+        lambda _holder, **_kwargs: lambda: _FakeClient(launched),
+    )
+    return manager, launched, MCPClientCallbackRuntime(server_name="demo", server_config=config)
+
+
+@pytest.mark.asyncio
+async def test_unpooled_server_always_leases_primary(monkeypatch: pytest.MonkeyPatch) -> None:
+    manager, launched, callback_runtime = _pooled_manager(monkeypatch, None)
+    async with manager:
+        async with manager.lease_tool_call_server("demo", callback_runtime=callback_runtime) as a:
+            async with manager.lease_tool_call_server(
+                "demo", callback_runtime=callback_runtime
+            ) as b:
+                assert a is b is manager.running_servers["demo"]
+        assert manager.get_pool("demo") is None
+    assert len(launched) == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_balances_by_outstanding_requests(monkeypatch: pytest.MonkeyPatch) -> None:
+    manager, launched, callback_runtime = _pooled_manager(monkeypatch, 3)
+    async with manager:
+        async with manager.lease_tool_call_server("demo", callback_runtime=callback_runtime) as a:
+            async with manager.lease_tool_call_server(
+                "demo", callback_runtime=callback_runtime
+            ) as b:
+                async with manager.lease_tool_call_server(
+                    "demo", callback_runtime=callback_runtime
+                ) as c:
+                    assert len({id(a), id(b), id(c)}) == 3
+                    assert a is manager.running_servers["demo"]
+                    assert b.pool_member and c.pool_member
+                    pool = manager.get_pool("demo")
+                    assert pool is not None
+                    assert pool.stats().in_flight == 3
+
+                # The freed member is the least busy again.
+                async with manager.lease_tool_call_server(
+                    "demo", callback_runtime=callback_runtime
+                ) as d:
+                    assert d is c
+
+        stats = pool.stats()
+        assert (stats.size, stats.healthy, stats.in_flight) == (3, 3, 0)
+        assert stats.member_calls == (1, 1, 2)
+        assert len(launched) == 3
+
+    assert manager.get_pool("demo") is None
+    assert all(client.exited for client in launched)
+
+
+@pytest.mark.asyncio
+async def test_pool_recycles_unhealthy_members(monkeypatch: pytest.MonkeyPatch) -> None:
+    manager, launched, callback_runtime = _pooled_manager(monkeypatch, 2)
+    async with manager:
+        async with manager.lease_tool_call_server("demo", callback_runtime=callback_runtime):
+            pass
+        pool = manager.get_pool("demo")
+        assert pool is not None
+        (member,) = pool.connections()
+        member._error_occurred = True
+
+        async with manager.lease_tool_call_server("demo", callback_runtime=callback_runtime):
+            pass
+
+        (replacement,) = pool.connections()
+        assert replacement is not member
+        assert member._lifecycle_complete_event.is_set()
+        assert pool.stats().recycled == 1
+        assert len(launched) == 3
+
+
+@pytest.mark.asyncio
+async def test_disconnect_server_shuts_down_pool_members(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    manager, launched, callback_runtime = _pooled_manager(monkeypatch, 2)
+    async with manager:
+        async with manager.lease_tool_call_server("demo", callback_runtime=callback_runtime):
+            pass
+        await manager.disconnect_server("demo")
+        await asyncio.sleep(0)
+
+        assert manager.get_pool("demo") is None
+        assert all(client.exited for client in launched)
+
+
+def test_pool_size_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="greater than zero"):
+        MCPServerSettings(name="bad", transport="stdio", command="echo", pool_size=0)
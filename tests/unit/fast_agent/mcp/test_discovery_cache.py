@@ -0,0 +1,167 @@
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Literal, cast
+
+import pytest
+from mcp.client import CacheMode
+from mcp_types import Implementation, Prompt, Tool
+
+from fast_agent.config import MCPServerSettings, Settings
+from fast_agent.context import Context
+from fast_agent.mcp.app_integrations import AppServerConfig
+from fast_agent.mcp.discovery_cache import DiscoveryCache, discovery_cache_key
+from fast_agent.mcp.mcp_aggregator import MCPAggregator, NamespacedTool, _AttachmentDiscovery
+from fast_agent.mcp_server_registry import ServerRegistry
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from fast_agent.mcp.mcp_connection_manager import MCPConnectionManager
+
+
+def _key(config: MCPServerSettings, *, version: str = "1.0", instructions: str | None = None):
+    return discovery_cache_key(
+        "docs",
+        config,
+        implementation_name="docs-server",
+        implementation_version=version,
+        protocol_version="2025-06-18",
+        instructions=instructions,
+    )
+
+
+def test_discovery_cache_round_trips_and_rejects_other_keys(tmp_path: "Path") -> None:
+    cache = DiscoveryCache(tmp_path)
+    config = MCPServerSettings(name="docs", transport="http", url="https://example.com/mcp")
+    key = _key(config)
+    tool = Tool(name="search", description="Search docs", input_schema={"type": "object"})
+
+    assert cache.load("docs", key) is None
+    cache.store(
+        "docs",
+        key,
+        tools=[tool],
+        prompts=[Prompt(name="summarize")],
+        app_integration_config=AppServerConfig(server_name="docs"),
+    )
+
+    cached = cache.load("docs", key)
+    assert cached is not None
+    assert cached.tools == [tool]
+    assert [prompt.name for prompt in cached.prompts] == ["summarize"]
+    assert cache.load("docs", _key(config, version="1.1")) is None
+    assert cache.load("docs", _key(config, instructions="new")) is None
+    assert (
+        cache.load("docs", _key(config.model_copy(update={"url": "https://example.com/v2"})))
+        is None
+    )
+    # The cache mode itself does not change what the server returns.
+    assert _key(config.model_copy(update={"discovery_cache": "strict"})) == key
+
+    next(tmp_path.glob("*.json")).write_text("{not json", encoding="utf-8")
+    assert cache.load("docs", key) is None
+
+
+class _CountingAggregator(MCPAggregator):
+    def __init__(self, tool_names: list[str], **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.tool_names = tool_names
+        self.discoveries = 0
+
+    async def _discover_server_attachment(
+        self,
+        server_name: str,
+        *,
+        cache_mode: CacheMode = "use",
+    ) -> _AttachmentDiscovery:
+        del cache_mode
+        self.discoveries += 1
+        return _AttachmentDiscovery(
+            tools=[
+                NamespacedTool(
+                    tool=Tool(name=name, input_schema={"type": "object"}),
+                    server_name=server_name,
+                    namespaced_tool_name=f"{server_name}__{name}",
+                )
+                for name in self.tool_names
+            ],
+            prompts=[],
+            skill_registry=None,
+            app_integration_config=AppServerConfig(server_name=server_name),
+            capabilities=None,
+        )
+
+    async def get_capabilities(self, server_name: str):
+        del server_name
+        return None
+
+
+def _aggregator(
+    tmp_path: "Path",
+    mode: Literal["off", "stale-while-revalidate", "strict"],
+    tool_names: list[str],
+) -> tuple[_CountingAggregator, MCPServerSettings]:
+    config = MCPServerSettings(
+        name="docs", transport="http", url="https://example.com/mcp", discovery_cache=mode
+    )
+    registry = ServerRegistry()
+    registry.register_central("docs", config)
+    aggregator = _CountingAggregator(
+        tool_names,
+        server_names=["docs"],
+        connection_persistence=True,
+        context=Context(config=Settings(home=str(tmp_path)), server_registry=registry),
+    )
+    server_conn = SimpleNamespace(
+        server_config=config,
+        server_implementation=Implementation(name="docs-server", version="1.0"),
+        protocol_version="2025-06-18",
+        client=SimpleNamespace(instructions="Search the docs."),
+    )
+    aggregator._persistent_connection_manager = cast(
+        "MCPConnectionManager", SimpleNamespace(running_servers={"docs": server_conn})
+    )
+    return aggregator, config
+
+
+@pytest.mark.asyncio
+async def test_stale_while_revalidate_serves_cache_then_refreshes(tmp_path: "Path") -> None:
+    first, config = _aggregator(tmp_path, "stale-while-revalidate", ["search"])
+    discovery, from_cache = await first._discover_server_attachment_with_cache("docs", config)
+    assert (from_cache, first.discoveries) == (False, 1)
+
+    # A later process finds the entry and skips discovery until revalidation.
+    second, config = _aggregator(tmp_path, "stale-while-revalidate", ["search", "fetch"])
+    discovery, from_cache = await second._discover_server_attachment_with_cache("docs", config)
+    assert (from_cache, second.discoveries) == (True, 0)
+    assert [tool.namespaced_tool_name for tool in discovery.tools] == ["docs__search"]
+
+    await second._commit_server_attachment("docs", discovery)
+    second._schedule_discovery_revalidation("docs")
+    await second._discovery_revalidations["docs"]
+
+    assert second.discoveries == 1
+    assert sorted(second._namespaced_tool_map) == ["docs__fetch", "docs__search"]
+    third, config = _aggregator(tmp_path, "stale-while-revalidate", [])
+    discovery, from_cache = await third._discover_server_attachment_with_cache("docs", config)
+    assert from_cache
+    assert [tool.tool.name for tool in discovery.tools] == ["search", "fetch"]
+
+
+@pytest.mark.asyncio
+async def test_strict_mode_always_rediscovers(tmp_path: "Path") -> None:
+    for expected in (["search"], ["search", "fetch"]):
+        aggregator, config = _aggregator(tmp_path, "strict", expected)
+        discovery, from_cache = await aggregator._discover_server_attachment_with_cache(
+            "docs", config
+        )
+        assert not from_cache
+        assert aggregator.discoveries == 1
+        assert [tool.tool.name for tool in discovery.tools] == expected
+
+
+@pytest.mark.asyncio
+async def test_cache_disabled_by_default(tmp_path: "Path") -> None:
+    aggregator, config = _aggregator(tmp_path, "off", ["search"])
+    await aggregator._discover_server_attachment_with_cache("docs", config)
+
+    assert list(tmp_path.rglob("*.json")) == []
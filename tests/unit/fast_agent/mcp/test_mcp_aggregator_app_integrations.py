@@ -452,3 +452,32 @@ def test_app_resource_without_tool_warns() -> None:
     assert config.enabled is True
     assert not config.tools
     assert any("no tools expose them" in warning.lower() for warning in config.warnings)
+
+
+def test_list_tools_reuses_tool_objects_until_catalog_changes() -> None:
+    aggregator = _create_aggregator()
+    aggregator.initialized = True
+
+    namespaced = NamespacedTool(
+        tool=_tool_with_meta(name="tool_a", input_schema={"type": "object"}, meta={}),
+        server_name="test",
+        namespaced_tool_name="test.tool_a",
+    )
+    aggregator._namespaced_tool_map = {"test.tool_a": namespaced}
+    aggregator._server_to_tool_map["test"] = [namespaced]
+
+    first = asyncio.run(aggregator.list_tools()).tools
+    second = asyncio.run(aggregator.list_tools()).tools
+    assert first is not second
+    assert first[0] is second[0]
+
+    version = aggregator.tool_list_version
+    aggregator._evaluate_app_integrations_for_server = AsyncMock(
+        return_value=(None, AppServerConfig(server_name="test"))
+    )
+    asyncio.run(aggregator._refresh_server_resources("test"))
+
+    refreshed = asyncio.run(aggregator.list_tools()).tools
+    assert aggregator.tool_list_version == version + 1
+    assert refreshed[0] is not first[0]
+    assert refreshed[0].name == "test.tool_a"
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
 from types import SimpleNamespace
 from typing import TYPE_CHECKING, Any, cast
 
@@ -9,6 +10,8 @@ from fast_agent.llm.fastagent_llm import _mcp_metadata_var
 from fast_agent.mcp.mcp_aggregator import MCPAggregator
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from fast_agent.mcp.mcp_connection_manager import MCPConnectionManager
 
 
@@ -37,6 +40,12 @@ class _FakeConnectionManager:
         del server_name, callback_runtime
         return SimpleNamespace(client=self._session)
 
+    @asynccontextmanager
+    async def lease_tool_call_server(
+        self, server_name: str, callback_runtime
+    ) -> AsyncIterator[SimpleNamespace]:
+        yield await self.get_server(server_name, callback_runtime)
+
 
 @pytest.mark.asyncio
 async def test_execute_on_server_uses_meta_for_call_tool() -> None:
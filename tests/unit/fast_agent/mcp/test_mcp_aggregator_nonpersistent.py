@@ -135,6 +135,10 @@ async def test_connection_error_does_not_replay_tool_call() -> None:
             del args, kwargs
             return SimpleNamespace(client=_ToolClient(), negotiation="adopt")
 
+        @asynccontextmanager
+        async def lease_tool_call_server(self, *args, **kwargs):
+            yield await self.get_server(*args, **kwargs)
+
         async def reconnect_server(self, *args, **kwargs):
             callback_runtime = kwargs["callback_runtime"]
             del args, kwargs
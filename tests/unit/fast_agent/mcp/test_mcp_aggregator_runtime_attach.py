@@ -171,6 +171,35 @@ async def test_detach_server_removes_runtime_indexes() -> None:
     assert aggregator._app_integration_configs == {}
 
 
+@pytest.mark.asyncio
+async def test_tool_catalog_snapshot_is_reused_until_tools_change() -> None:
+    context = _build_context({})
+    aggregator = MCPAggregator(
+        server_names=["alpha"],
+        connection_persistence=False,
+        context=context,
+    )
+    namespaced_tool = NamespacedTool(
+        tool=Tool(name="demo", input_schema={"type": "object"}),
+        server_name="alpha",
+        namespaced_tool_name="alpha__demo",
+    )
+    aggregator._attached_server_names = ["alpha"]
+    aggregator._namespaced_tool_map = {"alpha__demo": namespaced_tool}
+    aggregator._server_to_tool_map = {"alpha": [namespaced_tool]}
+
+    catalog = aggregator.tool_catalog()
+    assert aggregator.tool_catalog() is catalog
+    assert aggregator.resolve_tool_name("demo").server_name == "alpha"
+
+    await aggregator.detach_server("alpha")
+
+    refreshed = aggregator.tool_catalog()
+    assert refreshed is not catalog
+    assert refreshed.namespaced_tool("alpha__demo") is None
+    assert aggregator.resolve_tool_name("demo").server_name is None
+
+
 def test_list_configured_detached_servers_includes_registry_entries() -> None:
     context = _build_context(
         {
@@ -47,3 +47,33 @@ def test_tool_catalog_is_an_ordered_structural_snapshot() -> None:
     assert catalog.resolve_tool_name("first-server__other").server_name == "first-server"
     assert catalog.resolve_tool_name("render").server_name == "second"
     assert catalog.resolve_tool_name("missing").server_name == "first-server"
+
+
+def test_tool_catalog_prefers_longest_server_prefix() -> None:
+    catalog = MCPToolCatalog.snapshot(
+        by_namespaced_name={},
+        by_server={},
+        server_names=["github", "github__enterprise"],
+    )
+
+    resolution = catalog.resolve_tool_name("github__enterprise__search")
+    assert resolution.server_name == "github__enterprise"
+    assert resolution.local_name == "search"
+    assert catalog.resolve_tool_name("github__search").server_name == "github"
+
+
+def test_tool_catalog_reports_bare_name_ambiguity_in_server_order() -> None:
+    alpha = _tool("alpha", "search")
+    beta = _tool("beta", "search")
+    gamma = _tool("gamma", "search")
+    catalog = MCPToolCatalog.snapshot(
+        by_namespaced_name={tool.namespaced_tool_name: tool for tool in (gamma, alpha, beta)},
+        by_server={"beta": [beta], "alpha": [alpha], "gamma": [gamma]},
+        server_names=["alpha", "beta", "gamma"],
+    )
+
+    resolution = catalog.resolve_tool_name("search")
+    assert resolution.server_name == "beta"
+    assert resolution.ambiguous_servers == ("beta", "alpha", "gamma")
+    assert catalog.first_tool_named("search") is gamma
+    assert catalog.resolve_tool_name("beta__search").ambiguous_servers == ()
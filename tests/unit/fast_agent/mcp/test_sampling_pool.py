@@ -0,0 +1,130 @@
+import asyncio
+
+import pytest
+from mcp_types import CreateMessageRequestParams, CreateMessageResult, SamplingMessage, TextContent
+
+from fast_agent.config import MCPSamplingSettings, MCPServerSettings, Settings
+from fast_agent.context import Context
+from fast_agent.mcp import sampling
+from fast_agent.mcp.sampling_pool import SamplingLLMPool, SamplingPoolKey
+
+
+def _params(text: str, system_prompt: str | None = None) -> CreateMessageRequestParams:
+    return CreateMessageRequestParams(
+        max_tokens=256,
+        messages=[SamplingMessage(role="user", content=TextContent(type="text", text=text))],
+        system_prompt=system_prompt,
+    )
+
+
+def _server(**sampling_settings) -> MCPServerSettings:
+    return MCPServerSettings(
+        name="summarizer",
+        transport="stdio",
+        command="echo",
+        sampling=MCPSamplingSettings(model="passthrough", **sampling_settings),
+    )
+
+
+@pytest.mark.asyncio
+async def test_sample_reuses_pooled_llm_without_history(monkeypatch: pytest.MonkeyPatch) -> None:
+    created = []
+    original = sampling.create_sampling_llm
+
+    def counting_create(*args, **kwargs):
+        llm = original(*args, **kwargs)
+        created.append(llm)
+        return llm
+
+    monkeypatch.setattr(sampling, "create_sampling_llm", counting_create)
+    context = Context(config=Settings())
+    server = _server()
+
+    for index, prompt in enumerate([None, "Summarize tersely.", None]):
+        result = await sampling.sample(
+            _params(f"message {index}", prompt),
+            server_name="summarizer",
+            server_config=server,
+            agent_model=None,
+            api_key=None,
+            app_context=context,
+        )
+        assert isinstance(result, CreateMessageResult)
+        assert isinstance(result.content, TextContent)
+        assert result.content.text == f"message {index}"
+
+    assert len(created) == 1
+    (llm,) = created
+    assert llm.instruction == "You are a helpful AI Agent."
+    assert llm.message_history == []
+
+    assert context.sampling_pool is not None
+    stats = context.sampling_pool.stats("summarizer")
+    assert stats is not None
+    assert (stats.requests, stats.pool_hits, stats.in_flight) == (3, 2, 0)
+    assert stats.hit_rate == pytest.approx(2 / 3)
+    assert stats.max_latency_seconds >= stats.mean_latency_seconds > 0
+
+
+def test_pool_key_separates_models_keys_and_sampling_settings() -> None:
+    settings = MCPSamplingSettings(model="passthrough")
+    key = SamplingPoolKey.build("passthrough", "secret", settings)
+
+    assert "secret" not in repr(key)
+    assert key == SamplingPoolKey.build("passthrough", "secret", settings)
+    assert key != SamplingPoolKey.build("passthrough", "other", settings)
+    assert key != SamplingPoolKey.build("playback", "secret", settings)
+    assert key != SamplingPoolKey.build(
+        "passthrough", "secret", MCPSamplingSettings(model="passthrough", temperature=0.2)
+    )
+    # The concurrency limit does not change how an LLM behaves.
+    assert key == SamplingPoolKey.build(
+        "passthrough", "secret", MCPSamplingSettings(model="passthrough", max_concurrent=1)
+    )
+
+
+@pytest.mark.asyncio
+async def test_pool_bounds_concurrency_and_drops_failed_llms() -> None:
+    pool = SamplingLLMPool()
+    key = SamplingPoolKey.build("passthrough", None, None)
+    created: list[object] = []
+
+    def create():
+        llm = sampling.create_sampling_llm(_params("x"), "passthrough", None, None)
+        created.append(llm)
+        return llm
+
+    release = asyncio.Event()
+
+    async def hold() -> None:
+        async with pool.lease(
+            key, server_name="slow", max_concurrent=2, create=create, instruction="hi"
+        ):
+            await release.wait()
+
+    tasks = [asyncio.create_task(hold()) for _ in range(3)]
+    await asyncio.sleep(0)
+    stats = pool.stats("slow")
+    assert stats is not None
+    assert (stats.in_flight, stats.queue_depth) == (2, 1)
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert len(created) == 2
+    assert pool.idle_count(key) == 2
+
+    with pytest.raises(RuntimeError):
+        async with pool.lease(
+            key, server_name="slow", max_concurrent=2, create=create, instruction="hi"
+        ):
+            raise RuntimeError("provider failed")
+    assert pool.idle_count(key) == 1
+
+
+def test_sampling_is_unlimited_unless_configured() -> None:
+    assert MCPSamplingSettings().max_concurrent is None
+
+
+def test_sampling_max_concurrent_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="greater than zero"):
+        MCPSamplingSettings(max_concurrent=0)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from fast_agent.patch.seek_sequence import seek_sequence
+import random
+
+from fast_agent.patch.seek_sequence import LineIndex, seek_sequence
 
 
 def test_seek_sequence_prefers_exact_match() -> None:
@@ -25,3 +27,57 @@ def test_seek_sequence_eof_searches_only_final_possible_position() -> None:
     lines = ["target", "other", "target"]
 
     assert seek_sequence(lines, ["target"], start=0, eof=True) == 2
+
+
+def test_seek_sequence_prefers_stricter_matcher_over_earlier_position() -> None:
+    lines = ["  target", "other", "target"]
+
+    assert seek_sequence(lines, ["target"], start=0, eof=False) == 2
+
+
+def test_seek_sequence_respects_start_with_index() -> None:
+    lines = ["a", "b", "a", "b"]
+    index = LineIndex(lines)
+
+    assert seek_sequence(lines, ["a", "b"], start=0, eof=False, index=index) == 0
+    assert seek_sequence(lines, ["a", "b"], start=1, eof=False, index=index) == 2
+    assert seek_sequence(lines, ["a", "b"], start=3, eof=False, index=index) is None
+
+
+def test_line_index_normalises_each_level_once() -> None:
+    lines = ["alpha", "a\u2014b", "gamma"]
+    index = LineIndex(lines)
+
+    first = index.level(3)
+    assert seek_sequence(lines, ["a-b"], start=0, eof=False, index=index) == 1
+    assert index.level(3) is first
+
+
+def test_seek_sequence_matches_linear_scan_reference() -> None:
+    rng = random.Random(1234)
+    vocabulary = ["x = 1", "x = 1  ", "  x = 1", "y\u2013z", "y-z", "", "pass"]
+    for _ in range(200):
+        lines = [rng.choice(vocabulary) for _ in range(rng.randint(1, 12))]
+        pattern = [rng.choice(vocabulary) for _ in range(rng.randint(1, 3))]
+        start = rng.randint(0, len(lines))
+        eof = rng.random() < 0.2
+
+        assert seek_sequence(lines, pattern, start, eof) == _linear_seek(lines, pattern, start, eof)
+
+
+def _linear_seek(lines: list[str], pattern: list[str], start: int, eof: bool) -> int | None:
+    if len(pattern) > len(lines):
+        return None
+    last_start = len(lines) - len(pattern)
+    search_range = range(last_start if eof else start, last_start + 1)
+    for normaliser in (
+        lambda value: value,
+        str.rstrip,
+        str.strip,
+        lambda value: value.strip().replace("\u2013", "-").replace("\u2014", "-"),
+    ):
+        for index in search_range:
+            window = lines[index : index + len(pattern)]
+            if [normaliser(line) for line in window] == [normaliser(line) for line in pattern]:
+                return index
+    return None
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from collections import OrderedDict
 from dataclasses import dataclass
 
 import pytest
@@ -14,7 +15,8 @@ from fast_agent.privacy.privacy_filter_onnx import (
     _replace_spans,
     _resolve_onnx_execution_providers,
 )
-from fast_agent.privacy.sanitizer import RedactionSpan
+from fast_agent.privacy.sanitizer import RedactionSpan, sanitize_texts
+from fast_agent.privacy.viterbi import build_viterbi_tables
 from fast_agent.session.trace_export_errors import SessionExportPrivacyFilterError
 
 
@@ -93,6 +95,109 @@ def test_onnx_sanitizer_chunks_long_text_with_overlap() -> None:
     assert spans == [RedactionSpan(label="private_person", start=14, end=19)]
 
 
+_LABELS = ["O", "B-private_person", "I-private_person", "E-private_person", "S-private_person"]
+_ALICE_ID = 7
+
+
+class _WordTokenizer(_WhitespaceTokenizer):
+    """Whitespace tokenizer whose ids identify the word "Alice"."""
+
+    def encode(self, text: str) -> _Encoding:
+        encoding = super().encode(text)
+        encoding.ids = [
+            _ALICE_ID if end > start and text[start:end] == "Alice" else 1
+            for start, end in encoding.offsets
+        ]
+        return encoding
+
+
+class _AliceSession:
+    """Fake ORT session that labels every unmasked "Alice" token as a person."""
+
+    def __init__(self, np) -> None:
+        self._np = np
+        self.batch_shapes: list[tuple[int, int]] = []
+
+    def run(self, _output_names, feeds):
+        input_ids = feeds["input_ids"]
+        attention_mask = feeds["attention_mask"]
+        self.batch_shapes.append(tuple(input_ids.shape))
+        logits = self._np.full((*input_ids.shape, len(_LABELS)), -5.0, dtype=self._np.float32)
+        logits[..., _LABELS.index("O")] = 5.0
+        person = (input_ids == _ALICE_ID) & (attention_mask == 1)
+        logits[person, _LABELS.index("S-private_person")] = 10.0
+        return [logits]
+
+
+class _BatchingSanitizer(OpenAIPrivacyFilterOnnxSanitizer):
+    """Stand-in sanitizer running real windowing/batching over a fake session."""
+
+    def __init__(self, np, *, max_window_tokens: int = 4, max_batch_windows: int = 16) -> None:
+        self._np = np
+        self._tokenizer = _WordTokenizer()
+        self._session = _AliceSession(np)
+        self._labels = _LABELS
+        self._viterbi_tables = build_viterbi_tables(_LABELS, np)
+        self._max_window_tokens = max_window_tokens
+        self._window_overlap_tokens = 1
+        self._max_batch_windows = max_batch_windows
+        self._max_batch_tokens = 4096
+        self._pad_token_id = 0
+        self._cache = OrderedDict()
+        self._cache_entries = 16
+        self._progress_callback = None
+        self._show_redactions = False
+
+
+def test_onnx_sanitizer_batches_windows_from_many_texts() -> None:
+    np = pytest.importorskip("numpy")
+    texts = [
+        "hello Alice",
+        "one two three Alice five six seven",
+        "nothing here",
+        "Alice and Alice",
+    ]
+    sequential = _BatchingSanitizer(np)
+    expected = [sequential.detect_spans(text) for text in texts]
+
+    batched = _BatchingSanitizer(np)
+    actual = batched.detect_spans_batch(texts)
+
+    assert actual == expected
+    assert actual[0] == [RedactionSpan(label="private_person", start=6, end=11)]
+    # Five windows (the long text splits in two) packed into a single padded call.
+    assert batched._session.batch_shapes == [(5, 5)]
+    assert len(sequential._session.batch_shapes) == 5
+
+
+def test_onnx_sanitizer_batch_respects_window_limit() -> None:
+    np = pytest.importorskip("numpy")
+    sanitizer = _BatchingSanitizer(np, max_batch_windows=2)
+
+    sanitizer.detect_spans_batch(["Alice", "a Alice", "b Alice", "c"])
+
+    assert [shape[0] for shape in sanitizer._session.batch_shapes] == [2, 2]
+
+
+def test_onnx_sanitizer_caches_repeated_texts_by_content_hash() -> None:
+    np = pytest.importorskip("numpy")
+    sanitizer = _BatchingSanitizer(np)
+    prompt = "You help Alice with tools"
+
+    first = sanitize_texts(sanitizer, [prompt, "hi Alice", prompt, ""])
+    second = sanitizer.sanitize_text(prompt)
+
+    assert [item.text for item in first] == [
+        "You help <PRIVATE_PERSON> with tools",
+        "hi <PRIVATE_PERSON>",
+        "You help <PRIVATE_PERSON> with tools",
+        "",
+    ]
+    assert second is first[0]
+    # The long prompt splits into two windows; the duplicate is not re-run.
+    assert sanitizer._session.batch_shapes == [(3, 5)]
+
+
 def test_merge_spans_preserves_adjacent_entities() -> None:
     spans = _merge_spans(
         [
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import shutil
+import subprocess
+from typing import TYPE_CHECKING
+
+import pytest
+
+from fast_agent.session.git_metadata import GitProvenanceService, capture_git_metadata
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _run_git(repo: Path, *args: str) -> str:
+    result = subprocess.run(
+        ["git", "-C", str(repo), *args],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return result.stdout.strip()
+
+
+def _init_git_repo(path: Path) -> str:
+    if shutil.which("git") is None:
+        pytest.skip("git is not available")
+    path.mkdir()
+    _run_git(path, "init")
+    _run_git(path, "config", "user.email", "test@example.com")
+    _run_git(path, "config", "user.name", "Test User")
+    _run_git(path, "remote", "add", "origin", "https://token@github.com/fast-agent-ai/demo.git")
+    (path / "demo.txt").write_text("one\n", encoding="utf-8")
+    _run_git(path, "add", "demo.txt")
+    _run_git(path, "commit", "-m", "initial")
+    return _run_git(path, "rev-parse", "HEAD")
+
+
+class _CountingService(GitProvenanceService):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.commands: list[tuple[str, ...]] = []
+
+    async def _run(self, cwd: Path, *args: str) -> tuple[int, str] | None:
+        self.commands.append(args)
+        return await super()._run(cwd, *args)
+
+
+@pytest.mark.asyncio
+async def test_git_provenance_service_matches_blocking_capture(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    commit = _init_git_repo(repo)
+
+    captured = await GitProvenanceService().capture(repo)
+    blocking = capture_git_metadata(repo)
+
+    assert captured is not None
+    assert blocking is not None
+    assert captured.commit == commit == blocking.commit
+    assert captured.repository_root == blocking.repository_root
+    assert captured.remote_url == "https://github.com/fast-agent-ai/demo.git"
+    assert captured.github_repository == "fast-agent-ai/demo"
+    assert captured.branch == blocking.branch
+    assert captured.dirty is False
+
+
+@pytest.mark.asyncio
+async def test_git_provenance_service_reuses_state_until_repository_changes(
+    tmp_path: Path,
+) -> None:
+    repo = tmp_path / "repo"
+    _init_git_repo(repo)
+    service = _CountingService(max_age_seconds=3600)
+
+    await service.capture(repo)
+    first_count = len(service.commands)
+    await service.capture(repo)
+    assert len(service.commands) == first_count
+
+    (repo / "demo.txt").write_text("two\n", encoding="utf-8")
+    _run_git(repo, "commit", "-am", "second")
+    second_commit = _run_git(repo, "rev-parse", "HEAD")
+
+    refreshed = await service.capture(repo)
+
+    assert refreshed is not None
+    assert refreshed.commit == second_commit
+    refresh_commands = service.commands[first_count:]
+    # Root and remote are cached; only HEAD, branch and dirty state are re-queried.
+    assert ("remote", "get-url", "origin") not in refresh_commands
+    assert len(refresh_commands) == 3
+
+
+@pytest.mark.asyncio
+async def test_git_provenance_service_refreshes_after_max_age(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    _init_git_repo(repo)
+    service = GitProvenanceService(max_age_seconds=0)
+
+    first = await service.capture(repo)
+    (repo / "demo.txt").write_text("edited\n", encoding="utf-8")
+    second = await service.capture(repo)
+
+    assert first is not None and first.dirty is False
+    assert second is not None and second.dirty is True
+
+
+@pytest.mark.asyncio
+async def test_git_provenance_service_max_age_can_be_set_per_capture(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    _init_git_repo(repo)
+    service = GitProvenanceService(max_age_seconds=3600)
+
+    await service.capture(repo)
+    (repo / "demo.txt").write_text("edited\n", encoding="utf-8")
+    cached = await service.capture(repo)
+    refreshed = await service.capture(repo, max_age_seconds=0)
+
+    assert cached is not None and cached.dirty is False
+    assert refreshed is not None and refreshed.dirty is True
+    assert service.max_age_seconds == 3600
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("dirty_check", "untracked_dirty"),
+    [("full", True), ("tracked", False), ("index", False)],
+)
+async def test_git_provenance_service_dirty_check_modes(
+    tmp_path: Path,
+    dirty_check,
+    untracked_dirty: bool,
+) -> None:
+    repo = tmp_path / "repo"
+    _init_git_repo(repo)
+    service = GitProvenanceService(dirty_check=dirty_check, max_age_seconds=0)
+
+    (repo / "untracked.txt").write_text("new\n", encoding="utf-8")
+    untracked = await service.capture(repo)
+    (repo / "demo.txt").write_text("changed\n", encoding="utf-8")
+    modified = await service.capture(repo)
+
+    assert untracked is not None and untracked.dirty is untracked_dirty
+    assert modified is not None and modified.dirty is True
+
+
+@pytest.mark.asyncio
+async def test_git_provenance_service_returns_none_outside_repository(tmp_path: Path) -> None:
+    if shutil.which("git") is None:
+        pytest.skip("git is not available")
+
+    assert await GitProvenanceService().capture(tmp_path) is None
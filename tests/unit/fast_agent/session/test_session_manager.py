@@ -229,6 +229,50 @@ async def test_save_history_preview_skips_empty_first_user_message(tmp_path) ->
     assert session.info.metadata["first_user_preview"] == "actual prompt"
 
 
+@pytest.mark.asyncio
+async def test_turn_boundary_save_captures_git_state_off_loop(tmp_path, monkeypatch) -> None:
+    import shutil
+    import subprocess
+
+    if shutil.which("git") is None:
+        pytest.skip("git is not available")
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    for args in (
+        ("init",),
+        ("config", "user.email", "test@example.com"),
+        ("config", "user.name", "Test User"),
+        ("commit", "--allow-empty", "-m", "initial"),
+    ):
+        subprocess.run(("git", "-C", str(workspace), *args), check=True, capture_output=True)
+
+    def blocking_capture(_cwd):
+        raise AssertionError("turn-boundary saves must not shell out synchronously")
+
+    monkeypatch.setattr("fast_agent.session.git_metadata.capture_git_metadata", blocking_capture)
+    old_settings = get_settings()
+    update_global_settings(old_settings.model_copy(update={"git_aware": True}))
+    try:
+        manager = SessionManager(
+            cwd=workspace,
+            home_override=tmp_path / ".fast-agent",
+            respect_env_override=False,
+        )
+        session = manager.create_session()
+        agent = _Agent(name="main", instruction="Stored prompt", history=[_message("user", "hi")])
+
+        await session.save_history(cast("AgentProtocol", agent))
+    finally:
+        update_global_settings(old_settings)
+
+    snapshot = load_session_snapshot(
+        json.loads((session.directory / "session.json").read_text(encoding="utf-8"))
+    )
+    assert snapshot.continuation.git is not None
+    assert snapshot.continuation.git.current is not None
+    assert snapshot.continuation.git.current.repository_root == str(workspace.resolve())
+
+
 @pytest.mark.asyncio
 async def test_checkpoint_save_writes_compact_history_that_round_trips(tmp_path) -> None:
     from fast_agent.mcp.prompt_serialization import load_messages
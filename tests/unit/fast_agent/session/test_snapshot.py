@@ -794,6 +794,74 @@ def test_capture_session_snapshot_checkpoint_reuses_captured_git_state(
     assert resumed_checkpoint.continuation.git.current.commit == second_commit
 
 
+@pytest.mark.asyncio
+async def test_capture_session_snapshot_never_runs_git_synchronously_after_prefetch(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from fast_agent.session import git_metadata
+    from fast_agent.session.git_metadata import GitProvenanceService
+
+    workspace = tmp_path / "workspace"
+    commit = _init_git_repo(workspace)
+    link = tmp_path / "link"
+    link.symlink_to(workspace, target_is_directory=True)
+    config_path = tmp_path / "fast-agent.yaml"
+    config_path.write_text("git_aware: true\n", encoding="utf-8")
+    get_settings(config_path=str(config_path))
+
+    def blocking_capture(_cwd: Path) -> None:
+        raise AssertionError("git ran on the event loop")
+
+    monkeypatch.setattr(git_metadata, "capture_git_metadata", blocking_capture)
+    manager = SessionManager(
+        cwd=workspace,
+        home_override=tmp_path / ".fast-agent",
+        respect_env_override=False,
+    )
+    session = manager.create_session()
+    agent = _Agent(
+        name="foo",
+        instruction="resolved foo prompt",
+        config=AgentConfig("foo", instruction="template foo", model=None),
+    )
+    identity = SessionSaveIdentity(
+        manager=manager,
+        session=session,
+        created=False,
+        acp_session_id=None,
+        session_cwd=link,
+        session_store_scope="workspace",
+        session_store_cwd=workspace,
+    )
+
+    # A prefetch that found nothing is not retried synchronously.
+    unprefetched = capture_session_snapshot(
+        session=session,
+        active_agent=cast("AgentProtocol", agent),
+        agent_registry=None,
+        identity=identity,
+        git_prefetched=True,
+    )
+    assert unprefetched.continuation.git is None
+
+    # Metadata captured through the symlinked path matches the resolved cwd.
+    service = GitProvenanceService(max_age_seconds=3600)
+    prefetched = await service.capture(link, max_age_seconds=0)
+    snapshot = capture_session_snapshot(
+        session=session,
+        active_agent=cast("AgentProtocol", agent),
+        agent_registry=None,
+        identity=identity,
+        git_metadata=prefetched,
+        git_prefetched=True,
+    )
+    assert snapshot.continuation.git is not None
+    assert snapshot.continuation.git.current is not None
+    assert snapshot.continuation.git.current.commit == commit
+    assert service.max_age_seconds == 3600
+
+
 def test_capture_session_snapshot_omits_git_when_config_disabled(tmp_path: Path) -> None:
     workspace = tmp_path / "workspace"
     _init_git_repo(workspace)
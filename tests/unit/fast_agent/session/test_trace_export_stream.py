@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from fast_agent.session import trace_export_stream
+from fast_agent.session.trace_export_errors import SessionExportOptionsError
+from fast_agent.session.trace_export_stream import (
+    AttachmentStore,
+    JsonlRecordSink,
+    open_trace_text,
+    zstd_module,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _require_zstd() -> None:
+    try:
+        zstd_module()
+    except SessionExportOptionsError:
+        pytest.skip("zstd support is not installed")
+
+
+def test_sink_shards_records_into_numbered_files(tmp_path: Path) -> None:
+    with JsonlRecordSink(tmp_path / "trace.jsonl", shard_records=2) as sink:
+        for index in range(5):
+            sink.write({"index": index})
+
+    assert [path.name for path in sink.paths] == [
+        "trace-00000.jsonl",
+        "trace-00001.jsonl",
+        "trace-00002.jsonl",
+    ]
+    assert sink.record_count == 5
+    lines = [line for path in sink.paths for line in path.read_text().splitlines()]
+    assert [json.loads(line)["index"] for line in lines] == [0, 1, 2, 3, 4]
+
+
+def test_sink_writes_zstd_compressed_records(tmp_path: Path) -> None:
+    _require_zstd()
+    with JsonlRecordSink(tmp_path / "trace.jsonl", compression="zstd") as sink:
+        sink.write({"text": "héllo"})
+
+    assert sink.paths == [tmp_path / "trace.jsonl.zst"]
+    with open_trace_text(sink.paths[0]) as handle:
+        assert [json.loads(line) for line in handle] == [{"text": "héllo"}]
+
+
+def test_missing_zstd_support_is_reported(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    def unavailable(name: str) -> object:
+        raise ImportError(name)
+
+    monkeypatch.setattr(trace_export_stream, "import_module", unavailable)
+
+    with pytest.raises(SessionExportOptionsError, match="zstandard"):
+        JsonlRecordSink(tmp_path / "trace.jsonl", compression="zstd")
+
+
+def test_attachment_store_deduplicates_by_content_hash(tmp_path: Path) -> None:
+    store = AttachmentStore(tmp_path / "attachments", relative_to=tmp_path)
+
+    first = store.data_url_reference("data:image/png;base64,aW1hZ2U=")
+    second = store.store_base64("aW1hZ2U=", mime_type="image/png")
+
+    assert first == second
+    assert first is not None and first.startswith("attachments/")
+    assert (tmp_path / first).read_bytes() == b"image"
+    assert (store.stored_count, store.reused_count, store.stored_bytes) == (1, 1, 5)
+    assert store.data_url_reference("https://example.com/image.png") is None
+    assert store.store_base64("not base64!") is None
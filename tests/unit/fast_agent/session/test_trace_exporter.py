@@ -44,11 +44,13 @@ from fast_agent.session.session_manager import SessionManager
 from fast_agent.session.trace_export_atif import (
     AtifRunSource,
     _package_version,
+    atif_json_chunks,
     build_atif_fanout_trajectory,
     build_atif_trajectory,
 )
 from fast_agent.session.trace_export_errors import (
     SessionExportAmbiguousAgentError,
+    SessionExportOptionsError,
     SessionExportPrivacyFilterError,
     SessionExportReadError,
     SessionExportWriteError,
@@ -1556,6 +1558,8 @@ def test_session_trace_exporter_applies_privacy_sanitizer_to_codex_text(
     assert redactions["total"] == 9
     assert redactions["by_label"] == {"private_person": 9}
     assert redactions["elapsed_seconds"] >= 0
+    assert redactions["characters"] == result.redaction.characters > 0
+    assert redactions["characters_per_second"] > 0
 
     payloads = [record["payload"] for record in records]
     developer = next(payload for payload in payloads if payload.get("role") == "developer")
@@ -2559,3 +2563,115 @@ def test_session_trace_exporter_uploads_trace_to_hugging_face_dataset(tmp_path:
     assert result.upload is not None
     assert result.upload.repo_id == "owner/dataset"
     assert result.upload.path_in_repo == "exports/trace.jsonl"
+
+
+def test_session_trace_exporter_streams_sharded_trace_with_hashed_attachments(
+    tmp_path: Path,
+) -> None:
+    manager = _build_manager(tmp_path)
+    session_id = "2604201303-x5MNlH"
+    session_dir = manager.base_dir / session_id
+    session_dir.mkdir(parents=True)
+    image = ImageContent(type="image", data="aW1hZ2U=", mime_type="image/png")
+    messages: list[PromptMessageExtended] = []
+    for index in range(2):
+        messages.extend(
+            [
+                PromptMessageExtended(
+                    role="user",
+                    content=[TextContent(type="text", text=f"look {index}"), image],
+                ),
+                PromptMessageExtended(
+                    role="assistant",
+                    content=[TextContent(type="text", text=f"seen {index}")],
+                    stop_reason=LlmStopReason.END_TURN,
+                ),
+            ]
+        )
+    save_json(messages, str(session_dir / "history_dev.json"))
+    _write_session_snapshot(
+        session_dir,
+        session_id=session_id,
+        active_agent="dev",
+        agents={"dev": SessionAgentSnapshot(history_file="history_dev.json")},
+    )
+    exporter = SessionTraceExporter(session_manager=manager)
+
+    inline = exporter.export(
+        ExportRequest(target=session_dir, agent_name="dev", output_path=tmp_path / "inline.jsonl")
+    )
+    result = exporter.export(
+        ExportRequest(
+            target=session_dir,
+            agent_name="dev",
+            output_path=tmp_path / "out" / "trace.jsonl",
+            shard_records=4,
+            hash_attachments=True,
+        )
+    )
+
+    assert result.output_path == tmp_path / "out" / "trace-00000.jsonl"
+    assert len(result.output_paths) == -(-inline.record_count // 4)
+    assert result.record_count == inline.record_count
+    attachments = list((tmp_path / "out" / "attachments").iterdir())
+    assert [path.suffix for path in attachments] == [".png"]
+    assert attachments[0].read_bytes() == b"image"
+
+    reference = f"attachments/{attachments[0].name}"
+    sharded = "".join(path.read_text(encoding="utf-8") for path in result.output_paths)
+    expected = inline.output_path.read_text(encoding="utf-8").replace(
+        "data:image/png;base64,aW1hZ2U=", reference
+    )
+    assert sharded == expected
+    assert sharded.count(reference) == 4
+
+
+def test_session_trace_exporter_rejects_multi_file_output_with_upload(tmp_path: Path) -> None:
+    manager = _build_manager(tmp_path)
+    session_dir = manager.base_dir / "2604201303-x5MNlH"
+    session_dir.mkdir(parents=True)
+
+    with pytest.raises(SessionExportOptionsError, match="cannot be uploaded"):
+        SessionTraceExporter(session_manager=manager).export(
+            ExportRequest(
+                target=session_dir,
+                agent_name="dev",
+                output_path=tmp_path / "trace.jsonl",
+                hf_url="hf://buckets/owner/traces/",
+                hash_attachments=True,
+            )
+        )
+
+
+def test_atif_streaming_serialization_matches_whole_document_dump() -> None:
+    messages = [
+        PromptMessageExtended(
+            role="user",
+            content=[
+                TextContent(type="text", text='describe ✓ "quoted"\nlines'),
+                ImageContent(type="image", data="aW1hZ2U=", mime_type="image/png"),
+            ],
+        ),
+        PromptMessageExtended(
+            role="assistant",
+            content=[TextContent(type="text", text="a picture")],
+            stop_reason=LlmStopReason.END_TURN,
+        ),
+    ]
+    trajectory = build_atif_trajectory(
+        AtifRunSource(
+            session_id="session",
+            agent_name="dev",
+            model_name="model",
+            provider="openai",
+            history=messages,
+            message_timestamps=(None, None),
+            extra={"nested": {"values": [1, 2]}},
+        )
+    )
+    child = trajectory.model_copy(update={"trajectory_id": "child-1"})
+    parent = trajectory.model_copy(update={"subagent_trajectories": [child]})
+
+    for document in (trajectory, parent):
+        streamed = "".join(atif_json_chunks(document))
+        assert streamed == json.dumps(document.to_json_dict(), ensure_ascii=False, indent=2)
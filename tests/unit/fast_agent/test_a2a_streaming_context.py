@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, cast
+
+import pytest
+
+from fast_agent.a2a import server as a2a_server
+from fast_agent.a2a.server import _A2AStreamingContext
+
+
+class _FakeUpdater:
+    task_id = "task-1"
+    context_id = "ctx-1"
+
+    def __init__(self, *, blocked: bool = False) -> None:
+        self.artifacts: list[dict[str, Any]] = []
+        self.publishing = asyncio.Event()
+        self.published = asyncio.Event()
+        # Publishes wait here, standing in for a slow subscriber until released.
+        self.release = asyncio.Event()
+        if not blocked:
+            self.release.set()
+
+    async def add_artifact(
+        self,
+        *,
+        parts: list[Any],
+        artifact_id: str | None = None,
+        name: str | None = None,
+        append: bool = False,
+        last_chunk: bool = False,
+    ) -> None:
+        self.publishing.set()
+        await self.release.wait()
+        self.artifacts.append(
+            {
+                "text": parts[0].text,
+                "artifact_id": artifact_id,
+                "append": append,
+                "last_chunk": last_chunk,
+            }
+        )
+        self.published.set()
+
+
+@pytest.fixture(autouse=True)
+def _task_already_started(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def started() -> None:
+        return None
+
+    monkeypatch.setattr(a2a_server, "_ensure_current_task_started", started)
+
+
+def _context(updater: _FakeUpdater, **kwargs: Any) -> _A2AStreamingContext:
+    context = _A2AStreamingContext(
+        updater=cast("Any", updater),
+        artifact_id="task-1:response",
+        **kwargs,
+    )
+    context.start()
+    return context
+
+
+async def _stream_tokens(context: _A2AStreamingContext, tokens: list[str]) -> None:
+    for index, token in enumerate(tokens, start=1):
+        context.record_chunk(token)
+        if index % 50 == 0:
+            await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_ten_thousand_token_response_is_coalesced() -> None:
+    updater = _FakeUpdater()
+    # A long interval leaves only size-triggered flushes during the stream.
+    context = _context(updater, flush_chars=256, flush_interval=3600.0)
+    tokens = [f"tok{index} " for index in range(10_000)]
+
+    await _stream_tokens(context, tokens)
+    await context.drain()
+
+    expected = "".join(tokens)
+    assert "".join(artifact["text"] for artifact in updater.artifacts) == expected
+    assert context.streamed_text() == expected
+    assert context.chunks_recorded == 10_000
+    assert context.events_published == len(updater.artifacts)
+    assert 1 < len(updater.artifacts) <= len(expected) // 256 + 1
+    assert updater.artifacts[0]["append"] is False
+    assert all(artifact["append"] for artifact in updater.artifacts[1:])
+
+
+@pytest.mark.asyncio
+async def test_small_response_waits_for_interval_until_drained() -> None:
+    updater = _FakeUpdater()
+    context = _context(updater, flush_chars=10_000, flush_interval=3600.0)
+
+    context.record_chunk("hello ")
+    context.record_chunk("world")
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+    assert updater.artifacts == []
+    await context.drain()
+    assert [artifact["text"] for artifact in updater.artifacts] == ["hello world"]
+
+
+@pytest.mark.asyncio
+async def test_small_response_flushes_once_interval_elapses() -> None:
+    updater = _FakeUpdater()
+    context = _context(updater, flush_chars=10_000, flush_interval=0.0)
+
+    context.record_chunk("hello ")
+    context.record_chunk("world")
+    await updater.published.wait()
+
+    assert [artifact["text"] for artifact in updater.artifacts] == ["hello world"]
+    await context.drain()
+
+
+@pytest.mark.asyncio
+async def test_slow_subscribers_coalesce_behind_in_flight_publish() -> None:
+    updater = _FakeUpdater(blocked=True)
+    context = _context(updater, flush_chars=1, flush_interval=0.0, max_pending_chars=0)
+    tokens = [f"{index} " for index in range(1_000)]
+
+    context.record_chunk(tokens[0])
+    await updater.publishing.wait()
+    for token in tokens[1:]:
+        context.record_chunk(token)
+    updater.release.set()
+    await context.drain()
+
+    assert [artifact["text"] for artifact in updater.artifacts] == [
+        tokens[0],
+        "".join(tokens[1:]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_backlog_limit_stops_incremental_updates() -> None:
+    updater = _FakeUpdater(blocked=True)
+    context = _context(updater, flush_chars=1, flush_interval=0.0, max_pending_chars=100)
+
+    context.record_chunk("first ")
+    await updater.publishing.wait()
+    for index in range(200):
+        context.record_chunk(f"{index} ")
+    updater.release.set()
+    await context.drain()
+
+    assert [artifact["text"] for artifact in updater.artifacts] == ["first "]
+    # The executor compares this with the final response and resends it in full.
+    assert context.streamed_text() == "first "
+
+
+@pytest.mark.asyncio
+async def test_drain_without_start_does_not_block() -> None:
+    context = _A2AStreamingContext(updater=cast("Any", _FakeUpdater()), artifact_id="a")
+    context.record_chunk("unused")
+
+    await asyncio.wait_for(context.drain(), timeout=1.0)
@@ -49,7 +49,10 @@ def test_configure_otel_samples_and_flushes_spans(sample_rate: float, span_expor
         )
 
         with (
-            patch.object(context_module, "OTLPSpanExporter", return_value=exporter),
+            patch(
+                "opentelemetry.exporter.otlp.proto.http.trace_exporter.OTLPSpanExporter",
+                return_value=exporter,
+            ),
             warnings.catch_warnings(record=True) as caught,
         ):
             warnings.simplefilter("always")
@@ -82,3 +85,39 @@ def test_configure_otel_samples_and_flushes_spans(sample_rate: float, span_expor
     )
 
     assert result.returncode == 0, result.stderr
+
+
+def test_llm_sdk_instrumentors_attach_when_first_used() -> None:
+    script = textwrap.dedent(
+        """
+        import asyncio
+        import sys
+
+        import fast_agent.context as context_module
+        from fast_agent.config import OpenTelemetrySettings, Settings
+
+        def loaded(sdk):
+            return f"opentelemetry.instrumentation.{sdk}" in sys.modules
+
+        # Recorded before telemetry is configured; instrumented once it is.
+        context_module.instrument_llm_sdk("anthropic")
+        assert not loaded("anthropic")
+
+        settings = Settings(otel=OpenTelemetrySettings(enabled=True))
+        asyncio.run(context_module.configure_otel(settings))
+        assert loaded("anthropic")
+        assert not loaded("openai") and not loaded("google_genai")
+
+        context_module.instrument_llm_sdk("openai")
+        assert loaded("openai")
+        assert not loaded("google_genai")
+        """
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        check=False,
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,63 @@
+"""Cold-start import guards for the CLI and batch worker.
+
+These use ``python -X importtime`` in a fresh interpreter and check which
+modules were imported, so they catch regressions such as an eager SDK or
+exporter import without depending on how fast the machine is.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+# Heavy telemetry machinery that must only load when OpenTelemetry is enabled.
+TELEMETRY_PREFIXES = (
+    "opentelemetry.sdk",
+    "opentelemetry.exporter",
+    "opentelemetry.instrumentation",
+)
+
+
+def _imported_modules(*args: str) -> set[str]:
+    """Return the modules a fresh interpreter imports for ``args``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        check=False,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    modules: set[str] = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        modules.add(line.rsplit("|", 1)[-1].strip())
+    return modules
+
+
+def _telemetry_modules(modules: set[str]) -> list[str]:
+    return sorted(name for name in modules if name.startswith(TELEMETRY_PREFIXES))
+
+
+def test_go_help_does_not_import_runtime_or_telemetry() -> None:
+    modules = _imported_modules("-m", "fast_agent.cli", "--no-update-check", "go", "--help")
+
+    assert "fast_agent.context" not in modules
+    assert _telemetry_modules(modules) == []
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import fast_agent.context",
+        "import fast_agent.cli.commands.batch, fast_agent.core.fastagent",
+    ],
+)
+def test_worker_cold_start_skips_telemetry_when_disabled(statement: str) -> None:
+    modules = _imported_modules("-c", statement)
+
+    assert "fast_agent.context" in modules
+    assert _telemetry_modules(modules) == []